@@ -19,10 +19,13 @@
 
 """Tools for aggregating benchmark results."""
 
+import csv
 import json
+import re
 import statistics
+from functools import partial
 from pathlib import Path
-from typing import Callable, Dict, List, Tuple, cast
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple, cast
 
 from autonomy.analyse.benchmark.html import (
     BLOCK_TEMPLATE,
@@ -33,10 +36,27 @@ from autonomy.analyse.benchmark.html import (
     TROW_TEMPLATE,
 )
 
+PERIOD_FILE_PATTERN = re.compile(r"^(\d+)\.json$")
+PERCENTILES = (50, 90, 99)
+SUMMARY_TITLE = "Benchmark statistics across all agents"
+
+
+def percentile(values: Sequence[float], percent: float) -> float:
+    """Compute a percentile of the values, interpolating linearly between the closest ranks."""
+    if len(values) == 0:
+        raise ValueError("Cannot compute a percentile of no values.")
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * percent / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
 STATISTICS = {
     "Mean": statistics.mean,
     "Maximum": max,
     "Minimum": min,
+    **{f"P{p}": partial(percentile, percent=p) for p in PERCENTILES},
 }
 
 
@@ -51,6 +71,138 @@ class BlockTypes:  # pylint: disable=too-few-public-methods
     types = (LOCAL, CONSENSUS, TOTAL)
 
 
+class OutputFormats:  # pylint: disable=too-few-public-methods
+    """Output formats."""
+
+    HTML = "html"
+    CSV = "csv"
+    JSON = "json"
+
+    formats = (HTML, CSV, JSON)
+
+
+def iter_period_files(agent_dir: Path, period: int = -1) -> Iterator[Tuple[int, Path]]:
+    """Iterate over the period files of an agent, in the order of the periods."""
+    period_files = []
+    for file in agent_dir.iterdir():
+        match = PERIOD_FILE_PATTERN.match(file.name)
+        if match is None:
+            continue
+        period_ = int(match.group(1))
+        if period in (-1, period_):
+            period_files.append((period_, file))
+    yield from sorted(period_files)
+
+
+def iter_agent_dirs(path: Path) -> Iterator[Path]:
+    """Iterate over the agent directories of a benchmarks directory."""
+    yield from sorted(
+        agent_dir for agent_dir in Path(path).iterdir() if agent_dir.is_dir()
+    )
+
+
+def get_blocks(block_type: str) -> Tuple[str, ...]:
+    """Get the blocks to consider for a block type."""
+    return BlockTypes.types if block_type == BlockTypes.ALL else (block_type,)
+
+
+def collect_samples(
+    path: Path,
+    block_type: str = BlockTypes.ALL,
+    period: int = -1,
+) -> Dict[Tuple[str, str], List[float]]:
+    """
+    Collect the measurements of each behaviour and block across all the agents and periods.
+
+    The period files are read one at a time, and only the measurements are kept in memory.
+
+    :param path: path to the benchmarks directory.
+    :param block_type: the block type to collect.
+    :param period: the period to collect, -1 for all the periods.
+    :return: a mapping of (behaviour, block) to the measurements.
+    """
+    blocks = get_blocks(block_type)
+    samples: Dict[Tuple[str, str], List[float]] = {}
+    for agent_dir in iter_agent_dirs(path):
+        for _, period_file in iter_period_files(agent_dir, period):
+            with open(period_file, encoding="utf-8") as fp:
+                period_data = json.load(fp)
+            for behaviour in period_data:
+                for block in blocks:
+                    value = behaviour["data"].get(block)
+                    if value is None:
+                        continue
+                    samples.setdefault((behaviour["behaviour"], block), []).append(
+                        value
+                    )
+    return samples
+
+
+def summarize(samples: Dict[Tuple[str, str], List[float]]) -> List[Dict[str, Any]]:
+    """Summarize the measurements of each behaviour and block."""
+    return [
+        {
+            "behaviour": behaviour,
+            "block": block,
+            "count": len(values),
+            **{
+                name.lower(): aggregator(values)
+                for name, aggregator in STATISTICS.items()
+            },
+        }
+        for (behaviour, block), values in sorted(samples.items())
+    ]
+
+
+def create_rows_table(title: str, block_type: str, rows: List[Dict[str, Any]]) -> str:
+    """Create a table of rows."""
+    table = f"""<div style="width: 100%; text-align: center"> {title}</div>\n"""
+    if len(rows) == 0:
+        return table
+    header_columns = list(rows[0])
+    thead = "".join(map(TH_TEMPLATE.format, header_columns))
+    tbody = "".join(
+        TROW_TEMPLATE.format(
+            "".join(TD_TEMPLATE.format(row[c]) for c in header_columns)
+        )
+        for row in rows
+    )
+    return table + BLOCK_TEMPLATE.format(
+        table=TABLE_TEMPLATE.format(
+            colspan=len(header_columns),
+            block_type=block_type,
+            thead=thead,
+            tbody=tbody,
+        ),
+    )
+
+
+def write_rows(
+    rows: List[Dict[str, Any]],
+    output: Path,
+    output_format: str,
+    title: str,
+    block_type: str,
+) -> None:
+    """Write rows to the output in the given format."""
+    if output_format == OutputFormats.JSON:
+        output.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        return
+
+    if output_format == OutputFormats.CSV:
+        with open(output, "w", newline="", encoding="utf-8") as fp:
+            if len(rows) > 0:
+                writer = csv.DictWriter(fp, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+        return
+
+    output.write_text(
+        HTML_TEMPLATE.format(tables=create_rows_table(title, block_type, rows)),
+        encoding="utf-8",
+    )
+
+
 def read_benchmark_data(
     path: Path,
     block_type: str = BlockTypes.ALL,
@@ -58,17 +210,11 @@ def read_benchmark_data(
 ) -> Dict[str, Dict[str, List[Dict]]]:
     """Returns logs."""
     benchmark_data: Dict[str, Dict[str, List[Dict]]] = {}
-    for agent_dir in path.iterdir():
+    for agent_dir in iter_agent_dirs(path):
         benchmark_data[agent_dir.name] = {}
-        benchmark_data_files = list(agent_dir.glob("*.json"))
-        periods = sorted(
-            tuple(map(lambda x: x.name, benchmark_data_files))
-            if period == -1
-            else (f"{period}.json",)
-        )
-        for _period in periods:
-            period_name, _ = _period.split(".")
-            period_data = json.loads((agent_dir / _period).read_text())
+        for period_, period_file in iter_period_files(agent_dir, period):
+            period_name = str(period_)
+            period_data = json.loads(period_file.read_text())
             if block_type == BlockTypes.ALL:
                 benchmark_data[agent_dir.name][period_name] = period_data
                 continue
@@ -149,13 +295,13 @@ def create_agent_table(
         data=data,
         blocks=blocks,
     )
-    behaviour_history: Dict[str, List[float]] = {
-        behaviour: [] for behaviour in header_columns[1:]
-    }
     for block, block_data in tables_data.items():
+        behaviour_history: Dict[str, List[float]] = {
+            behaviour: [] for behaviour in header_columns[1:]
+        }
         thead = "".join(map(TH_TEMPLATE.format, header_columns))
         tbody = ""
-        for period in sorted(periods):
+        for period in sorted(periods, key=int):
             rows = TD_TEMPLATE.format(period)
             for behaviour_name in header_columns[1:]:
                 behaviour_history[behaviour_name].append(
@@ -177,23 +323,44 @@ def create_agent_table(
     return tables
 
 
-def aggregate(path: Path, block_type: str, period: int, output: Path) -> None:
-    """Benchmark Aggregator."""
+def aggregate(
+    path: Path,
+    block_type: str,
+    period: int,
+    output: Path,
+    output_format: str = OutputFormats.HTML,
+) -> None:
+    """
+    Benchmark Aggregator.
+
+    The statistics of each behaviour and block across all the agents are written in any format.
+    The HTML output additionally contains a table per agent with the measurements of each period.
+
+    :param path: path to the benchmarks directory.
+    :param block_type: the block type to aggregate.
+    :param period: the period to aggregate, -1 for all the periods.
+    :param output: path to the output file.
+    :param output_format: the format of the output.
+    """
     path = Path(path)
+    summary = summarize(collect_samples(path, block_type=block_type, period=period))
+    if output_format != OutputFormats.HTML:
+        write_rows(summary, output, output_format, SUMMARY_TITLE, block_type)
+        return
+
     benchmark_data = read_benchmark_data(
         path,
         block_type=block_type,
         period=period,
     )
-    tables = [
+    tables = [create_rows_table(SUMMARY_TITLE, block_type, summary)]
+    tables.extend(
         create_agent_table(
             agent=agent,
             data=data,
-            blocks=(
-                BlockTypes.types if block_type == BlockTypes.ALL else (block_type,)
-            ),
+            blocks=get_blocks(block_type),
         )
         for agent, data in benchmark_data.items()
-    ]
+    )
 
     output.write_text(HTML_TEMPLATE.format(tables="".join(tables)), encoding="utf-8")
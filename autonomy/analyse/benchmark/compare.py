@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tools for comparing benchmark results."""
+
+import math
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from autonomy.analyse.benchmark.aggregate import (
+    BlockTypes,
+    OutputFormats,
+    collect_samples,
+    percentile,
+    write_rows,
+)
+
+DEFAULT_SIGNIFICANCE_LEVEL = 0.05
+DEFAULT_MIN_CHANGE = 0.05
+COMPARISON_TITLE = "Benchmark comparison against the baseline"
+
+
+def _rank(values: Sequence[float]) -> List[float]:
+    """Rank the values, assigning the average rank to ties."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return ranks
+
+
+def mann_whitney_u(baseline: Sequence[float], candidate: Sequence[float]) -> float:
+    """
+    Test whether the candidate measurements tend to be greater than the baseline ones.
+
+    One-sided Mann-Whitney U test, using the normal approximation with tie and continuity corrections.
+
+    :param baseline: the baseline measurements.
+    :param candidate: the candidate measurements.
+    :return: the p-value of the test.
+    """
+    n_baseline, n_candidate = len(baseline), len(candidate)
+    if n_baseline == 0 or n_candidate == 0:
+        raise ValueError("Cannot compare empty samples.")
+
+    n = n_baseline + n_candidate
+    ranks = _rank([*baseline, *candidate])
+    u_candidate = sum(ranks[n_baseline:]) - n_candidate * (n_candidate + 1) / 2
+
+    ties: Dict[float, int] = {}
+    for rank in ranks:
+        ties[rank] = ties.get(rank, 0) + 1
+    tie_correction = (
+        sum(t**3 - t for t in ties.values()) / (n * (n - 1)) if n > 1 else 0
+    )
+    variance = n_baseline * n_candidate / 12 * ((n + 1) - tie_correction)
+    if variance <= 0:
+        return 1.0
+
+    mean = n_baseline * n_candidate / 2
+    z = (u_candidate - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(
+    baseline: Path,
+    candidate: Path,
+    block_type: str = BlockTypes.ALL,
+    period: int = -1,
+    significance_level: float = DEFAULT_SIGNIFICANCE_LEVEL,
+    min_change: float = DEFAULT_MIN_CHANGE,
+) -> List[Dict[str, Any]]:
+    """
+    Compare the measurements of each behaviour and block of a candidate run against a baseline run.
+
+    A behaviour's block is flagged as a regression if its candidate measurements are significantly
+    greater than the baseline ones, and its median grew by at least `min_change`.
+
+    :param baseline: path to the baseline benchmarks directory.
+    :param candidate: path to the candidate benchmarks directory.
+    :param block_type: the block type to compare.
+    :param period: the period to compare, -1 for all the periods.
+    :param significance_level: the significance level of the test.
+    :param min_change: the minimum relative change of the median to flag a regression.
+    :return: a row per behaviour and block present in both runs.
+    """
+    baseline_samples = collect_samples(baseline, block_type=block_type, period=period)
+    candidate_samples = collect_samples(candidate, block_type=block_type, period=period)
+
+    rows = []
+    for key in sorted(baseline_samples.keys() & candidate_samples.keys()):
+        behaviour, block = key
+        baseline_values, candidate_values = (
+            baseline_samples[key],
+            candidate_samples[key],
+        )
+        baseline_median = percentile(baseline_values, 50)
+        candidate_median = percentile(candidate_values, 50)
+        change: Optional[float] = (
+            (candidate_median - baseline_median) / baseline_median
+            if baseline_median > 0
+            else None
+        )
+        p_value = mann_whitney_u(baseline_values, candidate_values)
+        rows.append(
+            {
+                "behaviour": behaviour,
+                "block": block,
+                "baseline_count": len(baseline_values),
+                "candidate_count": len(candidate_values),
+                "baseline_p50": baseline_median,
+                "candidate_p50": candidate_median,
+                "baseline_p90": percentile(baseline_values, 90),
+                "candidate_p90": percentile(candidate_values, 90),
+                "change": change,
+                "p_value": p_value,
+                "regression": p_value < significance_level
+                and (change is None or change >= min_change),
+            }
+        )
+    return rows
+
+
+def compare_and_write(  # pylint: disable=too-many-arguments
+    baseline: Path,
+    candidate: Path,
+    block_type: str,
+    period: int,
+    output: Path,
+    output_format: str = OutputFormats.HTML,
+    significance_level: float = DEFAULT_SIGNIFICANCE_LEVEL,
+    min_change: float = DEFAULT_MIN_CHANGE,
+) -> List[Dict[str, Any]]:
+    """Compare a candidate run against a baseline run, write the comparison and return the regressions."""
+    rows = compare(
+        baseline=baseline,
+        candidate=candidate,
+        block_type=block_type,
+        period=period,
+        significance_level=significance_level,
+        min_change=min_change,
+    )
+    write_rows(rows, output, output_format, COMPARISON_TITLE, block_type)
+    return [row for row in rows if row["regression"]]
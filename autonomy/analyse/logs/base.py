@@ -20,8 +20,9 @@
 """Tools for analysing logs."""
 
 import re
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Tuple
+from typing import Optional, Tuple
 
 LOGS_DB = "logs.db"
 TIME_FORMAT = "%Y-%m-%d %H:%M:%S,%f"
@@ -29,8 +30,31 @@ TIMESTAMP_REGEX = re.compile(r"^(\[(\d+-\d+-\d+ \d+:\d+:\d+,\d+)\])")
 LOG_ROW_REGEX = re.compile(
     r"\[(\d+-\d+-\d+ \d+:\d+:\d+,\d+)\] \[([A-Z]+)\]( \[agent\])? ((.|\n)*)"
 )
+LOG_BLOCK_REGEX = re.compile(
+    r"\[(\d+-\d+-\d+ \d+:\d+:\d+,\d+)\] \[([A-Z]+)\](?: \[agent\])? (.*)", re.DOTALL
+)
+LOG_BLOCK_START_REGEX = re.compile(rb"^\[\d+-\d+-\d+ \d+:\d+:\d+,\d+\]", re.MULTILINE)
 ENTER_BEHAVIOUR_REGEX = re.compile(r"Entered in the \'([a-z_]+)\' behaviour")
 ENTER_ROUND_REGEX = re.compile(r"Entered in the \'([a-z_]+)\' round for period (\d+)")
 EXIT_ROUND_REGEX = re.compile(r"'([a-z_]+)' round is done with event: (Event\.[A-Z_]+)")
 
 LogRow = Tuple[datetime, str, str, int, str, str]
+# period, round name, start time, end time, duration in seconds, exit event
+RoundRow = Tuple[int, str, datetime, Optional[datetime], Optional[float], Optional[str]]
+
+
+@dataclass
+class LogsProgress:
+    """
+    Ingestion progress of a log file.
+
+    The last log block of a file is re-ingested on the next run, as more lines may be
+    appended to it. Hence, the progress points to the start of the last log block,
+    and holds the parsing state right before it.
+    """
+
+    offset: int = 0
+    period: int = 0
+    round_name: str = "agent_startup"
+    behaviour_name: str = "agent_startup"
+    rowid: Optional[int] = None
@@ -19,23 +19,65 @@
 
 """Log streams"""
 
-import re
+import mmap
+import os
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Generator, List, Optional, TextIO, Tuple, cast
+from typing import Dict, Generator, Iterator, List, Optional, Tuple
 
 from autonomy.analyse.logs.base import (
     ENTER_BEHAVIOUR_REGEX,
     ENTER_ROUND_REGEX,
-    LOG_ROW_REGEX,
+    LOG_BLOCK_REGEX,
+    LOG_BLOCK_START_REGEX,
     LogRow,
-    TIMESTAMP_REGEX,
+    LogsProgress,
     TIME_FORMAT,
 )
 from autonomy.analyse.logs.db import AgentLogsDB
 
 
+def parse_timestamp(timestamp: str) -> datetime:
+    """Parse a log timestamp."""
+    try:
+        return datetime.fromisoformat(timestamp.replace(",", "."))
+    except ValueError:  # pragma: nocover
+        return datetime.strptime(timestamp, TIME_FORMAT)
+
+
+def iter_log_blocks(file: Path, offset: int = 0) -> Iterator[Tuple[int, str]]:
+    """
+    Iterate over the log blocks of a file, starting from a byte offset.
+
+    The file is memory mapped and split on the timestamps starting the log blocks,
+    so that multiline blocks are not grown line by line. Any text preceding the
+    first timestamp is skipped.
+
+    :param file: the log file.
+    :param offset: the byte offset to start from.
+    :yield: the byte offsets and the contents of the log blocks.
+    """
+    if file.stat().st_size <= offset:
+        return
+
+    with file.open(mode="rb") as fp, mmap.mmap(
+        fp.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        block_start: Optional[int] = None
+        for match in LOG_BLOCK_START_REGEX.finditer(mm, offset):
+            if block_start is not None:
+                yield block_start, mm[block_start : match.start()].decode(
+                    "utf-8", errors="replace"
+                )
+            block_start = match.start()
+        if block_start is not None:
+            yield block_start, mm[block_start:].decode("utf-8", errors="replace")
+
+
 class LogCollection(ABC):
     """Collection of logs."""
 
@@ -58,55 +100,75 @@ class LogCollection(ABC):
     ) -> "LogCollection":
         """Create logs database."""
 
-    @staticmethod
-    def get_next_log_block(
-        fp: TextIO,
-        prev_line: Optional[str],
-    ) -> Tuple[Optional[str], Optional[str]]:
-        """Get next log block."""
-        if prev_line is None:
-            return None, None
-
-        line = prev_line
-        while True:
-            _line = fp.readline()
-            if _line == "":
-                return prev_line, None
-            if TIMESTAMP_REGEX.match(_line) is not None:
-                return line, _line
-            line += _line
+    def create_agent_dbs(
+        self,
+        dbs: Dict[str, AgentLogsDB],
+        reset: bool = False,
+        max_workers: Optional[int] = None,  # pylint: disable=unused-argument
+    ) -> "LogCollection":
+        """Create the logs databases of several agents."""
+        for agent, db in dbs.items():
+            self.create_agent_db(agent=agent, db=db, reset=reset)
+        return self
 
     @classmethod
-    def parse(cls, file: Path) -> Generator[LogRow, None, None]:
-        """Parse logs and yield rows."""
-        with file.open(mode="r", encoding="utf-8") as fp:
-            prev_line: Optional[str] = fp.readline()
-            current_period = 0
-            current_round = "agent_startup"
-            current_behaviour = "agent_startup"
-            while True:
-                line, prev_line = cls.get_next_log_block(fp=fp, prev_line=prev_line)
-                if line is None and prev_line is None:
-                    break
-
-                match = LOG_ROW_REGEX.match(string=cast(str, line))
-                _timestamp, log_level, _, log_block, _ = cast(re.Match, match).groups()
-                timestamp = datetime.strptime(_timestamp, TIME_FORMAT)
-                match = ENTER_BEHAVIOUR_REGEX.match(string=log_block)
-                if match is not None:
-                    (current_behaviour,) = match.groups()
-
-                match = ENTER_ROUND_REGEX.match(string=log_block)
-                if match is not None:
-                    current_round, current_period = cast(
-                        Tuple[str, int], match.groups()
-                    )
+    def parse(
+        cls, file: Path, progress: Optional[LogsProgress] = None
+    ) -> Generator[LogRow, None, None]:
+        """
+        Parse logs and yield rows.
+
+        :param file: the log file.
+        :param progress: the progress to resume parsing from. It is updated
+            in place to point to the last parsed log block.
+        :yield: the log rows.
+        """
+        progress = LogsProgress() if progress is None else progress
+        current_period = progress.period
+        current_round = progress.round_name
+        current_behaviour = progress.behaviour_name
+        for offset, block in iter_log_blocks(file, progress.offset):
+            match = LOG_BLOCK_REGEX.match(block)
+            if match is None:  # pragma: nocover
+                continue
+
+            progress.offset = offset
+            progress.period = current_period
+            progress.round_name = current_round
+            progress.behaviour_name = current_behaviour
+
+            _timestamp, log_level, log_block = match.groups()
+            timestamp = parse_timestamp(_timestamp)
+            match = ENTER_BEHAVIOUR_REGEX.match(string=log_block)
+            if match is not None:
+                (current_behaviour,) = match.groups()
+
+            match = ENTER_ROUND_REGEX.match(string=log_block)
+            if match is not None:
+                current_round, _period = match.groups()
+                current_period = int(_period)
+
+            yield timestamp, log_level, log_block, current_period, current_round, current_behaviour
 
-                yield timestamp, log_level, log_block, current_period, current_round, current_behaviour
+
+def _parse_to_db(
+    agent: str, log_file: Path, db_file: Path, progress: LogsProgress
+) -> LogsProgress:
+    """Parse a log file into a new database file, and return the parsing progress."""
+    db = AgentLogsDB(agent=agent, file=db_file).create()
+    db.insert_many(
+        logs=LogCollection.parse(file=log_file, progress=progress), index=False
+    )
+    return progress
 
 
 class FromDirectory(LogCollection):
-    """Log stream from directory."""
+    """
+    Log stream from directory.
+
+    The logs are ingested incrementally: only the lines appended to the log files
+    since the previous ingestion are parsed.
+    """
 
     def __init__(self, directory: Path) -> None:
         """Initialize object."""
@@ -120,19 +182,86 @@ class FromDirectory(LogCollection):
             map(lambda x: x.name.replace(".txt", ""), self.directory.glob("aea_*.txt"))
         )
 
+    def _prepare(
+        self, agent: str, db: AgentLogsDB, reset: bool = False
+    ) -> LogsProgress:
+        """Prepare the table of an agent for ingestion, and return the progress to resume from."""
+        log_file = self.directory / f"{agent}.txt"
+        progress = None if reset or not db.exists() else db.get_progress()
+        if progress is None or log_file.stat().st_size < progress.offset:
+            # the table was never ingested incrementally or the log file was rotated
+            db.create(reset=True)
+            return LogsProgress()
+
+        if progress.rowid is not None:
+            # re-ingest the last log block, as lines may have been appended to it
+            db.truncate(progress.rowid)
+        return progress
+
+    @staticmethod
+    def _commit(db: AgentLogsDB, progress: LogsProgress) -> None:
+        """Record the ingestion progress."""
+        progress.rowid = db.max_rowid()
+        db.set_progress(progress)
+
     def create_agent_db(
         self,
         agent: str,
         db: AgentLogsDB,
         reset: bool = False,
     ) -> "FromDirectory":
-        """Create logs table for agent."""
+        """Create logs table for agent, or ingest the lines appended since the last run."""
 
         log_file = self.directory / f"{agent}.txt"
-        db.create(reset=reset)
-        db.insert_many(
-            logs=self.parse(
-                file=log_file,
-            )
-        )
+        progress = self._prepare(agent=agent, db=db, reset=reset)
+        db.insert_many(logs=self.parse(file=log_file, progress=progress))
+        self._commit(db, progress)
+        return self
+
+    def create_agent_dbs(
+        self,
+        dbs: Dict[str, AgentLogsDB],
+        reset: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> "FromDirectory":
+        """
+        Create the logs tables of several agents, parsing the log files in parallel.
+
+        Each log file is parsed into a temporary database by a worker process,
+        and the records are then bulk copied into the agent's table.
+
+        :param dbs: the databases of the agents.
+        :param reset: whether to re-ingest the log files from scratch.
+        :param max_workers: the maximum number of worker processes.
+        :return: the collection.
+        """
+        max_workers = min(len(dbs), max_workers or os.cpu_count() or 1)
+        if max_workers <= 1:
+            super().create_agent_dbs(dbs=dbs, reset=reset)
+            return self
+
+        progresses = {
+            agent: self._prepare(agent=agent, db=db, reset=reset)
+            for agent, db in dbs.items()
+        }
+        temp_dir = Path(tempfile.mkdtemp(dir=self.directory))
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    agent: executor.submit(
+                        _parse_to_db,
+                        agent,
+                        self.directory / f"{agent}.txt",
+                        temp_dir / f"{agent}.db",
+                        progress,
+                    )
+                    for agent, progress in progresses.items()
+                }
+                for agent, future in futures.items():
+                    progress = future.result()
+                    db = dbs[agent]
+                    db.insert_from(temp_dir / f"{agent}.db")
+                    self._commit(db, progress)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
         return self
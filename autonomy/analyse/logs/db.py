@@ -22,10 +22,18 @@
 import re
 import sqlite3
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Iterator, List, Optional, Tuple
-
-from autonomy.analyse.logs.base import LogRow
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+from autonomy.analyse.logs.base import (
+    ENTER_ROUND_REGEX,
+    EXIT_ROUND_REGEX,
+    LogRow,
+    LogsProgress,
+    RoundRow,
+)
 
 TIMESTAMP = "timestamp"
 LOG_LEVEL = "log_level"
@@ -34,6 +42,11 @@ PERIOD = "period"
 ROUND = "round_name"
 BEHAVIOUR = "behaviour_name"
 EXIT_EVENT = "exit_event"
+START_TIME = "start_time"
+END_TIME = "end_time"
+DURATION = "duration"
+START_ROWID = "start_rowid"
+END_ROWID = "end_rowid"
 
 # regex pattern for safe table/column names (alphanumeric + underscore + hyphen)
 SAFE_IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_-]*$")
@@ -47,6 +60,109 @@ QUERY_CHECK_TABLE_EXISTS = (
 )
 QUERY_DROP_TABLE = 'DROP TABLE "{agent}";'
 QUERY_INSERT_LOG = 'INSERT INTO "{agent}" VALUES (?, ?, ?, ?, ?, ?);'
+QUERY_CREATE_INDEX = (
+    'CREATE INDEX IF NOT EXISTS "{agent}_{column}" ON "{agent}" ({column});'
+)
+QUERY_CREATE_FTS_TABLE = (
+    'CREATE VIRTUAL TABLE IF NOT EXISTS "{agent}_fts" '
+    + f'USING fts5({MESSAGE}, content="{{agent}}", content_rowid="rowid");'
+)
+QUERY_REBUILD_FTS_TABLE = (
+    'INSERT INTO "{agent}_fts"("{agent}_fts") VALUES(\'rebuild\');'
+)
+QUERY_DROP_FTS_TABLE = 'DROP TABLE IF EXISTS "{agent}_fts";'
+QUERY_INDEX_FTS_ROWS = (
+    'INSERT INTO "{agent}_fts"(rowid, '
+    + MESSAGE
+    + ") SELECT rowid, "
+    + MESSAGE
+    + ' FROM "{agent}" WHERE rowid>=?;'
+)
+QUERY_DELETE_FTS_ROWS = (
+    'INSERT INTO "{agent}_fts"("{agent}_fts", rowid, '
+    + MESSAGE
+    + ") SELECT 'delete', rowid, "
+    + MESSAGE
+    + ' FROM "{agent}" WHERE rowid>=?;'
+)
+QUERY_DELETE_ROWS = 'DELETE FROM "{agent}" WHERE rowid>=?;'
+QUERY_MAX_ROWID = 'SELECT MAX(rowid) FROM "{agent}";'
+QUERY_COPY_ROWS = 'INSERT INTO "{agent}" SELECT * FROM part."{agent}" ORDER BY rowid;'
+
+PROGRESS_TABLE = "_ingest_progress"
+QUERY_CREATE_PROGRESS_TABLE = (
+    f"CREATE TABLE IF NOT EXISTS {PROGRESS_TABLE} "
+    f"(agent TEXT PRIMARY KEY, offset INTEGER, {PERIOD} INTEGER, {ROUND} TEXT, {BEHAVIOUR} TEXT, row_id INTEGER);"
+)
+QUERY_SELECT_PROGRESS = f"SELECT offset, {PERIOD}, {ROUND}, {BEHAVIOUR}, row_id FROM {PROGRESS_TABLE} WHERE agent=?;"  # nosec
+QUERY_UPSERT_PROGRESS = (
+    f"INSERT OR REPLACE INTO {PROGRESS_TABLE} VALUES (?, ?, ?, ?, ?, ?);"  # nosec
+)
+QUERY_DELETE_PROGRESS = f"DELETE FROM {PROGRESS_TABLE} WHERE agent=?;"  # nosec
+
+# the round transitions table holds one row per round instance, from the `Entered in the`
+# log to the `round is done` log; the rowids point to these logs in the agent table
+ROUND_COLUMNS = f"{PERIOD}, {ROUND}, {START_TIME}, {END_TIME}, {DURATION}, {EXIT_EVENT}"
+QUERY_CREATE_ROUNDS_TABLE = (
+    'CREATE TABLE IF NOT EXISTS "{agent}_rounds" '
+    + f"({PERIOD} INTEGER, {ROUND} TEXT, {START_TIME} TIMESTAMP, {END_TIME} TIMESTAMP, "
+    + f"{DURATION} REAL, {EXIT_EVENT} TEXT, {START_ROWID} INTEGER, {END_ROWID} INTEGER);"
+)
+QUERY_CREATE_ROUNDS_INDEX = 'CREATE INDEX IF NOT EXISTS "{agent}_rounds_{column}" ON "{agent}_rounds" ({column});'
+QUERY_DROP_ROUNDS_TABLE = 'DROP TABLE IF EXISTS "{agent}_rounds";'
+QUERY_SELECT_TRANSITION_LOGS = (
+    f"SELECT rowid, {TIMESTAMP}, {MESSAGE} "
+    + 'FROM "{agent}" WHERE rowid>=? AND '
+    + f"({MESSAGE} LIKE 'Entered in the %round for period %' OR {MESSAGE} LIKE '%round is done with event: %') "
+    + "ORDER BY rowid;"
+)
+QUERY_SELECT_OPEN_ROUND = (
+    f"SELECT rowid, {ROUND}, {START_TIME} "
+    + 'FROM "{agent}_rounds" '
+    + f"WHERE {END_ROWID} IS NULL ORDER BY {START_ROWID} DESC LIMIT 1;"
+)
+QUERY_INSERT_ROUND = (
+    'INSERT INTO "{agent}_rounds" '
+    + f"({PERIOD}, {ROUND}, {START_TIME}, {START_ROWID}) VALUES (?, ?, ?, ?);"
+)
+QUERY_CLOSE_ROUND = (
+    'UPDATE "{agent}_rounds" '
+    + f"SET {END_TIME}=?, {DURATION}=?, {EXIT_EVENT}=?, {END_ROWID}=? WHERE rowid=?;"
+)
+QUERY_DELETE_ROUNDS = 'DELETE FROM "{agent}_rounds" ' + f"WHERE {START_ROWID}>=?;"
+QUERY_REOPEN_ROUNDS = (
+    'UPDATE "{agent}_rounds" '
+    + f"SET {END_TIME}=NULL, {DURATION}=NULL, {EXIT_EVENT}=NULL, {END_ROWID}=NULL "
+    + f"WHERE {END_ROWID}>=?;"
+)
+QUERY_SELECT_EXECUTION_PATH = (
+    f"SELECT {PERIOD}, {ROUND}, {EXIT_EVENT} "
+    + 'FROM "{agent}_rounds" '
+    + f"ORDER BY {START_ROWID};"
+)
+QUERY_SELECT_ROUND_TIMEOUTS = (
+    f"SELECT {ROUND}, COUNT(*), SUM(IFNULL({EXIT_EVENT}, '') LIKE ?) "
+    + 'FROM "{agent}_rounds" {condition} '
+    + f"GROUP BY {ROUND};"
+)
+# the round timeout events are named after timeouts, e.g. `Event.ROUND_TIMEOUT`
+TIMEOUT_EVENT_PATTERN = "%TIMEOUT%"
+
+INDEXED_COLUMNS = (PERIOD, ROUND, BEHAVIOUR, TIMESTAMP)
+ROUNDS_INDEXED_COLUMNS = (PERIOD, ROUND, DURATION)
+INSERT_BATCH_SIZE = 10_000
+# pragmas for bulk loading; the database can be rebuilt from the log files if the load is interrupted
+BUILD_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=OFF;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-65536;",
+)
+# restore the defaults after loading, so no write-ahead log files are left next to the database
+RESTORE_PRAGMAS = (
+    "PRAGMA synchronous=FULL;",
+    "PRAGMA journal_mode=DELETE;",
+)
 
 
 def validate_sql_identifier(identifier: str) -> str:
@@ -62,6 +178,47 @@ def validate_sql_identifier(identifier: str) -> str:
     return identifier
 
 
+@lru_cache(maxsize=128)
+def _compile(pattern: str) -> "re.Pattern":
+    """Compile a regex pattern."""
+    return re.compile(pattern)
+
+
+def regexp(pattern: str, value: Optional[str]) -> bool:
+    """Implement the SQLite `REGEXP` operator with the semantics of `re.match`."""
+    return value is not None and _compile(pattern).match(value) is not None
+
+
+def _round_condition(
+    period: Optional[int] = None, round_name: Optional[str] = None
+) -> Tuple[str, List[Any]]:
+    """Build the condition and the parameters to select round instances."""
+    conditions, paramaters = [], []
+    if period is not None:
+        conditions.append(f"{PERIOD}=?")
+        paramaters.append(period)
+    if round_name is not None:
+        conditions.append(f"{ROUND}=?")
+        paramaters.append(round_name)
+    if len(conditions) == 0:
+        return "", paramaters
+    return "WHERE " + " AND ".join(conditions), paramaters
+
+
+def _close_round(  # pylint: disable=too-many-arguments
+    db: sqlite3.Connection,
+    query: str,
+    open_round: Tuple[int, str, datetime],
+    end_time: datetime,
+    event: Optional[str],
+    rowid: int,
+) -> None:
+    """Close a round instance."""
+    round_id, _, start_time = open_round
+    duration = (end_time - start_time).total_seconds()
+    db.execute(query, (end_time, duration, event, rowid, round_id))
+
+
 class AgentLogsDB:
     """Logs DB"""
 
@@ -77,6 +234,7 @@ class AgentLogsDB:
             database=self._db_path,
             detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
         )
+        self._db.create_function("REGEXP", 2, regexp, deterministic=True)
 
     def select(
         self,
@@ -86,8 +244,28 @@ class AgentLogsDB:
         period: Optional[int] = None,
         round_name: Optional[str] = None,
         behaviour_name: Optional[str] = None,
+        include_regexes: Sequence[str] = (),
+        exclude_regexes: Sequence[str] = (),
+        search: Optional[str] = None,
+        start_rowid: Optional[int] = None,
+        end_rowid: Optional[int] = None,
     ) -> List[LogRow]:
-        """Build select query."""
+        """
+        Build select query.
+
+        :param start_time: select the logs after this time.
+        :param end_time: select the logs before this time.
+        :param log_level: select the logs with this level.
+        :param period: select the logs of this period.
+        :param round_name: select the logs of this round.
+        :param behaviour_name: select the logs of this behaviour.
+        :param include_regexes: select the logs whose message matches any of these regexes.
+        :param exclude_regexes: select the logs whose message does not match any of these regexes.
+        :param search: select the logs whose message matches this full-text search query.
+        :param start_rowid: select the logs starting from this rowid.
+        :param end_rowid: select the logs before this rowid.
+        :return: the selected logs.
+        """
 
         query = (
             f"SELECT * from {self.agent}"  # nosec, Safe after validation in constructor
@@ -124,13 +302,99 @@ class AgentLogsDB:
             query = _append_condition(_query=query, condition=f"{BEHAVIOUR}=?")
             paramaters.append(behaviour_name)
 
+        for pattern in (*include_regexes, *exclude_regexes):
+            try:
+                _compile(pattern)
+            except re.error as e:
+                raise ValueError(f"Invalid regex {pattern!r}: {e}") from e
+
+        if len(include_regexes) > 0:
+            conditions = " OR ".join([f"{MESSAGE} REGEXP ?"] * len(include_regexes))
+            query = _append_condition(_query=query, condition=f"({conditions})")
+            paramaters.extend(include_regexes)
+
+        if len(exclude_regexes) > 0:
+            conditions = " OR ".join([f"NOT {MESSAGE} REGEXP ?"] * len(exclude_regexes))
+            query = _append_condition(_query=query, condition=f"({conditions})")
+            paramaters.extend(exclude_regexes)
+
+        if start_rowid is not None:
+            query = _append_condition(_query=query, condition="rowid>=?")
+            paramaters.append(start_rowid)
+
+        if end_rowid is not None:
+            query = _append_condition(_query=query, condition="rowid<?")
+            paramaters.append(end_rowid)
+
+        if search is not None:
+            if not self.has_fts():
+                raise ValueError(
+                    f"No full-text search index found for agent {self.agent}; "
+                    "Please rebuild the database with `--reset-db`"
+                )
+            query = _append_condition(
+                _query=query,
+                condition=f'rowid IN (SELECT rowid FROM "{self.agent}_fts" WHERE "{self.agent}_fts" MATCH ?)',  # nosec
+            )
+            paramaters.append(search)
+
         query += ";"
         return self.cursor.execute(query, paramaters).fetchall()
 
-    def execution_path(self) -> List[Tuple[int, str, str]]:
+    def execution_path(self) -> List[Tuple[int, str, Optional[str]]]:
         """Extraction FSM execution path"""
+        if not self.has_rounds():
+            return []
         return self.cursor.execute(
-            f"SELECT {PERIOD}, {ROUND}, MAX({EXIT_EVENT}) from {self.agent} GROUP BY {ROUND};"  # nosec, Safe after validation in constructor
+            QUERY_SELECT_EXECUTION_PATH.format(agent=self.agent)
+        ).fetchall()
+
+    def rounds(
+        self,
+        period: Optional[int] = None,
+        round_name: Optional[str] = None,
+        slowest: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[RoundRow]:
+        """
+        Select the round instances.
+
+        :param period: select the rounds of this period.
+        :param round_name: select the instances of this round.
+        :param slowest: order the rounds by decreasing duration, instead of by start.
+        :param limit: the maximum number of rounds to select.
+        :return: the selected rounds.
+        """
+        if not self.has_rounds():
+            return []
+
+        condition, paramaters = _round_condition(period=period, round_name=round_name)
+        order = f"{DURATION} DESC" if slowest else START_ROWID
+        query = f'SELECT {ROUND_COLUMNS} FROM "{self.agent}_rounds" {condition} ORDER BY {order}'  # nosec
+        if limit is not None:
+            query += " LIMIT ?"
+            paramaters.append(limit)
+        return self.cursor.execute(query + ";", paramaters).fetchall()
+
+    def round_timeouts(
+        self,
+        period: Optional[int] = None,
+        round_name: Optional[str] = None,
+    ) -> List[Tuple[str, int, int]]:
+        """
+        Count the instances and the timeouts of each round.
+
+        :param period: count the rounds of this period.
+        :param round_name: count the instances of this round.
+        :return: the round names, their number of instances and of timeouts.
+        """
+        if not self.has_rounds():
+            return []
+
+        condition, paramaters = _round_condition(period=period, round_name=round_name)
+        return self.cursor.execute(
+            QUERY_SELECT_ROUND_TIMEOUTS.format(agent=self.agent, condition=condition),
+            [TIMEOUT_EVENT_PATTERN, *paramaters],
         ).fetchall()
 
     @property
@@ -146,9 +410,76 @@ class AgentLogsDB:
             is not None
         )
 
+    def has_fts(self) -> bool:
+        """Check if the full-text search index exists."""
+
+        return (
+            self.cursor.execute(
+                QUERY_CHECK_TABLE_EXISTS, (f"{self.agent}_fts",)
+            ).fetchone()
+            is not None
+        )
+
+    def has_rounds(self) -> bool:
+        """Check if the round transitions table exists."""
+
+        return (
+            self.cursor.execute(
+                QUERY_CHECK_TABLE_EXISTS, (f"{self.agent}_rounds",)
+            ).fetchone()
+            is not None
+        )
+
     def delete(self) -> "AgentLogsDB":
         """Delete table"""
+        self.cursor.execute(QUERY_DROP_ROUNDS_TABLE.format(agent=self.agent))
+        self.cursor.execute(QUERY_DROP_FTS_TABLE.format(agent=self.agent))
         self.cursor.execute(QUERY_DROP_TABLE.format(agent=self.agent))
+        self.cursor.execute(QUERY_CREATE_PROGRESS_TABLE)
+        self.cursor.execute(QUERY_DELETE_PROGRESS, (self.agent,))
+        return self
+
+    def max_rowid(self) -> Optional[int]:
+        """Get the rowid of the last record."""
+        (rowid,) = self.cursor.execute(
+            QUERY_MAX_ROWID.format(agent=self.agent)
+        ).fetchone()
+        return rowid
+
+    def get_progress(self) -> Optional[LogsProgress]:
+        """Get the ingestion progress of the agent's log file."""
+        self.cursor.execute(QUERY_CREATE_PROGRESS_TABLE)
+        row = self.cursor.execute(QUERY_SELECT_PROGRESS, (self.agent,)).fetchone()
+        return None if row is None else LogsProgress(*row)
+
+    def set_progress(self, progress: LogsProgress) -> "AgentLogsDB":
+        """Set the ingestion progress of the agent's log file."""
+        with self._db:
+            self._db.execute(QUERY_CREATE_PROGRESS_TABLE)
+            self._db.execute(
+                QUERY_UPSERT_PROGRESS,
+                (
+                    self.agent,
+                    progress.offset,
+                    progress.period,
+                    progress.round_name,
+                    progress.behaviour_name,
+                    progress.rowid,
+                ),
+            )
+        return self
+
+    def truncate(self, rowid: int) -> "AgentLogsDB":
+        """Delete the records starting from the given rowid."""
+        with self._db:
+            if self.has_fts():
+                self._db.execute(
+                    QUERY_DELETE_FTS_ROWS.format(agent=self.agent), (rowid,)
+                )
+            if self.has_rounds():
+                self._db.execute(QUERY_DELETE_ROUNDS.format(agent=self.agent), (rowid,))
+                self._db.execute(QUERY_REOPEN_ROUNDS.format(agent=self.agent), (rowid,))
+            self._db.execute(QUERY_DELETE_ROWS.format(agent=self.agent), (rowid,))
         return self
 
     def create(self, reset: bool = False) -> "AgentLogsDB":
@@ -166,15 +497,143 @@ class AgentLogsDB:
 
         return self
 
+    def create_indexes(self, from_rowid: int = 1) -> "AgentLogsDB":
+        """
+        Create the indexes of the agent table and the full-text search index of the messages.
+
+        :param from_rowid: the rowid of the first record missing from an existing full-text search index.
+        :return: the database.
+        """
+
+        with self._db:
+            for column in INDEXED_COLUMNS:
+                self._db.execute(
+                    QUERY_CREATE_INDEX.format(agent=self.agent, column=column)
+                )
+            if self.has_fts():
+                self._db.execute(
+                    QUERY_INDEX_FTS_ROWS.format(agent=self.agent), (from_rowid,)
+                )
+                return self
+            try:
+                self._db.execute(QUERY_CREATE_FTS_TABLE.format(agent=self.agent))
+            except sqlite3.OperationalError:  # pragma: nocover
+                # the sqlite library was compiled without FTS5
+                return self
+            self._db.execute(QUERY_REBUILD_FTS_TABLE.format(agent=self.agent))
+        return self
+
+    def materialise_rounds(self, from_rowid: int = 1) -> "AgentLogsDB":
+        """
+        Extract the round transitions from the logs into the rounds table.
+
+        A round instance starts with its `Entered in the` log, and ends with its
+        `round is done` log, or with the next `Entered in the` log if the former
+        is missing (e.g., if the agent was restarted).
+
+        :param from_rowid: the rowid of the first log to extract the transitions from.
+        :return: the database.
+        """
+
+        with self._db:
+            self._db.execute(QUERY_CREATE_ROUNDS_TABLE.format(agent=self.agent))
+            for column in ROUNDS_INDEXED_COLUMNS:
+                self._db.execute(
+                    QUERY_CREATE_ROUNDS_INDEX.format(agent=self.agent, column=column)
+                )
+
+            open_round = self._db.execute(
+                QUERY_SELECT_OPEN_ROUND.format(agent=self.agent)
+            ).fetchone()
+            query_insert = QUERY_INSERT_ROUND.format(agent=self.agent)
+            query_close = QUERY_CLOSE_ROUND.format(agent=self.agent)
+
+            for rowid, timestamp, message in self._db.execute(
+                QUERY_SELECT_TRANSITION_LOGS.format(agent=self.agent), (from_rowid,)
+            ).fetchall():
+                match = ENTER_ROUND_REGEX.match(message)
+                if match is not None:
+                    round_name, period = match.groups()
+                    if open_round is not None:
+                        _close_round(
+                            self._db, query_close, open_round, timestamp, None, rowid
+                        )
+                    round_id = self._db.execute(
+                        query_insert, (int(period), round_name, timestamp, rowid)
+                    ).lastrowid
+                    open_round = (round_id, round_name, timestamp)
+                    continue
+
+                match = EXIT_ROUND_REGEX.match(message)
+                if match is None or open_round is None:
+                    continue
+                round_name, event = match.groups()
+                if round_name == open_round[1]:
+                    _close_round(
+                        self._db, query_close, open_round, timestamp, event, rowid
+                    )
+                    open_round = None
+
+        return self
+
     def insert_many(
         self,
         logs: Iterator[LogRow],
+        batch_size: int = INSERT_BATCH_SIZE,
+        index: bool = True,
     ) -> "AgentLogsDB":
-        """Insert a record"""
-        for timestamp, log_level, message, period, round_name, behaviour_name in logs:
-            self.cursor.execute(
-                QUERY_INSERT_LOG.format(agent=self.agent),
-                (timestamp, log_level, message, period, round_name, behaviour_name),
+        """
+        Insert records in batches, then update the indexes.
+
+        :param logs: the records to insert.
+        :param batch_size: the number of records to insert per statement.
+        :param index: whether to update the indexes and the round transitions.
+        :return: the database.
+        """
+        from_rowid = (self.max_rowid() or 0) + 1
+        query = QUERY_INSERT_LOG.format(agent=self.agent)
+        logs = iter(logs)
+
+        def _insert() -> None:
+            while True:
+                batch = list(islice(logs, batch_size))
+                if len(batch) == 0:
+                    break
+                self._db.executemany(query, batch)
+
+        self._bulk_load(_insert, from_rowid, index)
+        return self
+
+    def insert_from(self, file: Path, index: bool = True) -> "AgentLogsDB":
+        """
+        Copy the records of the agent from another database file.
+
+        :param file: the database file to copy the records from.
+        :param index: whether to update the indexes and the round transitions.
+        :return: the database.
+        """
+        from_rowid = (self.max_rowid() or 0) + 1
+        self._db.execute("ATTACH DATABASE ? AS part;", (str(file),))
+        try:
+            self._bulk_load(
+                lambda: self._db.execute(QUERY_COPY_ROWS.format(agent=self.agent)),
+                from_rowid,
+                index,
             )
-        self._db.commit()
+        finally:
+            self._db.execute("DETACH DATABASE part;")
         return self
+
+    def _bulk_load(self, load: Callable[[], Any], from_rowid: int, index: bool) -> None:
+        """Run a load in a single transaction with the bulk loading pragmas."""
+        for pragma in BUILD_PRAGMAS:
+            self._db.execute(pragma)
+        try:
+            with self._db:
+                load()
+            if index:
+                self.create_indexes(from_rowid)
+                self.materialise_rounds(from_rowid)
+        finally:
+            for pragma in RESTORE_PRAGMAS:
+                self._db.execute(pragma)
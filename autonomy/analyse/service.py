@@ -176,6 +176,10 @@ ABCI_SKILL_MODEL_PARAMS_SCHEMA = {
         "slash_threshold_amount",
         "light_slash_unit_amount",
         "serious_slash_unit_amount",
+        "metrics_port",
+        "memory_report_period",
+        "memory_tracemalloc_frames",
+        "tx_compression_threshold",
         "setup",
     ],
 }
@@ -320,7 +324,10 @@ class ServiceAnalyser:
         self.logger.info("Checking if the service is deployed on-chain")
         try:
             *_, _service_state, _ = get_service_info(
-                ledger_api=ledger_api, chain_type=chain_type, token_id=token_id
+                ledger_api=ledger_api,
+                chain_type=chain_type,
+                token_id=token_id,
+                use_cache=True,
             )
         except get_requests_connection_error() as e:
             raise ServiceValidationFailed(
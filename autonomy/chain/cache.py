@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""On-disk cache for read-only chain queries."""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from aea.crypto.base import LedgerApi
+
+CHAIN_CACHE_ENV_VAR = "OPEN_AUTONOMY_CHAIN_CACHE"
+CHAIN_CACHE_TTL_ENV_VAR = "OPEN_AUTONOMY_CHAIN_CACHE_TTL"
+DEFAULT_CHAIN_CACHE_DIR = Path.home() / ".cache" / "open-autonomy" / "chain"
+DEFAULT_CHAIN_CACHE_TTL = 60.0
+
+_ENABLED_VALUES = ("1", "true", "yes")
+_DISABLED_VALUES = ("0", "false", "no")
+_BYTES_KEY = "__bytes__"
+
+# the chain of a ledger API does not change, so it is resolved once per object
+_CHAIN_IDS: "weakref.WeakKeyDictionary[LedgerApi, int]" = weakref.WeakKeyDictionary()
+
+
+def _encode(obj: Any) -> Any:
+    """Encode values which are not JSON serializable."""
+    if isinstance(obj, bytes):
+        return {_BYTES_KEY: obj.hex()}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _decode(obj: Dict) -> Any:
+    """Decode values encoded using `_encode`."""
+    if list(obj) == [_BYTES_KEY]:
+        return bytes.fromhex(obj[_BYTES_KEY])
+    return obj
+
+
+class ChainQueryCache:
+    """
+    On-disk cache for read-only chain, subgraph and IPFS metadata lookups.
+
+    Entries are stored as JSON files named after the hash of their key. Regular
+    entries expire after `ttl` seconds, permanent entries are used for data that
+    cannot change, like content addressed metadata.
+    """
+
+    def __init__(self, path: Path, ttl: float = DEFAULT_CHAIN_CACHE_TTL) -> None:
+        """Initialize object."""
+        self.path = path
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Make a cache key from the given parts."""
+        return hashlib.sha256(
+            json.dumps(parts, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the path for a cache entry."""
+        return self.path / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Get an entry, returns whether the entry was found and its value."""
+        try:
+            entry = json.loads(
+                self._entry_path(key=key).read_text(encoding="utf-8"),
+                object_hook=_decode,
+            )
+        except (OSError, ValueError):
+            return False, None
+
+        expires = entry.get("expires")
+        if expires is not None and expires < time.time():
+            return False, None
+        return True, entry.get("value")
+
+    def set(self, key: str, value: Any, permanent: bool = False) -> None:
+        """Store an entry, values which cannot be serialized are not cached."""
+        try:
+            data = json.dumps(
+                {
+                    "expires": None if permanent else time.time() + self.ttl,
+                    "value": value,
+                },
+                default=_encode,
+            )
+        except (TypeError, ValueError):
+            return
+
+        entry_path = self._entry_path(key=key)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(data, encoding="utf-8")
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            return
+
+    def fetch(
+        self,
+        call: Callable[[], Any],
+        *parts: Any,
+        permanent: bool = False,
+        should_cache: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Get a value from the cache or compute it using `call` and store it."""
+        key = self.make_key(*parts)
+        found, value = self.get(key=key)
+        if found:
+            return value
+
+        value = call()
+        if should_cache is None or should_cache(value):
+            self.set(key=key, value=value, permanent=permanent)
+        return value
+
+    def clear(self) -> None:
+        """Remove all the cache entries."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def get_chain_query_cache() -> Optional[ChainQueryCache]:
+    """
+    Get the chain query cache, if enabled.
+
+    The cache is enabled by setting `OPEN_AUTONOMY_CHAIN_CACHE` either to `1`
+    to use the default cache directory or to the path of a cache directory.
+    The expiry period of the entries which can change can be configured
+    using `OPEN_AUTONOMY_CHAIN_CACHE_TTL`.
+
+    :return: the cache object, or None if caching is not enabled.
+    """
+    value = os.environ.get(CHAIN_CACHE_ENV_VAR, "").strip()
+    if value == "" or value.lower() in _DISABLED_VALUES:
+        return None
+
+    path = DEFAULT_CHAIN_CACHE_DIR if value.lower() in _ENABLED_VALUES else Path(value)
+    ttl = float(os.environ.get(CHAIN_CACHE_TTL_ENV_VAR, DEFAULT_CHAIN_CACHE_TTL))
+    return ChainQueryCache(path=path, ttl=ttl)
+
+
+def _chain_id(ledger_api: LedgerApi) -> int:
+    """Get the chain id of a ledger API, without a request after the first one."""
+    chain_id = _CHAIN_IDS.get(ledger_api)
+    if chain_id is None:
+        chain_id = _CHAIN_IDS[ledger_api] = ledger_api.api.eth.chain_id
+    return chain_id
+
+
+def cached_contract_call(
+    call: Callable[[], Any],
+    ledger_api: LedgerApi,
+    contract_address: str,
+    method: str,
+    *args: Any,
+) -> Any:
+    """
+    Run a read-only contract call through the chain query cache, if enabled.
+
+    :param call: callable performing the actual contract call
+    :param ledger_api: ledger API object used for the call
+    :param contract_address: address of the contract
+    :param method: name of the contract method
+    :param args: arguments for the contract method
+    :return: the result of the contract call
+    """
+    cache = get_chain_query_cache()
+    if cache is None:
+        return call()
+
+    return cache.fetch(
+        call,
+        "contract",
+        _chain_id(ledger_api),
+        contract_address.lower(),
+        method,
+        args,
+    )
+
+
+def cached_query(
+    call: Callable[[], Any],
+    *parts: Any,
+    permanent: bool = False,
+    should_cache: Optional[Callable[[Any], bool]] = None,
+) -> Any:
+    """Run an off-chain read-only query through the chain query cache, if enabled."""
+    cache = get_chain_query_cache()
+    if cache is None:
+        return call()
+
+    return cache.fetch(call, *parts, permanent=permanent, should_cache=should_cache)
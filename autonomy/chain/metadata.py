@@ -22,7 +22,7 @@
 import json
 from collections import OrderedDict
 from pathlib import Path
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
 from aea.configurations.data_types import PackageId
 from aea.helpers.base import IPFSHash
@@ -57,6 +57,18 @@ def serialize_metadata(
     return json.dumps(obj=metadata, separators=(",", ":"))
 
 
+def publish_nft_image(nft: NFTHashOrPath, ipfs_tool: Optional[IPFSTool] = None) -> str:
+    """Publish the NFT image if required and return its hash."""
+    if isinstance(nft, IPFSHash):
+        return str(nft)
+
+    _, nft_image_hash, _ = (ipfs_tool or IPFSTool()).add(
+        str(nft.resolve()),
+        wrap_with_directory=False,
+    )
+    return to_v1(nft_image_hash)
+
+
 def publish_metadata(
     package_id: PackageId,
     package_path: Path,
@@ -65,15 +77,7 @@ def publish_metadata(
 ) -> Tuple[str, str]:
     """Publish service metadata."""
     ipfs_tool = IPFSTool()
-    if isinstance(nft, IPFSHash):
-        nft_image_hash = str(nft)
-    else:
-        _, nft_image_hash, _ = ipfs_tool.add(
-            str(nft.resolve()),
-            wrap_with_directory=False,
-        )
-        nft_image_hash = to_v1(nft_image_hash)
-
+    nft_image_hash = publish_nft_image(nft=nft, ipfs_tool=ipfs_tool)
     package_hash = IPFSHashOnly.get(file_path=str(package_path))
     metadata_string = serialize_metadata(
         package_hash=package_hash,
@@ -21,6 +21,7 @@
 
 import time
 from datetime import datetime
+from functools import partial
 from math import ceil
 from typing import Callable, Dict, List, Optional, TYPE_CHECKING, Tuple
 
@@ -37,7 +38,7 @@ from autonomy.chain.constants import (
     SERVICE_REGISTRY_CONTRACT,
 )
 from autonomy.chain.exceptions import ComponentMintFailed, InvalidMintParameter
-from autonomy.chain.tx import TxSettler
+from autonomy.chain.tx import TxPipeline, TxSettler
 
 try:
     from web3.exceptions import Web3Exception
@@ -157,15 +158,12 @@ class MintManager:
         )
         tx_dict = tx_settler.transact(dry_run=self.dry_run).tx_dict
         if self.dry_run:
-            print("=== Dry run output ===")
-            print("Method: " + str(method).split(" ")[2])
-            print(f"Contract: {contract_address}")
-            print("Kwargs: ")
-            for key, val in kwargs.items():
-                print(f"    {key}: {val}")
-            print("Transaction: ")
-            for key, val in (tx_dict or {}).items():
-                print(f"    {key}: {val}")
+            self._print_dry_run(
+                method=method,
+                contract_address=contract_address,
+                kwargs=kwargs,
+                tx_dict=tx_dict,
+            )
             return ()
 
         return tx_settler.settle().get_events(
@@ -176,6 +174,37 @@ class MintManager:
             event_name=event,
         )
 
+    @staticmethod
+    def _print_dry_run(
+        method: Callable,
+        contract_address: str,
+        kwargs: Dict,
+        tx_dict: Optional[Dict],
+    ) -> None:
+        """Print the dry run output for a transaction."""
+        print("=== Dry run output ===")
+        print("Method: " + str(method).split(" ")[2])
+        print(f"Contract: {contract_address}")
+        print("Kwargs: ")
+        for key, val in kwargs.items():
+            print(f"    {key}: {val}")
+        print("Transaction: ")
+        for key, val in (tx_dict or {}).items():
+            print(f"    {key}: {val}")
+
+    @staticmethod
+    def _get_unit_id(
+        events: Tuple["EventData", ...], metadata_hash: str
+    ) -> Optional[int]:
+        """Get the unit ID for the given metadata hash from the unit events."""
+        for event in events:
+            if (
+                "unitHash" in event["args"]
+                and event["args"]["unitHash"].hex() == metadata_hash[2:]
+            ):
+                return event["args"]["unitId"]
+        return None
+
     def validate_address(self, address: str) -> str:
         """Validate address string."""
         try:
@@ -212,13 +241,88 @@ class MintManager:
                 else AGENT_REGISTRY_CONTRACT
             ),
         )
-        for event in events:
-            if (
-                "unitHash" in event["args"]
-                and event["args"]["unitHash"].hex() == metadata_hash[2:]
-            ):
-                return event["args"]["unitId"]
-        return None
+        return self._get_unit_id(events=events, metadata_hash=metadata_hash)
+
+    def mint_components(
+        self,
+        components: List[Tuple[str, UnitType, List[int]]],
+        owner: Optional[str] = None,
+    ) -> List[Optional[int]]:
+        """
+        Publish several components on-chain using pipelined transactions.
+
+        The components are minted using consecutive nonces without waiting for
+        the previous mints to settle, so none of them can depend on another one
+        from the same batch.
+
+        :param components: list of (metadata hash, component type, dependencies)
+        :param owner: owner address for the minted components
+        :return: the list of token IDs in the same order as `components`
+        """
+        owner = self.validate_address(owner or self.crypto.address)
+        contract_address = ContractConfigs.get(
+            name=REGISTRIES_MANAGER_CONTRACT.name
+        ).contracts[self.chain_type]
+        method = registry_contracts.registries_manager.get_create_transaction
+        pipeline = TxPipeline(
+            ledger_api=self.ledger_api,
+            crypto=self.crypto,
+            chain_type=self.chain_type,
+            timeout=self.timeout,
+            retries=self.retries,
+            sleep=self.sleep,
+        )
+        batch_kwargs = []
+        for metadata_hash, component_type, dependencies in components:
+            kwargs = dict(
+                owner=owner,
+                component_type=component_type,
+                metadata_hash=metadata_hash,
+                sender=self.crypto.address,
+                dependencies=sorted(set(dependencies)),
+            )
+            pipeline.add(
+                tx_builder=partial(
+                    method,
+                    ledger_api=self.ledger_api,
+                    contract_address=contract_address,
+                    raise_on_try=True,
+                    **kwargs,
+                )
+            )
+            batch_kwargs.append(kwargs)
+
+        pipeline.transact(dry_run=self.dry_run)
+        if self.dry_run:
+            for kwargs, settler in zip(batch_kwargs, pipeline.settlers):
+                self._print_dry_run(
+                    method=method,
+                    contract_address=contract_address,
+                    kwargs=kwargs,
+                    tx_dict=settler.tx_dict,
+                )
+            return [None] * len(components)
+
+        pipeline.settle()
+        token_ids = []
+        for (metadata_hash, component_type, _), settler in zip(
+            components, pipeline.settlers
+        ):
+            events = settler.get_events(
+                contract=registry_contracts.get_contract(
+                    COMPONENT_REGISTRY_CONTRACT
+                    if component_type == UnitType.COMPONENT
+                    else AGENT_REGISTRY_CONTRACT
+                ).get_instance(
+                    ledger_api=self.ledger_api,
+                    contract_address=contract_address,
+                ),
+                event_name="CreateUnit",
+            )
+            token_ids.append(
+                self._get_unit_id(events=events, metadata_hash=metadata_hash)
+            )
+        return token_ids
 
     def update_component(
         self, metadata_hash: str, unit_id: int, component_type: UnitType
@@ -241,13 +345,7 @@ class MintManager:
                 else AGENT_REGISTRY_CONTRACT
             ),
         )
-        for event in events:
-            if (
-                "unitHash" in event["args"]
-                and event["args"]["unitHash"].hex() == metadata_hash[2:]
-            ):
-                return event["args"]["unitId"]
-        return None
+        return self._get_unit_id(events=events, metadata_hash=metadata_hash)
 
     def mint_service(
         self,
@@ -28,6 +28,7 @@ from aea.configurations.data_types import PublicId
 from aea.crypto.base import Crypto, LedgerApi
 
 from autonomy.chain.base import ServiceState, registry_contracts
+from autonomy.chain.cache import cached_contract_call
 from autonomy.chain.config import ChainType, ContractConfigs
 from autonomy.chain.constants import (
     ERC20_CONTRACT,
@@ -110,7 +111,10 @@ def get_poly_safe_deployment_payload(
 
 
 def get_agent_instances(
-    ledger_api: LedgerApi, chain_type: ChainType, token_id: int
+    ledger_api: LedgerApi,
+    chain_type: ChainType,
+    token_id: int,
+    use_cache: bool = False,
 ) -> Dict:
     """
     Get the list of agent instances.
@@ -118,20 +122,34 @@ def get_agent_instances(
     :param ledger_api: `aea.crypto.LedgerApi` object for interacting with the chain
     :param chain_type: Chain type
     :param token_id: Token ID pointing to the on-chain service
+    :param use_cache: use the chain query cache, if enabled
     :returns: number of agent instances and the list of registered addressed
     """
 
-    return registry_contracts.service_registry.get_agent_instances(
-        ledger_api=ledger_api,
-        contract_address=ContractConfigs.get(SERVICE_REGISTRY_CONTRACT.name).contracts[
-            chain_type
-        ],
-        service_id=token_id,
+    contract_address = ContractConfigs.get(SERVICE_REGISTRY_CONTRACT.name).contracts[
+        chain_type
+    ]
+
+    def _call() -> Dict:
+        return registry_contracts.service_registry.get_agent_instances(
+            ledger_api=ledger_api,
+            contract_address=contract_address,
+            service_id=token_id,
+        )
+
+    if not use_cache:
+        return _call()
+
+    return cached_contract_call(
+        _call, ledger_api, contract_address, "getAgentInstances", token_id
     )
 
 
 def get_service_info(
-    ledger_api: LedgerApi, chain_type: ChainType, token_id: int
+    ledger_api: LedgerApi,
+    chain_type: ChainType,
+    token_id: int,
+    use_cache: bool = False,
 ) -> ServiceInfo:
     """
     Returns service info.
@@ -139,17 +157,28 @@ def get_service_info(
     :param ledger_api: `aea.crypto.LedgerApi` object for interacting with the chain
     :param chain_type: Chain type
     :param token_id: Token ID pointing to the on-chain service
+    :param use_cache: use the chain query cache, if enabled
     :returns: security deposit, multisig address, IPFS hash for config,
             threshold, max number of agent instances, number of agent instances,
             service state, list of cannonical agents
     """
 
-    return registry_contracts.service_registry.get_service_information(
-        ledger_api=ledger_api,
-        contract_address=ContractConfigs.get(SERVICE_REGISTRY_CONTRACT.name).contracts[
-            chain_type
-        ],
-        token_id=token_id,
+    contract_address = ContractConfigs.get(SERVICE_REGISTRY_CONTRACT.name).contracts[
+        chain_type
+    ]
+
+    def _call() -> ServiceInfo:
+        return registry_contracts.service_registry.get_service_information(
+            ledger_api=ledger_api,
+            contract_address=contract_address,
+            token_id=token_id,
+        )
+
+    if not use_cache:
+        return _call()
+
+    return cached_contract_call(
+        _call, ledger_api, contract_address, "getService", token_id
     )
 
 
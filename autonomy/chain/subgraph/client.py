@@ -26,6 +26,7 @@ from typing import List, Optional, TypedDict, cast
 from aea.configurations.data_types import PackageId, PackageType
 from aea.helpers.http_requests import post
 
+from autonomy.chain.cache import cached_query
 from autonomy.chain.subgraph.queries import (
     FIND_BY_PACKAGE_HASH,
     FIND_BY_PUBLIC_ID,
@@ -61,6 +62,21 @@ class SubgraphClient:
 
     def _query(self, query: str) -> UnitContainer:
         """Perform a query"""
+        # Empty results are not cached since the queried unit may be minted
+        # and indexed at any time
+        return cast(
+            UnitContainer,
+            cached_query(
+                lambda: self._request(query=query),
+                "subgraph",
+                self._url,
+                query,
+                should_cache=lambda data: len(data.get("units", [])) > 0,
+            ),
+        )
+
+    def _request(self, query: str) -> UnitContainer:
+        """Send a query request to the subgraph"""
         # Cloudflare fronts the default subgraph and 403s requests without
         # a User-Agent; urllib (used by aea.helpers.http_requests) sends
         # none by default, so set one explicitly.
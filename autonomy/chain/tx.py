@@ -22,7 +22,7 @@
 import math
 import time
 from datetime import datetime
-from typing import Any, Callable, Dict, Optional, TYPE_CHECKING, cast
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, Tuple, cast
 
 from aea.crypto.base import Crypto, LedgerApi
 from aea.helpers.logging import setup_logger
@@ -38,6 +38,11 @@ from autonomy.chain.exceptions import (
     get_requests_connection_error,
 )
 
+try:
+    from web3.exceptions import TransactionNotFound
+except (ModuleNotFoundError, ImportError):
+    TransactionNotFound = Exception
+
 if TYPE_CHECKING:
     from web3.contract import Contract
     from web3.types import EventData, TxReceipt
@@ -49,6 +54,7 @@ DEFAULT_ON_CHAIN_INTERACT_RETRIES = 5
 DEFAULT_ON_CHAIN_INTERACT_SLEEP = 3.0
 DEFAULT_GAS_PRICE_MULTIPLIER = 1.0
 DEFAULT_GAS_ESTIMATE_MULTIPLIER = 1.0
+REPLACEMENT_GAS_PRICE_BUMP = 1.125
 DEFAULT_MISSING_EVENT_EXCEPTION = Exception(
     "Could not verify transaction. Event not found."
 )
@@ -115,12 +121,14 @@ class TxSettler:  # pylint: disable=too-many-instance-attributes
         sleep: Optional[float] = None,
         gas_price_multiplier: Optional[float] = None,
         gas_estimate_multiplier: Optional[float] = None,
+        nonce: Optional[int] = None,
     ) -> None:
         """Initialize object."""
         self.chain_type = chain_type
         self.ledger_api = ledger_api
         self.crypto = crypto
         self.tx_builder = tx_builder
+        self.nonce = nonce
         self.timeout = timeout or DEFAULT_ON_CHAIN_INTERACT_TIMEOUT
         self.retries = retries or DEFAULT_ON_CHAIN_INTERACT_RETRIES
         self.sleep = sleep or DEFAULT_ON_CHAIN_INTERACT_SLEEP
@@ -201,6 +209,9 @@ class TxSettler:  # pylint: disable=too-many-instance-attributes
                 if self.tx_dict is None:
                     raise TxBuildError("Got empty transaction")
 
+                if self.nonce is not None:  # Nonce assigned by the caller
+                    self.tx_dict["nonce"] = self.nonce
+
                 if dry_run:  # Return with only the transaction dict on dry-run
                     return self
 
@@ -253,11 +264,16 @@ class TxSettler:  # pylint: disable=too-many-instance-attributes
             timeout=self.timeout,
             poll_latency=self.sleep,
         )
+        self.wait_for_rpc_sync(block_number=self.tx_receipt.blockNumber)
+        return self
+
+    def wait_for_rpc_sync(self, block_number: int) -> None:
+        """Wait for the RPC state to reach the given block."""
         rpc_sync_check_deadline = datetime.now().timestamp() + self.timeout
         retries = 0
-        while self.ledger_api.api.eth.block_number < self.tx_receipt.blockNumber:
+        while self.ledger_api.api.eth.block_number < block_number:
             logger.warning(
-                f"RPC state not synced with block {self.tx_receipt.blockNumber}. "
+                f"RPC state not synced with block {block_number}. "
                 f"Retrying in {self.sleep} seconds..."
             )
             time.sleep(self.sleep)
@@ -265,18 +281,16 @@ class TxSettler:  # pylint: disable=too-many-instance-attributes
 
             if retries > self.retries:
                 raise ChainTimeoutError(
-                    f"RPC node not synced with block {self.tx_receipt.blockNumber} "
+                    f"RPC node not synced with block {block_number} "
                     f"after {self.retries} retries."
                 )
 
             if datetime.now().timestamp() >= rpc_sync_check_deadline:
                 raise ChainTimeoutError(
-                    f"RPC node not synced with block {self.tx_receipt.blockNumber} "
+                    f"RPC node not synced with block {block_number} "
                     f"after {self.timeout} seconds."
                 )
 
-        return self
-
     def get_events(
         self,
         contract: "Contract",
@@ -313,3 +327,154 @@ class TxSettler:  # pylint: disable=too-many-instance-attributes
             f"Could not find event '{event_name}' with argument '{expected_event_arg_name}: "
             f"{expected_event_arg_value}' in the tx with hash {self.tx_hash}"
         )
+
+
+class TxPipeline:  # pylint: disable=too-many-instance-attributes
+    """Pipelined tx settlement helper.
+
+    Assigns consecutive nonces locally, broadcasts the transactions back-to-back
+    and tracks their receipts together instead of waiting for each transaction
+    to be mined before sending the next one. Since every transaction is built
+    before any of them is mined, the pipelined transactions must not depend on
+    each other's on-chain effects.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        ledger_api: LedgerApi,
+        crypto: Crypto,
+        chain_type: ChainType,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        sleep: Optional[float] = None,
+        gas_price_multiplier: Optional[float] = None,
+        gas_estimate_multiplier: Optional[float] = None,
+    ) -> None:
+        """Initialize object."""
+        self.chain_type = chain_type
+        self.ledger_api = ledger_api
+        self.crypto = crypto
+        self.timeout = timeout or DEFAULT_ON_CHAIN_INTERACT_TIMEOUT
+        self.retries = retries or DEFAULT_ON_CHAIN_INTERACT_RETRIES
+        self.sleep = sleep or DEFAULT_ON_CHAIN_INTERACT_SLEEP
+        self.gas_price_multiplier = gas_price_multiplier
+        self.gas_estimate_multiplier = gas_estimate_multiplier
+        self.settlers: List[TxSettler] = []
+        self._tx_hashes: Dict[int, List[str]] = {}
+
+    def add(self, tx_builder: Callable[[], Dict]) -> TxSettler:
+        """Add a transaction to the pipeline and return its settler."""
+        settler = TxSettler(
+            ledger_api=self.ledger_api,
+            crypto=self.crypto,
+            chain_type=self.chain_type,
+            tx_builder=tx_builder,
+            timeout=self.timeout,
+            retries=self.retries,
+            sleep=self.sleep,
+            gas_price_multiplier=self.gas_price_multiplier,
+            gas_estimate_multiplier=self.gas_estimate_multiplier,
+        )
+        self.settlers.append(settler)
+        return settler
+
+    def _send(self, settler: TxSettler) -> None:
+        """Send a transaction and keep track of its hash."""
+        settler.transact()
+        tx_hashes = self._tx_hashes.setdefault(cast(int, settler.nonce), [])
+        if settler.tx_hash is not None and settler.tx_hash not in tx_hashes:
+            tx_hashes.append(settler.tx_hash)
+
+    def transact(self, dry_run: bool = False) -> "TxPipeline":
+        """Assign consecutive nonces and broadcast all the transactions."""
+        if dry_run:
+            for settler in self.settlers:
+                settler.transact(dry_run=True)
+            return self
+
+        try:
+            nonce = self.ledger_api.api.eth.get_transaction_count(
+                self.crypto.address, "pending"
+            )
+        except get_requests_connection_error() as e:
+            raise RPCError("Cannot connect to the given RPC") from e
+
+        for settler in self.settlers:
+            settler.nonce = nonce
+            nonce += 1
+            self._send(settler)
+        return self
+
+    def _get_receipt(self, nonce: int) -> Optional[Tuple[str, "TxReceipt"]]:
+        """Get the receipt of any of the transactions sent with the given nonce."""
+        for tx_hash in reversed(self._tx_hashes.get(nonce, [])):
+            try:
+                receipt = self.ledger_api.api.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                continue
+            if receipt is not None:
+                return tx_hash, receipt
+        return None
+
+    def _replace(self, settler: TxSettler) -> None:
+        """Replace a stuck transaction with a repriced one using the same nonce."""
+        logger.warning(
+            f"Transaction with nonce {settler.nonce} not mined after {self.timeout} "
+            "seconds; replacing it with a repriced one..."
+        )
+        settler.gas_price_multiplier *= REPLACEMENT_GAS_PRICE_BUMP
+        settler.tx_hash = None
+        try:
+            self._send(settler)
+        except ChainTimeoutError as e:
+            # The replaced transaction may have been mined in the meantime,
+            # keep tracking the hashes already sent with this nonce
+            logger.warning(f"Could not replace transaction: {e}")
+
+    def settle(self) -> "TxPipeline":
+        """Wait for all the transactions to be mined."""
+        pending = {
+            cast(int, settler.nonce): settler
+            for settler in self.settlers
+            if settler.tx_receipt is None
+        }
+        if any(len(self._tx_hashes.get(nonce, [])) == 0 for nonce in pending):
+            raise TxSettleError("Cannot settle the transactions before they are sent.")
+
+        replacements = 0
+        deadline = datetime.now().timestamp() + self.timeout
+        while True:
+            for nonce, settler in list(pending.items()):
+                mined = self._get_receipt(nonce)
+                if mined is None:
+                    continue
+                settler.tx_hash, settler.tx_receipt = mined
+                del pending[nonce]
+
+            if len(pending) == 0:
+                break
+
+            if datetime.now().timestamp() < deadline:
+                time.sleep(self.sleep)
+                continue
+
+            if replacements >= self.retries:
+                raise ChainTimeoutError(
+                    f"{len(pending)} transaction(s) not mined after "
+                    f"{self.retries} replacements"
+                )
+
+            replacements += 1
+            for settler in pending.values():
+                self._replace(settler)
+            deadline = datetime.now().timestamp() + self.timeout
+
+        if len(self.settlers) > 0:
+            latest = max(
+                self.settlers,
+                key=lambda settler: cast("TxReceipt", settler.tx_receipt).blockNumber,
+            )
+            latest.wait_for_rpc_sync(
+                block_number=cast("TxReceipt", latest.tx_receipt).blockNumber
+            )
+        return self
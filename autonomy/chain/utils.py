@@ -28,6 +28,7 @@ from aea.helpers.http_requests import ConnectionError as AeaHttpConnectionError
 from aea.helpers.http_requests import get as r_get
 
 from autonomy.chain.base import registry_contracts
+from autonomy.chain.cache import cached_contract_call, cached_query
 from autonomy.chain.constants import SERVICE_MANAGER_TOKEN_COMPATIBLE_CHAINS
 from autonomy.chain.exceptions import (
     DependencyError,
@@ -37,6 +38,8 @@ from autonomy.chain.exceptions import (
 from autonomy.chain.metadata import IPFS_URI_PREFIX
 from autonomy.constants import OLAS_DOCS_URL
 
+IPFS_PATH = "/ipfs/"
+
 
 def get_ipfs_hash_from_uri(uri: str) -> str:
     """Split IPFS hash from the ipfs uri"""
@@ -50,6 +53,7 @@ def resolve_component_id(
     token_id: int,
     is_agent: bool = False,
     is_service: bool = False,
+    use_cache: bool = False,
 ) -> Dict:
     """Resolve component ID to metadata json"""
 
@@ -61,10 +65,19 @@ def resolve_component_id(
         else:
             token_uri_callable = registry_contracts.component_registry.get_token_uri
 
-        metadata_uri = token_uri_callable(
-            ledger_api=ledger_api,
-            contract_address=contract_address,
-            token_id=token_id,
+        def _get_token_uri() -> str:
+            return token_uri_callable(
+                ledger_api=ledger_api,
+                contract_address=contract_address,
+                token_id=token_id,
+            )
+
+        metadata_uri = (
+            cached_contract_call(
+                _get_token_uri, ledger_api, contract_address, "tokenURI", token_id
+            )
+            if use_cache
+            else _get_token_uri()
         )
     except get_requests_connection_error() as e:
         raise FailedToRetrieveComponentMetadata(
@@ -73,8 +86,19 @@ def resolve_component_id(
             f"You can read more about the configurations on {OLAS_DOCS_URL}/open-autonomy/advanced_reference/commands/autonomy_service/#options."
         ) from e
 
-    try:
+    def _get_metadata() -> Dict:
         return r_get(url=metadata_uri, timeout=30).json()
+
+    try:
+        if not use_cache:
+            return _get_metadata()
+        # Metadata served from an IPFS path is content addressed
+        return cached_query(
+            _get_metadata,
+            "metadata",
+            metadata_uri,
+            permanent=IPFS_PATH in metadata_uri,
+        )
     except AeaHttpConnectionError as e:
         raise FailedToRetrieveComponentMetadata(
             "Error connecting to the IPFS gateway"
@@ -19,6 +19,7 @@
 
 """Analyse CLI module."""
 
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, cast
@@ -31,7 +32,12 @@ from aea.cli.utils.decorators import pass_ctx
 from aea.configurations.constants import PACKAGES
 from aea.configurations.data_types import PublicId
 
-from autonomy.analyse.benchmark.aggregate import BlockTypes, aggregate
+from autonomy.analyse.benchmark.aggregate import BlockTypes, OutputFormats, aggregate
+from autonomy.analyse.benchmark.compare import (
+    DEFAULT_MIN_CHANGE,
+    DEFAULT_SIGNIFICANCE_LEVEL,
+    compare_and_write,
+)
 from autonomy.analyse.handlers import check_handlers
 from autonomy.analyse.logs.base import TIME_FORMAT
 from autonomy.chain.config import ChainType
@@ -251,6 +257,32 @@ def docstrings(ctx: Context, update: bool) -> None:
     type=str,
     help="Regex pattern to exclude from the result.",
 )
+@click.option(
+    "--search",
+    type=str,
+    help="Full-text search query on the log messages (SQLite FTS5 syntax).",
+)
+@click.option(
+    "--follow",
+    is_flag=True,
+    help="Keep ingesting and printing the lines appended to the log files.",
+)
+@click.option(
+    "--slowest-rounds",
+    type=int,
+    help="Print the N slowest round instances across the agents.",
+)
+@click.option(
+    "--timeouts",
+    "round_timeouts",
+    is_flag=True,
+    help="Print the timeout frequency of each round across the agents.",
+)
+@click.option(
+    "--critical-path",
+    is_flag=True,
+    help="Print the slowest agent of each round instance, per period.",
+)
 def _parse_logs(
     logs_dir: Optional[Path],
     agents: List[str],
@@ -262,8 +294,13 @@ def _parse_logs(
     behaviour_name: Optional[str],
     include_regexes: List[str],
     exclude_regexes: List[str],
+    search: Optional[str] = None,
     reset_db: bool = False,
     fsm_path: bool = False,
+    follow: bool = False,
+    slowest_rounds: Optional[int] = None,
+    round_timeouts: bool = False,
+    critical_path: bool = False,
 ) -> None:
     """A tool for analysing autonomous agent runtime logs"""
 
@@ -279,19 +316,34 @@ def _parse_logs(
         )
 
     parser.create_tables(reset=reset_db)
-    selection = (
-        parser.select(
-            agents=agents,
-            start_time=start_time,
-            end_time=end_time,
-            log_level=log_level,
-            period=period,
-            round_name=round_name,
-            behaviour_name=behaviour_name,
+    if slowest_rounds is not None:
+        return parser.slowest_rounds(
+            agents=agents, limit=slowest_rounds, period=period, round_name=round_name
         )
-        .re_include(regexes=include_regexes)
-        .re_exclude(regexes=exclude_regexes)
-    )
+
+    if round_timeouts:
+        return parser.round_timeouts(
+            agents=agents, period=period, round_name=round_name
+        )
+
+    if critical_path:
+        return parser.critical_path(agents=agents, period=period)
+
+    filters = {
+        "start_time": start_time,
+        "end_time": end_time,
+        "log_level": log_level,
+        "period": period,
+        "round_name": round_name,
+        "behaviour_name": behaviour_name,
+        "include_regexes": include_regexes,
+        "exclude_regexes": exclude_regexes,
+        "search": search,
+    }
+    with reraise_as_click_exception(ValueError, sqlite3.OperationalError):
+        if follow:
+            return parser.follow(agents=agents, **filters)
+        selection = parser.select(agents=agents, **filters)
 
     if fsm_path:
         return selection.execution_path()
@@ -404,13 +456,97 @@ def _check_dialogues(
     "--output",
     "-o",
     type=click.types.Path(file_okay=True, dir_okay=False, resolve_path=True),
-    default=BENCHMARKS_DIR,
+    default=None,
+    help=f"Output file. Defaults to `{BENCHMARKS_DIR}` with the extension of the format.",
 )
-def benchmark(path: Path, block_type: str, period: int, output: Path) -> None:
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(choices=OutputFormats.formats, case_sensitive=True),
+    default=OutputFormats.HTML,
+    help="Output format.",
+)
+@click.option(
+    "--compare",
+    "baseline",
+    type=click.types.Path(exists=True, file_okay=False, resolve_path=True),
+    default=None,
+    help="Baseline benchmarks directory to compare PATH against.",
+)
+@click.option(
+    "--significance-level",
+    type=float,
+    default=DEFAULT_SIGNIFICANCE_LEVEL,
+    show_default=True,
+    help="Significance level for flagging a regression when comparing.",
+)
+@click.option(
+    "--min-change",
+    type=float,
+    default=DEFAULT_MIN_CHANGE,
+    show_default=True,
+    help="Minimum relative change of the median for flagging a regression when comparing.",
+)
+@click.option(
+    "--fail-on-regression",
+    is_flag=True,
+    help="Exit with an error if a regression is found when comparing.",
+)
+def benchmark(  # pylint: disable=too-many-arguments
+    path: Path,
+    block_type: str,
+    period: int,
+    output: Optional[Path],
+    output_format: str,
+    baseline: Optional[Path],
+    significance_level: float,
+    min_change: float,
+    fail_on_regression: bool,
+) -> None:
     """Benchmark aggregator."""
 
+    output = (
+        BENCHMARKS_DIR.with_suffix(f".{output_format}")
+        if output is None
+        else Path(output)
+    )
+    if baseline is None:
+        with reraise_as_click_exception(Exception):
+            aggregate(
+                path=path,
+                block_type=block_type,
+                period=period,
+                output=output,
+                output_format=output_format,
+            )
+        return
+
     with reraise_as_click_exception(Exception):
-        aggregate(path=path, block_type=block_type, period=period, output=Path(output))
+        regressions = compare_and_write(
+            baseline=Path(baseline),
+            candidate=Path(path),
+            block_type=block_type,
+            period=period,
+            output=output,
+            output_format=output_format,
+            significance_level=significance_level,
+            min_change=min_change,
+        )
+
+    if len(regressions) == 0:
+        click.echo("No regressions found.")
+        return
+
+    click.echo(f"Found {len(regressions)} regression(s):")
+    for row in regressions:
+        change = "n/a" if row["change"] is None else f"{row['change']:+.1%}"
+        click.echo(
+            f"- {row['behaviour']} ({row['block']}): "
+            f"p50 {row['baseline_p50']:.6f}s -> {row['candidate_p50']:.6f}s "
+            f"({change}, p={row['p_value']:.4f})"
+        )
+    if fail_on_regression:
+        raise click.ClickException("Benchmark regressions found.")
 
 
 @analyse_group.command(name="service")
@@ -19,11 +19,11 @@
 
 """Helpers for analyse command"""
 
-import re
 import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, cast
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, cast
 
 import click
 from aea.components.base import load_aea_package
@@ -61,6 +61,8 @@ from autonomy.cli.utils.click_utils import sys_path_patch
 from autonomy.configurations.base import PACKAGE_TYPE_TO_CONFIG_CLASS, Service
 from autonomy.constants import ABSTRACT_ROUND_ABCI_SKILL_WITH_HASH
 
+FOLLOW_INTERVAL = 1.0
+
 
 def load_package_tree(packages_dir: Path) -> None:
     """Load package tree."""
@@ -144,19 +146,16 @@ class ParseLogs:
 
         return self
 
-    def create_tables(self, reset: bool = False) -> "ParseLogs":
-        """Create required tables."""
-
-        for agent, db in self._dbs.items():
-            db_exists = db.exists()
-            if db_exists and not reset:
-                continue
+    def create_tables(
+        self, reset: bool = False, max_workers: Optional[int] = None
+    ) -> "ParseLogs":
+        """Create required tables, or ingest the logs appended since the last run."""
 
-            self._collection.create_agent_db(
-                agent=agent,
-                db=db,
-                reset=reset,
-            )
+        self._collection.create_agent_dbs(
+            dbs=self._dbs,
+            reset=reset,
+            max_workers=max_workers,
+        )
 
         return self
 
@@ -169,6 +168,9 @@ class ParseLogs:
         period: Optional[int],
         round_name: Optional[str],
         behaviour_name: Optional[str],
+        include_regexes: Sequence[str] = (),
+        exclude_regexes: Sequence[str] = (),
+        search: Optional[str] = None,
     ) -> "ParseLogs":
         """Query and return results."""
 
@@ -181,41 +183,47 @@ class ParseLogs:
                 period=period,
                 round_name=round_name,
                 behaviour_name=behaviour_name,
+                include_regexes=include_regexes,
+                exclude_regexes=exclude_regexes,
+                search=search,
             )
 
         self.results = results
         return self
 
-    def re_include(self, regexes: List[str]) -> "ParseLogs":
-        """Apply a set of regexes on the result."""
-        if len(regexes) == 0:
-            return self
-
-        compiled_re = [re.compile(pattern) for pattern in regexes]
-
-        def _apply_filter(row: LogRow) -> bool:
-            return any(map(lambda _re: _re.match(row[2]) is not None, compiled_re))
-
-        for agent, logs in self.results.items():
-            self.results[agent] = list(filter(_apply_filter, logs))
-
-        return self
-
-    def re_exclude(self, regexes: List[str]) -> "ParseLogs":
-        """Apply a set of regexes on the result."""
-
-        if len(regexes) == 0:
-            return self
-
-        compiled_re = [re.compile(pattern) for pattern in regexes]
-
-        def _apply_filter(row: LogRow) -> bool:
-            return any(map(lambda _re: _re.match(row[2]) is None, compiled_re))
-
-        for agent, logs in self.results.items():
-            self.results[agent] = list(filter(_apply_filter, logs))
-
-        return self
+    def follow(
+        self,
+        agents: List[str],
+        interval: float = FOLLOW_INTERVAL,
+        **filters: Any,
+    ) -> None:
+        """
+        Print the selected logs, then keep ingesting and printing the appended ones.
+
+        The last log block of each agent is printed once the next one is appended,
+        as more lines may still be appended to it.
+
+        :param agents: the agents to follow.
+        :param interval: the interval between ingestions, in seconds.
+        :param filters: the filters of the selection.
+        """
+
+        start_rowids = dict.fromkeys(agents, 1)
+        while True:
+            for agent in agents:
+                db = self._dbs[agent]
+                progress = db.get_progress()
+                if progress is None or progress.rowid is None:
+                    continue
+                for timestamp, log_level, message, _, _, _ in db.select(
+                    start_rowid=start_rowids[agent],
+                    end_rowid=progress.rowid,
+                    **filters,
+                ):
+                    click.echo(f"[{agent}][{timestamp}][{log_level}] {message}")
+                start_rowids[agent] = progress.rowid
+            time.sleep(interval)
+            self.create_tables(max_workers=1)
 
     def execution_path(self) -> None:
         """Output FSM path"""
@@ -236,6 +244,94 @@ class ParseLogs:
                     click.echo(f"| |_ {round_name} | {exit_event}")
             click.echo("|_ End\n")
 
+    def slowest_rounds(
+        self,
+        agents: List[str],
+        limit: int,
+        period: Optional[int] = None,
+        round_name: Optional[str] = None,
+    ) -> None:
+        """Print the slowest round instances across the agents."""
+
+        rounds = [
+            (agent, *row)
+            for agent in agents
+            for row in self._dbs[agent].rounds(
+                period=period, round_name=round_name, slowest=True, limit=limit
+            )
+            if row[4] is not None
+        ]
+        rounds.sort(key=lambda row: row[5], reverse=True)
+        click.echo("agent | period | round | start time | duration (s) | exit event")
+        for agent, _period, _round, start_time, _, duration, event in rounds[:limit]:
+            click.echo(
+                f"{agent} | {_period} | {_round} | {start_time} | {duration:.3f} | {event}"
+            )
+
+    def round_timeouts(
+        self,
+        agents: List[str],
+        period: Optional[int] = None,
+        round_name: Optional[str] = None,
+    ) -> None:
+        """Print the timeout frequency of each round across the agents."""
+
+        counts: Dict[str, List[int]] = {}
+        for agent in agents:
+            for _round, instances, timeouts in self._dbs[agent].round_timeouts(
+                period=period, round_name=round_name
+            ):
+                count = counts.setdefault(_round, [0, 0])
+                count[0] += instances
+                count[1] += timeouts
+
+        click.echo("round | instances | timeouts | timeout rate")
+        for _round, (instances, timeouts) in sorted(
+            counts.items(), key=lambda item: item[1][1] / item[1][0], reverse=True
+        ):
+            click.echo(
+                f"{_round} | {instances} | {timeouts} | {timeouts / instances:.2%}"
+            )
+
+    def critical_path(self, agents: List[str], period: Optional[int] = None) -> None:
+        """
+        Print the critical path of each period across the agents.
+
+        The instances of a round are matched across the agents by their order in the
+        period, and the slowest agent of each instance is on the critical path.
+
+        :param agents: the agents to compare.
+        :param period: the period to print the critical path of.
+        """
+
+        # the instances of each (period, round, occurrence) across the agents
+        instances: Dict[Tuple[int, str, int], List[Tuple[float, datetime, str]]] = {}
+        for agent in agents:
+            occurrences: Dict[Tuple[int, str], int] = {}
+            for _period, _round, start_time, _, duration, _ in self._dbs[agent].rounds(
+                period=period
+            ):
+                occurrence = occurrences.get((_period, _round), 0)
+                occurrences[(_period, _round)] = occurrence + 1
+                if duration is not None:
+                    instances.setdefault((_period, _round, occurrence), []).append(
+                        (duration, start_time, agent)
+                    )
+
+        paths: Dict[int, List[Tuple[datetime, str, str, float]]] = {}
+        for (_period, _round, _), steps in instances.items():
+            duration, _, agent = max(steps)
+            start_time = min(start_time for _, start_time, _ in steps)
+            paths.setdefault(_period, []).append((start_time, _round, agent, duration))
+
+        for _period, path in sorted(paths.items()):
+            path.sort()
+            total = sum(duration for *_, duration in path)
+            click.echo(f"|_ Period {_period} | {total:.3f}s")
+            for _, _round, agent, duration in path:
+                click.echo(f"| |_ {_round} | {agent} | {duration:.3f}s")
+        click.echo("|_ End\n")
+
     def table(self) -> None:
         """Print table."""
 
@@ -383,6 +479,7 @@ def _get_on_chain_service_id(
         contract_address=ContractConfigs.service_registry.contracts[chain_type],
         token_id=cast(int, token_id),
         is_service=True,
+        use_cache=True,
     )
     package_hash = cast(str, service_info["code_uri"]).replace("ipfs://", "")
     public_id = PublicId.from_str(service_info["name"]).with_hash(
@@ -19,15 +19,19 @@
 
 """On-chain interaction helpers."""
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, cast
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, cast
 
 import click
 from aea.configurations.base import PackageConfiguration
 from aea.configurations.data_types import PackageId, PackageType, PublicId
 from aea.configurations.loader import load_configuration_object
 from aea.helpers.base import IPFSHash
+from aea.helpers.dependency_tree import DependencyTree
 from aea.helpers.http_requests import ConnectionError as HttpConnectionError
+from aea.helpers.ipfs.base import IPFSHashOnly
 
 from autonomy.chain.base import ServiceState, UnitType
 from autonomy.chain.config import ChainType, ContractConfigs, OnChainHelper
@@ -38,7 +42,11 @@ from autonomy.chain.constants import (
     SERVICE_REGISTRY_TOKEN_UTILITY_CONTRACT,
 )
 from autonomy.chain.exceptions import ChainInteractionError
-from autonomy.chain.metadata import NFTHashOrPath, publish_metadata
+from autonomy.chain.metadata import (
+    NFTHashOrPath,
+    publish_metadata,
+    publish_nft_image,
+)
 from autonomy.chain.mint import DEFAULT_NFT_IMAGE_HASH, MintManager
 from autonomy.chain.service import (
     ServiceManager,
@@ -56,6 +64,58 @@ from autonomy.chain.utils import (
 )
 from autonomy.configurations.base import PACKAGE_TYPE_TO_CONFIG_CLASS, Service
 
+MINTABLE_PACKAGE_TYPES = (
+    PackageType.PROTOCOL,
+    PackageType.CONTRACT,
+    PackageType.CONNECTION,
+    PackageType.SKILL,
+    PackageType.AGENT,
+)
+PACKAGES_FILE = "packages.json"
+DEFAULT_PUBLISH_WORKERS = 8
+DRY_RUN_TOKEN_ID = 0  # unit IDs start from 1, so this never clashes with a minted unit
+
+
+def get_mint_order(packages_dir: Path) -> List[List[PackageId]]:
+    """
+    Get the mintable packages from a packages directory in dependency order.
+
+    Packages are grouped so that every package only depends on packages from
+    the previous groups, which means the packages in a group can be minted
+    together. If the directory has a `packages.json` file, only the `dev`
+    packages are included.
+
+    :param packages_dir: path to the packages directory
+    :return: the list of package groups
+    """
+    dev_packages: Optional[Set[PackageId]] = None
+    packages_file = packages_dir / PACKAGES_FILE
+    if packages_file.exists():
+        dev_packages = set(
+            map(
+                PackageId.from_uri_path,
+                json.loads(packages_file.read_text(encoding="utf-8"))["dev"],
+            )
+        )
+
+    mint_order = []
+    for level in DependencyTree.generate(packages_dir):
+        packages = [
+            package_id
+            for package_id in level
+            if package_id.package_type in MINTABLE_PACKAGE_TYPES
+            and (dev_packages is None or package_id in dev_packages)
+            and (
+                packages_dir
+                / package_id.author
+                / package_id.package_type.to_plural()
+                / package_id.name
+            ).exists()
+        ]
+        if len(packages) > 0:
+            mint_order.append(sorted(packages, key=str))
+    return mint_order
+
 
 class MintHelper(OnChainHelper):  # pylint: disable=too-many-instance-attributes
     """Mint helper."""
@@ -197,27 +257,63 @@ class MintHelper(OnChainHelper):  # pylint: disable=too-many-instance-attributes
             self.dependencies = []
             return self
 
+        self.dependencies = sorted(
+            self._get_dependency_token_id(package_id=package_id)
+            for package_id in self._get_package_dependencies(
+                package_configuration=self.package_configuration
+            )
+        )
+        return self
+
+    @staticmethod
+    def _get_package_dependencies(
+        package_configuration: PackageConfiguration,
+    ) -> List[PackageId]:
+        """Get the dependencies of a package configuration."""
         dependencies = []
+        for ptype in PackageType:
+            if not hasattr(package_configuration, ptype.to_plural()):
+                continue
+            for dependency in getattr(package_configuration, ptype.to_plural()):
+                dependencies.append(PackageId(package_type=ptype, public_id=dependency))
+        return dependencies
+
+    def _find_token_id(
+        self, package_id: PackageId, package_hash: Optional[str] = None
+    ) -> Optional[int]:
+        """
+        Find the on-chain token ID for a package using the subgraph, if it is minted.
+
+        :param package_id: the id of the package.
+        :param package_hash: if given, only a unit minted with this exact package hash is considered.
+        :return: the token ID, or `None` if the package is not minted.
+        """
         try:
-            for ptype in PackageType:
-                if not hasattr(self.package_configuration, ptype.to_plural()):
-                    continue
-                for dependency in getattr(
-                    self.package_configuration, ptype.to_plural()
-                ):
-                    units = self.subgraph.get_record_by_package_id(
-                        package_id=PackageId(package_type=ptype, public_id=dependency)
-                    ).get("units", [])
-                    if len(units) == 0:
-                        raise click.ClickException(
-                            f"Could not find on-chain token for {dependency} of type {ptype}"
-                        )
-                    unit, *_ = sorted(units, key=lambda x: x["tokenId"])
-                    dependencies.append(unit["tokenId"])
-            self.dependencies = sorted(list(map(int, dependencies)))
+            if package_hash is None:
+                container = self.subgraph.get_record_by_package_id(
+                    package_id=package_id
+                )
+            else:
+                container = self.subgraph.get_record_by_package_hash(
+                    package_hash=package_hash
+                )
+            units = container.get("units", [])
         except HttpConnectionError as e:
             raise click.ClickException(message=f"Error interacting with subgraph; {e}")
-        return self
+        if len(units) == 0:
+            return None
+        unit, *_ = sorted(units, key=lambda x: x["tokenId"])
+        return int(unit["tokenId"])
+
+    def _get_dependency_token_id(self, package_id: PackageId) -> int:
+        """Get the on-chain token ID for a dependency using the subgraph."""
+        token_id = self._find_token_id(package_id=package_id)
+        if token_id is None:
+            raise click.ClickException(
+                f"Could not find on-chain token for {package_id.public_id} "
+                f"of type {package_id.package_type}"
+            )
+        return token_id
 
     def verify_service_dependencies(self, agent_id: int) -> "MintHelper":
         """Verify component dependencies."""
@@ -309,6 +405,159 @@ class MintHelper(OnChainHelper):  # pylint: disable=too-many-instance-attributes
             component_type=UnitType.AGENT,
         )
 
+    def _publish_packages_metadata(
+        self, packages: List[Tuple[PackageConfiguration, Path]]
+    ) -> List[Tuple[str, str]]:
+        """Publish the metadata for several packages concurrently."""
+        nft = IPFSHash(publish_nft_image(nft=self.nft))
+        with ThreadPoolExecutor(
+            max_workers=min(DEFAULT_PUBLISH_WORKERS, len(packages))
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda package: publish_metadata(
+                        package_id=package[0].package_id,
+                        package_path=package[1],
+                        nft=nft,
+                        description=package[0].description,
+                    ),
+                    packages,
+                )
+            )
+
+    def mint_packages(
+        self,
+        packages_dir: Path,
+        owner: Optional[str] = None,
+    ) -> None:
+        """Mint all the components and agents from a packages directory."""
+
+        self.check_required_environment_variables(
+            configs=(
+                ContractConfigs.registries_manager,
+                ContractConfigs.component_registry,
+                ContractConfigs.agent_registry,
+            )
+        )
+
+        mint_order = get_mint_order(packages_dir=packages_dir)
+        if len(mint_order) == 0:
+            raise click.ClickException(f"No mintable packages found in {packages_dir}")
+
+        # the packages minted already with the same code, e.g. by a previous run which failed midway, are reused
+        token_ids: Dict[PackageId, Optional[int]] = {}
+        if self.chain_type == ChainType.ETHEREUM:
+            for package_id in (
+                package_id for level in mint_order for package_id in level
+            ):
+                package_path = (
+                    packages_dir
+                    / package_id.author
+                    / package_id.package_type.to_plural()
+                    / package_id.name
+                )
+                token_id = self._find_token_id(
+                    package_id=package_id,
+                    package_hash=IPFSHashOnly.get(file_path=str(package_path)),
+                )
+                if token_id is not None:
+                    click.echo(
+                        f"{package_id} is already minted with token ID {token_id}"
+                    )
+                    token_ids[package_id] = token_id
+        mint_order = [
+            [package_id for package_id in level if package_id not in token_ids]
+            for level in mint_order
+        ]
+        mint_order = [level for level in mint_order if len(level) > 0]
+
+        configurations: Dict[PackageId, PackageConfiguration] = {}
+        packages = []
+        for package_id in (package_id for level in mint_order for package_id in level):
+            package_path = (
+                packages_dir
+                / package_id.author
+                / package_id.package_type.to_plural()
+                / package_id.name
+            )
+            configurations[package_id] = self.load_package_configuration(
+                package_path=package_path,
+                package_type=package_id.package_type,
+            ).package_configuration
+            packages.append((configurations[package_id], package_path))
+
+        metadata: Dict[PackageId, Tuple[str, str]] = {}
+        if len(packages) > 0:
+            click.echo(f"Publishing metadata for {len(packages)} packages...")
+            metadata = dict(
+                zip(configurations, self._publish_packages_metadata(packages=packages))
+            )
+
+        for level in mint_order:
+            components = []
+            for package_id in level:
+                dependencies = []
+                if self.chain_type == ChainType.ETHEREUM:
+                    for dependency in self._get_package_dependencies(
+                        package_configuration=configurations[package_id]
+                    ):
+                        dependencies.append(
+                            self._get_minted_dependency_token_id(
+                                dependency=dependency, token_ids=token_ids
+                            )
+                        )
+                components.append(
+                    (
+                        metadata[package_id][0],
+                        (
+                            UnitType.AGENT
+                            if package_id.package_type == PackageType.AGENT
+                            else UnitType.COMPONENT
+                        ),
+                        dependencies,
+                    )
+                )
+
+            click.echo(f"Minting {', '.join(map(str, level))}...")
+            try:
+                minted = self.manager.mint_components(
+                    components=components, owner=owner
+                )
+            except ChainInteractionError as e:  # pragma: nocover
+                raise click.ClickException(
+                    f"Component mint failed with following error; {e.__class__.__name__}({e})"
+                ) from e
+
+            for package_id, token_id in zip(level, minted):
+                token_ids[package_id] = token_id
+                if self.dry_run:
+                    continue
+                if token_id is None:  # pragma: nocover
+                    raise click.ClickException(
+                        f"Could not verify metadata hash to retrieve the token ID for {package_id}"
+                    )
+                (Path.cwd() / f"{token_id}.json").write_text(metadata[package_id][1])
+
+        if self.dry_run:
+            return
+
+        rows: List[Sequence[Any]] = [("Package", "Metadata Hash", "Token ID")]
+        for package_id, token_id in token_ids.items():
+            metadata_hash = metadata[package_id][0] if package_id in metadata else "-"
+            rows.append((str(package_id), metadata_hash, token_id))
+        click.echo("Packages minted with:")
+        click.echo(_draw_table(rows))
+
+    def _get_minted_dependency_token_id(
+        self, dependency: PackageId, token_ids: Dict[PackageId, Optional[int]]
+    ) -> int:
+        """Get the token ID of a dependency, which may have been minted in the same run."""
+        if dependency.without_hash() not in token_ids:
+            return self._get_dependency_token_id(package_id=dependency)
+        token_id = token_ids[dependency.without_hash()]
+        # the dependencies minted in a dry run have no token ID yet
+        return DRY_RUN_TOKEN_ID if token_id is None else token_id
+
     def mint_service(
         self,
         number_of_slots: int,
@@ -789,6 +1038,7 @@ def print_service_info(service_id: int, chain_type: ChainType) -> None:
         ledger_api=ledger_api,
         chain_type=chain_type,
         token_id=service_id,
+        use_cache=True,
     )
     service_state = ServiceState(_service_state)
     rows = [
@@ -813,6 +1063,7 @@ def print_service_info(service_id: int, chain_type: ChainType) -> None:
                             ledger_api=ledger_api,
                             chain_type=chain_type,
                             token_id=service_id,
+                            use_cache=True,
                         ).get("agentInstances", []),
                     ),
                 ),
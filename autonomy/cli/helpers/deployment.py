@@ -343,9 +343,13 @@ def _resolve_on_chain_token_id(
             contract_address=contract_address,
             token_id=token_id,
             is_service=True,
+            use_cache=True,
         )
         info = get_agent_instances(
-            ledger_api=ledger_api, chain_type=chain_type, token_id=token_id
+            ledger_api=ledger_api,
+            chain_type=chain_type,
+            token_id=token_id,
+            use_cache=True,
         )
         agent_instances = info["agentInstances"]
         (
@@ -355,7 +359,10 @@ def _resolve_on_chain_token_id(
             consensus_threshold,
             *_,
         ) = get_service_info(
-            ledger_api=ledger_api, chain_type=chain_type, token_id=token_id
+            ledger_api=ledger_api,
+            chain_type=chain_type,
+            token_id=token_id,
+            use_cache=True,
         )
     except FailedToRetrieveComponentMetadata as e:
         raise click.ClickException(str(e)) from e
@@ -352,6 +352,40 @@ def agent(
     return mint_helper.mint_agent(owner=owner)
 
 
+@mint.command()
+@click.argument(
+    "packages_dir",
+    type=PathArgument(exists=True, file_okay=False, dir_okay=True),
+)
+@key_path_decorator
+@hwi_flag
+@password_decorator
+@nft_decorator
+@owner_flag
+@pass_ctx
+def packages(
+    ctx: Context,
+    packages_dir: Path,
+    key: Path,
+    password: Optional[str],
+    nft: Optional[Union[Path, IPFSHash]],
+    owner: Optional[str],
+    hwi: bool = False,
+) -> None:
+    """Mint all the components and agents from a packages directory in dependency order."""
+
+    MintHelper(
+        chain_type=cast(ChainType, ctx.config.get("chain_type")),
+        key=key,
+        password=password,
+        hwi=hwi,
+        dry_run=ctx.config.get("dry_run"),
+        timeout=ctx.config.get("timeout"),
+        retries=ctx.config.get("retries"),
+        sleep=ctx.config.get("sleep"),
+    ).verify_nft(nft=nft).mint_packages(packages_dir=packages_dir, owner=owner)
+
+
 @mint.command()
 @package_path_decorator
 @key_path_decorator
@@ -19,17 +19,24 @@
 
 """Develop CLI module."""
 
+import importlib
+import json
 import time
+from dataclasses import asdict
 from pathlib import Path
 
 import click
+import yaml
 from aea.cli.utils.click_utils import reraise_as_click_exception
 from aea.configurations.constants import PACKAGES
+from aea.helpers.io import open_file
 
+from autonomy.cli.utils.click_utils import sys_path_patch
 from autonomy.constants import DEFAULT_BUILD_FOLDER, DOCKER_COMPOSE_YAML
 from autonomy.deploy.base import build_hash_id
 from autonomy.deploy.constants import PERSISTENT_DATA_DIR, TM_STATE_DIR
 from autonomy.replay.agent import AgentRunner
+from autonomy.replay.store import DumpStore, materialise_periods
 from autonomy.replay.tendermint import build_tendermint_apps
 from autonomy.replay.utils import (
     fix_address_books,
@@ -38,6 +45,9 @@ from autonomy.replay.utils import (
 )
 
 REGISTRY_PATH = Path(PACKAGES)
+ABCI_REQUESTS_REPLAY_MODULE = (
+    "packages.valory.skills.abstract_round_abci.test_tools.replay"
+)
 
 
 @click.group(name="replay")
@@ -95,6 +105,8 @@ def run_tendermint(build_dir: Path) -> None:
     dump_dir = build_dir / PERSISTENT_DATA_DIR / TM_STATE_DIR
 
     # TODO: missing error handling
+    for node_home in materialise_periods(dump_dir):
+        click.echo(f"Materialised {node_home}")
     fix_address_books(build_dir)
     fix_config_files(build_dir)
 
@@ -108,3 +120,106 @@ def run_tendermint(build_dir: Path) -> None:
         proxy_app.run(host="localhost", port=8080)
     except KeyboardInterrupt:
         tendermint_network.stop()
+
+
+@replay_group.command(name="materialise")
+@click.argument("period", type=int, required=True)
+@click.option(
+    "--build",
+    "build_dir",
+    type=click.Path(dir_okay=True, exists=True),
+    default=Path(DEFAULT_BUILD_FOLDER.format(build_hash_id())),
+    help="Path to build directory.",
+)
+@click.option(
+    "--output",
+    "output_dir",
+    type=click.Path(file_okay=False, dir_okay=True),
+    default=None,
+    help="Directory to materialise the period in, defaults to the period folder of the dumps.",
+)
+def materialise_period(period: int, build_dir: Path, output_dir: Path) -> None:
+    """Materialise the tendermint homes of a period from the dump store."""
+
+    build_dir = Path(build_dir).absolute()
+    dump_dir = build_dir / PERSISTENT_DATA_DIR / TM_STATE_DIR
+    output_dir = Path(output_dir or dump_dir / f"period_{period}").absolute()
+
+    store = DumpStore(dump_dir)
+    nodes = store.nodes(period)
+    if not nodes:
+        raise click.ClickException(
+            f"Can't find the dumps of period {period} in {dump_dir}"
+        )
+
+    for node_id in nodes:
+        node_home = store.materialise(period, node_id, output_dir / f"node{node_id}")
+        click.echo(f"Materialised {node_home}")
+
+
+@replay_group.command(name="requests")
+@click.argument("log", type=click.Path(exists=True, dir_okay=False), required=True)
+@click.option(
+    "--skill",
+    "skill_dir",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True),
+    required=True,
+    help="Path to the directory of the skill.",
+)
+@click.option(
+    "--overrides",
+    "overrides_file",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="YAML file with the overrides of the skill's configuration.",
+)
+@click.option(
+    "--agent-address",
+    type=str,
+    default="replay_agent_address",
+    help="Address of the agent whose requests were recorded.",
+)
+@click.option(
+    "--registry",
+    "registry_path",
+    type=click.Path(exists=True, dir_okay=True),
+    default=REGISTRY_PATH,
+    help="Path to registry folder.",
+)
+@click.option("--json", "as_json", is_flag=True, help="Print the statistics as JSON.")
+def replay_requests(  # pylint: disable=too-many-arguments
+    log: Path,
+    skill_dir: Path,
+    overrides_file: Path,
+    agent_address: str,
+    registry_path: Path,
+    as_json: bool,
+) -> None:
+    """Replay a log of ABCI requests into the ABCI handler of a skill, headless."""
+
+    registry_path = Path(registry_path).absolute()
+    overrides = None
+    if overrides_file is not None:
+        with open_file(overrides_file) as fp:
+            overrides = yaml.safe_load(fp)
+
+    with reraise_as_click_exception(
+        FileNotFoundError, ValueError, ImportError
+    ), sys_path_patch(registry_path.parent):
+        replay = importlib.import_module(ABCI_REQUESTS_REPLAY_MODULE)
+        replayer = replay.AbciRequestsReplayer(
+            Path(skill_dir).absolute(), overrides, agent_address
+        )
+        try:
+            stats = replayer.replay(log)
+        except replay.AppHashMismatchError as e:
+            raise click.ClickException(str(e)) from e
+
+    if as_json:
+        click.echo(json.dumps(asdict(stats)))
+        return
+    click.echo(
+        f"Replayed {stats.requests} requests, {stats.blocks} blocks in {stats.runs} run(s) "
+        f"in {stats.duration:.3f}s: {stats.requests_per_second:.0f} requests/s, "
+        f"{stats.blocks_per_second:.0f} blocks/s; {stats.verified_commits} app hashes verified."
+    )
@@ -43,6 +43,7 @@ DEATTACH_WINDOWS_FLAG = 0x00000008
 
 TM_ENV_TMHOME = "TMHOME"
 TM_ENV_TMSTATE = "TMSTATE"
+TM_ENV_TMSTATE_COMPRESSION = "TMSTATE_COMPRESSION"
 TM_ENV_PROXY_APP = "PROXY_APP"
 TM_ENV_P2P_LADDR = "P2P_LADDR"
 TM_ENV_RPC_LADDR = "RPC_LADDR"
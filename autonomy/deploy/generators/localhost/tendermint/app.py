@@ -19,6 +19,7 @@
 
 """HTTP server to control the tendermint execution environment."""
 
+import atexit
 import json
 import logging
 import os
@@ -26,6 +27,8 @@ import re
 import shutil
 import stat
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
@@ -45,8 +48,10 @@ from autonomy.deploy.constants import (
     TM_ENV_PROXY_APP,
     TM_ENV_RPC_LADDR,
     TM_ENV_TMHOME,
+    TM_ENV_TMSTATE_COMPRESSION,
     TM_ENV_USE_GRPC,
 )
+from autonomy.replay.store import DumpStore
 
 try:
     from .tendermint import (  # type: ignore
@@ -172,9 +177,15 @@ class PeriodDumper:
 
     resets: int
     dump_dir: Path
+    store: DumpStore
     logger: logging.Logger
 
-    def __init__(self, logger: logging.Logger, dump_dir: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        dump_dir: Optional[Path] = None,
+        compression: Optional[str] = None,
+    ) -> None:
         """Initialize object."""
 
         self.resets = 0
@@ -186,6 +197,14 @@ class PeriodDumper:
                 str(self.dump_dir), onerror=self.readonly_handler
             )
         self.dump_dir.mkdir(exist_ok=True)
+        self.store = DumpStore(
+            self.dump_dir,
+            compression=compression or os.environ.get(TM_ENV_TMSTATE_COMPRESSION),
+        )
+        self._staged: Optional[Tuple[Path, int, int]] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="period_dumper"
+        )
 
     @staticmethod
     def readonly_handler(
@@ -199,19 +218,69 @@ class PeriodDumper:
             pass
 
     def dump_period(self) -> None:
-        """Dump tendermint run data for replay"""
-        store_dir = self.dump_dir / f"period_{self.resets}"
-        store_dir.mkdir(exist_ok=True)
+        """
+        Dump tendermint run data for replay
+
+        Only the snapshot of the node home is taken here, while the node is
+        stopped. It is moved into the deduplicated store by `store_period`, in
+        the background, once the node has been reset.
+        """
+        self.discard_period()
+        period = self.resets
+        self.resets += 1
+        node_id = int(os.environ["ID"])
         try:
-            shutil.copytree(
-                os.environ["TMHOME"], str(store_dir / ("node" + os.environ["ID"]))
+            staged = self.store.stage(Path(os.environ["TMHOME"]), period, node_id)
+        except OSError as e:
+            self.logger.info(
+                f"Error occurred while dumping data for period {period}: {e}"
             )
-            self.logger.info(f"Dumped data for period {self.resets}")
+            return
+        self._staged = (staged, period, node_id)
+
+    def store_period(self) -> Optional[Future]:
+        """
+        Move the staged snapshot into the store in the background.
+
+        :return: the future of the background dump, if a snapshot is staged.
+        """
+        if self._staged is None:
+            return None
+        staged, self._staged = self._staged, None
+        future = self._executor.submit(self._ingest, *staged)
+        future.add_done_callback(partial(self._check_stored, staged[1]))
+        return future
+
+    def discard_period(self) -> None:
+        """Discard the staged snapshot, when the node is restarted without a reset."""
+        if self._staged is None:
+            return
+        (staged, period, _), self._staged = self._staged, None
+        shutil.rmtree(staged, ignore_errors=True)
+        self.resets = period
+
+    def stop(self) -> None:
+        """Discard the staged snapshot, and wait for the background dumps to complete."""
+        self.discard_period()
+        self._executor.shutdown(wait=True)
+
+    def _check_stored(self, period: int, future: Future) -> None:
+        """Log the unexpected error of a background dump, if any."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.logger.error(f"Failed to dump data for period {period}: {error}")
+
+    def _ingest(self, staged: Path, period: int, node_id: int) -> None:
+        """Move a staged snapshot into the store."""
+        try:
+            self.store.ingest(staged, period, node_id)
+            self.logger.info(f"Dumped data for period {period}")
         except OSError as e:
             self.logger.info(
-                f"Error occurred while dumping data for period {self.resets}: {e}"
+                f"Error occurred while dumping data for period {period}: {e}"
             )
-        self.resets += 1
 
 
 def create_app(  # pylint: disable=too-many-statements
@@ -231,6 +300,8 @@ def create_app(  # pylint: disable=too-many-statements
 
     app = Flask(__name__)
     period_dumper = PeriodDumper(logger=app.logger, dump_dir=dump_dir)
+    # the server runs until the process exits, the pending dumps are completed then
+    atexit.register(period_dumper.stop)
     tendermint_node = TendermintNode(
         tendermint_params,
         logger=app.logger,
@@ -361,8 +432,11 @@ def create_app(  # pylint: disable=too-many-statements
 
             return_code = tendermint_node.prune_blocks()
             if return_code:
+                # the snapshot shares the files the node keeps writing to
+                period_dumper.discard_period()
                 tendermint_node.start()
                 raise RuntimeError("Could not perform `unsafe-reset-all` successfully!")
+            period_dumper.store_period()
             defaults = get_defaults()
             tendermint_node.reset_genesis_file(
                 request.args.get("genesis_time", defaults["genesis_time"]),
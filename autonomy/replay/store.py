@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Content addressed store for the tendermint period dumps."""
+
+import errno
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional
+
+OBJECTS_DIR = "objects"
+MANIFESTS_DIR = "manifests"
+STAGING_DIR = ".staging"
+GZIP = "gzip"
+SUPPORTED_COMPRESSIONS = (GZIP,)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# `unsafe-reset-all` deletes the `data` folder and the node recreates its files,
+# so these can be hard linked while staging. Everything else (genesis, config)
+# gets rewritten in place after a reset and has to be copied.
+LINKED_DIRS = ("data",)
+
+PERIOD_DIR_REGEX = re.compile(r"^period_(\d+)$")
+NODE_MANIFEST_REGEX = re.compile(r"^node(\d+)\.json$")
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    """Hard link the file, fall back to a copy across file systems."""
+    try:
+        os.link(source, destination)
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+            raise
+        shutil.copy2(source, destination)
+
+
+def _hash_file(path: Path) -> str:
+    """Compute the sha256 digest of a file."""
+    sha = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(HASH_CHUNK_SIZE), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+class DumpStore:
+    """
+    Deduplicated store for the tendermint period dumps.
+
+    The layout of the store is
+
+        <root>/objects/<sha[:2]>/<sha>[.gz]
+        <root>/manifests/period_<n>/node<id>.json
+
+    every file of a dumped node home is stored once under the digest of its
+    content and a manifest per period and node maps the relative paths of the
+    home to the stored objects. A manifest is written only after all of its
+    objects are in place, so any period which has one can be materialised.
+    """
+
+    def __init__(self, root: Path, compression: Optional[str] = None) -> None:
+        """
+        Initialize the store.
+
+        :param root: root directory of the store.
+        :param compression: compression to use for the new objects.
+        """
+        if compression is not None and compression not in SUPPORTED_COMPRESSIONS:
+            raise ValueError(
+                f"Unsupported compression {compression!r}; "
+                f"supported compressions: {SUPPORTED_COMPRESSIONS}"
+            )
+        self.root = Path(root)
+        self.compression = compression
+
+    @property
+    def objects_dir(self) -> Path:
+        """Directory of the stored objects."""
+        return self.root / OBJECTS_DIR
+
+    @property
+    def manifests_dir(self) -> Path:
+        """Directory of the period manifests."""
+        return self.root / MANIFESTS_DIR
+
+    def manifest_path(self, period: int, node_id: int) -> Path:
+        """Path to the manifest of a node for a period."""
+        return self.manifests_dir / f"period_{period}" / f"node{node_id}.json"
+
+    def periods(self) -> List[int]:
+        """Periods with at least one complete node dump."""
+        if not self.manifests_dir.is_dir():
+            return []
+        periods = []
+        for path in self.manifests_dir.iterdir():
+            match = PERIOD_DIR_REGEX.match(path.name)
+            if match is not None and self.nodes(int(match.group(1))):
+                periods.append(int(match.group(1)))
+        return sorted(periods)
+
+    def nodes(self, period: int) -> List[int]:
+        """Nodes with a complete dump for the given period."""
+        period_dir = self.manifests_dir / f"period_{period}"
+        if not period_dir.is_dir():
+            return []
+        return sorted(
+            int(match.group(1))
+            for match in map(NODE_MANIFEST_REGEX.match, os.listdir(period_dir))
+            if match is not None
+        )
+
+    def stage(self, source: Path, period: int, node_id: int) -> Path:
+        """
+        Take a snapshot of a node home, ready to be ingested.
+
+        This is the only part of a dump which has to happen while the node is
+        stopped: the files which are recreated by a reset are hard linked and
+        the rest is copied, so it does not depend on the size of the chain.
+
+        :param source: tendermint home directory of the node.
+        :param period: period the snapshot belongs to.
+        :param node_id: id of the node.
+        :return: path to the staged snapshot.
+        """
+        staged = self.root / STAGING_DIR / f"period_{period}" / f"node{node_id}"
+        if staged.exists():
+            shutil.rmtree(staged)
+        for dirpath, _, filenames in os.walk(source):
+            relative = Path(dirpath).relative_to(source)
+            (staged / relative).mkdir(parents=True, exist_ok=True)
+            link = bool(relative.parts) and relative.parts[0] in LINKED_DIRS
+            for filename in filenames:
+                if link:
+                    _link_or_copy(Path(dirpath, filename), staged / relative / filename)
+                else:
+                    shutil.copy2(Path(dirpath, filename), staged / relative / filename)
+        return staged
+
+    def ingest(self, staged: Path, period: int, node_id: int) -> Dict:
+        """
+        Move a staged snapshot into the store and write its manifest.
+
+        :param staged: path to the staged snapshot.
+        :param period: period the snapshot belongs to.
+        :param node_id: id of the node.
+        :return: the manifest of the snapshot.
+        """
+        files: Dict[str, Dict] = {}
+        directories: List[str] = []
+        for dirpath, dirnames, filenames in os.walk(staged):
+            relative = Path(dirpath).relative_to(staged)
+            directories.extend(
+                (relative / dirname).as_posix() for dirname in sorted(dirnames)
+            )
+            for filename in sorted(filenames):
+                path = Path(dirpath, filename)
+                mode = os.stat(path).st_mode & 0o777
+                files[(relative / filename).as_posix()] = {
+                    "object": self._add_object(path),
+                    "mode": mode,
+                }
+
+        manifest = {
+            "period": period,
+            "node": node_id,
+            "directories": directories,
+            "files": files,
+        }
+        manifest_path = self.manifest_path(period, node_id)
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2))
+        os.replace(tmp_path, manifest_path)
+        shutil.rmtree(staged)
+        return manifest
+
+    def _find_object(self, digest: str) -> Optional[str]:
+        """Find the stored object for a digest, regardless of its compression."""
+        for name in (digest, f"{digest}.gz"):
+            if (self.objects_dir / digest[:2] / name).is_file():
+                return f"{digest[:2]}/{name}"
+        return None
+
+    def _add_object(self, path: Path) -> str:
+        """Add a file to the objects, unless its content is already stored."""
+        if path.stat().st_nlink > 1:
+            # still shared with the node home, so break the link before hashing
+            private_copy = path.with_name(f"{path.name}.copy")
+            shutil.copy2(path, private_copy)
+            os.replace(private_copy, path)
+
+        digest = _hash_file(path)
+        existing = self._find_object(digest)
+        if existing is not None:
+            return existing
+
+        object_dir = self.objects_dir / digest[:2]
+        object_dir.mkdir(parents=True, exist_ok=True)
+        if self.compression == GZIP:
+            name = f"{digest}.gz"
+            tmp_path = object_dir / f"{name}.tmp"
+            with open(path, "rb") as src, gzip.open(tmp_path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        else:
+            name = digest
+            tmp_path = object_dir / f"{name}.tmp"
+            # the staged file is not linked anywhere else, so it is moved
+            os.replace(path, tmp_path)
+        os.replace(tmp_path, object_dir / name)
+        return f"{digest[:2]}/{name}"
+
+    def materialise(self, period: int, node_id: int, target: Path) -> Path:
+        """
+        Recreate the home directory of a node for a period.
+
+        The files are copied out of the store, since tendermint modifies its
+        home when it runs and the objects are shared between the periods.
+
+        :param period: period to materialise.
+        :param node_id: id of the node.
+        :param target: directory to materialise the node home in.
+        :return: the target directory.
+        """
+        manifest_path = self.manifest_path(period, node_id)
+        if not manifest_path.is_file():
+            raise FileNotFoundError(
+                f"Can't find the dump of node {node_id} for period {period} in {self.root}"
+            )
+        manifest = json.loads(manifest_path.read_text())
+
+        target.mkdir(parents=True, exist_ok=True)
+        for directory in manifest["directories"]:
+            (target / directory).mkdir(parents=True, exist_ok=True)
+        for relative, entry in manifest["files"].items():
+            object_path = self.objects_dir / entry["object"]
+            destination = target / relative
+            if object_path.suffix == ".gz":
+                with gzip.open(object_path, "rb") as src, open(
+                    destination, "wb"
+                ) as dst:
+                    shutil.copyfileobj(src, dst)
+            else:
+                shutil.copyfile(object_path, destination)
+            os.chmod(destination, entry["mode"] | 0o200)
+        return target
+
+
+def materialise_periods(dump_dir: Path) -> List[Path]:
+    """
+    Materialise the periods of the store in `dump_dir` which are not on disk yet.
+
+    :param dump_dir: directory of the tendermint dumps.
+    :return: list of the materialised node homes.
+    """
+    store = DumpStore(dump_dir)
+    materialised = []
+    for period in store.periods():
+        for node_id in store.nodes(period):
+            target = dump_dir / f"period_{period}" / f"node{node_id}"
+            if target.exists():
+                continue
+            materialised.append(store.materialise(period, node_id, target))
+    return materialised
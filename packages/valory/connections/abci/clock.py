@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""A process-wide clock, which simulated services can run faster than the wall clock."""
+
+import datetime
+from threading import Lock
+from time import monotonic
+from time import time as time_
+from typing import Optional
+
+
+class VirtualClock:
+    """A clock running `speed` times faster than the wall clock, starting from the current time.
+
+    The clock can also be fast-forwarded explicitly, using `advance`.
+    """
+
+    def __init__(self, speed: float = 1.0, start: Optional[float] = None) -> None:
+        """
+        Initialize the clock.
+
+        :param speed: how many virtual seconds elapse per real second.
+        :param start: the virtual time the clock starts from, as a POSIX timestamp; defaults to the current time.
+        """
+        if speed <= 0:
+            raise ValueError(f"The speed of a clock must be positive, got {speed}.")
+        self.speed = speed
+        self._start = time_() if start is None else start
+        self._started_at = monotonic()
+        self._offset = 0.0
+        self._lock = Lock()
+
+    def time(self) -> float:
+        """Get the virtual time, as a POSIX timestamp."""
+        with self._lock:
+            elapsed = (monotonic() - self._started_at) * self.speed
+            return self._start + elapsed + self._offset
+
+    def now(self) -> datetime.datetime:
+        """Get the virtual time, as a naive local datetime, like the wall clock time of `datetime`."""
+        return datetime.datetime.fromtimestamp(self.time())
+
+    def advance(self, seconds: float) -> None:
+        """
+        Fast-forward the clock.
+
+        :param seconds: the virtual seconds to skip.
+        """
+        if seconds < 0:
+            raise ValueError(
+                "A clock can only be advanced by a positive amount of time."
+            )
+        with self._lock:
+            self._offset += seconds
+
+    def real_duration(self, seconds: float) -> float:
+        """
+        Get the real duration of an interval of virtual time.
+
+        :param seconds: the virtual seconds.
+        :return: the real seconds.
+        """
+        return seconds / self.speed
+
+
+_clock: Optional[VirtualClock] = None
+_clock_lock = Lock()
+
+
+def install_virtual_clock(speed: float) -> VirtualClock:
+    """
+    Install the virtual clock of the process, or get it if it is already installed.
+
+    The agents of a multi-agent service running in the same process share the same clock.
+
+    :param speed: how many virtual seconds elapse per real second.
+    :return: the virtual clock.
+    """
+    global _clock  # pylint: disable=global-statement
+    with _clock_lock:
+        if _clock is None:
+            _clock = VirtualClock(speed)
+        elif _clock.speed != speed:
+            raise ValueError(
+                f"A virtual clock with speed {_clock.speed} is already installed, cannot use speed {speed}."
+            )
+        return _clock
+
+
+def uninstall_virtual_clock() -> None:
+    """Uninstall the virtual clock of the process, going back to the wall clock."""
+    global _clock  # pylint: disable=global-statement
+    with _clock_lock:
+        _clock = None
+
+
+def get_virtual_clock() -> Optional[VirtualClock]:
+    """Get the virtual clock of the process, if one is installed."""
+    return _clock
+
+
+def time() -> float:
+    """Get the time of the process, as a POSIX timestamp; the virtual time if a virtual clock is installed."""
+    clock = _clock
+    return time_() if clock is None else clock.time()
+
+
+def now() -> datetime.datetime:
+    """Get the time of the process, as a naive local datetime; the virtual time if a virtual clock is installed."""
+    clock = _clock
+    return datetime.datetime.now() if clock is None else clock.now()
+
+
+def real_duration(seconds: float) -> float:
+    """
+    Get the real duration of an interval of the time of the process.
+
+    :param seconds: the seconds, in the time of the process.
+    :return: the real seconds.
+    """
+    clock = _clock
+    return seconds if clock is None else clock.real_duration(seconds)
@@ -28,13 +28,15 @@ import signal
 import subprocess  # nosec
 import sys
 from asyncio import AbstractEventLoop, AbstractServer, CancelledError, Task
+from collections import deque
+from dataclasses import dataclass
 from io import BytesIO
 from logging import Logger
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from threading import Event, Thread
-from time import time as time_
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from threading import Condition, Event, Lock, Thread
+from time import monotonic
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, Union, cast
 from urllib.parse import parse_qs, urlparse
 
 import grpc
@@ -45,7 +47,9 @@ from aea.mail.base import Envelope
 from aea.protocols.dialogue.base import DialogueLabel
 from google.protobuf.message import DecodeError
 
+from packages.valory.connections.abci import clock
 from packages.valory.connections.abci.dialogues import AbciDialogues
+from packages.valory.connections.abci.recording import AbciRequestsRecorder
 from packages.valory.connections.abci.tendermint.abci import (  # type: ignore
     types_pb2_grpc,
 )
@@ -1059,6 +1063,230 @@ class TcpServerChannel:  # pylint: disable=too-many-instance-attributes
         await writer.drain()
 
 
+@dataclass(frozen=True)
+class MockBlock:
+    """A block produced by a `MockNetwork`."""
+
+    sequence: int
+    height: int
+    time: float
+    txs: Tuple[bytes, ...]
+
+
+class MockNetwork:  # pylint: disable=too-many-instance-attributes
+    """An in-process network of mock Tendermint nodes, ordering the transactions of several agents into shared blocks.
+
+    Each agent's `MockServerChannel` joins the network as a node. The transactions broadcast to any node
+    are collected in a shared mempool, and every node delivers the same blocks to its agent's ABCI handler.
+    Blocks are produced in lockstep: the next block is only produced once all the nodes have committed the
+    previous one, and as soon as a transaction is pending, or after `block_time` seconds otherwise.
+    The transactions of a block are ordered by hash, so that their order does not depend on the timing of the
+    agents. The network does not start producing blocks before all its `n_nodes` nodes have joined.
+    Block times follow the virtual clock of the process, if one is installed.
+
+    Known semantic departures from real Tendermint, on top of the ones of `MockServerChannel`:
+    - all the nodes have to commit a block before the next one is produced, instead of two thirds of them.
+    - a reset of the chain takes place once all the nodes have requested it, and blocks are not produced meanwhile.
+    - a node which leaves and joins the network again does not replay the blocks it missed.
+    """
+
+    _networks: Dict[str, "MockNetwork"] = {}
+    _networks_lock = Lock()
+
+    def __init__(
+        self, n_nodes: int, block_time: float = 1.0, name: Optional[str] = None
+    ) -> None:
+        """
+        Initialize the network.
+
+        :param n_nodes: the number of nodes which must join before blocks are produced.
+        :param block_time: the time between empty blocks, in seconds.
+        :param name: the name the network is registered with, if any.
+        """
+        if n_nodes < 1:
+            raise ValueError(f"A mock network needs at least one node, got {n_nodes}.")
+        self.n_nodes = n_nodes
+        self.block_time = block_time
+        self.name = name
+        self._condition = Condition()
+        self._wakeups: Dict[int, Callable[[], None]] = {}
+        self._committed: Dict[int, int] = {}
+        self._resetting: Set[int] = set()
+        self._next_node = 0
+        self._complete = False
+        self._mempool: List[bytes] = []
+        self._block: Optional[MockBlock] = None
+        self._sequence = 0
+        self._height = 0
+        # the first block is produced as soon as all the nodes have joined
+        self._last_block_at = monotonic() - clock.real_duration(block_time)
+        self._stopped = False
+        self._thread = Thread(target=self._produce_blocks, daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def get(cls, name: str, n_nodes: int, block_time: float = 1.0) -> "MockNetwork":
+        """
+        Get the network registered with the given name, creating it if necessary.
+
+        :param name: the name of the network.
+        :param n_nodes: the number of nodes of the network.
+        :param block_time: the time between empty blocks, in seconds.
+        :return: the network.
+        """
+        with cls._networks_lock:
+            network = cls._networks.get(name)
+            if network is None:
+                network = cls(n_nodes, block_time, name)
+                cls._networks[name] = network
+            elif network.n_nodes != n_nodes:
+                raise ValueError(
+                    f"Mock network {name!r} has {network.n_nodes} nodes, not {n_nodes}."
+                )
+            return network
+
+    @property
+    def height(self) -> int:
+        """Get the height of the last block."""
+        return self._height
+
+    @property
+    def is_stopped(self) -> bool:
+        """Check whether the network has stopped, i.e., all its nodes have left."""
+        return self._stopped
+
+    def join(self, wakeup: Callable[[], None]) -> int:
+        """
+        Join the network as a node.
+
+        :param wakeup: a thread-safe callable, called whenever a block is produced.
+        :return: the id of the node.
+        """
+        with self._condition:
+            if self._stopped:
+                raise ValueError("Mock network has stopped, all its nodes have left.")
+            if len(self._wakeups) >= self.n_nodes:
+                raise ValueError(f"Mock network is full, it has {self.n_nodes} nodes.")
+            node = self._next_node
+            self._next_node += 1
+            self._wakeups[node] = wakeup
+            self._committed[node] = self._sequence
+            self._complete = self._complete or len(self._wakeups) == self.n_nodes
+            self._condition.notify_all()
+            return node
+
+    def leave(self, node: int) -> None:
+        """
+        Leave the network; the network stops once all its nodes have left.
+
+        :param node: the id of the node.
+        """
+        with self._condition:
+            self._wakeups.pop(node, None)
+            self._committed.pop(node, None)
+            self._resetting.discard(node)
+            self._check_reset()
+            self._condition.notify_all()
+            if self._wakeups:
+                return
+            self._stopped = True
+        self._thread.join()
+        if self.name is not None:
+            with self._networks_lock:
+                if self._networks.get(self.name) is self:
+                    del self._networks[self.name]
+
+    def submit(self, tx: bytes) -> None:
+        """
+        Add a transaction to the mempool.
+
+        :param tx: the transaction.
+        """
+        with self._condition:
+            self._mempool.append(tx)
+            self._condition.notify_all()
+
+    def get_block(self, sequence: int) -> Optional[MockBlock]:
+        """
+        Get a block, if it has been produced.
+
+        :param sequence: the sequence number of the block.
+        :return: the block, or None if it has not been produced yet.
+        """
+        with self._condition:
+            block = self._block
+        if block is None or block.sequence != sequence:
+            return None
+        return block
+
+    def committed(self, node: int, sequence: int) -> None:
+        """
+        Signal that a node has committed a block.
+
+        :param node: the id of the node.
+        :param sequence: the sequence number of the block.
+        """
+        with self._condition:
+            if node in self._committed:
+                self._committed[node] = sequence
+                self._condition.notify_all()
+
+    def request_reset(self, node: int) -> None:
+        """
+        Request to reset the chain; the reset takes place once all the nodes have requested it.
+
+        :param node: the id of the node.
+        """
+        with self._condition:
+            if node in self._wakeups:
+                self._resetting.add(node)
+                self._check_reset()
+                self._condition.notify_all()
+
+    def _check_reset(self) -> None:
+        """Reset the chain, if all the nodes have requested it."""
+        if self._resetting and self._resetting.issuperset(self._wakeups):
+            self._resetting.clear()
+            self._height = 0
+            self._mempool.clear()
+
+    def _is_ready(self) -> bool:
+        """Check whether the next block can be produced."""
+        return (
+            self._complete
+            and not self._resetting
+            and all(sequence == self._sequence for sequence in self._committed.values())
+        )
+
+    def _produce_blocks(self) -> None:
+        """Produce the blocks, until stopped."""
+        with self._condition:
+            while not self._stopped:
+                if not self._is_ready():
+                    self._condition.wait()
+                    continue
+                remaining = (
+                    self._last_block_at
+                    + clock.real_duration(self.block_time)
+                    - monotonic()
+                )
+                if not self._mempool and remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                self._produce_block()
+
+    def _produce_block(self) -> None:
+        """Produce a block with the pending transactions, and wake up the nodes."""
+        txs = tuple(sorted(self._mempool, key=lambda tx: hashlib.sha256(tx).digest()))
+        self._mempool.clear()
+        self._sequence += 1
+        self._height += 1
+        self._block = MockBlock(self._sequence, self._height, clock.time(), txs)
+        self._last_block_at = monotonic()
+        for wakeup in self._wakeups.values():
+            wakeup()
+
+
 class MockServerChannel:  # pylint: disable=too-many-instance-attributes
     """Mock server channel that acts as a drop-in replacement for Tendermint in single-agent services.
 
@@ -1070,9 +1298,12 @@ class MockServerChannel:  # pylint: disable=too-many-instance-attributes
       ``ResponseDeliverTx`` from the handler.
 
     These are acceptable for single-agent services where consensus validation is unnecessary.
+    Multi-agent services can run in a single process by joining the channels of their agents to a `MockNetwork`.
+    If a virtual clock is installed, the block times follow it and empty blocks are produced `speed` times faster.
     """
 
     DEFAULT_BLOCK_TIME = 1.0
+    MAX_DELIVERED_TXS = 10_000
 
     def __init__(
         self,
@@ -1081,6 +1312,7 @@ class MockServerChannel:  # pylint: disable=too-many-instance-attributes
         rpc_port: int = DEFAULT_RPC_PORT,
         logger: Optional[Logger] = None,
         block_time: float = DEFAULT_BLOCK_TIME,
+        network: Optional[MockNetwork] = None,
     ):
         """
         Initialize the mock server.
@@ -1089,13 +1321,18 @@ class MockServerChannel:  # pylint: disable=too-many-instance-attributes
         :param rpc_host: the host for the mock RPC HTTP server.
         :param rpc_port: the port for the mock RPC HTTP server.
         :param logger: the logger.
-        :param block_time: time between blocks in seconds.
+        :param block_time: time between blocks in seconds, ignored if the channel joins a network.
+        :param network: the network to join as a node, if any.
         """
         self.target_skill_id = target_skill_id
         self.rpc_host = rpc_host
         self.rpc_port = rpc_port
         self.logger = logger or logging.getLogger()
         self.block_time = block_time
+        self.network = network
+        self._node: Optional[int] = None
+        self._block_event: Optional[asyncio.Event] = None
+        self._delivered_order: Deque[str] = deque()
 
         # channel state
         self._dialogues = AbciDialogues(connection_id=PUBLIC_ID)
@@ -1136,6 +1373,8 @@ class MockServerChannel:  # pylint: disable=too-many-instance-attributes
         self._delivered_txs = set()
         self._height = 0
         self._new_tx_event = asyncio.Event()
+        self._delivered_order = deque()
+        self._block_event = asyncio.Event()
 
         # start mock RPC HTTP server using stdlib asyncio
         try:
@@ -1149,6 +1388,12 @@ class MockServerChannel:  # pylint: disable=too-many-instance-attributes
         self.logger.info(
             f"Mock Tendermint RPC server started on {self.rpc_host}:{self.rpc_port}"
         )
+        if self.network is not None:
+            if self.network.is_stopped and self.network.name is not None:
+                self.network = MockNetwork.get(
+                    self.network.name, self.network.n_nodes, self.network.block_time
+                )
+            self._node = self.network.join(self._wakeup)
 
         # start block production
         self._block_producer_task = loop.create_task(self._produce_blocks())
@@ -1167,6 +1412,8 @@ class MockServerChannel:  # pylint: disable=too-many-instance-attributes
                 pass
             self._block_producer_task = None
 
+        self._leave_network()
+
         if self._rpc_server is not None:
             self._rpc_server.close()
             await self._rpc_server.wait_closed()
@@ -1223,20 +1470,20 @@ class MockServerChannel:  # pylint: disable=too-many-instance-attributes
         await cast(asyncio.Queue, self._request_queue).put(envelope)
         return await self._response_future
 
-    def _now_timestamp(self) -> Timestamp:
-        """Get the current time as a Timestamp."""
-        now = time_()
+    def _now_timestamp(self, now: Optional[float] = None) -> Timestamp:
+        """Get the current time, or the given one, as a Timestamp."""
+        now = clock.time() if now is None else now
         seconds = int(now)
         nanos = int((now - seconds) * 1_000_000_000)
         return Timestamp(seconds, nanos)
 
-    def _make_header(self, height: int) -> Header:
+    def _make_header(self, height: int, now: Optional[float] = None) -> Header:
         """Build a minimal block header."""
         return Header(
             version=ConsensusVersion(0, 0),
             chain_id="mock",
             height=height,
-            time=self._now_timestamp(),
+            time=self._now_timestamp(now),
             last_block_id=BlockID(b"", PartSetHeader(0, b"")),
             last_commit_hash=b"",
             data_hash=b"",
@@ -1268,19 +1515,12 @@ class MockServerChannel:  # pylint: disable=too-many-instance-attributes
                 initial_height=1,
             )
 
+            if self.network is not None:
+                await self._follow_network()
+                return
+
             # block production loop
             while not self._is_stopped:
-                self._height += 1
-                header = self._make_header(self._height)
-
-                await self._send_and_wait(
-                    AbciMessage.Performative.REQUEST_BEGIN_BLOCK,
-                    hash=b"",
-                    header=header,
-                    last_commit_info=LastCommitInfo(0, []),
-                    byzantine_validators=Evidences([]),
-                )
-
                 # deliver pending transactions
                 pending = list(self._mempool)
                 self._mempool.clear()
@@ -1288,28 +1528,14 @@ class MockServerChannel:  # pylint: disable=too-many-instance-attributes
                 # have completed since we only reach here after a new tx arrived
                 # or block_time elapsed (no new activity)
                 self._delivered_txs.clear()
-                for tx_bytes in pending:
-                    tx_hash = hashlib.sha256(tx_bytes).hexdigest().upper()
-                    await self._send_and_wait(
-                        AbciMessage.Performative.REQUEST_DELIVER_TX,
-                        tx=tx_bytes,
-                    )
-                    self._delivered_txs.add(tx_hash)
-
-                await self._send_and_wait(
-                    AbciMessage.Performative.REQUEST_END_BLOCK,
-                    height=self._height,
-                )
-                await self._send_and_wait(
-                    AbciMessage.Performative.REQUEST_COMMIT,
-                )
+                await self._run_block(self._height + 1, pending)
 
                 # wait for block_time OR until a new tx arrives
                 if not self._new_tx_event.is_set():  # type: ignore
                     try:
                         await asyncio.wait_for(
                             self._new_tx_event.wait(),  # type: ignore
-                            timeout=self.block_time,
+                            timeout=clock.real_duration(self.block_time),
                         )
                     except asyncio.TimeoutError:
                         pass
@@ -1319,6 +1545,7 @@ class MockServerChannel:  # pylint: disable=too-many-instance-attributes
         except Exception as e:  # pylint: disable=broad-except
             self.logger.error(f"Mock block producer error: {type(e).__name__}: {e}")
             self._is_stopped = True
+            self._leave_network()
             if self._rpc_server is not None:
                 self._rpc_server.close()
                 await self._rpc_server.wait_closed()
@@ -1327,6 +1554,72 @@ class MockServerChannel:  # pylint: disable=too-many-instance-attributes
             if self._request_queue is not None:
                 await self._request_queue.put(None)
 
+    async def _run_block(
+        self, height: int, txs: List[bytes], now: Optional[float] = None
+    ) -> None:
+        """
+        Run the ABCI lifecycle of a block: begin_block, deliver_tx for each transaction, end_block and commit.
+
+        :param height: the height of the block.
+        :param txs: the transactions of the block.
+        :param now: the time of the block, defaults to the current time.
+        """
+        self._height = height
+        await self._send_and_wait(
+            AbciMessage.Performative.REQUEST_BEGIN_BLOCK,
+            hash=b"",
+            header=self._make_header(height, now),
+            last_commit_info=LastCommitInfo(0, []),
+            byzantine_validators=Evidences([]),
+        )
+        for tx_bytes in txs:
+            tx_hash = hashlib.sha256(tx_bytes).hexdigest().upper()
+            await self._send_and_wait(
+                AbciMessage.Performative.REQUEST_DELIVER_TX,
+                tx=tx_bytes,
+            )
+            self._delivered_txs.add(tx_hash)
+            if self.network is not None:
+                self._delivered_order.append(tx_hash)
+                if len(self._delivered_order) > self.MAX_DELIVERED_TXS:
+                    self._delivered_txs.discard(self._delivered_order.popleft())
+
+        await self._send_and_wait(
+            AbciMessage.Performative.REQUEST_END_BLOCK,
+            height=height,
+        )
+        await self._send_and_wait(
+            AbciMessage.Performative.REQUEST_COMMIT,
+        )
+
+    async def _follow_network(self) -> None:
+        """Run the ABCI lifecycle of the blocks produced by the network."""
+        network = cast(MockNetwork, self.network)
+        block_event = cast(asyncio.Event, self._block_event)
+        sequence = 0
+        while not self._is_stopped:
+            block_event.clear()
+            block = network.get_block(sequence + 1)
+            if block is None:
+                await block_event.wait()
+                continue
+            await self._run_block(block.height, list(block.txs), block.time)
+            sequence = block.sequence
+            network.committed(cast(int, self._node), sequence)
+
+    def _wakeup(self) -> None:
+        """Wake up the block loop; called by the network's thread."""
+        loop, block_event = self._loop, self._block_event
+        if loop is None or block_event is None or loop.is_closed():
+            return  # pragma: nocover
+        loop.call_soon_threadsafe(block_event.set)
+
+    def _leave_network(self) -> None:
+        """Leave the network, if the channel has joined one."""
+        if self.network is not None and self._node is not None:
+            self.network.leave(self._node)
+            self._node = None
+
     # --- Mock Tendermint RPC HTTP server (stdlib asyncio) ---
 
     async def _handle_rpc_connection(  # pylint: disable=too-many-locals
@@ -1417,7 +1710,10 @@ class MockServerChannel:  # pylint: disable=too-many-instance-attributes
             )
             return 400, body
         tx_hash = hashlib.sha256(tx_bytes).hexdigest().upper()
-        self._mempool.append(tx_bytes)
+        if self.network is not None:
+            self.network.submit(tx_bytes)
+        else:
+            self._mempool.append(tx_bytes)
         if self._new_tx_event is not None:
             self._new_tx_event.set()
         body = json.dumps(
@@ -1484,11 +1780,12 @@ class MockServerChannel:  # pylint: disable=too-many-instance-attributes
 
     def _handle_net_info(self) -> Tuple[int, str]:
         """Handle /net_info — return minimal valid response."""
+        n_peers = 0 if self.network is None else self.network.n_nodes - 1
         body = json.dumps(
             {
                 "jsonrpc": "2.0",
                 "id": "",
-                "result": {"n_peers": "0", "peers": []},
+                "result": {"n_peers": str(n_peers), "peers": []},
             }
         )
         return 200, body
@@ -1498,6 +1795,9 @@ class MockServerChannel:  # pylint: disable=too-many-instance-attributes
         self._height = 0
         self._mempool.clear()
         self._delivered_txs.clear()
+        self._delivered_order.clear()
+        if self.network is not None and self._node is not None:
+            self.network.request_reset(self._node)
         body = json.dumps({"status": True, "message": "mock reset"})
         return 200, body
 
@@ -1821,6 +2121,16 @@ class ABCIServerConnection(Connection):  # pylint: disable=too-many-instance-att
         self._process_connection_params()
         self._process_tendermint_params()
 
+        # the ABCI requests can be recorded, to replay them without Tendermint
+        abci_requests_log = cast(
+            Optional[str], self.configuration.config.get("abci_requests_log")
+        )
+        self.recorder: Optional[AbciRequestsRecorder] = (
+            AbciRequestsRecorder(abci_requests_log)
+            if abci_requests_log is not None
+            else None
+        )
+
         if self.use_grpc and not self.use_mock:
             self.channel = GrpcServerChannel(
                 self.target_skill_id,
@@ -1847,11 +2157,28 @@ class ABCIServerConnection(Connection):  # pylint: disable=too-many-instance-att
             parsed = urlparse(rpc_laddr_clean)
             rpc_host = parsed.hostname or LOCALHOST
             rpc_port = parsed.port or DEFAULT_RPC_PORT
+            # simulated services can run on a virtual clock, faster than the wall clock
+            virtual_time_speed = cast(
+                Optional[float], self.configuration.config.get("virtual_time_speed")
+            )
+            if virtual_time_speed is not None:
+                clock.install_virtual_clock(virtual_time_speed)
+            # the agents of a multi-agent service running in the same process join the same mock network
+            mock_network_name = cast(
+                Optional[str], self.configuration.config.get("mock_network", None)
+            )
+            mock_network = None
+            if mock_network_name is not None:
+                mock_network = MockNetwork.get(
+                    mock_network_name,
+                    cast(int, self.configuration.config.get("mock_network_size", 1)),
+                )
             self.channel = MockServerChannel(
                 target_skill_id=self.target_skill_id,
                 rpc_host=rpc_host,
                 rpc_port=rpc_port,
                 logger=self.logger,
+                network=mock_network,
             )
 
     def _process_connection_params(self) -> None:
@@ -1967,6 +2294,8 @@ class ABCIServerConnection(Connection):  # pylint: disable=too-many-instance-att
         if self.channel.is_stopped:  # pragma: no cover
             self.state = ConnectionStates.disconnected
             return
+        if self.recorder is not None:
+            self.recorder.open()
         self.state = ConnectionStates.connected
 
     async def disconnect(self) -> None:
@@ -1986,6 +2315,8 @@ class ABCIServerConnection(Connection):  # pylint: disable=too-many-instance-att
             Union[TcpServerChannel, GrpcServerChannel, MockServerChannel], self.channel
         )
         await self.channel.disconnect()
+        if self.recorder is not None:
+            self.recorder.close()
         self.state = ConnectionStates.disconnected
 
     async def send(self, envelope: Envelope) -> None:
@@ -1998,6 +2329,12 @@ class ABCIServerConnection(Connection):  # pylint: disable=too-many-instance-att
         self.channel = cast(
             Union[TcpServerChannel, GrpcServerChannel, MockServerChannel], self.channel
         )
+        message = cast(AbciMessage, envelope.message)
+        if (
+            self.recorder is not None
+            and message.performative == AbciMessage.Performative.RESPONSE_COMMIT
+        ):
+            self.recorder.record_commit(message.data)
         await self.channel.send(envelope)
 
     async def receive(self, *args: Any, **kwargs: Any) -> Optional[Envelope]:
@@ -2014,6 +2351,8 @@ class ABCIServerConnection(Connection):  # pylint: disable=too-many-instance-att
         )
         try:
             message = await self.channel.get_message()
+            if self.recorder is not None:
+                self.recorder.record_request(cast(AbciMessage, message.message))
             return message
         except CancelledError:  # pragma: no cover
             return None
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Recording of the ABCI requests received by the connection, so that they can be replayed without Tendermint."""
+
+from enum import Enum
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Tuple, Union, cast
+
+from packages.valory.protocols.abci import AbciMessage
+
+RECORDING_MAGIC = b"ABCIREC1"
+
+
+class RecordType(Enum):
+    """The type of a record of an ABCI requests log."""
+
+    START = 0
+    REQUEST = 1
+    COMMIT = 2
+
+
+Record = Tuple[RecordType, Union[AbciMessage, bytes]]
+
+
+def _encode_varint(number: int) -> bytes:
+    """Encode a non-negative number as an unsigned LEB128 varint."""
+    buffer = bytearray()
+    while True:
+        byte = number & 0x7F
+        number >>= 7
+        if number:
+            buffer.append(byte | 0x80)
+            continue
+        buffer.append(byte)
+        return bytes(buffer)
+
+
+def _read_varint(file: BinaryIO) -> Optional[int]:
+    """Read an unsigned LEB128 varint, or return None if the file ends first."""
+    number, shift = 0, 0
+    while True:
+        byte = file.read(1)
+        if not byte:
+            return None
+        number |= (byte[0] & 0x7F) << shift
+        if not byte[0] & 0x80:
+            return number
+        shift += 7
+
+
+class AbciRequestsRecorder:
+    """An append-only binary log of the ABCI requests, and of the app hashes returned at every commit.
+
+    The log starts with `RECORDING_MAGIC`, followed by the records. Each record is a type byte, the varint-encoded
+    length of its payload, and the payload: the serialized `AbciMessage` of a request, the app hash of a commit
+    response, or nothing for the start of a run. The records of a restarted agent are appended to the same log.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Initialize the recorder.
+
+        :param path: the path of the log.
+        """
+        self.path = Path(path)
+        self._file: Optional[BinaryIO] = None
+
+    @property
+    def is_open(self) -> bool:
+        """Check whether the log is open."""
+        return self._file is not None
+
+    def open(self) -> None:
+        """Open the log, marking the start of a run."""
+        if self._file is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        log_file = open(self.path, "ab")  # pylint: disable=consider-using-with
+        self._file = cast(BinaryIO, log_file)
+        if self._file.tell() == 0:
+            self._file.write(RECORDING_MAGIC)
+        self._write(RecordType.START, b"")
+
+    def close(self) -> None:
+        """Close the log."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+
+    def record_request(self, message: AbciMessage) -> None:
+        """
+        Record an ABCI request.
+
+        :param message: the request.
+        """
+        self._write(RecordType.REQUEST, AbciMessage.serializer.encode(message))
+
+    def record_commit(self, app_hash: bytes) -> None:
+        """
+        Record the app hash returned in response to a commit; the log is flushed at every commit.
+
+        :param app_hash: the app hash.
+        """
+        self._write(RecordType.COMMIT, app_hash)
+        cast(BinaryIO, self._file).flush()
+
+    def _write(self, record_type: RecordType, payload: bytes) -> None:
+        """Write a record."""
+        if self._file is None:
+            raise ValueError(f"The ABCI requests log {self.path} is not open.")
+        self._file.write(
+            bytes([record_type.value]) + _encode_varint(len(payload)) + payload
+        )
+
+
+def read_records(path: Union[str, Path]) -> Iterator[Record]:
+    """
+    Read the records of an ABCI requests log.
+
+    A truncated last record, e.g., because the agent was killed while writing it, is ignored.
+
+    :param path: the path of the log.
+    :yield: the type of each record, along with the request, the app hash, or the empty payload of a start.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(RECORDING_MAGIC)) != RECORDING_MAGIC:
+            raise ValueError(f"{path} is not an ABCI requests log.")
+        while True:
+            type_byte = file.read(1)
+            if not type_byte:
+                return
+            length = _read_varint(file)
+            if length is None:
+                return
+            payload = file.read(length)
+            if len(payload) < length:
+                return
+            record_type = RecordType(type_byte[0])
+            if record_type == RecordType.REQUEST:
+                yield record_type, cast(
+                    AbciMessage, AbciMessage.serializer.decode(payload)
+                )
+                continue
+            yield record_type, payload
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Tests for the clock of the abci connection."""
+
+import datetime
+from time import time
+
+import pytest
+
+from packages.valory.connections.abci import clock
+from packages.valory.connections.abci.clock import (
+    VirtualClock,
+    get_virtual_clock,
+    install_virtual_clock,
+    uninstall_virtual_clock,
+)
+
+
+def test_virtual_clock() -> None:
+    """Test the virtual clock."""
+    virtual_clock = VirtualClock(speed=100.0, start=0.0)
+    first = virtual_clock.time()
+    second = virtual_clock.time()
+    assert 0.0 <= first <= second
+    assert virtual_clock.real_duration(50.0) == 0.5
+
+    virtual_clock.advance(3600.0)
+    assert virtual_clock.time() >= second + 3600.0
+    assert virtual_clock.now() >= datetime.datetime.fromtimestamp(3600.0)
+
+
+def test_virtual_clock_starts_now() -> None:
+    """Test that the virtual clock starts from the current time by default."""
+    before = time()
+    virtual_clock = VirtualClock(speed=2.0)
+    assert before <= virtual_clock.time() <= time() + 1.0
+
+
+@pytest.mark.parametrize("speed", (0.0, -1.0))
+def test_virtual_clock_invalid_speed(speed: float) -> None:
+    """Test that the speed of the virtual clock must be positive."""
+    with pytest.raises(ValueError, match="must be positive"):
+        VirtualClock(speed)
+
+
+def test_virtual_clock_cannot_go_back() -> None:
+    """Test that the virtual clock cannot be moved backwards."""
+    with pytest.raises(ValueError, match="positive amount of time"):
+        VirtualClock().advance(-1.0)
+
+
+def test_process_clock() -> None:
+    """Test the clock of the process, with and without a virtual clock installed."""
+    assert get_virtual_clock() is None
+    assert clock.real_duration(10.0) == 10.0
+    assert abs(clock.time() - time()) < 1.0
+    assert abs((clock.now() - datetime.datetime.now()).total_seconds()) < 1.0
+
+    virtual_clock = install_virtual_clock(1000.0)
+    try:
+        assert get_virtual_clock() is virtual_clock
+        virtual_clock.advance(3600.0)
+        assert clock.real_duration(10.0) == 0.01
+        assert clock.time() >= time() + 3600.0
+        assert clock.now() >= datetime.datetime.now() + datetime.timedelta(hours=1)
+    finally:
+        uninstall_virtual_clock()
+    assert get_virtual_clock() is None
@@ -27,7 +27,7 @@ import json
 import socket
 import urllib.error
 import urllib.request
-from typing import AsyncGenerator, Dict, List, Tuple, cast
+from typing import AsyncGenerator, Callable, Dict, List, Optional, Tuple, cast
 
 import pytest
 import pytest_asyncio
@@ -36,7 +36,14 @@ from aea.mail.base import Envelope
 from aea.protocols.base import Address, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 
-from packages.valory.connections.abci.connection import MockServerChannel
+from packages.valory.connections.abci.clock import (
+    install_virtual_clock,
+    uninstall_virtual_clock,
+)
+from packages.valory.connections.abci.connection import (
+    MockNetwork,
+    MockServerChannel,
+)
 from packages.valory.protocols.abci import AbciMessage
 from packages.valory.protocols.abci.custom_types import Events, ValidatorUpdates
 from packages.valory.protocols.abci.dialogues import AbciDialogue
@@ -458,3 +465,331 @@ class TestLifecycle:
         url = f"http://127.0.0.1:{connected_channel.rpc_port}/nonexistent"
         status, body = await asyncio.to_thread(_http_get, url)
         assert status == 404
+
+
+# --- Multi-agent mock network tests ---
+
+
+_Delivery = Tuple[int, Optional[bytes]]
+
+
+async def _serve(
+    ch: MockServerChannel, deliveries: List[_Delivery], timestamps: List[int]
+) -> None:
+    """Respond to all the requests of a channel, recording the delivered transactions by height.
+
+    :param ch: the mock channel.
+    :param deliveries: the (height, tx) pairs of the delivered transactions, with tx None for commits.
+    :param timestamps: the timestamps of the block headers.
+    """
+    skill_dialogues = _SkillSideDialogues(str(ch.target_skill_id))
+    while True:
+        env = await ch.get_message()
+        request = cast(AbciMessage, env.message)
+        if request.performative == AbciMessage.Performative.REQUEST_BEGIN_BLOCK:
+            timestamps.append(request.header.time.seconds)
+        elif request.performative == AbciMessage.Performative.REQUEST_DELIVER_TX:
+            deliveries.append((ch._height, request.tx))
+        elif request.performative == AbciMessage.Performative.REQUEST_COMMIT:
+            deliveries.append((ch._height, None))
+        dialogue = skill_dialogues.update(request)
+        resp_perf, resp_kwargs = _RESPONSE_MAP[request.performative]
+        response = cast(
+            AbciMessage, dialogue.reply(performative=resp_perf, **resp_kwargs)
+        )
+        await ch.send(
+            Envelope(to=response.to, sender=response.sender, message=response)
+        )
+
+
+def _free_port() -> int:
+    """Get a free port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("", 0))  # nosec
+        return s.getsockname()[1]
+
+
+async def _wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> None:
+    """Wait until a condition holds."""
+    deadline = asyncio.get_event_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_event_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+class TestMockNetwork:
+    """Test running several agents against a shared mock network."""
+
+    N_NODES = 4
+
+    def setup_method(self) -> None:
+        """Set up the test."""
+        self.network = MockNetwork(self.N_NODES, block_time=10.0)
+        self.channels = [
+            MockServerChannel(
+                target_skill_id=SKILL_ID,
+                rpc_host="127.0.0.1",
+                rpc_port=_free_port(),
+                network=self.network,
+            )
+            for _ in range(self.N_NODES)
+        ]
+        self.deliveries: List[List[_Delivery]] = [[] for _ in self.channels]
+        self.timestamps: List[List[int]] = [[] for _ in self.channels]
+        self.servers: List[asyncio.Task] = []
+
+    async def _connect(self, serve: bool = True) -> None:
+        """Connect the channels, and serve their requests."""
+        loop = asyncio.get_event_loop()
+        for ch in self.channels:
+            await ch.connect(loop)
+        if serve:
+            for node in range(self.N_NODES):
+                self._serve(node)
+
+    def _serve(self, node: int) -> None:
+        """Serve the requests of a node's channel."""
+        serve = _serve(
+            self.channels[node], self.deliveries[node], self.timestamps[node]
+        )
+        self.servers.append(asyncio.get_event_loop().create_task(serve))
+
+    async def _disconnect(self) -> None:
+        """Disconnect the channels."""
+        for server in self.servers:
+            server.cancel()
+        for ch in self.channels:
+            await ch.disconnect()
+        assert self.network.is_stopped
+
+    def _broadcast(self, node: int, tx: bytes) -> None:
+        """Broadcast a transaction via a node's RPC server."""
+        url = f"http://127.0.0.1:{self.channels[node].rpc_port}/broadcast_tx_sync?tx=0x{tx.hex()}"
+        status, _ = _http_get(url)
+        assert status == 200
+
+    @pytest.mark.asyncio
+    async def test_blocks_are_shared(self) -> None:
+        """Test that all the nodes deliver the same blocks, with the transactions ordered by hash."""
+        await self._connect(serve=False)
+        try:
+            for node in range(self.N_NODES - 1):
+                self._serve(node)
+            await _wait_for(lambda: all((1, None) in d for d in self.deliveries[:-1]))
+            # the last node has not committed block 1, so the next block is not produced yet
+            txs = [f"tx_{i}".encode() for i in range(self.N_NODES)]
+            for node, tx in enumerate(txs):
+                await asyncio.to_thread(self._broadcast, node, tx)
+            assert self.network.height == 1
+            self._serve(self.N_NODES - 1)
+            await _wait_for(lambda: all((2, None) in d for d in self.deliveries))
+        finally:
+            await self._disconnect()
+
+        expected_txs = sorted(txs, key=lambda tx: hashlib.sha256(tx).digest())
+        for deliveries, timestamps in zip(self.deliveries, self.timestamps):
+            assert deliveries == self.deliveries[0]
+            assert timestamps == self.timestamps[0]
+            assert [tx for height, tx in deliveries if tx is not None] == expected_txs
+            assert all(height == 2 for height, tx in deliveries if tx is not None)
+
+    @pytest.mark.asyncio
+    async def test_no_blocks_before_all_nodes_joined(self) -> None:
+        """Test that the network waits for all the nodes to join."""
+        loop = asyncio.get_event_loop()
+        await self.channels[0].connect(loop)
+        server = loop.create_task(
+            _serve(self.channels[0], self.deliveries[0], self.timestamps[0])
+        )
+        try:
+            self.network.submit(b"tx")
+            await asyncio.sleep(0.2)
+            assert self.network.height == 0
+            assert self.deliveries[0] == []
+        finally:
+            server.cancel()
+            await self.channels[0].disconnect()
+
+    @pytest.mark.asyncio
+    async def test_rpc(self) -> None:
+        """Test the RPC endpoints of the nodes of a network."""
+        await self._connect()
+        try:
+            tx = b"tx"
+            tx_hash = hashlib.sha256(tx).hexdigest().upper()
+            await asyncio.to_thread(self._broadcast, 0, tx)
+            await _wait_for(
+                lambda: all((tx_hash in ch._delivered_txs) for ch in self.channels)
+            )
+            for ch in self.channels:
+                base_url = f"http://127.0.0.1:{ch.rpc_port}"
+                status, body = await asyncio.to_thread(
+                    _http_get, f"{base_url}/tx?hash=0x{tx_hash}"
+                )
+                assert status == 200
+                status, body = await asyncio.to_thread(
+                    _http_get, f"{base_url}/net_info"
+                )
+                assert body["result"]["n_peers"] == str(self.N_NODES - 1)
+        finally:
+            await self._disconnect()
+
+    @pytest.mark.asyncio
+    async def test_reset(self) -> None:
+        """Test that the chain is reset once all the nodes have requested it."""
+        await self._connect()
+        try:
+            await _wait_for(lambda: self.network.height == 1)
+            await asyncio.to_thread(self._broadcast, 0, b"tx")
+            await _wait_for(lambda: self.network.height >= 2)
+            for node, ch in enumerate(self.channels):
+                url = f"http://127.0.0.1:{ch.rpc_port}/hard_reset"
+                await asyncio.to_thread(_http_get, url)
+                if node < self.N_NODES - 1:
+                    # the network waits for all the nodes to request the reset
+                    assert self.network.height >= 2
+            assert self.network.height == 0
+            await asyncio.to_thread(self._broadcast, 1, b"tx_after_reset")
+            # the heights start over after the reset
+            await _wait_for(
+                lambda: all((1, b"tx_after_reset") in d for d in self.deliveries)
+            )
+        finally:
+            await self._disconnect()
+
+
+class TestMockNetworkTwentyNodes(TestMockNetwork):
+    """Test running twenty agents against a shared mock network."""
+
+    N_NODES = 20
+
+
+def test_mock_network_registry() -> None:
+    """Test getting the mock networks by name."""
+    network = MockNetwork.get("test_network", 2)
+    try:
+        assert MockNetwork.get("test_network", 2) is network
+        with pytest.raises(ValueError, match="has 2 nodes, not 3"):
+            MockNetwork.get("test_network", 3)
+        nodes = [network.join(lambda: None) for _ in range(2)]
+        with pytest.raises(ValueError, match="Mock network is full"):
+            network.join(lambda: None)
+    finally:
+        for node in nodes:
+            network.leave(node)
+    assert network.is_stopped
+    assert MockNetwork.get("test_network", 3) is not network
+    MockNetwork.get("test_network", 3).leave(-1)
+    with pytest.raises(ValueError, match="has stopped"):
+        network.join(lambda: None)
+
+
+def test_mock_network_invalid_size() -> None:
+    """Test that a mock network needs at least one node."""
+    with pytest.raises(ValueError, match="needs at least one node"):
+        MockNetwork(0)
+
+
+class TestVirtualTime:
+    """Test the mock chain running on a virtual clock."""
+
+    SPEED = 1000.0
+    BLOCK_TIME = 10.0
+
+    def setup_method(self) -> None:
+        """Set up the test."""
+        self.clock = install_virtual_clock(self.SPEED)
+
+    def teardown_method(self) -> None:
+        """Tear down the test."""
+        uninstall_virtual_clock()
+
+    @pytest.mark.asyncio
+    async def test_empty_blocks(self) -> None:
+        """Test that the empty blocks are produced faster, with timestamps following the virtual clock."""
+        ch = MockServerChannel(
+            target_skill_id=SKILL_ID,
+            rpc_host="127.0.0.1",
+            rpc_port=_free_port(),
+            block_time=self.BLOCK_TIME,
+        )
+        deliveries: List[_Delivery] = []
+        timestamps: List[int] = []
+        loop = asyncio.get_event_loop()
+        await ch.connect(loop)
+        server = loop.create_task(_serve(ch, deliveries, timestamps))
+        try:
+            # 10 blocks would take 100 seconds on the wall clock
+            await _wait_for(lambda: len(timestamps) >= 10, timeout=5.0)
+        finally:
+            server.cancel()
+            await ch.disconnect()
+
+        intervals = [end - start for start, end in zip(timestamps, timestamps[1:])]
+        assert all(interval >= self.BLOCK_TIME - 1 for interval in intervals)
+        assert timestamps[-1] <= self.clock.time()
+
+    @pytest.mark.asyncio
+    async def test_network(self) -> None:
+        """Test that the blocks of a network follow the virtual clock."""
+        network = MockNetwork(2, block_time=self.BLOCK_TIME)
+        channels = [
+            MockServerChannel(
+                target_skill_id=SKILL_ID,
+                rpc_host="127.0.0.1",
+                rpc_port=_free_port(),
+                network=network,
+            )
+            for _ in range(2)
+        ]
+        timestamps: List[List[int]] = [[], []]
+        loop = asyncio.get_event_loop()
+        servers = []
+        for ch, ch_timestamps in zip(channels, timestamps):
+            await ch.connect(loop)
+            servers.append(loop.create_task(_serve(ch, [], ch_timestamps)))
+        try:
+            await _wait_for(lambda: network.height >= 10, timeout=5.0)
+        finally:
+            for server in servers:
+                server.cancel()
+            for ch in channels:
+                await ch.disconnect()
+
+        common = min(len(ts) for ts in timestamps)
+        assert timestamps[0][:common] == timestamps[1][:common]
+        assert timestamps[0][9] - timestamps[0][0] >= 9 * (self.BLOCK_TIME - 1)
+
+    @pytest.mark.asyncio
+    async def test_fast_forward(self) -> None:
+        """Test that advancing the clock moves the timestamps of the next blocks forward."""
+        ch = MockServerChannel(
+            target_skill_id=SKILL_ID,
+            rpc_host="127.0.0.1",
+            rpc_port=_free_port(),
+            block_time=self.BLOCK_TIME,
+        )
+        timestamps: List[int] = []
+        loop = asyncio.get_event_loop()
+        await ch.connect(loop)
+        server = loop.create_task(_serve(ch, [], timestamps))
+        try:
+            await _wait_for(lambda: len(timestamps) >= 1)
+            self.clock.advance(3600.0)
+            await _wait_for(lambda: len(timestamps) >= 2)
+        finally:
+            server.cancel()
+            await ch.disconnect()
+
+        assert timestamps[1] - timestamps[0] >= 3600
+
+
+def test_virtual_clock_config_speed_mismatch() -> None:
+    """Test that the agents of a process share the speed of the virtual clock."""
+    clock = install_virtual_clock(10.0)
+    try:
+        assert install_virtual_clock(10.0) is clock
+        with pytest.raises(ValueError, match="already installed"):
+            install_virtual_clock(20.0)
+    finally:
+        uninstall_virtual_clock()
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Tests for the recording of the ABCI requests."""
+
+from pathlib import Path
+
+import pytest
+
+from packages.valory.connections.abci.connection import PUBLIC_ID
+from packages.valory.connections.abci.dialogues import AbciDialogues
+from packages.valory.connections.abci.recording import (
+    AbciRequestsRecorder,
+    RECORDING_MAGIC,
+    RecordType,
+    read_records,
+)
+from packages.valory.protocols.abci import AbciMessage
+
+SKILL_ID = "valory/test_skill:0.1.0"
+
+
+def _request(dialogues: AbciDialogues, height: int) -> AbciMessage:
+    """Create an end block request."""
+    message, _ = dialogues.create(
+        counterparty=SKILL_ID,
+        performative=AbciMessage.Performative.REQUEST_END_BLOCK,
+        height=height,
+    )
+    return message
+
+
+def test_record_and_read(tmp_path: Path) -> None:
+    """Test that the recorded requests and app hashes are read back in order."""
+    log = tmp_path / "logs" / "abci_requests.log"
+    dialogues = AbciDialogues(connection_id=PUBLIC_ID)
+    recorder = AbciRequestsRecorder(log)
+    assert not recorder.is_open
+    recorder.open()
+    assert recorder.is_open
+    recorder.open()  # opening an open log is a no-op
+    requests = [_request(dialogues, height) for height in range(1, 300)]
+    for height, request in enumerate(requests, start=1):
+        recorder.record_request(request)
+        recorder.record_commit(height.to_bytes(32, "big"))
+    recorder.close()
+    recorder.close()  # closing a closed log is a no-op
+
+    records = list(read_records(log))
+    assert records[0] == (RecordType.START, b"")
+    for height, request in enumerate(requests, start=1):
+        (request_type, replayed), (commit_type, app_hash) = records[
+            2 * height - 1 : 2 * height + 1
+        ]
+        assert request_type == RecordType.REQUEST
+        assert isinstance(replayed, AbciMessage)
+        assert replayed.performative == AbciMessage.Performative.REQUEST_END_BLOCK
+        assert replayed.height == height
+        assert replayed.dialogue_reference == request.dialogue_reference
+        assert commit_type == RecordType.COMMIT
+        assert app_hash == height.to_bytes(32, "big")
+
+
+def test_runs_are_appended(tmp_path: Path) -> None:
+    """Test that the records of a restarted agent are appended to the same log."""
+    log = tmp_path / "abci_requests.log"
+    for _ in range(2):
+        recorder = AbciRequestsRecorder(log)
+        recorder.open()
+        recorder.record_commit(b"app_hash")
+        recorder.close()
+
+    assert log.read_bytes().count(RECORDING_MAGIC) == 1
+    assert [record_type for record_type, _ in read_records(log)] == [
+        RecordType.START,
+        RecordType.COMMIT,
+        RecordType.START,
+        RecordType.COMMIT,
+    ]
+
+
+def test_truncated_record_is_ignored(tmp_path: Path) -> None:
+    """Test that a truncated last record is ignored."""
+    log = tmp_path / "abci_requests.log"
+    recorder = AbciRequestsRecorder(log)
+    recorder.open()
+    recorder.record_commit(b"app_hash")
+    recorder.record_request(_request(AbciDialogues(connection_id=PUBLIC_ID), 1))
+    recorder.close()
+
+    data = log.read_bytes()
+    for end in (len(data) - 1, len(data) - 20):
+        log.write_bytes(data[:end])
+        assert [record_type for record_type, _ in read_records(log)] == [
+            RecordType.START,
+            RecordType.COMMIT,
+        ]
+
+
+def test_invalid_log(tmp_path: Path) -> None:
+    """Test reading a file which is not an ABCI requests log."""
+    log = tmp_path / "abci_requests.log"
+    log.write_bytes(b"not a log")
+    with pytest.raises(ValueError, match="is not an ABCI requests log"):
+        list(read_records(log))
+
+
+def test_record_before_open(tmp_path: Path) -> None:
+    """Test that the log has to be opened before recording."""
+    with pytest.raises(ValueError, match="is not open"):
+        AbciRequestsRecorder(tmp_path / "abci_requests.log").record_commit(b"")
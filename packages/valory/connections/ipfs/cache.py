@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""A bounded, content-addressed cache for the files downloaded from IPFS."""
+
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from shutil import rmtree
+from typing import Callable, Dict, Optional, cast
+
+Files = Dict[str, str]
+STAGING_PREFIX = ".staging-"
+
+
+def _disk_size(path: Path) -> int:
+    """Get the total size of the files under a path."""
+    if path.is_file():
+        return path.stat().st_size
+    return sum(
+        (Path(root) / fname).stat().st_size
+        for root, _, filenames in os.walk(path)
+        for fname in filenames
+    )
+
+
+def _memory_size(files: Files) -> int:
+    """Get the approximate size of the files held in memory."""
+    return sum(len(path) + len(data) for path, data in files.items())
+
+
+class IpfsCache:  # pylint: disable=too-many-instance-attributes
+    """
+    A cache of the files downloaded from IPFS, keyed by their CID.
+
+    CIDs are immutable, therefore an entry never needs to be invalidated; it is
+    only evicted, least recently used first, when one of the size bounds is exceeded.
+    The on-disk tier keeps the downloaded content under ``<path>/<cid>`` so that it
+    survives restarts, while the optional in-memory tier keeps the decoded files.
+    Concurrent fetches of the same CID are coalesced into a single download.
+
+    The cache is thread-safe, as the connection serves its requests from an executor.
+    """
+
+    def __init__(
+        self,
+        reader: Callable[[Path], Files],
+        path: Optional[str] = None,
+        max_size: int = 0,
+        memory_max_size: int = 0,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        :param reader: reads the files under a downloaded directory.
+        :param path: the directory of the on-disk tier.
+        :param max_size: the maximum size in bytes of the on-disk tier, `0` disables it.
+        :param memory_max_size: the maximum size of the in-memory tier, `0` disables it.
+        """
+        if max_size < 0 or memory_max_size < 0:
+            raise ValueError("The IPFS cache sizes must be non-negative.")
+        self._reader = reader
+        self._path = Path(path) if path is not None and max_size > 0 else None
+        self._max_size = max_size
+        self._memory_max_size = memory_max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._memory: "OrderedDict[str, Files]" = OrderedDict()
+        self._size = 0
+        self._memory_size = 0
+        self._in_flight: Dict[str, Future] = {}
+        self.hits = 0
+        self.misses = 0
+        if self._path is not None:
+            self._load()
+
+    @property
+    def size(self) -> int:
+        """Get the size in bytes of the on-disk tier."""
+        return self._size
+
+    @property
+    def memory_size(self) -> int:
+        """Get the approximate size of the in-memory tier."""
+        return self._memory_size
+
+    def __contains__(self, ipfs_hash: object) -> bool:
+        """Check whether a CID is cached."""
+        return ipfs_hash in self._memory or ipfs_hash in self._entries
+
+    def _load(self) -> None:
+        """Index the entries left on disk by a previous run, oldest first."""
+        path = cast(Path, self._path)
+        path.mkdir(parents=True, exist_ok=True)
+        entries = []
+        for entry in path.iterdir():
+            if entry.name.startswith(STAGING_PREFIX):
+                rmtree(entry, ignore_errors=True)
+                continue
+            entries.append((entry.stat().st_mtime, entry.name, _disk_size(entry)))
+        for _, ipfs_hash, size in sorted(entries):
+            self._entries[ipfs_hash] = size
+            self._size += size
+        self._evict()
+
+    @staticmethod
+    def _is_cid(ipfs_hash: str) -> bool:
+        """Check whether a hash can be used as a directory name."""
+        return ipfs_hash.isalnum()
+
+    def _lookup(self, ipfs_hash: str) -> Optional[Files]:
+        """Look a CID up in both tiers, refreshing its recency."""
+        files = self._memory.get(ipfs_hash)
+        if files is not None:
+            self._memory.move_to_end(ipfs_hash)
+            return files
+        if ipfs_hash not in self._entries:
+            return None
+        entry = cast(Path, self._path) / ipfs_hash
+        try:
+            files = self._reader(entry)
+            os.utime(entry)
+        except OSError:
+            # the entry was removed behind our back
+            self._discard(ipfs_hash)
+            return None
+        self._entries.move_to_end(ipfs_hash)
+        self._remember(ipfs_hash, files)
+        return files
+
+    def _remember(self, ipfs_hash: str, files: Files) -> None:
+        """Keep the files of a CID in memory."""
+        size = _memory_size(files)
+        if size > self._memory_max_size:
+            return
+        self._memory[ipfs_hash] = files
+        self._memory_size += size
+        while self._memory_size > self._memory_max_size:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= _memory_size(evicted)
+
+    def _store(self, ipfs_hash: str, downloaded: Path) -> None:
+        """Move a downloaded file or directory to the on-disk tier."""
+        if self._path is None or not self._is_cid(ipfs_hash):
+            return
+        size = _disk_size(downloaded)
+        if size > self._max_size:
+            return
+        entry = self._path / ipfs_hash
+        if entry.exists():  # pragma: nocover
+            rmtree(entry, ignore_errors=True)
+        os.replace(downloaded, entry)
+        self._entries[ipfs_hash] = size
+        self._size += size
+        self._evict()
+
+    def _discard(self, ipfs_hash: str) -> None:
+        """Remove a CID from the on-disk tier."""
+        self._size -= self._entries.pop(ipfs_hash)
+        rmtree(cast(Path, self._path) / ipfs_hash, ignore_errors=True)
+
+    def _evict(self) -> None:
+        """Evict the least recently used entries until the on-disk tier fits."""
+        while self._size > self._max_size:
+            self._discard(next(iter(self._entries)))
+
+    def _download(self, ipfs_hash: str, download: Callable[[str, str], Path]) -> Files:
+        """Download a CID to a staging directory, read it and cache it."""
+        if self._path is not None:
+            staging = tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=self._path)
+        else:
+            staging = tempfile.mkdtemp()
+        try:
+            downloaded = download(ipfs_hash, staging)
+            files = self._reader(downloaded)
+            with self._lock:
+                self._store(ipfs_hash, downloaded)
+                self._remember(ipfs_hash, files)
+            return files
+        finally:
+            rmtree(staging, ignore_errors=True)
+
+    def fetch(self, ipfs_hash: str, download: Callable[[str, str], Path]) -> Files:
+        """
+        Get the files of a CID, downloading them only on a cache miss.
+
+        :param ipfs_hash: the CID to fetch.
+        :param download: downloads a CID to a directory and returns the path to read.
+        :return: a copy of the files of the CID.
+        """
+        with self._lock:
+            files = self._lookup(ipfs_hash)
+            if files is not None:
+                self.hits += 1
+                return dict(files)
+            in_flight = self._in_flight.get(ipfs_hash)
+            if in_flight is None:
+                self.misses += 1
+                self._in_flight[ipfs_hash] = future = Future()
+
+        if in_flight is not None:
+            return dict(in_flight.result())
+
+        try:
+            files = self._download(ipfs_hash, download)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(files)
+            return dict(files)
+        finally:
+            with self._lock:
+                del self._in_flight[ipfs_hash]
@@ -19,26 +19,34 @@
 """A connection responsible for uploading and downloading files from IPFS."""
 
 import asyncio
+import json
 import os
-import tempfile
+import threading
+import time
+import urllib.parse
+import urllib.request
+import uuid
 from asyncio import Task
-from concurrent.futures import Executor, ThreadPoolExecutor
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from shutil import rmtree
-from typing import Any, Callable, Dict, Optional, cast
+from typing import Any, Callable, Dict, Optional, Set, Tuple, cast
 
 from aea.configurations.base import PublicId
 from aea.connections.base import Connection, ConnectionStates
 from aea.mail.base import Envelope
 from aea.protocols.base import Address, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
-from aea_cli_ipfs.ipfs_utils import IPFSTool
+from aea_cli_ipfs.ipfs_utils import DEFAULT_IPFS_URI_BASE, IPFSTool, addr_to_url
 
+from packages.valory.connections.ipfs.cache import IpfsCache
+from packages.valory.connections.ipfs.unixfs import encode_files, hash_files
 from packages.valory.protocols.ipfs import IpfsMessage
 from packages.valory.protocols.ipfs.dialogues import IpfsDialogue
 from packages.valory.protocols.ipfs.dialogues import IpfsDialogues as BaseIpfsDialogues
 
 PUBLIC_ID = PublicId.from_str("valory/ipfs:0.1.0")
+BACKGROUND_UPLOAD = "background_upload"
 
 
 class IpfsDialogues(BaseIpfsDialogues):
@@ -70,12 +78,17 @@ class IpfsDialogues(BaseIpfsDialogues):
         )
 
 
-class IpfsConnection(Connection):
+class IpfsConnection(Connection):  # pylint: disable=too-many-instance-attributes
     """An async connection for sending and receiving files to IPFS."""
 
     connection_id = PUBLIC_ID
     DEFAULT_REQUEST_TIMEOUT = 60.0
     DEFAULT_EXECUTOR_WORKERS = 4
+    DEFAULT_MAX_IN_FLIGHT_REQUESTS = 64
+    DEFAULT_CACHE_DIR = "ipfs_cache"
+    DEFAULT_CACHE_MAX_SIZE = 100 * 1024 * 1024
+    DEFAULT_MEMORY_CACHE_MAX_SIZE = 0
+    DEFAULT_STATS_REPORT_INTERVAL = 60.0
 
     def __init__(self, **kwargs: Any) -> None:
         """
@@ -86,13 +99,54 @@ class IpfsConnection(Connection):
         super().__init__(**kwargs)  # pragma: no cover
         ipfs_domain = self.configuration.config.get("ipfs_domain")
         self.ipfs_tool: IPFSTool = IPFSTool(ipfs_domain)
+        self._api_url = (
+            f"{addr_to_url(self.ipfs_tool.addr).rstrip('/')}/{DEFAULT_IPFS_URI_BASE}"
+        )
+        self._pin_later: bool = self.configuration.config.get("pin_later", False)
         self.task_to_request: Dict[asyncio.Future, Envelope] = {}
+        self._task_started: Dict[asyncio.Future, float] = {}
+        self._uploads: Set[Future] = set()
         self.loop_executor: Optional[Executor] = None
         self.dialogues = IpfsDialogues(connection_id=PUBLIC_ID)
         self._response_envelopes: Optional[asyncio.Queue] = None
+        self._executor_workers: int = self.configuration.config.get(
+            "executor_workers", self.DEFAULT_EXECUTOR_WORKERS
+        )
+        self._max_in_flight_requests: int = self.configuration.config.get(
+            "max_in_flight_requests", self.DEFAULT_MAX_IN_FLIGHT_REQUESTS
+        )
         self._request_timeout: Optional[float] = self.configuration.config.get(
             "request_timeout", self.DEFAULT_REQUEST_TIMEOUT
         )
+        self._timeouts: Dict[IpfsMessage.Performative, Optional[float]] = {
+            performative: self.configuration.config.get(
+                f"{performative.value}_timeout", self._request_timeout
+            )
+            for performative in (
+                IpfsMessage.Performative.GET_FILES,
+                IpfsMessage.Performative.STORE_FILES,
+            )
+        }
+        self._stats_report_interval: Optional[float] = self.configuration.config.get(
+            "stats_report_interval", self.DEFAULT_STATS_REPORT_INTERVAL
+        )
+        self._stats_lock = threading.Lock()
+        # the count, total and maximum latency of the requests served since the last report, by request
+        self._latencies: Dict[str, Tuple[int, float, float]] = {}
+        self._stats_reported = time.perf_counter()
+        cache_dir = self.configuration.config.get("cache_dir")
+        if cache_dir is None:
+            cache_dir = os.path.join(self.data_dir, self.DEFAULT_CACHE_DIR)
+        self.cache = IpfsCache(
+            reader=self._read_files_recursive,
+            path=cache_dir,
+            max_size=self.configuration.config.get(
+                "cache_max_size", self.DEFAULT_CACHE_MAX_SIZE
+            ),
+            memory_max_size=self.configuration.config.get(
+                "memory_cache_max_size", self.DEFAULT_MEMORY_CACHE_MAX_SIZE
+            ),
+        )
 
     @property
     def response_envelopes(self) -> asyncio.Queue:
@@ -103,12 +157,65 @@ class IpfsConnection(Connection):
             )
         return self._response_envelopes
 
+    @property
+    def queue_depth(self) -> int:
+        """Get the number of requests in flight, i.e., queued or being served, including the background uploads."""
+        return len(self.task_to_request) + len(self._uploads)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get the number of requests in flight and the latencies of the requests served since the last report."""
+        with self._stats_lock:
+            return self._stats()
+
+    def _stats(self) -> Dict[str, Any]:
+        """Get the stats of the connection, the caller must hold the stats lock."""
+        return {
+            "requests_in_flight": len(self.task_to_request),
+            "background_uploads": len(self._uploads),
+            "latency": {
+                request: {"count": count, "mean": total / count, "max": maximum}
+                for request, (count, total, maximum) in self._latencies.items()
+            },
+        }
+
+    def _observe_latency(self, request: str, latency: float) -> None:
+        """
+        Record the latency of a request, and report the stats if they are due.
+
+        :param request: the kind of the request.
+        :param latency: the seconds taken to serve the request.
+        """
+        with self._stats_lock:
+            count, total, maximum = self._latencies.get(request, (0, 0.0, 0.0))
+            self._latencies[request] = (
+                count + 1,
+                total + latency,
+                max(maximum, latency),
+            )
+            now = time.perf_counter()
+            interval = self._stats_report_interval
+            if interval is None or now - self._stats_reported < interval:
+                return
+            stats = self._stats()
+            self._latencies.clear()
+            self._stats_reported = now
+        latencies = "".join(
+            f"; {request}: {values['count']} served, "
+            f"{values['mean']:.3f}s mean, {values['max']:.3f}s max"
+            for request, values in sorted(stats["latency"].items())
+        )
+        self.logger.info(
+            f"IPFS connection stats: {stats['requests_in_flight']} requests in flight, "
+            f"{stats['background_uploads']} background uploads{latencies}."
+        )
+
     async def connect(self) -> None:
         """Set up the connection."""
         self.ipfs_tool.check_ipfs_node_running()
         self._response_envelopes = asyncio.Queue()
         self.loop_executor = ThreadPoolExecutor(
-            max_workers=self.DEFAULT_EXECUTOR_WORKERS,
+            max_workers=self._executor_workers,
             thread_name_prefix="ipfs-conn",
         )
         self.state = ConnectionStates.connected
@@ -123,6 +230,7 @@ class IpfsConnection(Connection):
         for task in self.task_to_request.keys():
             if not task.cancelled():  # pragma: nocover
                 task.cancel()
+        self._task_started.clear()
         self._response_envelopes = None
         if self.loop_executor is not None:
             self.loop_executor.shutdown(wait=False)
@@ -132,9 +240,30 @@ class IpfsConnection(Connection):
 
     async def send(self, envelope: Envelope) -> None:
         """Send an envelope."""
+        if 0 < self._max_in_flight_requests <= self.queue_depth:
+            self._reject(envelope)
+            return
         task = self._handle_envelope(envelope)
         task.add_done_callback(self._handle_done_task)
         self.task_to_request[task] = envelope
+        self._task_started[task] = time.perf_counter()
+
+    def _reject(self, envelope: Envelope) -> None:
+        """
+        Reject a request right away because too many requests are in flight.
+
+        Replying with an error, instead of queueing the request, signals the
+        backpressure to the skill without waiting for its request timeout.
+
+        :param envelope: the rejected request.
+        """
+        err = (
+            f"IPFS connection is busy: {self.queue_depth} requests in flight, "
+            f"the limit is {self._max_in_flight_requests}."
+        )
+        self.logger.warning(err)
+        dialogue = self.dialogues.update(cast(IpfsMessage, envelope.message))
+        self._put_response(envelope, self._handle_error(err, dialogue))
 
     async def receive(self, *args: Any, **kwargs: Any) -> Optional[Envelope]:
         """Receive an envelope."""
@@ -172,7 +301,8 @@ class IpfsConnection(Connection):
             return self.run_async(
                 self._handle_error, err, None, timeout=self._request_timeout
             )
-        task = self.run_async(handler, message, dialogue, timeout=self._request_timeout)
+        timeout = message.timeout or self._timeouts[performative]
+        task = self.run_async(handler, message, dialogue, timeout=timeout)
         return task
 
     def _handle_store_files(
@@ -181,7 +311,9 @@ class IpfsConnection(Connection):
         """
         Handle a STORE_FILES performative.
 
-        Uploads the provided files to ipfs.
+        Uploads the provided files to ipfs, straight from memory.
+        If `pin_later` is enabled and the hash can be computed locally,
+        the hash is returned right away and the files are uploaded in the background.
 
         :param message: The ipfs request.
         :returns: the hash of the uploaded files.
@@ -194,8 +326,10 @@ class IpfsConnection(Connection):
         if len(files) == 1:
             # a single file needs to be stored,
             # we don't need to create a dir
-            path, data = files.popitem()
-            self.__create_file(path, data)
+            path, data = next(iter(files.items()))
+            name = os.path.basename(path)
+            contents = {name: data.encode("utf-8")}
+            directory = False
         else:
             # multiple files are present, which means that it's a directory
             # we begin by checking that they belong to the same directory
@@ -210,21 +344,35 @@ class IpfsConnection(Connection):
                 return cast(IpfsMessage, self._handle_error(err, dialogue))
 
             # "path" is the directory, it's the same for all the files
-            path = dirs.pop()
-            os.makedirs(path, exist_ok=True)
-            for file_path, data in files.items():
-                self.__create_file(file_path, data)
-        try:
-            # note that path will be a dir if multiple files
-            # are being uploaded.
-            _, hash_, _ = self.ipfs_tool.add(path)
-            self.logger.debug(f"Successfully stored files with hash: {hash_}.")
-        except Exception as e:  # pylint: disable=broad-except  # noqa: BLE001
-            err = str(e)
+            name = os.path.basename(dirs.pop())
+            contents = {
+                os.path.basename(file_path): data.encode("utf-8")
+                for file_path, data in files.items()
+            }
+            directory = True
+        if not name:
+            err = f"Cannot store files without a name: {list(files)}"
             self.logger.error(err)
             return cast(IpfsMessage, self._handle_error(err, dialogue))
-        finally:
-            self.__remove_filepath(path)
+
+        hash_ = hash_files(name, contents, directory) if self._pin_later else None
+        if hash_ is not None:
+            executor = cast(Executor, self.loop_executor)
+            upload = executor.submit(self._add_files, name, contents, directory)
+            # background uploads count towards the requests in flight until they are done
+            self._uploads.add(upload)
+            upload.add_done_callback(
+                partial(self._check_upload, hash_, time.perf_counter())
+            )
+            self.logger.debug(f"Storing files with hash {hash_} in the background.")
+        else:
+            try:
+                hash_ = self._add_files(name, contents, directory)
+                self.logger.debug(f"Successfully stored files with hash: {hash_}.")
+            except Exception as e:  # pylint: disable=broad-except  # noqa: BLE001
+                err = str(e)
+                self.logger.error(err)
+                return cast(IpfsMessage, self._handle_error(err, dialogue))
         response_message = cast(
             IpfsMessage,
             dialogue.reply(
@@ -235,6 +383,47 @@ class IpfsConnection(Connection):
         )
         return response_message
 
+    def _add_files(self, name: str, contents: Dict[str, bytes], directory: bool) -> str:
+        """
+        Add files to the ipfs node, wrapped with a directory.
+
+        :param name: the name of the file, or of the directory holding the files.
+        :param contents: the contents of the files, by their name.
+        :param directory: whether the files are held in a directory.
+        :returns: the hash of the wrapper directory.
+        """
+        boundary = uuid.uuid4().hex
+        params = urllib.parse.urlencode(
+            {"pin": "true", "recursive": "true", "wrap-with-directory": "true"}
+        )
+        request = urllib.request.Request(
+            f"{self._api_url}/add?{params}",
+            data=encode_files(name, contents, directory, boundary),
+            headers={"Content-Type": f'multipart/form-data; boundary="{boundary}"'},
+            method="POST",
+        )
+        timeout = self._timeouts[IpfsMessage.Performative.STORE_FILES]
+        with urllib.request.urlopen(request, timeout=timeout) as response:  # nosec
+            body = response.read().decode("utf-8")
+        # `/add` responds with a json line per object, the wrapper is the last one
+        return json.loads(body.strip().splitlines()[-1])["Hash"]
+
+    def _check_upload(self, hash_: str, started: float, upload: Future) -> None:
+        """Check the result of a background upload."""
+        self._uploads.discard(upload)
+        self._observe_latency(BACKGROUND_UPLOAD, time.perf_counter() - started)
+        try:
+            uploaded_hash = upload.result()
+        except Exception as e:  # pylint: disable=broad-except  # noqa: BLE001
+            self.logger.error(f"Failed to store files with hash {hash_}: {e}")
+            return
+        if uploaded_hash != hash_:
+            self.logger.error(
+                f"Stored files with hash {uploaded_hash}, but {hash_} was returned."
+            )
+            return
+        self.logger.debug(f"Successfully stored files with hash: {hash_}.")
+
     def _read_files_recursive(self, base_dir: Path) -> Dict[str, str]:
         """
         Recursively read all text files under a directory.
@@ -261,45 +450,52 @@ class IpfsConnection(Connection):
         Handle GET_FILES performative.
 
         Downloads and returns the files resulting from the ipfs hash.
+        The files are served from the cache when the hash has been fetched before,
+        and concurrent requests for the same hash share a single download.
 
         :param message: The ipfs request.
         :returns: the downloaded files.
         """
         ipfs_hash = message.ipfs_hash
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            try:
-                self.ipfs_tool.download(ipfs_hash, tmp_dir)
-            except Exception as e:  # pylint: disable=broad-except
-                err = str(e)
-                self.logger.error(err)
-                return cast(IpfsMessage, self._handle_error(err, dialogue))
+        try:
+            response_body = self.cache.fetch(ipfs_hash, self._download)
+        except Exception as e:  # pylint: disable=broad-except
+            err = str(e)
+            self.logger.error(err)
+            return cast(IpfsMessage, self._handle_error(err, dialogue))
 
-            files = os.listdir(tmp_dir)
-            if not files:
-                err = f"IPFS download for {ipfs_hash} produced no files"
-                self.logger.error(err)
-                return cast(IpfsMessage, self._handle_error(err, dialogue))
-            if len(files) > 1:
-                self.logger.warning(
-                    f"Multiple files or dirs found in {tmp_dir}. "
-                    f"The first will be used. "
-                )
-            downloaded_file = files[0]
-            base_dir = Path(tmp_dir)
-            if os.path.isdir(base_dir / downloaded_file):
-                base_dir = base_dir / downloaded_file
-
-            response_body = self._read_files_recursive(base_dir)
-
-            response_message = cast(
-                IpfsMessage,
-                dialogue.reply(
-                    performative=IpfsMessage.Performative.FILES,
-                    files=response_body,
-                    target_message=message,
-                ),
+        response_message = cast(
+            IpfsMessage,
+            dialogue.reply(
+                performative=IpfsMessage.Performative.FILES,
+                files=response_body,
+                target_message=message,
+            ),
+        )
+        return response_message
+
+    def _download(self, ipfs_hash: str, target_dir: str) -> Path:
+        """
+        Download the content of an ipfs hash.
+
+        :param ipfs_hash: the hash to download.
+        :param target_dir: the directory to download to.
+        :returns: the path to read the downloaded files from.
+        """
+        self.ipfs_tool.download(ipfs_hash, target_dir)
+        files = os.listdir(target_dir)
+        if not files:
+            raise ValueError(f"IPFS download for {ipfs_hash} produced no files")
+        if len(files) > 1:
+            self.logger.warning(
+                f"Multiple files or dirs found in {target_dir}. "
+                f"The first will be used. "
             )
-            return response_message
+        downloaded_file = files[0]
+        base_dir = Path(target_dir)
+        if os.path.isdir(base_dir / downloaded_file):
+            base_dir = base_dir / downloaded_file
+        return base_dir
 
     def _handle_error(
         self, reason: str, dialogue: Optional[BaseDialogue] = None
@@ -338,6 +534,17 @@ class IpfsConnection(Connection):
         :param task: the done task.
         """
         request = self.task_to_request.pop(task)
+        started = self._task_started.pop(task, None)
+        if started is not None:
+            performative = cast(IpfsMessage, request.message).performative.value
+            latency = time.perf_counter() - started
+            self.logger.debug(
+                "IPFS %s request served in %.3fs, %d requests in flight.",
+                performative,
+                latency,
+                self.queue_depth,
+            )
+            self._observe_latency(performative, latency)
         try:
             response_message: Optional[Message] = task.result()
         except Exception as exc:  # pylint: disable=broad-except  # noqa: BLE001
@@ -353,6 +560,17 @@ class IpfsConnection(Connection):
                 )
                 response_message = None
 
+        self._put_response(request, response_message)
+
+    def _put_response(
+        self, request: Envelope, response_message: Optional[Message]
+    ) -> None:
+        """
+        Put the response to a request on the response queue.
+
+        :param request: the request envelope.
+        :param response_message: the response, or `None` if the request cannot be replied to.
+        """
         response_envelope = None
         if response_message is not None:
             response_envelope = Envelope(
@@ -364,18 +582,3 @@ class IpfsConnection(Connection):
 
         # not handling `asyncio.QueueFull` exception, because the maxsize we defined for the Queue is infinite
         self.response_envelopes.put_nowait(response_envelope)
-
-    @staticmethod
-    def __create_file(path: str, data: str) -> None:
-        """Creates a file in the specified path."""
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(data)
-
-    def __remove_filepath(self, filepath: str) -> None:
-        """Remove a file or a folder. If filepath is not a file or a folder, an `IPFSInteractionError` is raised."""
-        if os.path.isfile(filepath):
-            os.remove(filepath)
-        elif os.path.isdir(filepath):
-            rmtree(filepath)
-        else:  # pragma: no cover
-            self.logger.error(f"`{filepath}` is not an existing filepath!")
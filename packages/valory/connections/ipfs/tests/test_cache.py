@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+# pylint: disable=protected-access
+
+"""Tests for the ipfs connection cache."""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+from unittest import mock
+
+import pytest
+
+from packages.valory.connections.ipfs.cache import IpfsCache, STAGING_PREFIX
+
+CID_1 = "bafybeicid1"
+CID_2 = "bafybeicid2"
+CID_3 = "bafybeicid3"
+
+
+def read_files(base_dir: Path) -> Dict[str, str]:
+    """Read the files under a directory."""
+    return {
+        str(path.relative_to(base_dir)): path.read_text(encoding="utf-8")
+        for path in sorted(base_dir.rglob("*"))
+        if path.is_file()
+    }
+
+
+class FakeIpfs:
+    """A fake IPFS node which serves a fixed payload per CID."""
+
+    def __init__(self, size: int = 10, delay: float = 0.0) -> None:
+        """Initialize the fake node."""
+        self.size = size
+        self.delay = delay
+        self.downloads: List[str] = []
+
+    def download(self, ipfs_hash: str, target_dir: str) -> Path:
+        """Download a CID as a directory holding a single file."""
+        self.downloads.append(ipfs_hash)
+        time.sleep(self.delay)
+        package_dir = Path(target_dir, ipfs_hash)
+        package_dir.mkdir()
+        (package_dir / "data.txt").write_text(
+            ipfs_hash[-1] * self.size, encoding="utf-8"
+        )
+        return package_dir
+
+
+class TestIpfsCache:
+    """Tests for `IpfsCache`."""
+
+    def test_invalid_sizes(self, tmp_path: Path) -> None:
+        """Test that negative sizes are rejected."""
+        with pytest.raises(ValueError, match="must be non-negative"):
+            IpfsCache(read_files, str(tmp_path), max_size=-1)
+
+    def test_disk_hit(self, tmp_path: Path) -> None:
+        """Test that a cached CID is not downloaded again."""
+        ipfs = FakeIpfs()
+        cache = IpfsCache(read_files, str(tmp_path), max_size=100)
+        first = cache.fetch(CID_1, ipfs.download)
+        first["data.txt"] = "mutated"
+        second = cache.fetch(CID_1, ipfs.download)
+
+        assert second == {"data.txt": "1" * 10}
+        assert ipfs.downloads == [CID_1]
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.size == 10
+        assert os.listdir(tmp_path) == [CID_1]
+
+    def test_lru_eviction_by_size(self, tmp_path: Path) -> None:
+        """Test that the least recently used CIDs are evicted first."""
+        ipfs = FakeIpfs()
+        cache = IpfsCache(read_files, str(tmp_path), max_size=25)
+        cache.fetch(CID_1, ipfs.download)
+        cache.fetch(CID_2, ipfs.download)
+        cache.fetch(CID_1, ipfs.download)
+        cache.fetch(CID_3, ipfs.download)
+
+        assert CID_1 in cache and CID_3 in cache
+        assert CID_2 not in cache
+        assert sorted(os.listdir(tmp_path)) == [CID_1, CID_3]
+        assert cache.size == 20
+
+    def test_oversized_entry_not_cached(self, tmp_path: Path) -> None:
+        """Test that an entry larger than the bound is served but not kept."""
+        ipfs = FakeIpfs(size=50)
+        cache = IpfsCache(read_files, str(tmp_path), max_size=25)
+
+        assert cache.fetch(CID_1, ipfs.download) == {"data.txt": "1" * 50}
+        assert CID_1 not in cache
+        assert os.listdir(tmp_path) == []
+
+    def test_memory_tier(self, tmp_path: Path) -> None:
+        """Test that the in-memory tier avoids reading from disk."""
+        ipfs = FakeIpfs()
+        reader = mock.Mock(side_effect=read_files)
+        cache = IpfsCache(reader, str(tmp_path), max_size=100, memory_max_size=100)
+        cache.fetch(CID_1, ipfs.download)
+        cache.fetch(CID_1, ipfs.download)
+
+        assert reader.call_count == 1
+        assert cache.memory_size == len("data.txt") + 10
+
+    def test_memory_only(self) -> None:
+        """Test the in-memory tier without an on-disk tier."""
+        ipfs = FakeIpfs()
+        cache = IpfsCache(read_files, memory_max_size=20)
+        cache.fetch(CID_1, ipfs.download)
+        cache.fetch(CID_2, ipfs.download)
+        cache.fetch(CID_2, ipfs.download)
+
+        assert CID_1 not in cache and CID_2 in cache
+        assert ipfs.downloads == [CID_1, CID_2]
+        assert cache.size == 0
+
+    def test_restart(self, tmp_path: Path) -> None:
+        """Test that the on-disk tier survives a restart."""
+        ipfs = FakeIpfs()
+        IpfsCache(read_files, str(tmp_path), max_size=100).fetch(CID_1, ipfs.download)
+        (tmp_path / f"{STAGING_PREFIX}leftover").mkdir()
+
+        cache = IpfsCache(read_files, str(tmp_path), max_size=100)
+        assert cache.fetch(CID_1, ipfs.download) == {"data.txt": "1" * 10}
+        assert ipfs.downloads == [CID_1]
+        assert os.listdir(tmp_path) == [CID_1]
+
+    def test_restart_with_smaller_bound(self, tmp_path: Path) -> None:
+        """Test that the entries left on disk are evicted to fit a smaller bound."""
+        ipfs = FakeIpfs()
+        cache = IpfsCache(read_files, str(tmp_path), max_size=100)
+        cache.fetch(CID_1, ipfs.download)
+        cache.fetch(CID_2, ipfs.download)
+        os.utime(tmp_path / CID_1, (0, 0))
+
+        cache = IpfsCache(read_files, str(tmp_path), max_size=15)
+        assert os.listdir(tmp_path) == [CID_2]
+        assert cache.size == 10
+
+    def test_removed_entry(self, tmp_path: Path) -> None:
+        """Test that an entry removed from disk is downloaded again."""
+        ipfs = FakeIpfs()
+        cache = IpfsCache(read_files, str(tmp_path), max_size=100)
+        cache.fetch(CID_1, ipfs.download)
+        with mock.patch("os.utime", side_effect=FileNotFoundError):
+            cache.fetch(CID_1, ipfs.download)
+
+        assert ipfs.downloads == [CID_1, CID_1]
+
+    def test_failed_download(self, tmp_path: Path) -> None:
+        """Test that a failed download is neither cached nor left on disk."""
+        cache = IpfsCache(read_files, str(tmp_path), max_size=100)
+        with pytest.raises(ValueError, match="boom"):
+            cache.fetch(CID_1, mock.Mock(side_effect=ValueError("boom")))
+
+        assert CID_1 not in cache
+        assert os.listdir(tmp_path) == []
+        assert cache._in_flight == {}
+
+    @pytest.mark.parametrize("fail", (False, True))
+    def test_coalescing(self, tmp_path: Path, fail: bool) -> None:
+        """Test that concurrent fetches of the same CID share one download."""
+        ipfs = FakeIpfs(delay=0.2)
+
+        def download(ipfs_hash: str, target_dir: str) -> Path:
+            """Download a CID, failing after the delay if requested."""
+            path = ipfs.download(ipfs_hash, target_dir)
+            if fail:
+                raise ValueError("boom")
+            return path
+
+        cache = IpfsCache(read_files, str(tmp_path), max_size=100)
+        results: List[object] = []
+
+        def fetch() -> None:
+            """Fetch a CID, recording the result or the error."""
+            try:
+                results.append(cache.fetch(CID_1, download))
+            except ValueError as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=fetch) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.misses == 1
+        assert ipfs.downloads == [CID_1]
+        assert len(results) == 4
+        if fail:
+            assert all(isinstance(result, ValueError) for result in results)
+            assert CID_1 not in cache
+        else:
+            assert all(result == {"data.txt": "1" * 10} for result in results)
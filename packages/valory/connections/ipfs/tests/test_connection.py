@@ -22,7 +22,9 @@
 
 import asyncio
 import os
+import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from unittest import mock
 from unittest.mock import MagicMock
@@ -59,15 +61,20 @@ class TestIpfsConnection:
             ipfs_domain=LOCAL_IPFS,
             connection_id=IpfsConnection.connection_id,
         )
+        self.data_dir = tempfile.mkdtemp()
         self.connection = IpfsConnection(
             configuration=configuration,
-            data_dir=MagicMock(),
+            data_dir=self.data_dir,
         )
         self.dummy_msg = IpfsMessage(performative=IpfsMessage.Performative.GET_FILES)  # type: ignore
         self.dummy_envelope = Envelope(
             to=str(PUBLIC_ID), sender=ANY_SKILL, message=self.dummy_msg
         )
 
+    def teardown_method(self) -> None:
+        """Tear down the tests."""
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
     @pytest.mark.asyncio
     async def test_connect(self) -> None:
         """Test connect"""
@@ -128,6 +135,82 @@ class TestIpfsConnection:
             await self.connection.send(self.dummy_envelope)
             assert len(self.connection.task_to_request) == 1
 
+    @pytest.mark.asyncio
+    async def test_send_rejects_when_busy(self) -> None:
+        """Test that send replies with an error when too many requests are in flight."""
+        await self.connection.connect()
+        self.connection._max_in_flight_requests = 1
+        self.connection.task_to_request[MagicMock()] = self.dummy_envelope
+        message = IpfsMessage(
+            performative=IpfsMessage.Performative.GET_FILES,  # type: ignore
+            dialogue_reference=self.connection.dialogues.new_self_initiated_dialogue_reference(),
+            ipfs_hash="dummy_hash",
+        )
+        message.sender = ANY_SKILL
+        message.to = str(PUBLIC_ID)
+        envelope = Envelope(to=str(PUBLIC_ID), sender=ANY_SKILL, message=message)
+        with mock.patch.object(IpfsConnection, "_handle_envelope") as mock_handle:
+            await self.connection.send(envelope)
+        mock_handle.assert_not_called()
+        assert self.connection.queue_depth == 1
+        response = self.connection.response_envelopes.get_nowait()
+        assert response.message.performative == IpfsMessage.Performative.ERROR
+        assert "IPFS connection is busy" in response.message.reason
+
+    @pytest.mark.asyncio
+    async def test_send_rejects_when_busy_uploading(self) -> None:
+        """Test that the background uploads count towards the requests in flight."""
+        await self.connection.connect()
+        self.connection._max_in_flight_requests = 1
+        self.connection._uploads.add(MagicMock())
+        with mock.patch.object(
+            IpfsConnection, "_handle_envelope"
+        ) as mock_handle, mock.patch.object(IpfsConnection, "_reject") as mock_reject:
+            await self.connection.send(self.dummy_envelope)
+        mock_handle.assert_not_called()
+        mock_reject.assert_called_once_with(self.dummy_envelope)
+
+    def test_stats(self) -> None:
+        """Test that the latencies are reported and reset every report interval."""
+        self.connection._stats_report_interval = None
+        self.connection._observe_latency("get_files", 1.0)
+        self.connection._observe_latency("get_files", 3.0)
+        assert self.connection.stats == {
+            "requests_in_flight": 0,
+            "background_uploads": 0,
+            "latency": {"get_files": {"count": 2, "mean": 2.0, "max": 3.0}},
+        }
+
+        self.connection._stats_report_interval = 0.0
+        with mock.patch.object(self.connection.logger, "info") as mock_info:
+            self.connection._observe_latency("store_files", 0.5)
+        mock_info.assert_called_once_with(
+            "IPFS connection stats: 0 requests in flight, 0 background uploads; "
+            "get_files: 2 served, 2.000s mean, 3.000s max; "
+            "store_files: 1 served, 0.500s mean, 0.500s max."
+        )
+        assert self.connection.stats["latency"] == {}
+
+    @pytest.mark.parametrize(
+        ("message_timeout", "expected_timeout"), ((None, 5.0), (1.0, 1.0))
+    )
+    def test_handle_envelope_timeouts(
+        self, message_timeout: Optional[float], expected_timeout: float
+    ) -> None:
+        """Test that the timeout of the request, or of its operation, is applied."""
+        self.connection._timeouts[IpfsMessage.Performative.GET_FILES] = 5.0
+        message = IpfsMessage(
+            performative=IpfsMessage.Performative.GET_FILES,  # type: ignore
+            ipfs_hash="dummy_hash",
+            timeout=message_timeout,
+        )
+        envelope = Envelope(to=str(PUBLIC_ID), sender=ANY_SKILL, message=message)
+        with mock.patch.object(self.connection.dialogues, "update"), mock.patch.object(
+            IpfsConnection, "run_async"
+        ) as mock_run_async:
+            self.connection._handle_envelope(envelope)
+        assert mock_run_async.call_args.kwargs["timeout"] == expected_timeout
+
     @pytest.mark.asyncio
     async def test_receive(self) -> None:
         """Tests receive."""
@@ -349,6 +432,28 @@ class TestIpfsConnection:
             assert message is not None
             mock_logger.assert_called_with(expected_log)
 
+    def test_handle_store_files_pin_later(self) -> None:
+        """Test _handle_store_files returns the hash before the upload completes."""
+        self.connection._pin_later = True
+        self.connection.loop_executor = ThreadPoolExecutor(max_workers=1)
+        message = IpfsMessage(
+            performative=IpfsMessage.Performative.STORE_FILES,  # type: ignore
+            files={
+                "dummy_dir/dummy_filename1": "dummy_content",
+                "dummy_dir/dummy_filename2": "dummy_content",
+            },
+        )
+        dialogue = MagicMock()
+        with mock.patch.object(self.connection.logger, "error") as mock_error:
+            self.connection._handle_store_files(message, dialogue)
+            self.connection.loop_executor.shutdown(wait=True)
+        ipfs_hash = dialogue.reply.call_args[1]["ipfs_hash"]
+        assert ipfs_hash == "QmRP7wK1NZKwno9CFxQUeFaJip5eaaLBo1v8WFtyECgLCz"
+        mock_error.assert_not_called()
+        assert self.connection.queue_depth == 0
+        assert self.connection.stats["latency"]["background_upload"]["count"] == 1
+        assert self.connection.ipfs_tool.is_a_package(ipfs_hash)
+
     @pytest.mark.parametrize(
         ("extra_files", "download_side_effect"),
         [
@@ -540,6 +645,34 @@ class TestIpfsConnection:
             assert "tool.py" in files
             assert files["tool.py"] == "def run(): pass"
 
+    def test_handle_get_files_served_from_cache(self) -> None:
+        """Test _handle_get_files downloads a hash only once."""
+        with tempfile.TemporaryDirectory() as pkg_dir:
+            with open(os.path.join(pkg_dir, "tool.py"), "w", encoding="utf-8") as f:
+                f.write("def run(): pass")
+            _, ipfs_hash, _ = self.connection.ipfs_tool.add(
+                pkg_dir, wrap_with_directory=False
+            )
+
+        message = IpfsMessage(
+            performative=IpfsMessage.Performative.GET_FILES,  # type: ignore
+            ipfs_hash=ipfs_hash,
+        )
+        ipfs_tool = self.connection.ipfs_tool
+        with mock.patch.object(
+            ipfs_tool, "download", wraps=ipfs_tool.download
+        ) as mock_download:
+            for _ in range(2):
+                dialogue = MagicMock()
+                self.connection._handle_get_files(message, dialogue)
+                files = dialogue.reply.call_args[1]["files"]
+                assert files == {"tool.py": "def run(): pass"}
+        mock_download.assert_called_once()
+        assert ipfs_hash in self.connection.cache
+        assert os.path.isdir(
+            os.path.join(self.data_dir, IpfsConnection.DEFAULT_CACHE_DIR, ipfs_hash)
+        )
+
     def test_ipfs_dialogue(self) -> None:
         """Test 'IpfsDialogues' creation."""
         dialogues = IpfsDialogues(connection_id=str(PUBLIC_ID))
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Tests for the in-memory UnixFS objects of the ipfs connection."""
+
+from typing import Dict
+
+import pytest
+from aea.helpers.ipfs.base import IPFSHashOnly
+
+from packages.valory.connections.ipfs.unixfs import MAX_LINKS, encode_files, hash_files
+
+BOUNDARY = "boundary"
+CONTENT = b"dummy_content"
+
+
+@pytest.mark.parametrize(
+    ("name", "files", "directory", "expected_hash"),
+    [
+        (
+            "dummy_filename",
+            {"dummy_filename": CONTENT},
+            False,
+            "QmYn1qHyFMDdVxYcwseLBdooLAyc3orNBH8vvj4iPTXd4R",
+        ),
+        (
+            "dummy_dir",
+            {"dummy_filename1": CONTENT, "dummy_filename2": CONTENT},
+            True,
+            "QmRP7wK1NZKwno9CFxQUeFaJip5eaaLBo1v8WFtyECgLCz",
+        ),
+        (
+            "dummy_dir_nested",
+            {"dummy_filename2": CONTENT, "dummy_filename1": CONTENT},
+            True,
+            "QmcYhNziJDuwmRVg8TYY5S5fUycuBguM6zxukgMDnVQt8H",
+        ),
+    ],
+)
+def test_hash_files(
+    name: str, files: Dict[str, bytes], directory: bool, expected_hash: str
+) -> None:
+    """Test that the hashes match the ones assigned by the IPFS node."""
+    assert hash_files(name, files, directory) == expected_hash
+
+
+def test_hash_files_large_file() -> None:
+    """Test that the hash of a chunked file matches the one of the file on disk."""
+    data = b"0" * (IPFSHashOnly.DEFAULT_CHUNK_SIZE * 3 + 1)
+    expected = IPFSHashOnly.hash_bytes(
+        data, wrap=True, cid_v1=False, file_name_if_wrap="file"
+    )
+    assert hash_files("file", {"file": data}, False) == expected
+
+
+@pytest.mark.parametrize("size", (0, IPFSHashOnly.DEFAULT_CHUNK_SIZE * MAX_LINKS + 1))
+def test_hash_files_not_reproducible(size: int) -> None:
+    """Test that no hash is computed for layouts which cannot be reproduced."""
+    files = {"file": CONTENT, "other": b"0" * size}
+    assert hash_files("dir", files, True) is None
+
+
+def test_encode_file() -> None:
+    """Test encoding a single file."""
+    body = b"".join(encode_files("data.json", {"data.json": b"{}"}, False, BOUNDARY))
+    assert body == (
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="data.json"\r\n'
+        b"Content-Type: application/json\r\n"
+        b"\r\n"
+        b"{}\r\n"
+        b"--boundary--\r\n"
+    )
+
+
+def test_encode_directory() -> None:
+    """Test encoding the files of a directory."""
+    body = b"".join(encode_files("dir", {"b": b"2", "a": b"1"}, True, BOUNDARY))
+    assert body == (
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="dir"\r\n'
+        b"Content-Type: application/x-directory\r\n"
+        b"\r\n"
+        b"\r\n"
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="dir%2Fa"\r\n'
+        b"Content-Type: application/octet-stream\r\n"
+        b"\r\n"
+        b"1\r\n"
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="dir%2Fb"\r\n'
+        b"Content-Type: application/octet-stream\r\n"
+        b"\r\n"
+        b"2\r\n"
+        b"--boundary--\r\n"
+    )
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""In-memory construction of the UnixFS objects uploaded to IPFS."""
+
+import mimetypes
+import urllib.parse
+from typing import Dict, Iterator, Optional, Tuple, cast
+
+from aea.helpers.ipfs.base import IPFSHashOnly, PBNode, unixfs_pb2
+
+Files = Dict[str, bytes]
+# the maximum number of links of a node in the balanced layout of the IPFS node
+MAX_LINKS = 174
+
+
+def _file_node(data: bytes) -> Tuple[bytes, int]:
+    """Get the multihash and the cumulative size of a file node."""
+    # pylint: disable=protected-access
+    file_pb, size = IPFSHashOnly._pb_serialize_bytes(data)
+    return IPFSHashOnly._generate_multihash_bytes(file_pb), size
+
+
+def _directory_node(files: Files) -> Tuple[bytes, int]:
+    """Get the multihash and the cumulative size of a flat directory node."""
+    node = PBNode()
+    content_size = 0
+    for name, data in sorted(files.items()):
+        link_hash, size = _file_node(data)
+        node.Links.append(  # type: ignore # pylint: disable=no-member
+            IPFSHashOnly.create_link(link_hash, size, name)
+        )
+        content_size += size
+    node_data = unixfs_pb2.Data()  # type: ignore # pylint: disable=no-member
+    node_data.Type = unixfs_pb2.Data.Directory  # type: ignore # pylint: disable=no-member
+    node.Data = node_data.SerializeToString(deterministic=True)
+    serialization = IPFSHashOnly._serialize(node)  # pylint: disable=protected-access
+    multihash = (
+        IPFSHashOnly._generate_multihash_bytes(  # pylint: disable=protected-access
+            serialization
+        )
+    )
+    return multihash, len(serialization) + content_size
+
+
+def hash_files(name: str, files: Files, directory: bool) -> Optional[str]:
+    """
+    Compute locally the hash the IPFS node assigns to the wrapped files.
+
+    Mirrors the default options of `ipfs add --wrap-with-directory`, i.e., CIDv0 and
+    fixed-size chunks. Contents whose layout cannot be reproduced exactly,
+    namely empty files and files spanning more chunks than a single node can link,
+    are not hashed.
+
+    :param name: the name of the file, or of the directory holding the files.
+    :param files: the contents of the files, by their name.
+    :param directory: whether the files are held in a directory.
+    :return: the hash of the wrapper directory, or `None` if it cannot be computed.
+    """
+    max_size = MAX_LINKS * IPFSHashOnly.DEFAULT_CHUNK_SIZE
+    if any(not data or len(data) > max_size for data in files.values()):
+        return None
+    if directory:
+        link_hash, size = _directory_node(files)
+    else:
+        link_hash, size = _file_node(files[name])
+    link = IPFSHashOnly.create_link(link_hash, size, name)
+    return cast(str, IPFSHashOnly.wrap_in_a_node(link))
+
+
+def _part_header(boundary: str, filename: str, content_type: str) -> bytes:
+    """Encode the header of a multipart form-data part."""
+    quoted = urllib.parse.quote(filename, safe="")
+    return (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{quoted}"\r\n'
+        f"Content-Type: {content_type}\r\n"
+        f"\r\n"
+    ).encode()
+
+
+def encode_files(
+    name: str, files: Files, directory: bool, boundary: str
+) -> Iterator[bytes]:
+    """
+    Encode the files as the multipart body of an `/add` request.
+
+    :param name: the name of the file, or of the directory holding the files.
+    :param files: the contents of the files, by their name.
+    :param directory: whether the files are held in a directory.
+    :param boundary: the multipart boundary.
+    :yield: the chunks of the request body.
+    """
+    if directory:
+        yield _part_header(boundary, name, "application/x-directory") + b"\r\n"
+    for filename, data in sorted(files.items()):
+        if directory:
+            filename = f"{name}/{filename}"
+        content_type, _ = mimetypes.guess_type(filename)
+        yield _part_header(
+            boundary, filename, content_type or "application/octet-stream"
+        )
+        yield data
+        yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode()
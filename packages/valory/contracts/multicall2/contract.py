@@ -20,7 +20,7 @@
 """This module contains a wrapper around Multicall2."""
 
 import logging
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from aea.common import JSONLike
 from aea.configurations.base import PublicId
@@ -34,6 +34,25 @@ _logger = logging.getLogger(
 )
 
 
+def _abi_type(abi_output: Dict[str, Any]) -> str:
+    """
+    Get the canonical type of an ABI output, as expected by the codec.
+
+    Structs are represented in the ABI as `tuple` types with components,
+    which need to be expanded so that they can be decoded.
+
+    :param abi_output: the ABI output.
+    :return: the canonical type.
+    """
+    abi_type = abi_output["type"]
+    if not abi_type.startswith("tuple"):
+        return abi_type
+    components = ",".join(
+        _abi_type(component) for component in abi_output["components"]
+    )
+    return f"({components}){abi_type[len('tuple'):]}"
+
+
 class Multicall2Contract(Contract):
     """A wrapper for the MakerDAO Multicall2."""
 
@@ -115,7 +134,7 @@ class Multicall2Contract(Contract):
         for elem in contract_instance.abi:
             if elem.get("name", "") == abi_element_identifier:
                 output_types = elem["outputs"]
-                normalized_output_types = [t["type"] for t in output_types]
+                normalized_output_types = [_abi_type(t) for t in output_types]
                 break
 
         def decoder(return_data: bytes) -> Any:
@@ -156,3 +175,42 @@ class Multicall2Contract(Contract):
         ]
         block_number = ledger_api.api.eth.block_number
         return block_number, decoded_responses
+
+    @classmethod
+    def try_aggregate_and_decode(
+        cls,
+        ledger_api: LedgerApi,
+        contract_address: str,
+        calls_and_decoders: List[Tuple[Dict[str, Any], Callable]],
+        block_identifier: Any = "latest",
+    ) -> Tuple[int, List[Optional[Any]]]:
+        """
+        Make a non-reverting aggregate call, pinned to a single block.
+
+        Contrary to `aggregate_and_decode`, a failing call does not make the whole aggregate call revert.
+
+        :param ledger_api: the ledger apis.
+        :param contract_address: the multicall address.
+        :param calls_and_decoders: the calls and their corresponding output decoders.
+        :param block_identifier: the block at which the calls are made.
+        :return: the block number at which the calls were made and the decoded outputs, `None` for the failed calls.
+        """
+        instance = cls.get_instance(ledger_api, contract_address)
+        calls = [call[0] for call in calls_and_decoders]
+        decoders = [call[1] for call in calls_and_decoders]
+        block_number, _block_hash, call_responses = (
+            instance.functions.tryBlockAndAggregate(False, calls).call(
+                block_identifier=block_identifier
+            )
+        )
+        decoded_responses = []
+        for decoder, (success, return_data) in zip(decoders, call_responses):
+            if not success:
+                decoded_responses.append(None)
+                continue
+            try:
+                decoded_responses.append(decoder(return_data))
+            except Exception as e:  # pylint: disable=broad-except
+                _logger.warning(f"Could not decode the response of a call: {e}")
+                decoded_responses.append(None)
+        return block_number, decoded_responses
@@ -21,12 +21,17 @@
 
 from pathlib import Path
 from typing import Any, Dict, cast
+from unittest import mock
 
+import pytest
 from aea_test_autonomy.base_test_classes.contracts import BaseGanacheContractTest
 from aea_test_autonomy.configurations import DEFAULT_AMOUNT as DEFAULT_ETH_BALANCE
 from aea_test_autonomy.docker.base import skip_docker_tests
 
-from packages.valory.contracts.multicall2.contract import Multicall2Contract
+from packages.valory.contracts.multicall2.contract import (
+    Multicall2Contract,
+    _abi_type,
+)
 
 DEFAULT_GAS = 10000000
 DEFAULT_MAX_FEE_PER_GAS = 10**10
@@ -82,3 +87,58 @@ class TestTokenSettingsFactory(BaseGanacheContractTest):
             assert isinstance(response[0], int)
             actual_funds = response[0]
             assert actual_funds == expected_funds
+
+
+@pytest.mark.parametrize(
+    "abi_output, expected",
+    (
+        ({"type": "uint256"}, "uint256"),
+        (
+            {
+                "type": "tuple",
+                "components": [
+                    {"type": "address"},
+                    {"type": "uint256[]"},
+                    {"type": "tuple[]", "components": [{"type": "bool"}]},
+                ],
+            },
+            "(address,uint256[],(bool)[])",
+        ),
+    ),
+)
+def test_abi_type(abi_output: Dict[str, Any], expected: str) -> None:
+    """Test `_abi_type`."""
+    assert _abi_type(abi_output) == expected
+
+
+def test_try_aggregate_and_decode() -> None:
+    """Test `try_aggregate_and_decode`."""
+    instance = mock.MagicMock()
+    instance.functions.tryBlockAndAggregate.return_value.call.return_value = (
+        10,
+        b"block_hash",
+        [(True, b"first"), (False, b""), (True, b"undecodable")],
+    )
+
+    def failing_decoder(_: bytes) -> Any:
+        """A decoder which fails."""
+        raise ValueError("cannot decode")
+
+    calls_and_decoders = [
+        ({"target": "target"}, lambda data: (data,)),
+        ({"target": "target"}, lambda data: (data,)),
+        ({"target": "target"}, failing_decoder),
+    ]
+    with mock.patch.object(Multicall2Contract, "get_instance", return_value=instance):
+        block_number, results = Multicall2Contract.try_aggregate_and_decode(
+            mock.MagicMock(), "multicall", calls_and_decoders, block_identifier=10
+        )
+
+    assert block_number == 10
+    assert results == [(b"first",), None, None]
+    instance.functions.tryBlockAndAggregate.assert_called_once_with(
+        False, [call for call, _ in calls_and_decoders]
+    )
+    instance.functions.tryBlockAndAggregate.return_value.call.assert_called_once_with(
+        block_identifier=10
+    )
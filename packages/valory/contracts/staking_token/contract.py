@@ -19,11 +19,40 @@
 
 """This module contains the class to connect to the `StakingToken` contract."""
 
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
 from aea.common import JSONLike
 from aea.configurations.base import PublicId
 from aea.contracts.base import Contract
 from aea.crypto.base import LedgerApi
 
+from packages.valory.contracts.multicall2.contract import Multicall2Contract
+from packages.valory.contracts.staking_activity_checker.contract import (
+    StakingActivityCheckerContract,
+)
+
+NULL_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# the staking contract's getters included in a snapshot, mapped to the snapshot keys
+STAKING_CONTRACT_GETTERS = {
+    "available_rewards": "availableRewards",
+    "next_checkpoint_ts": "getNextRewardCheckpointTimestamp",
+    "ts_checkpoint": "tsCheckpoint",
+    "liveness_period": "livenessPeriod",
+    "activity_checker": "activityChecker",
+}
+SERVICE_INFO_KEYS = ("multisig", "owner", "nonces", "ts_start", "reward", "inactivity")
+
+
+def _unwrap(result: Optional[Tuple]) -> Any:
+    """Unwrap the decoded output of a single-output function."""
+    return None if result is None else result[0]
+
+
+def _to_list(value: Optional[Any]) -> Optional[List]:
+    """Convert a decoded array to a list, so that it can be serialized."""
+    return None if value is None else list(value)
+
 
 class StakingTokenContract(Contract):
     """The Staking Token contract."""
@@ -199,3 +228,126 @@ class StakingTokenContract(Contract):
         contract = cls.get_instance(ledger_api, contract_address)
         agent_ids = contract.functions.getAgentIds().call()
         return dict(data=agent_ids)
+
+    @classmethod
+    def get_staking_snapshot(
+        cls,
+        ledger_api: LedgerApi,
+        contract_address: str,
+        staking_contracts: Dict[str, List[int]],
+    ) -> JSONLike:
+        """
+        Get a snapshot of the staking state of several services, at a single block.
+
+        Instead of one request per value, all the values are fetched via two `Multicall2` calls,
+        the second one being pinned to the block of the first one:
+        1. for each staking contract, the available rewards, the checkpoint timestamps,
+           the liveness period and the activity checker, and for each service,
+           its staking state, its service info and its pending staking reward;
+        2. for each activity checker, the liveness ratio,
+           and for each staked service, the current nonces of its multisig.
+
+        The values which could not be retrieved, e.g., because a call reverted, are `None`.
+
+        :param ledger_api: the ledger apis.
+        :param contract_address: the `Multicall2` contract address.
+        :param staking_contracts: the staking contract addresses, mapped to the ids of the services to include.
+        :return: the block number and, for each staking contract, its state and its services' state.
+        """
+        calls: List[Tuple[Dict[str, Any], Callable]] = []
+        for staking_address, service_ids in staking_contracts.items():
+            instance = cls.get_instance(ledger_api, staking_address)
+            for getter in STAKING_CONTRACT_GETTERS.values():
+                calls.append(
+                    Multicall2Contract.encode_function_call(
+                        ledger_api, instance, getter, []
+                    )
+                )
+            for service_id in service_ids:
+                for getter in (
+                    "getStakingState",
+                    "getServiceInfo",
+                    "calculateStakingReward",
+                ):
+                    calls.append(
+                        Multicall2Contract.encode_function_call(
+                            ledger_api, instance, getter, [service_id]
+                        )
+                    )
+
+        block_number, results = Multicall2Contract.try_aggregate_and_decode(
+            ledger_api, contract_address, calls
+        )
+        responses = iter(_unwrap(result) for result in results)
+
+        snapshot: Dict[str, Dict[str, Any]] = {}
+        for staking_address, service_ids in staking_contracts.items():
+            staking_state: Dict[str, Any] = {
+                key: next(responses) for key in STAKING_CONTRACT_GETTERS
+            }
+            services: Dict[str, Dict[str, Any]] = {}
+            for service_id in service_ids:
+                state = next(responses)
+                info = next(responses)
+                reward = next(responses)
+                service: Dict[str, Any] = dict(
+                    zip(SERVICE_INFO_KEYS, info or (None,) * len(SERVICE_INFO_KEYS))
+                )
+                service["nonces"] = _to_list(service["nonces"])
+                service.update(staking_state=state, staking_reward=reward)
+                services[str(service_id)] = service
+            staking_state["services"] = services
+            snapshot[staking_address] = staking_state
+
+        cls._add_activity(ledger_api, contract_address, block_number, snapshot)
+        return dict(data=dict(block_number=block_number, staking_contracts=snapshot))
+
+    @classmethod
+    def _add_activity(
+        cls,
+        ledger_api: LedgerApi,
+        contract_address: str,
+        block_number: int,
+        snapshot: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Add the liveness ratios and the multisig nonces to the snapshot, in place, at the given block."""
+        calls: List[Tuple[Dict[str, Any], Callable]] = []
+        targets: List[Tuple[Dict[str, Any], str]] = []
+        for staking_state in snapshot.values():
+            activity_checker = staking_state["activity_checker"]
+            if activity_checker is None or activity_checker == NULL_ADDRESS:
+                staking_state["liveness_ratio"] = None
+                for service in staking_state["services"].values():
+                    service["multisig_nonces"] = None
+                continue
+
+            instance = StakingActivityCheckerContract.get_instance(
+                ledger_api, activity_checker
+            )
+            calls.append(
+                Multicall2Contract.encode_function_call(
+                    ledger_api, instance, "livenessRatio", []
+                )
+            )
+            targets.append((staking_state, "liveness_ratio"))
+            for service in staking_state["services"].values():
+                multisig = service["multisig"]
+                if multisig is None or multisig == NULL_ADDRESS:
+                    service["multisig_nonces"] = None
+                    continue
+                calls.append(
+                    Multicall2Contract.encode_function_call(
+                        ledger_api, instance, "getMultisigNonces", [multisig]
+                    )
+                )
+                targets.append((service, "multisig_nonces"))
+
+        if not calls:
+            return
+
+        _, results = Multicall2Contract.try_aggregate_and_decode(
+            ledger_api, contract_address, calls, block_identifier=block_number
+        )
+        for (target, key), result in zip(targets, results):
+            value = _unwrap(result)
+            target[key] = _to_list(value) if key == "multisig_nonces" else value
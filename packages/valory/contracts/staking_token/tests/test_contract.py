@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Tests for valory/staking_token contract."""
+
+from typing import Any, Callable, Dict, List, Tuple
+from unittest import mock
+
+from packages.valory.contracts.multicall2.contract import Multicall2Contract
+from packages.valory.contracts.staking_activity_checker.contract import (
+    StakingActivityCheckerContract,
+)
+from packages.valory.contracts.staking_token.contract import (
+    NULL_ADDRESS,
+    StakingTokenContract,
+)
+
+STAKING_ADDRESS = "0x" + "1" * 40
+ACTIVITY_CHECKER_ADDRESS = "0x" + "2" * 40
+MULTISIG_ADDRESS = "0x" + "3" * 40
+OWNER_ADDRESS = "0x" + "4" * 40
+BLOCK_NUMBER = 100
+
+
+def _encode_function_call(
+    _ledger_api: Any, _instance: Any, abi_element_identifier: str, args: List[Any]
+) -> Tuple[Dict[str, Any], Callable]:
+    """Encode a function call as its name and arguments, for the assertions."""
+    return {"callData": (abi_element_identifier, *args)}, lambda data: data
+
+
+def test_get_staking_snapshot() -> None:
+    """Test `get_staking_snapshot`."""
+    aggregate_calls: List[Tuple[List[Any], Any]] = []
+
+    def try_aggregate_and_decode(
+        _ledger_api: Any,
+        _contract_address: str,
+        calls_and_decoders: List[Tuple[Dict[str, Any], Callable]],
+        block_identifier: Any = "latest",
+    ) -> Tuple[int, List[Any]]:
+        """Return canned responses for the calls."""
+        calls = [call["callData"] for call, _ in calls_and_decoders]
+        aggregate_calls.append((calls, block_identifier))
+        responses = {
+            ("availableRewards",): (10,),
+            ("getNextRewardCheckpointTimestamp",): (20,),
+            ("tsCheckpoint",): (15,),
+            ("livenessPeriod",): (5,),
+            ("activityChecker",): (ACTIVITY_CHECKER_ADDRESS,),
+            ("getStakingState", 1): (1,),
+            ("getServiceInfo", 1): ((MULTISIG_ADDRESS, OWNER_ADDRESS, (3,), 12, 1, 0),),
+            ("calculateStakingReward", 1): (2,),
+            ("getStakingState", 2): (0,),
+            ("getServiceInfo", 2): ((NULL_ADDRESS, NULL_ADDRESS, (), 0, 0, 0),),
+            # the staking reward call of service 2 fails
+            ("livenessRatio",): (1000,),
+            ("getMultisigNonces", MULTISIG_ADDRESS): ((4,),),
+        }
+        return BLOCK_NUMBER, [responses.get(call) for call in calls]
+
+    with mock.patch.object(StakingTokenContract, "get_instance"), mock.patch.object(
+        StakingActivityCheckerContract, "get_instance"
+    ), mock.patch.object(
+        Multicall2Contract, "encode_function_call", side_effect=_encode_function_call
+    ), mock.patch.object(
+        Multicall2Contract,
+        "try_aggregate_and_decode",
+        side_effect=try_aggregate_and_decode,
+    ):
+        res = StakingTokenContract.get_staking_snapshot(
+            mock.MagicMock(), "multicall", {STAKING_ADDRESS: [1, 2]}
+        )
+
+    assert res == dict(
+        data=dict(
+            block_number=BLOCK_NUMBER,
+            staking_contracts={
+                STAKING_ADDRESS: {
+                    "available_rewards": 10,
+                    "next_checkpoint_ts": 20,
+                    "ts_checkpoint": 15,
+                    "liveness_period": 5,
+                    "activity_checker": ACTIVITY_CHECKER_ADDRESS,
+                    "liveness_ratio": 1000,
+                    "services": {
+                        "1": {
+                            "multisig": MULTISIG_ADDRESS,
+                            "owner": OWNER_ADDRESS,
+                            "nonces": [3],
+                            "ts_start": 12,
+                            "reward": 1,
+                            "inactivity": 0,
+                            "staking_state": 1,
+                            "staking_reward": 2,
+                            "multisig_nonces": [4],
+                        },
+                        "2": {
+                            "multisig": NULL_ADDRESS,
+                            "owner": NULL_ADDRESS,
+                            "nonces": [],
+                            "ts_start": 0,
+                            "reward": 0,
+                            "inactivity": 0,
+                            "staking_state": 0,
+                            "staking_reward": None,
+                            "multisig_nonces": None,
+                        },
+                    },
+                }
+            },
+        )
+    )
+    # two aggregate calls, the second one pinned to the block of the first one
+    assert len(aggregate_calls) == 2
+    assert aggregate_calls[0][1] == "latest"
+    assert aggregate_calls[1] == (
+        [("livenessRatio",), ("getMultisigNonces", MULTISIG_ADDRESS)],
+        BLOCK_NUMBER,
+    )
@@ -0,0 +1,527 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""
+Benchmark the ABCI transports without a Tendermint node.
+
+A synthetic block stream is replayed through the full request path of each agent: the framing of the
+transport, the decoding of the requests, the envelopes, the ABCI handler of the skill, and the encoding
+of the responses. The TCP and the gRPC transports are driven over a local socket, as a Tendermint node
+would; the mock transport is driven through the requests of its block producer, which skips `CheckTx`.
+
+Run it with:
+
+    python -m packages.valory.skills.abstract_abci.tests.benchmark --blocks 100 --txs-per-block 10
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union, cast
+
+import grpc
+from aea.configurations.data_types import PublicId
+from aea.mail.base import Envelope
+from aea.skills.base import Handler
+from aea.test_tools.network import get_unused_tcp_port
+from aea.test_tools.test_skill import BaseSkillTestCase
+from aea_test_autonomy.helpers.benchmark import (
+    BaseBenchmarkResult,
+    format_table,
+    run_benchmark_cli,
+)
+
+from packages.valory.connections.abci.connection import (
+    GrpcServerChannel,
+    MockServerChannel,
+    TcpServerChannel,
+    VarintMessageReader,
+    _TendermintABCISerializer,
+)
+from packages.valory.connections.abci.tendermint.abci import (
+    types_pb2 as abci_types,  # type: ignore
+)
+from packages.valory.connections.abci.tendermint.abci import (  # type: ignore
+    types_pb2_grpc,
+)
+from packages.valory.connections.abci.tendermint.types import (
+    types_pb2 as tendermint_types,  # type: ignore
+)
+from packages.valory.protocols.abci import AbciMessage
+from packages.valory.protocols.abci.custom_types import (
+    Evidences,
+    LastCommitInfo,
+    Timestamp,
+    ValidatorUpdates,
+)
+
+TCP = "tcp"
+GRPC = "grpc"
+MOCK = "mock"
+TRANSPORTS = (TCP, GRPC, MOCK)
+LOCALHOST = "127.0.0.1"
+CHAIN_ID = "benchmark"
+SKILL_DIR = Path(__file__).parents[1]
+
+_logger = logging.getLogger(__name__)
+
+MockRequest = Tuple[AbciMessage.Performative, Dict[str, Any]]
+Server = Union[TcpServerChannel, GrpcServerChannel, MockServerChannel]
+
+
+@dataclass(frozen=True)
+class BenchmarkConfig:  # pylint: disable=too-many-instance-attributes
+    """The configuration of a benchmark run."""
+
+    transport: str = TCP
+    blocks: int = 100
+    txs_per_block: int = 10
+    payload_size: int = 256
+    agents: int = 1
+    seed: int = 0
+    trace_allocations: bool = True
+    skill_dir: Path = SKILL_DIR
+
+
+@dataclass(frozen=True)
+class BenchmarkResult(BaseBenchmarkResult):
+    """The result of a benchmark run."""
+
+    transport: str
+    agents: int
+    requests: int
+    duration: float
+    latencies: Tuple[float, ...]
+    allocated_peak: Optional[int] = None
+    allocated_retained: Optional[int] = None
+
+    @property
+    def requests_per_second(self) -> float:
+        """Get the number of requests handled per second, by all the agents."""
+        return self.requests / self.duration if self.duration else 0.0
+
+    def latency(self, percentile: float) -> float:
+        """Get a percentile of the request latencies, in seconds, using the nearest rank."""
+        if not self.latencies:
+            return 0.0
+        rank = math.ceil(percentile / 100 * len(self.latencies))
+        return self.latencies[max(rank, 1) - 1]
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get the summary of the result."""
+        return {
+            "transport": self.transport,
+            "agents": self.agents,
+            "requests": self.requests,
+            "duration": self.duration,
+            "requests_per_second": self.requests_per_second,
+            "latency_p50": self.latency(50),
+            "latency_p99": self.latency(99),
+            "allocated_peak": self.allocated_peak,
+            "allocated_retained": self.allocated_retained,
+        }
+
+
+def make_transactions(config: BenchmarkConfig) -> List[List[bytes]]:
+    """Make the random transactions of each block."""
+    rng = random.Random(config.seed)  # nosec
+    return [
+        [rng.randbytes(config.payload_size) for _ in range(config.txs_per_block)]
+        for _ in range(config.blocks)
+    ]
+
+
+def make_requests(config: BenchmarkConfig) -> List[abci_types.Request]:
+    """
+    Make the requests a Tendermint node sends to the application for the synthetic block stream.
+
+    The transactions of each block are first checked, as on their arrival in the mempool,
+    and then delivered between the `BeginBlock` and the `EndBlock` requests.
+
+    :param config: the benchmark configuration.
+    :return: the requests.
+    """
+    requests = [
+        abci_types.Request(info=abci_types.RequestInfo()),
+        abci_types.Request(
+            init_chain=abci_types.RequestInitChain(chain_id=CHAIN_ID, initial_height=1)
+        ),
+    ]
+    for height, txs in enumerate(make_transactions(config), start=1):
+        requests.extend(
+            abci_types.Request(check_tx=abci_types.RequestCheckTx(tx=tx)) for tx in txs
+        )
+        header = tendermint_types.Header(chain_id=CHAIN_ID, height=height)
+        requests.append(
+            abci_types.Request(begin_block=abci_types.RequestBeginBlock(header=header))
+        )
+        requests.extend(
+            abci_types.Request(deliver_tx=abci_types.RequestDeliverTx(tx=tx))
+            for tx in txs
+        )
+        requests.append(
+            abci_types.Request(end_block=abci_types.RequestEndBlock(height=height))
+        )
+        requests.append(abci_types.Request(commit=abci_types.RequestCommit()))
+    return requests
+
+
+def make_mock_requests(
+    config: BenchmarkConfig, server: MockServerChannel
+) -> List[MockRequest]:
+    """Make the requests the block producer of the mock transport sends for the synthetic block stream."""
+    requests: List[MockRequest] = [
+        (
+            AbciMessage.Performative.REQUEST_INFO,
+            dict(version="", block_version=0, p2p_version=0),
+        ),
+        (
+            AbciMessage.Performative.REQUEST_INIT_CHAIN,
+            dict(
+                time=Timestamp(0, 0),
+                chain_id=CHAIN_ID,
+                validators=ValidatorUpdates([]),
+                app_state_bytes=b"",
+                initial_height=1,
+            ),
+        ),
+    ]
+    for height, txs in enumerate(make_transactions(config), start=1):
+        requests.append(
+            (
+                AbciMessage.Performative.REQUEST_BEGIN_BLOCK,
+                dict(
+                    hash=b"",
+                    header=server._make_header(  # pylint: disable=protected-access
+                        height
+                    ),
+                    last_commit_info=LastCommitInfo(0, []),
+                    byzantine_validators=Evidences([]),
+                ),
+            )
+        )
+        requests.extend(
+            (AbciMessage.Performative.REQUEST_DELIVER_TX, dict(tx=tx)) for tx in txs
+        )
+        requests.append(
+            (AbciMessage.Performative.REQUEST_END_BLOCK, dict(height=height))
+        )
+        requests.append((AbciMessage.Performative.REQUEST_COMMIT, {}))
+    return requests
+
+
+class _BenchmarkMockServerChannel(MockServerChannel):
+    """A mock server channel whose requests are sent by the benchmark rather than by its block producer."""
+
+    async def _produce_blocks(self) -> None:
+        """Do not produce any block."""
+
+
+class _Skill:  # pylint: disable=too-few-public-methods
+    """The skill of an agent, with the outbox routing the responses back to the connection."""
+
+    def __init__(self, skill_dir: Path) -> None:
+        """Load the skill."""
+        loader = cast(
+            Type[BaseSkillTestCase],
+            type("_SkillLoader", (BaseSkillTestCase,), dict(path_to_skill=skill_dir)),
+        )
+        loader.setup_class()
+        skill = loader._skill  # pylint: disable=protected-access
+        self.skill_id: PublicId = skill.skill_context.skill_id
+        self._handler = cast(Handler, skill.skill_context.handlers.abci)
+        multiplexer = loader._multiplexer  # pylint: disable=protected-access
+        self._out_queue = multiplexer.out_queue
+
+    def handle(self, envelope: Envelope) -> Envelope:
+        """Handle a request, and get the response from the outbox."""
+        self._handler.handle(envelope.message)
+        return self._out_queue.get_nowait()
+
+
+class _Agent:
+    """An agent's ABCI connection and skill, with the Tendermint node driving them."""
+
+    def __init__(self, config: BenchmarkConfig) -> None:
+        """Initialize the agent."""
+        self.transport = config.transport
+        self.skill = _Skill(config.skill_dir)
+        self.port = get_unused_tcp_port()
+        self.server: Server
+        if self.transport == TCP:
+            self.server = TcpServerChannel(
+                self.skill.skill_id, LOCALHOST, self.port, _logger
+            )
+        elif self.transport == GRPC:
+            self.server = GrpcServerChannel(
+                self.skill.skill_id, LOCALHOST, self.port, _logger
+            )
+        elif self.transport == MOCK:
+            self.server = _BenchmarkMockServerChannel(
+                self.skill.skill_id, LOCALHOST, self.port, _logger
+            )
+        else:
+            raise ValueError(
+                f"Unknown transport {self.transport!r}, expected one of {TRANSPORTS}."
+            )
+        self._serve_task: Optional[asyncio.Task] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader: Optional[VarintMessageReader] = None
+        self._grpc_channel: Optional[grpc.aio.Channel] = None
+        self._stub: Optional[types_pb2_grpc.ABCIApplicationStub] = None
+
+    async def start(self) -> None:
+        """Start the connection and the skill, and connect the node."""
+        await self.server.connect(asyncio.get_running_loop())
+        self._serve_task = asyncio.create_task(self._serve())
+        if self.transport == TCP:
+            reader, self._writer = await asyncio.open_connection(LOCALHOST, self.port)
+            self._reader = VarintMessageReader(reader)
+        elif self.transport == GRPC:
+            self._grpc_channel = grpc.aio.insecure_channel(f"{LOCALHOST}:{self.port}")
+            await self._grpc_channel.channel_ready()
+            self._stub = types_pb2_grpc.ABCIApplicationStub(self._grpc_channel)
+
+    async def stop(self) -> None:
+        """Disconnect the node, and stop the skill and the connection."""
+        if self._writer is not None:
+            self._writer.close()
+        if self._grpc_channel is not None:
+            await self._grpc_channel.close()
+        if self._serve_task is not None:
+            self._serve_task.cancel()
+        await self.server.disconnect()
+
+    async def _serve(self) -> None:
+        """Route the requests from the connection to the skill, and the responses back."""
+        try:
+            while True:
+                envelope = await self.server.get_message()
+                await self.server.send(self.skill.handle(envelope))
+        except Exception:
+            # disconnecting fails the pending request of the node, instead of leaving it waiting forever
+            await self.server.disconnect()
+            raise
+
+    async def replay(self, requests: Sequence[Any]) -> List[float]:
+        """Send the requests one after the other, and get the latency of each one of them."""
+        send = {TCP: self._send_tcp, GRPC: self._send_grpc, MOCK: self._send_mock}[
+            self.transport
+        ]
+        latencies = []
+        for request in requests:
+            start = time.perf_counter()
+            try:
+                await send(request)
+            except BaseException as e:
+                self._raise_skill_error(e)
+                raise
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    def _raise_skill_error(self, error: BaseException) -> None:
+        """Raise the error of the skill, if it is the reason for the failure of a request."""
+        task = self._serve_task
+        if task is None or not task.done() or task.cancelled():
+            return
+        skill_error = task.exception()
+        if skill_error is not None:
+            raise skill_error from error
+
+    async def _send_tcp(self, data: bytes) -> None:
+        """Send a serialized request over the socket, and read its response."""
+        writer = cast(asyncio.StreamWriter, self._writer)
+        writer.write(data)
+        await writer.drain()
+        await cast(VarintMessageReader, self._reader).read_next_message()
+
+    async def _send_grpc(self, request: Tuple[str, Any]) -> None:
+        """Call the gRPC method of a request."""
+        method, message = request
+        await getattr(self._stub, method)(message)
+
+    async def _send_mock(self, request: MockRequest) -> None:
+        """Send a request as the block producer of the mock transport does."""
+        performative, kwargs = request
+        server = cast(MockServerChannel, self.server)
+        await server._send_and_wait(  # pylint: disable=protected-access
+            performative, **kwargs
+        )
+
+    def prepare(self, config: BenchmarkConfig) -> List[Any]:
+        """Prepare the requests in the form sent over the transport, so that their preparation is not measured."""
+        if self.transport == MOCK:
+            return make_mock_requests(config, cast(MockServerChannel, self.server))
+        requests = make_requests(config)
+        if self.transport == TCP:
+            return [_TendermintABCISerializer.write_message(req) for req in requests]
+        prepared = []
+        for request in requests:
+            field = request.WhichOneof("value")
+            method = "".join(part.capitalize() for part in field.split("_"))
+            prepared.append((method, getattr(request, field)))
+        return prepared
+
+
+async def _replay(
+    agents: List[_Agent], requests: List[Any]
+) -> Tuple[float, List[float]]:
+    """Replay the requests through all the agents concurrently."""
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(agent.replay(requests) for agent in agents))
+    duration = time.perf_counter() - start
+    return duration, [latency for agent in latencies for latency in agent]
+
+
+async def run_benchmark(config: BenchmarkConfig) -> BenchmarkResult:
+    """
+    Run a benchmark.
+
+    The stream is replayed once to measure the throughput and the latencies. If the allocations are traced,
+    it is replayed a second time under `tracemalloc`, which slows down the execution, to measure the peak
+    and the retained traced memory.
+
+    :param config: the benchmark configuration.
+    :return: the result of the benchmark.
+    """
+    agents = [_Agent(config) for _ in range(config.agents)]
+    try:
+        for agent in agents:
+            await agent.start()
+        requests = agents[0].prepare(config)
+        duration, latencies = await _replay(agents, requests)
+
+        allocated_peak = allocated_retained = None
+        if config.trace_allocations:
+            tracemalloc.start()
+            try:
+                start, _ = tracemalloc.get_traced_memory()
+                await _replay(agents, requests)
+                current, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            allocated_peak, allocated_retained = peak - start, current - start
+    finally:
+        for agent in agents:
+            await agent.stop()
+
+    return BenchmarkResult(
+        transport=config.transport,
+        agents=config.agents,
+        requests=len(latencies),
+        duration=duration,
+        latencies=tuple(sorted(latencies)),
+        allocated_peak=allocated_peak,
+        allocated_retained=allocated_retained,
+    )
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    """Format the results as a table."""
+    header = (
+        "transport",
+        "agents",
+        "requests",
+        "seconds",
+        "requests/s",
+        "p50 (ms)",
+        "p99 (ms)",
+        "peak (KiB)",
+        "retained (KiB)",
+    )
+    rows = []
+    for result in results:
+        allocations = (
+            ("-", "-")
+            if result.allocated_peak is None
+            else (
+                f"{result.allocated_peak / 1024:.1f}",
+                f"{cast(int, result.allocated_retained) / 1024:.1f}",
+            )
+        )
+        rows.append(
+            (
+                result.transport,
+                str(result.agents),
+                str(result.requests),
+                f"{result.duration:.3f}",
+                f"{result.requests_per_second:.1f}",
+                f"{result.latency(50) * 1000:.3f}",
+                f"{result.latency(99) * 1000:.3f}",
+                *allocations,
+            )
+        )
+    return format_table(header, rows)
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the benchmark."""
+    parser.add_argument(
+        "--transport",
+        action="append",
+        choices=TRANSPORTS,
+        help="Transport to benchmark, can be repeated (default: all of them).",
+    )
+    parser.add_argument("--blocks", type=int, default=100)
+    parser.add_argument("--txs-per-block", type=int, default=10)
+    parser.add_argument("--payload-size", type=int, default=256, help="In bytes.")
+    parser.add_argument("--agents", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--skip-allocations",
+        action="store_true",
+        help="Do not replay the stream a second time to trace the allocations.",
+    )
+
+
+def _run(args: argparse.Namespace) -> List[BenchmarkResult]:
+    """Run the benchmark of each transport."""
+    logging.getLogger().setLevel(logging.WARNING)
+    return [
+        asyncio.run(
+            run_benchmark(
+                BenchmarkConfig(
+                    transport=transport,
+                    blocks=args.blocks,
+                    txs_per_block=args.txs_per_block,
+                    payload_size=args.payload_size,
+                    agents=args.agents,
+                    seed=args.seed,
+                    trace_allocations=not args.skip_allocations,
+                )
+            )
+        )
+        for transport in args.transport or TRANSPORTS
+    ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the benchmarks from the command line."""
+    run_benchmark_cli(__doc__, _add_arguments, _run, format_results, argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Test the ABCI transports benchmark."""
+
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+
+from packages.valory.skills.abstract_abci.tests import benchmark
+from packages.valory.skills.abstract_abci.tests.benchmark import (
+    BenchmarkConfig,
+    BenchmarkResult,
+    GRPC,
+    MOCK,
+    TCP,
+    TRANSPORTS,
+    format_results,
+    main,
+    make_requests,
+    run_benchmark,
+)
+
+BLOCKS = 2
+TXS_PER_BLOCK = 3
+AGENTS = 2
+
+
+def test_make_requests() -> None:
+    """Test the requests of the synthetic block stream."""
+    config = BenchmarkConfig(blocks=BLOCKS, txs_per_block=TXS_PER_BLOCK, payload_size=8)
+    requests = make_requests(config)
+    assert [request.WhichOneof("value") for request in requests[:11]] == [
+        "info",
+        "init_chain",
+        *["check_tx"] * TXS_PER_BLOCK,
+        "begin_block",
+        *["deliver_tx"] * TXS_PER_BLOCK,
+        "end_block",
+        "commit",
+    ]
+    assert len(requests) == 2 + BLOCKS * (2 * TXS_PER_BLOCK + 3)
+    assert all(len(request.check_tx.tx) == 8 for request in requests[2:5])
+    assert requests[2:5] != make_requests(BenchmarkConfig(seed=1))[2:5]
+
+
+@pytest.mark.parametrize(
+    "transport, requests_per_agent",
+    (
+        (TCP, 2 + BLOCKS * (2 * TXS_PER_BLOCK + 3)),
+        (GRPC, 2 + BLOCKS * (2 * TXS_PER_BLOCK + 3)),
+        # the block producer of the mock transport does not send `CheckTx` requests
+        (MOCK, 2 + BLOCKS * (TXS_PER_BLOCK + 3)),
+    ),
+)
+def test_run_benchmark(transport: str, requests_per_agent: int) -> None:
+    """Test running a benchmark on each transport."""
+    config = BenchmarkConfig(
+        transport=transport,
+        blocks=BLOCKS,
+        txs_per_block=TXS_PER_BLOCK,
+        agents=AGENTS,
+    )
+    result = asyncio.run(run_benchmark(config))
+    assert result.transport == transport
+    assert result.requests == AGENTS * requests_per_agent
+    assert result.requests_per_second > 0
+    assert 0 < result.latency(50) <= result.latency(99) <= result.latencies[-1]
+    assert result.allocated_peak is not None and result.allocated_peak > 0
+    assert result.allocated_retained is not None
+
+
+@pytest.mark.parametrize("transport", TRANSPORTS)
+def test_handler_failure(transport: str) -> None:
+    """Test that a failure of the handler fails the benchmark, instead of leaving it waiting."""
+    config = BenchmarkConfig(transport=transport, blocks=1, trace_allocations=False)
+    with mock.patch.object(
+        benchmark._Skill, "handle", side_effect=ValueError("failure")
+    ):
+        with pytest.raises(ValueError, match="failure"):
+            asyncio.run(asyncio.wait_for(run_benchmark(config), timeout=30))
+
+
+def test_unknown_transport() -> None:
+    """Test benchmarking an unknown transport."""
+    with pytest.raises(ValueError, match="Unknown transport 'http'"):
+        asyncio.run(run_benchmark(BenchmarkConfig(transport="http")))
+
+
+def test_result() -> None:
+    """Test the summary and the formatting of the results."""
+    result = BenchmarkResult(
+        transport=TCP,
+        agents=1,
+        requests=4,
+        duration=2.0,
+        latencies=(0.001, 0.002, 0.003, 0.004),
+    )
+    assert result.requests_per_second == 2.0
+    assert result.latency(50) == 0.002
+    assert result.latency(99) == 0.004
+    assert result.to_json()["latency_p99"] == 0.004
+    assert BenchmarkResult(TCP, 1, 0, 0.0, ()).latency(99) == 0.0
+
+    lines = format_results([result]).splitlines()
+    assert lines[0].startswith("transport | agents | requests")
+    assert lines[1].split(" | ") == [
+        "tcp      ",
+        "1     ",
+        "4       ",
+        "2.000  ",
+        "2.0       ",
+        "2.000   ",
+        "4.000   ",
+        "-         ",
+        "-",
+    ]
+
+
+def test_main(capsys: pytest.CaptureFixture) -> None:
+    """Test running the benchmarks from the command line."""
+    main(["--transport", TCP, "--blocks", "1", "--skip-allocations", "--json"])
+    (result,) = json.loads(capsys.readouterr().out)
+    assert result["transport"] == TCP
+    assert result["requests"] == 2 + (2 * 10 + 3)
+    assert result["allocated_peak"] is None
@@ -29,13 +29,23 @@ import re
 import sys
 import textwrap
 import uuid
+import zlib
 from abc import ABC, ABCMeta, abstractmethod
 from collections import Counter, deque
 from copy import copy, deepcopy
-from dataclasses import asdict, astuple, dataclass, field, is_dataclass
+from dataclasses import (
+    asdict,
+    astuple,
+    dataclass,
+    field,
+    fields,
+    is_dataclass,
+    replace,
+)
 from enum import Enum
 from inspect import isclass
 from math import ceil
+from time import perf_counter
 from typing import (
     Any,
     Callable,
@@ -71,7 +81,13 @@ from packages.valory.protocols.abci.custom_types import (
     LastCommitInfo,
     Validator,
 )
+from packages.valory.skills.abstract_round_abci.memory import MemoryUsage, usage_of
+from packages.valory.skills.abstract_round_abci.metrics import (
+    AbciMetrics,
+    get_metrics,
+)
 from packages.valory.skills.abstract_round_abci.utils import (
+    LazyFormat,
     consensus_threshold,
     is_json_serializable,
 )
@@ -105,6 +121,13 @@ PAYLOAD_KEY_ATTRIBUTE = "payload_key"
 COLLECTION_KEY_ATTRIBUTE = "collection_key"
 SELECTION_KEY_ATTRIBUTE = "selection_key"
 REQUIRED_BLOCK_CONFIRMATIONS_ATTRIBUTE = "required_block_confirmations"
+LARGE_FIELD_METADATA_KEY = "large"
+# the plain encoding of a transaction is a JSON object, i.e., it always starts with `{`,
+# so a null byte followed by the version of the envelope cannot be mistaken for it
+COMPRESSED_TRANSACTION_PREFIX = b"\x00\x01"
+# a decompressed transaction cannot carry more than a payload of `MAX_READ_IN_BYTES` and its signature
+MAX_DECOMPRESSED_TRANSACTION_BYTES = 2 * MAX_READ_IN_BYTES
+IPFS_REFERENCE_PREFIX = "ipfs://"
 
 EventType = TypeVar("EventType")
 
@@ -188,6 +211,41 @@ class _MetaPayload(ABCMeta):
         return new_cls
 
 
+def large_field(**kwargs: Any) -> Any:
+    """
+    Declare a payload field whose value is offloaded to IPFS.
+
+    When a payload is sent via `BaseBehaviour.send_a2a_transaction`, the value of each large field
+    is stored on IPFS and replaced by a reference to it, so that the transaction only carries the hash.
+    The values are stored as canonical JSON, with sorted keys and uncompressed, so that equal values get the same
+    content addressed reference on every agent, and rounds can compare the references as if they were the values.
+    Behaviours get the original value back via `BaseBehaviour.resolve_large_fields` or `BaseBehaviour.resolve_large_value`.
+
+    :param kwargs: the keyword arguments to pass to `dataclasses.field`.
+    :return: the field.
+    """
+    metadata = dict(kwargs.pop("metadata", None) or {})
+    metadata[LARGE_FIELD_METADATA_KEY] = True
+    return field(metadata=metadata, **kwargs)
+
+
+def is_ipfs_reference(value: Any) -> bool:
+    """Check whether a value is a reference to a large field's value stored on IPFS."""
+    return isinstance(value, str) and value.startswith(IPFS_REFERENCE_PREFIX)
+
+
+def to_ipfs_reference(ipfs_hash: str) -> str:
+    """Get the reference to a large field's value stored on IPFS with the given hash."""
+    return IPFS_REFERENCE_PREFIX + ipfs_hash
+
+
+def from_ipfs_reference(reference: str) -> str:
+    """Get the IPFS hash from a reference to a large field's value."""
+    if not is_ipfs_reference(reference):
+        raise ValueError(f"{reference!r} is not a reference to a value stored on IPFS.")
+    return reference[len(IPFS_REFERENCE_PREFIX) :]
+
+
 @dataclass(frozen=True)
 class BaseTxPayload(metaclass=_MetaPayload):
     """This class represents a base class for transaction payload classes."""
@@ -234,6 +292,22 @@ class BaseTxPayload(metaclass=_MetaPayload):
         object.__setattr__(payload, "id_", id_)
         return payload
 
+    @classmethod
+    def large_fields(cls) -> Tuple[str, ...]:
+        """Get the names of the fields declared via `large_field`."""
+        return tuple(
+            field_.name
+            for field_ in fields(cls)
+            if field_.metadata.get(LARGE_FIELD_METADATA_KEY, False)
+        )
+
+    def with_data(self, **data: Any) -> "BaseTxPayload":
+        """Create a new payload with the given data replaced, keeping the same id and round count."""
+        new = replace(self, **data)  # type: ignore
+        object.__setattr__(new, "round_count", self.round_count)
+        object.__setattr__(new, "id_", self.id_)
+        return new
+
     def with_new_id(self) -> "BaseTxPayload":
         """Create a new payload with the same content but new id."""
         new = type(self)(sender=self.sender, **self.data)  # type: ignore
@@ -261,21 +335,55 @@ class Transaction(ABC):
     payload: BaseTxPayload
     signature: str
 
-    def encode(self) -> bytes:
-        """Encode the transaction."""
+    def encode(self, compression_threshold: Optional[int] = None) -> bytes:
+        """
+        Encode the transaction.
+
+        :param compression_threshold: if set, the transactions whose JSON encoding is larger than this number of bytes
+            are compressed, and prefixed with `COMPRESSED_TRANSACTION_PREFIX`.
+        :return: the encoded transaction.
+        :raises ValueError: if the encoded transaction is too large.
+        """
 
         data = dict(payload=self.payload.json, signature=self.signature)
         encoded_data = json.dumps(data, sort_keys=True).encode()
+        if (
+            compression_threshold is not None
+            and len(encoded_data) > compression_threshold
+        ):
+            encoded_data = COMPRESSED_TRANSACTION_PREFIX + zlib.compress(encoded_data)
         if sys.getsizeof(encoded_data) > MAX_READ_IN_BYTES:
             raise ValueError(
                 f"Transaction must be smaller than {MAX_READ_IN_BYTES} bytes"
             )
         return encoded_data
 
+    @staticmethod
+    def _decompress(obj: bytes) -> bytes:
+        """Decompress a transaction encoded with `COMPRESSED_TRANSACTION_PREFIX`."""
+        decompressor = zlib.decompressobj()
+        try:
+            decompressed = decompressor.decompress(
+                obj[len(COMPRESSED_TRANSACTION_PREFIX) :],
+                MAX_DECOMPRESSED_TRANSACTION_BYTES,
+            )
+        except zlib.error as e:
+            raise TransactionNotValidError(
+                f"Compressed transaction is corrupted: {e}"
+            ) from e
+        if decompressor.unconsumed_tail or not decompressor.eof:
+            raise TransactionNotValidError(
+                "Compressed transaction is truncated or decompresses to more than "
+                f"{MAX_DECOMPRESSED_TRANSACTION_BYTES} bytes."
+            )
+        return decompressed
+
     @classmethod
     def decode(cls, obj: bytes) -> "Transaction":
-        """Decode the transaction."""
+        """Decode the transaction, either plain or compressed."""
 
+        if obj.startswith(COMPRESSED_TRANSACTION_PREFIX):
+            obj = cls._decompress(obj)
         data = json.loads(obj.decode())
         signature = data["signature"]
         payload = BaseTxPayload.from_json(data["payload"])
@@ -791,14 +899,18 @@ class AbciAppDB:
         self._data = db_data
         self.slashing_config = slashing_config
 
-    def hash(self) -> bytes:
-        """Create a hash of the data."""
+    def hash(self, metrics: Optional[AbciMetrics] = None) -> bytes:
+        """Create a hash of the data, recording its duration and size to the given metrics."""
         # Compute the sha256 hash of the serialized data
+        start = perf_counter()
         sha256 = hashlib.sha256()
         data = self.serialize()
         sha256.update(data.encode("utf-8"))
         hash_ = sha256.digest()
-        self.logger.debug(f"root hash: {hash_.hex()}; data: {data}")
+        if metrics is not None and metrics.registry.enabled:
+            metrics.db_hash_duration.observe(perf_counter() - start)
+            metrics.db_size.set(len(data))
+        self.logger.debug("root hash: %s; data: %s", hash_.hex(), data)
         return hash_
 
     @staticmethod
@@ -2436,6 +2548,7 @@ class AbciApp(
         self._round_results: List[BaseSynchronizedData] = []
         self._last_timestamp: Optional[datetime.datetime] = None
         self._current_timeout_entries: List[int] = []
+        self._round_start_time: Optional[float] = None
         self._timeouts = Timeouts[EventType]()
         self._transition_backup = TransitionBackup()
         self._switched = False
@@ -2660,6 +2773,7 @@ class AbciApp(
 
         self._last_round = self._current_round
         self._current_round_cls = round_cls
+        self._round_start_time = perf_counter()
         self._current_round = round_cls(
             self.synchronized_data,
             self.context,
@@ -2853,6 +2967,15 @@ class AbciApp(
         result = self.current_round.synchronized_data if result is None else result
         self._round_results.append(result)
 
+        metrics = get_metrics(self.context)
+        if metrics.registry.enabled:
+            round_id = self.current_round.round_id
+            metrics.round_events.inc(round=round_id, event=event)
+            if self._round_start_time is not None:
+                metrics.round_duration.observe(
+                    perf_counter() - self._round_start_time, round=round_id
+                )
+
         self._log_end(event)
         if next_round_cls is not None:
             self.schedule_round(next_round_cls)
@@ -2907,6 +3030,7 @@ class AbciApp(
                 "current AbciApp time after expired deadline: %s", self.last_timestamp
             )
 
+            get_metrics(self.context).timeouts.inc(event=timeout_event)
             self.process_event(timeout_event)
 
             self._timeouts.pop_earliest_cancelled_timeouts()
@@ -3283,6 +3407,7 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
         self._last_round_transition_tm_height: Optional[int] = None
         self._tm_height: Optional[int] = None
         self._block_stall_deadline: Optional[datetime.datetime] = None
+        self._block_start_time: Optional[float] = None
         self._terminating_round_called: bool = False
         # a mapping of the validators' addresses to their agent addresses
         # we create a mapping to avoid calculating the agent address from the validator address every time we need it
@@ -3328,7 +3453,7 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
     @offence_status.setter
     def offence_status(self, offence_status: Dict[str, OffenceStatus]) -> None:
         """Set the mapping of the agents' addresses to their offence status."""
-        self.abci_app.logger.debug(f"Setting offence status to: {offence_status}")
+        self.abci_app.logger.debug("Setting offence status to: %s", offence_status)
         self._offence_status = offence_status
         self.store_offence_status()
 
@@ -3367,8 +3492,10 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
             return
         encoded_status = self.serialized_offence_status()
         self.latest_synchronized_data.slashing_config = encoded_status
-        self.abci_app.logger.debug(f"Updated db with: {encoded_status}")
-        self.abci_app.logger.debug(f"App hash now is: {self.root_hash.hex()}")
+        self.abci_app.logger.debug("Updated db with: %s", encoded_status)
+        self.abci_app.logger.debug(
+            "App hash now is: %s", LazyFormat(lambda: self.root_hash.hex())
+        )
 
     def get_agent_address(self, validator: Validator) -> str:
         """Get corresponding agent address from a `Validator` instance."""
@@ -3439,6 +3566,42 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
         """Get the height."""
         return self._blockchain.height
 
+    def memory_usage(  # pylint: disable=protected-access
+        self, seen: Optional[Set[int]] = None
+    ) -> Dict[str, MemoryUsage]:
+        """
+        Get the approximate memory usage of the structures which grow with the agent's uptime.
+
+        :param seen: the ids of the objects which have already been sized.
+        :return: the memory usage of each structure.
+        """
+        seen = set() if seen is None else seen
+        abci_app = self.abci_app
+        db_data = abci_app.synchronized_data.db._data
+        db_entries = sum(
+            len(values) for data in db_data.values() for values in data.values()
+        )
+        # the db is sized first, as the round results and the rounds reference it
+        return {
+            "abci_app_db": usage_of(db_entries, db_data, seen),
+            "blockchain": usage_of(
+                self._blockchain.length, self._blockchain._blocks, seen
+            ),
+            "round_results": usage_of(
+                len(abci_app._round_results), abci_app._round_results, seen
+            ),
+            "previous_rounds": usage_of(
+                len(abci_app._previous_rounds), abci_app._previous_rounds, seen
+            ),
+            "timeouts": usage_of(abci_app._timeouts.size, abci_app._timeouts, seen),
+            "pending_offences": usage_of(
+                len(self.pending_offences), self.pending_offences, seen
+            ),
+            "offence_status": usage_of(
+                len(self._offence_status), self._offence_status, seen
+            ),
+        }
+
     @property
     def is_finished(self) -> bool:
         """Check if a round sequence has finished."""
@@ -3542,7 +3705,7 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
 
         :return: the root hash to be included as the Header.AppHash in the next block.
         """
-        return self.abci_app.synchronized_data.db.hash()
+        return self.abci_app.synchronized_data.db.hash(get_metrics(self._context))
 
     @property
     def tm_height(self) -> int:
@@ -3662,6 +3825,7 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
         )
         self._block_builder.reset()
         self._block_builder.header = header
+        self._block_start_time = perf_counter()
         self.abci_app.update_time(header.timestamp)
         self.set_block_stall_deadline()
         self.abci_app.logger.debug(
@@ -3733,6 +3897,10 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
             self._block_construction_phase = (
                 RoundSequence._BlockConstructionState.WAITING_FOR_BEGIN_BLOCK
             )
+            metrics = get_metrics(self._context)
+            if metrics.registry.enabled and self._block_start_time is not None:
+                metrics.block_duration.observe(perf_counter() - self._block_start_time)
+                metrics.block_height.set(block.header.height)
         except AddBlockError as exception:
             raise exception
 
@@ -3805,7 +3973,10 @@ class RoundSequence:  # pylint: disable=too-many-instance-attributes
 
         round_result, event = result
         self.abci_app.logger.debug(
-            f"updating round, current_round {self.current_round.round_id}, event: {event}, round result {round_result}"
+            "updating round, current_round %s, event: %s, round result %s",
+            self.current_round.round_id,
+            event,
+            round_result,
         )
         self.abci_app.process_event(event, result=round_result)
 
@@ -28,9 +28,11 @@ import sys
 from abc import ABC, ABCMeta, abstractmethod
 from enum import Enum
 from functools import partial
+from time import perf_counter
 from typing import (
     Any,
     Callable,
+    ContextManager,
     Dict,
     Generator,
     List,
@@ -40,6 +42,7 @@ from typing import (
     Union,
     cast,
 )
+from urllib.parse import urlparse
 
 from aea.exceptions import enforce
 from aea.mail.base import EnvelopeContext
@@ -54,6 +57,7 @@ from packages.open_aea.protocols.signing.custom_types import (
     SignedTransaction,
     Terms,
 )
+from packages.valory.connections.abci.clock import now as local_now
 from packages.valory.connections.http_client.connection import (
     PUBLIC_ID as HTTP_CLIENT_PUBLIC_ID,
 )
@@ -78,6 +82,9 @@ from packages.valory.skills.abstract_round_abci.base import (
     OK_CODE,
     RoundSequence,
     Transaction,
+    from_ipfs_reference,
+    is_ipfs_reference,
+    to_ipfs_reference,
 )
 from packages.valory.skills.abstract_round_abci.dialogues import (
     ContractApiDialogue,
@@ -100,12 +107,17 @@ from packages.valory.skills.abstract_round_abci.io_.store import (
     SupportedFiletype,
     SupportedObjectType,
 )
+from packages.valory.skills.abstract_round_abci.metrics import get_metrics
 from packages.valory.skills.abstract_round_abci.models import (
     BaseParams,
+    BenchmarkSpan,
+    BenchmarkTool,
+    LARGE_VALUES_CACHE_SIZE,
     Requests,
     SharedState,
     TendermintRecoveryParams,
 )
+from packages.valory.skills.abstract_round_abci.utils import LazyFormat
 
 # TODO: port registration code from registration_abci to here
 
@@ -230,19 +242,19 @@ class AsyncBehaviour(ABC):
         """Wait for a condition to happen.
 
         This is a local method that does not depend on the global clock,
-        so the usage of datetime.now() is acceptable here.
+        so the usage of the local time is acceptable here.
 
         :param condition: the condition to wait for
         :param timeout: the maximum amount of time to wait
         :yield: None
         """
         if timeout is not None:
-            deadline = datetime.datetime.now() + datetime.timedelta(0, timeout)
+            deadline = local_now() + datetime.timedelta(0, timeout)
         else:
             deadline = datetime.datetime.max
 
         while not condition():
-            if timeout is not None and datetime.datetime.now() > deadline:
+            if timeout is not None and local_now() > deadline:
                 raise TimeoutException()
             yield
 
@@ -252,15 +264,16 @@ class AsyncBehaviour(ABC):
 
         The argument may be a floating point number for subsecond precision.
         This is a local method that does not depend on the global clock, so the
-        usage of datetime.now() is acceptable here.
+        usage of the local time is acceptable here. The local time follows the
+        virtual clock of the process, if one is installed.
 
         :param seconds: the seconds
         :yield: None
         """
-        deadline = datetime.datetime.now() + datetime.timedelta(0, seconds)
+        deadline = local_now() + datetime.timedelta(0, seconds)
 
         def _wait_until() -> bool:
-            return datetime.datetime.now() > deadline
+            return local_now() > deadline
 
         yield from self.wait_for_condition(_wait_until)
 
@@ -275,7 +288,7 @@ class AsyncBehaviour(ABC):
         Care must be taken. This method does not handle concurrent requests.
         Use directly after a request is being sent.
         This is a local method that does not depend on the global clock,
-        so the usage of datetime.now() is acceptable here.
+        so the usage of the local time is acceptable here.
 
         :param condition: a callable
         :param timeout: max time to wait (in seconds)
@@ -283,7 +296,7 @@ class AsyncBehaviour(ABC):
         :yield: None
         """
         if timeout is not None:
-            deadline = datetime.datetime.now() + datetime.timedelta(0, timeout)
+            deadline = local_now() + datetime.timedelta(0, timeout)
         else:
             deadline = datetime.datetime.max
 
@@ -292,7 +305,7 @@ class AsyncBehaviour(ABC):
             message = None
             while message is None or not condition(message):
                 message = yield
-                if timeout is not None and datetime.datetime.now() > deadline:
+                if timeout is not None and local_now() > deadline:
                     raise TimeoutException()
             message = cast(Message, message)
             return message
@@ -615,6 +628,14 @@ class BaseBehaviour(
         """Return the synchronized data."""
         return self.shared_state.synchronized_data
 
+    def benchmark_span(self, name: str) -> ContextManager[BenchmarkSpan]:
+        """Measure a named span of the behaviour, nested in any active span."""
+        return (
+            cast(BenchmarkTool, self.context.benchmark_tool)
+            .measure(self.behaviour_id)
+            .span(name)
+        )
+
     @property
     def tm_communication_unhealthy(self) -> bool:
         """Return if the Tendermint communication is not healthy anymore."""
@@ -674,7 +695,7 @@ class BaseBehaviour(
 
         The argument may be a floating point number for subsecond precision.
         This is a local method that does not depend on the global clock,
-        so the usage of datetime.now() is acceptable here.
+        so the usage of the local time is acceptable here.
 
         :param seconds: the seconds
         :yield: None
@@ -686,7 +707,7 @@ class BaseBehaviour(
         )
 
         def _wait_until() -> bool:
-            return datetime.datetime.now() > deadline
+            return local_now() > deadline
 
         yield from self.wait_for_condition(_wait_until)
 
@@ -704,6 +725,8 @@ class BaseBehaviour(
         """
         Send transaction and wait for the response, and repeat until not successful.
 
+        The values of the payload's large fields are stored on IPFS first, and the transaction carries their references.
+
         :param: payload: the payload to send
         :param: resetting: flag indicating if we are resetting Tendermint nodes in this round.
         :yield: the responses
@@ -711,11 +734,121 @@ class BaseBehaviour(
         stop_condition = self.is_round_ended(self.matching_round.auto_round_id())
         round_count = self.synchronized_data.round_count
         object.__setattr__(payload, "round_count", round_count)
-        yield from self._send_transaction(
-            payload,
-            resetting,
-            stop_condition=stop_condition,
+        offloaded_payload = yield from self._offload_large_fields(
+            payload, stop_condition
         )
+        if offloaded_payload is None:
+            return
+        with self.benchmark_span("transaction"):
+            yield from self._send_transaction(
+                offloaded_payload,
+                resetting,
+                stop_condition=stop_condition,
+            )
+
+    def _offload_large_fields(
+        self,
+        payload: BaseTxPayload,
+        stop_condition: Callable[[], bool] = lambda: False,
+    ) -> Generator[None, None, Optional[BaseTxPayload]]:
+        """
+        Store the values of the payload's large fields on IPFS, and replace them with their references.
+
+        :param payload: the payload to offload.
+        :param stop_condition: the condition to stop retrying the upload.
+        :yield: None
+        :return: the payload carrying the references, or `None` if the stop condition was met before the upload succeeded.
+        """
+        references = {}
+        for name in payload.large_fields():
+            value = getattr(payload, name)
+            if value is None or is_ipfs_reference(value):
+                continue
+            store = partial(
+                self.send_to_ipfs,
+                f"{name}.json",
+                {name: value},
+                filetype=SupportedFiletype.JSON_COMPACT,
+            )
+            ipfs_hash = yield from store()
+            while ipfs_hash is None:
+                if stop_condition():
+                    self.context.logger.error(
+                        f"Could not store the large field `{name}` of {type(payload).__name__} on IPFS "
+                        "before the end of the round."
+                    )
+                    return None
+                yield from self.sleep(self.params.sleep_time)
+                ipfs_hash = yield from store()
+            reference = to_ipfs_reference(ipfs_hash)
+            self._cache_large_value(reference, value)
+            references[name] = reference
+        if not references:
+            return payload
+        return payload.with_data(**references)
+
+    def resolve_large_value(
+        self, value: Any, timeout: Optional[float] = None
+    ) -> Generator[None, None, Any]:
+        """
+        Get the value of a large payload field, fetching it from IPFS if it is a reference.
+
+        Resolved values are cached in the shared state, and must not be modified.
+
+        :param value: the value of the large field, e.g., as stored in the synchronized data.
+        :param timeout: timeout for the IPFS request.
+        :yield: None
+        :return: the resolved value, or `None` if it could not be fetched.
+        """
+        if not is_ipfs_reference(value):
+            return value
+        cache = self.shared_state.large_values
+        if value in cache:
+            cache.move_to_end(value)
+            return cache[value]
+        obj = yield from self.get_from_ipfs(
+            from_ipfs_reference(value), SupportedFiletype.JSON_COMPACT, timeout=timeout
+        )
+        if not isinstance(obj, dict) or len(obj) != 1:
+            self.context.logger.error(
+                f"Could not resolve the large field value {value}, got {obj!r} from IPFS."
+            )
+            return None
+        (resolved,) = obj.values()
+        self._cache_large_value(value, resolved)
+        return resolved
+
+    def resolve_large_fields(
+        self, payload: BaseTxPayload, timeout: Optional[float] = None
+    ) -> Generator[None, None, Optional[BaseTxPayload]]:
+        """
+        Get a copy of a payload with the values of its large fields fetched from IPFS.
+
+        :param payload: the payload to resolve.
+        :param timeout: timeout for each IPFS request.
+        :yield: None
+        :return: the resolved payload, or `None` if any of the values could not be fetched.
+        """
+        resolved = {}
+        for name in payload.large_fields():
+            value = getattr(payload, name)
+            if not is_ipfs_reference(value):
+                continue
+            resolved_value = yield from self.resolve_large_value(value, timeout)
+            if resolved_value is None:
+                return None
+            resolved[name] = resolved_value
+        if not resolved:
+            return payload
+        return payload.with_data(**resolved)
+
+    def _cache_large_value(self, reference: str, value: Any) -> None:
+        """Cache the value of a large payload field, evicting the least recently used values."""
+        cache = self.shared_state.large_values
+        cache[reference] = value
+        cache.move_to_end(reference)
+        while len(cache) > LARGE_VALUES_CACHE_SIZE:
+            cache.popitem(last=False)
 
     def async_act_wrapper(self) -> Generator:
         """Do the act, supporting asynchronous execution."""
@@ -847,13 +980,15 @@ class BaseBehaviour(
         )
         while not stop_condition():
             self.context.logger.debug(
-                f"Trying to send payload: {pprint.pformat(payload.json)}"
+                "Trying to send payload: %s",
+                LazyFormat(lambda payload_: pprint.pformat(payload_.json), payload),
             )
             signature_bytes = yield from self.get_signature(payload.encode())
             transaction = Transaction(payload, signature_bytes)
             try:
                 response = yield from self._submit_tx(
-                    transaction.encode(), timeout=request_timeout
+                    transaction.encode(self.params.tx_compression_threshold),
+                    timeout=request_timeout,
                 )
                 # There is no guarantee that beyond this line will be executed for a given behaviour execution.
                 # The tx could lead to a round transition which exits us from the behaviour execution.
@@ -890,7 +1025,9 @@ class BaseBehaviour(
                 raise ValueError(
                     f"Unable to decode response: {response} with body {str(response.body)}"
                 ) from e
-            self.context.logger.debug(f"JSON response: {pprint.pformat(json_body)}")
+            self.context.logger.debug(
+                "JSON response: %s", LazyFormat(pprint.pformat, json_body)
+            )
             tx_hash = json_body["result"]["hash"]
             if json_body["result"]["code"] != OK_CODE:
                 self.context.logger.error(
@@ -1328,7 +1465,8 @@ class BaseBehaviour(
             headers=headers,
             parameters=parameters,
         )
-        response = yield from self._do_request(http_message, http_dialogue)
+        with self.benchmark_span(f"http:{urlparse(url).netloc}"):
+            response = yield from self._do_request(http_message, http_dialogue)
         return response
 
     def _do_request(
@@ -1426,7 +1564,7 @@ class BaseBehaviour(
             Http client connection -> (HttpMessage | RESPONSE) -> AbstractRoundAbci skill
 
         This is a local method that does not depend on the global clock,
-        so the usage of datetime.now() is acceptable here.
+        so the usage of the local time is acceptable here.
 
         :param tx_hash: the transaction hash to check.
         :param timeout: timeout
@@ -1436,7 +1574,7 @@ class BaseBehaviour(
         :return: True if it is delivered successfully, False otherwise
         """
         if timeout is not None:
-            deadline = datetime.datetime.now() + datetime.timedelta(0, timeout)
+            deadline = local_now() + datetime.timedelta(0, timeout)
         else:
             deadline = datetime.datetime.max
         request_retry_delay = (
@@ -1451,7 +1589,7 @@ class BaseBehaviour(
         response = None
         for _ in range(max_attempts):
             request_timeout = (
-                (deadline - datetime.datetime.now()).total_seconds()
+                (deadline - local_now()).total_seconds()
                 if timeout is not None
                 else None
             )
@@ -1512,8 +1650,9 @@ class BaseBehaviour(
         :yield: SigningMessage object
         :return: message signature
         """
-        self._send_signing_request(message, is_deprecated_mode)
-        signature_response = yield from self.wait_for_message()
+        with self.benchmark_span("signing"):
+            self._send_signing_request(message, is_deprecated_mode)
+            signature_response = yield from self.wait_for_message()
         signature_response = cast(SigningMessage, signature_response)
         if signature_response.performative == SigningMessage.Performative.ERROR:
             self._handle_signing_failure()
@@ -1708,7 +1847,7 @@ class BaseBehaviour(
         response = yield from self.wait_for_message()
         return response
 
-    def get_contract_api_response(
+    def _build_contract_api_request(
         self,
         performative: ContractApiMessage.Performative,
         contract_address: Optional[str],
@@ -1716,14 +1855,9 @@ class BaseBehaviour(
         contract_callable: str,
         ledger_id: Optional[str] = None,
         **kwargs: Any,
-    ) -> Generator[None, None, ContractApiMessage]:
+    ) -> Tuple[ContractApiMessage, ContractApiDialogue]:
         """
-        Request contract safe transaction hash
-
-        Happy-path full flow of the messages.
-
-        AbstractRoundAbci skill -> (ContractApiMessage | ContractApiMessage.Performative) -> Ledger connection (contract dispatcher)
-        Ledger connection (contract dispatcher) -> (ContractApiMessage | ContractApiMessage.Performative) -> AbstractRoundAbci skill
+        Build a contract api request message and its dialogue.
 
         :param performative: the message performative
         :param contract_address: the contract address
@@ -1731,8 +1865,7 @@ class BaseBehaviour(
         :param contract_callable: the callable to call on the contract
         :param ledger_id: the ledger id, if not specified, the default ledger id is used
         :param kwargs: keyword argument for the contract api request
-        :return: the contract api response
-        :yields: the contract api response
+        :return: the contract api message and the contract api dialogue
         """
         contract_api_dialogues = cast(
             ContractApiDialogues, self.context.contract_api_dialogues
@@ -1755,14 +1888,116 @@ class BaseBehaviour(
             contract_api_dialogue,
         )
         contract_api_dialogue.terms = self._get_default_terms()
+        return cast(ContractApiMessage, contract_api_msg), contract_api_dialogue
+
+    def get_contract_api_response(
+        self,
+        performative: ContractApiMessage.Performative,
+        contract_address: Optional[str],
+        contract_id: str,
+        contract_callable: str,
+        ledger_id: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Generator[None, None, ContractApiMessage]:
+        """
+        Request contract safe transaction hash
+
+        Happy-path full flow of the messages.
+
+        AbstractRoundAbci skill -> (ContractApiMessage | ContractApiMessage.Performative) -> Ledger connection (contract dispatcher)
+        Ledger connection (contract dispatcher) -> (ContractApiMessage | ContractApiMessage.Performative) -> AbstractRoundAbci skill
+
+        :param performative: the message performative
+        :param contract_address: the contract address
+        :param contract_id: the contract id
+        :param contract_callable: the callable to call on the contract
+        :param ledger_id: the ledger id, if not specified, the default ledger id is used
+        :param kwargs: keyword argument for the contract api request
+        :return: the contract api response
+        :yields: the contract api response
+        """
+        contract_api_msg, contract_api_dialogue = self._build_contract_api_request(
+            performative,
+            contract_address,
+            contract_id,
+            contract_callable,
+            ledger_id,
+            **kwargs,
+        )
         request_nonce = self._get_request_nonce_from_dialogue(contract_api_dialogue)
         cast(Requests, self.context.requests).request_id_to_callback[
             request_nonce
         ] = self.get_callback_request()
-        self.context.outbox.put_message(message=contract_api_msg)
-        response = yield from self.wait_for_message()
+        with self.benchmark_span(f"contract:{contract_callable}"):
+            self.context.outbox.put_message(message=contract_api_msg)
+            response = yield from self.wait_for_message()
         return response
 
+    def get_collecting_callback(
+        self, responses: Dict[str, Message], request_nonce: str
+    ) -> Callable[[Message, "BaseBehaviour"], None]:
+        """Get a callback which collects the response of a request sent concurrently with others.
+
+        Contrary to the callback returned by `get_callback_request`, this one does not require
+        the behaviour to be waiting for a message, as the responses are stored and consumed
+        once all of them have arrived.
+
+        :param responses: the mapping of request nonces to responses to populate.
+        :param request_nonce: the nonce of the request whose response is collected.
+        :return: the request callback.
+        """
+
+        def callback_request(
+            message: Message, current_behaviour: BaseBehaviour
+        ) -> None:
+            """The callback request."""
+            if self.is_stopped:
+                self.context.logger.debug(
+                    "Dropping message as behaviour has stopped: %s", message
+                )
+            elif self != current_behaviour:
+                self.handle_late_messages(self.behaviour_id, message)
+            else:
+                responses[request_nonce] = message
+
+        return callback_request
+
+    def get_contract_api_responses(
+        self,
+        requests: List[Dict[str, Any]],
+    ) -> Generator[None, None, List[ContractApiMessage]]:
+        """
+        Send several contract api requests at once and wait until all of them have been responded.
+
+        All the requests are put in the outbox before waiting, so that the ledger connection can
+        process them concurrently and the total latency is that of the slowest request,
+        instead of the sum of all of them.
+
+        :param requests: the keyword arguments of each request, as expected by `get_contract_api_response`.
+        :return: the contract api responses, in the same order as the requests.
+        :yields: None
+        """
+        responses: Dict[str, Message] = {}
+        request_nonces = []
+        for request_kwargs in requests:
+            contract_api_msg, contract_api_dialogue = self._build_contract_api_request(
+                **request_kwargs
+            )
+            request_nonce = self._get_request_nonce_from_dialogue(contract_api_dialogue)
+            request_nonces.append(request_nonce)
+            cast(Requests, self.context.requests).request_id_to_callback[
+                request_nonce
+            ] = self.get_collecting_callback(responses, request_nonce)
+            self.context.outbox.put_message(message=contract_api_msg)
+
+        yield from self.wait_for_condition(
+            lambda: len(responses) == len(request_nonces)
+        )
+        return [
+            cast(ContractApiMessage, responses[request_nonce])
+            for request_nonce in request_nonces
+        ]
+
     @staticmethod
     def __parse_rpc_error(error: str) -> RPCResponseStatus:
         """Parse an RPC error and return an `RPCResponseStatus`"""
@@ -1873,7 +2108,7 @@ class BaseBehaviour(
         Start tendermint reset.
 
         This is a local method that does not depend on the global clock,
-        so the usage of datetime.now() is acceptable here.
+        so the usage of the local time is acceptable here.
 
         :param on_startup: Whether we are resetting on the start of the agent.
         :yield: None
@@ -1883,7 +2118,7 @@ class BaseBehaviour(
                 # if we are on startup we don't need to wait for the reset pause duration
                 # as the reset is being performed to update the tm config.
                 yield from self.wait_from_last_timestamp(self.hard_reset_sleep)
-            self._check_started = datetime.datetime.now()
+            self._check_started = local_now()
             self._timeout = self.params.max_healthcheck
             self._is_healthy = False
         yield
@@ -1894,7 +2129,7 @@ class BaseBehaviour(
         """End tendermint reset.
 
         This is a local method that does not depend on the global clock,
-        so the usage of datetime.now() is acceptable here.
+        so the usage of the local time is acceptable here.
         """
         self._check_started = None
         self._timeout = -1.0
@@ -1904,15 +2139,13 @@ class BaseBehaviour(
         """Check if the timeout expired.
 
         This is a local method that does not depend on the global clock,
-        so the usage of datetime.now() is acceptable here.
+        so the usage of the local time is acceptable here.
 
         :return: bool
         """
         if self._check_started is None or self._is_healthy:
             return False
-        return datetime.datetime.now() > self._check_started + datetime.timedelta(
-            0, self._timeout
-        )
+        return local_now() > self._check_started + datetime.timedelta(0, self._timeout)
 
     def _get_reset_params(self, default: bool) -> Optional[Dict[str, str]]:
         """Get the parameters for a hard reset request to Tendermint."""
@@ -2083,6 +2316,7 @@ class BaseBehaviour(
             if ipfs_message.performative != IpfsMessage.Performative.IPFS_HASH:
                 self.context.logger.error(
                     f"Expected performative {IpfsMessage.Performative.IPFS_HASH} but got {ipfs_message.performative}."
+                    + self._ipfs_error_reason(ipfs_message)
                 )
                 return None
             ipfs_hash = ipfs_message.ipfs_hash
@@ -2118,6 +2352,7 @@ class BaseBehaviour(
             if ipfs_message.performative != IpfsMessage.Performative.FILES:
                 self.context.logger.error(
                     f"Expected performative {IpfsMessage.Performative.FILES} but got {ipfs_message.performative}."
+                    + self._ipfs_error_reason(ipfs_message)
                 )
                 return None
             serialized_objects = ipfs_message.files
@@ -2134,6 +2369,13 @@ class BaseBehaviour(
             )
             return None
 
+    @staticmethod
+    def _ipfs_error_reason(ipfs_message: IpfsMessage) -> str:
+        """Get the reason of an IPFS error response, to be appended to a log."""
+        if ipfs_message.performative != IpfsMessage.Performative.ERROR:
+            return ""
+        return f" Reason: {ipfs_message.reason}"
+
     def _do_ipfs_request(
         self,
         dialogue: IpfsDialogue,
@@ -2146,9 +2388,22 @@ class BaseBehaviour(
         cast(Requests, self.context.requests).request_id_to_callback[
             request_nonce
         ] = self.get_callback_request()
-        # notify caller by propagating potential timeout exception.
-        response = yield from self.wait_for_message(timeout=timeout)
-        ipfs_message = cast(IpfsMessage, response)
+        start = perf_counter()
+        response_label = "timeout"
+        metrics = get_metrics(self.context)
+        metrics.ipfs_requests_in_flight.inc()
+        try:
+            # notify caller by propagating potential timeout exception.
+            response = yield from self.wait_for_message(timeout=timeout)
+            ipfs_message = cast(IpfsMessage, response)
+            response_label = ipfs_message.performative.value
+        finally:
+            metrics.ipfs_requests_in_flight.inc(-1)
+            metrics.ipfs_request_duration.observe(
+                perf_counter() - start,
+                request=message.performative.value,
+                response=response_label,
+            )
         return ipfs_message
 
 
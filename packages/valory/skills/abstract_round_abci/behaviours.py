@@ -366,6 +366,7 @@ class AbstractRoundBehaviour(  # pylint: disable=too-many-instance-attributes
         tm_manager.informed = False
         tm_manager.acn_communication_attempted = False
         self._process_current_round()
+        self.context.state.report_memory_usage()
         if self.current_behaviour is None:
             return
 
@@ -19,13 +19,17 @@
 
 """This module contains the classes required for dialogue management."""
 
-from typing import Any, Optional, Type
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Type
 
 from aea.exceptions import enforce
 from aea.helpers.transaction.base import Terms
 from aea.protocols.base import Address, Message
 from aea.protocols.dialogue.base import Dialogue as BaseDialogue
 from aea.protocols.dialogue.base import DialogueLabel as BaseDialogueLabel
+from aea.protocols.dialogue.base import Dialogues as BaseDialogues
+from aea.protocols.dialogue.base import PersistDialoguesStorageWithOffloading
 from aea.skills.base import Model
 
 from packages.open_aea.protocols.signing.dialogues import (
@@ -60,6 +64,147 @@ from packages.valory.protocols.tendermint.dialogues import (
 from packages.valory.protocols.tendermint.dialogues import (
     TendermintDialogues as BaseTendermintDialogues,
 )
+from packages.valory.skills.abstract_round_abci.metrics import (
+    AbciMetrics,
+    get_metrics,
+)
+from packages.valory.skills.abstract_round_abci.models import TypeCheckMixin
+
+DEFAULT_MAX_TERMINAL_DIALOGUES = 1000
+STORAGE_ARGS = {
+    "max_terminal_dialogues": Optional[int],
+    "terminal_dialogues_max_age": Optional[float],
+}
+
+
+class BoundedDialoguesStorage(PersistDialoguesStorageWithOffloading):
+    """
+    A dialogues storage which bounds the dialogues kept in memory in terminal state.
+
+    The oldest dialogues in terminal state are evicted when there are more than `max_terminal_dialogues`
+    of them, or when they have been in terminal state for longer than `terminal_dialogues_max_age` seconds.
+    The eviction runs whenever a dialogue reaches its terminal state, so it costs O(1) amortized per dialogue.
+    """
+
+    def __init__(
+        self,
+        dialogues: BaseDialogues,
+        max_terminal_dialogues: Optional[int] = DEFAULT_MAX_TERMINAL_DIALOGUES,
+        terminal_dialogues_max_age: Optional[float] = None,
+        persist: bool = True,
+    ) -> None:
+        """
+        Initialize the storage.
+
+        :param dialogues: the dialogues the storage is constructed for.
+        :param max_terminal_dialogues: the maximum number of dialogues to keep in terminal state, `None` for no limit.
+        :param terminal_dialogues_max_age: the maximum seconds to keep a dialogue in terminal state, `None` for no limit.
+        :param persist: whether to load and dump the dialogues from and to the agent's storage, if any.
+        """
+        super().__init__(dialogues)
+        enforce(
+            max_terminal_dialogues is None or max_terminal_dialogues >= 0,
+            f"`max_terminal_dialogues` must be non-negative, got {max_terminal_dialogues}.",
+        )
+        enforce(
+            terminal_dialogues_max_age is None or terminal_dialogues_max_age >= 0,
+            f"`terminal_dialogues_max_age` must be non-negative, got {terminal_dialogues_max_age}.",
+        )
+        if not persist:
+            # without a skill component, the dialogues are never looked up in, loaded from or dumped to a storage
+            self._skill_component = None
+        self._max_terminal_dialogues = max_terminal_dialogues
+        self._terminal_dialogues_max_age = terminal_dialogues_max_age
+        self._terminated_at: "OrderedDict[BaseDialogueLabel, float]" = OrderedDict()
+        self._evicted = 0
+        self._metrics_name = str(getattr(dialogues, "name", type(dialogues).__name__))
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Get the number of the active and the terminal state dialogues in memory, and of the evicted ones."""
+        terminal = len(self._terminal_state_dialogues_labels)
+        return {
+            "active": len(self._dialogues_by_dialogue_label) - terminal,
+            "terminal": terminal,
+            "evicted": self._evicted,
+        }
+
+    def cleanup(self) -> None:
+        """Clean up the storage."""
+        super().cleanup()
+        self._terminated_at.clear()
+        self._update_metrics()
+
+    def add(self, dialogue: BaseDialogue) -> None:
+        """Add a dialogue to the storage."""
+        super().add(dialogue)
+        self._update_metrics()
+
+    def remove(self, dialogue_label: BaseDialogueLabel) -> None:
+        """Remove a dialogue from the storage."""
+        super().remove(dialogue_label)
+        self._terminated_at.pop(dialogue_label, None)
+        self._update_metrics()
+
+    def dialogue_terminal_state_callback(self, dialogue: BaseDialogue) -> None:
+        """Keep track of the dialogues kept in terminal state, and evict the stale ones."""
+        super().dialogue_terminal_state_callback(dialogue)
+        label = dialogue.dialogue_label
+        if label in self._terminal_state_dialogues_labels:
+            self._terminated_at[label] = time.monotonic()
+            self.evict()
+            self._update_metrics()
+
+    def _add_terminal_state_dialogue(self, dialogue: BaseDialogue) -> None:
+        """Keep track of a dialogue in terminal state which is loaded back to memory, e.g., from the offloaded ones."""
+        super()._add_terminal_state_dialogue(dialogue)
+        self._terminated_at[dialogue.dialogue_label] = time.monotonic()
+        self.evict()
+        self._update_metrics()
+
+    def evict(self) -> None:
+        """Evict the oldest dialogues in terminal state which exceed the configured count or age."""
+        max_count = self._max_terminal_dialogues
+        max_age = self._terminal_dialogues_max_age
+        now = time.monotonic()
+        while self._terminated_at:
+            label, terminated_at = next(iter(self._terminated_at.items()))
+            too_many = max_count is not None and len(self._terminated_at) > max_count
+            too_old = max_age is not None and now - terminated_at > max_age
+            if not too_many and not too_old:
+                return
+            del self._terminated_at[label]
+            if label in self._terminal_state_dialogues_labels:
+                self.remove(label)
+                self._evicted += 1
+                self._metrics.dialogues_evicted.inc(dialogues=self._metrics_name)
+
+    @property
+    def _metrics(self) -> AbciMetrics:
+        """Get the metrics of the agent the dialogues belong to."""
+        return get_metrics(getattr(self._dialogues, "context", None))
+
+    def _update_metrics(self) -> None:
+        """Export the dialogue counts."""
+        metrics = self._metrics
+        if not metrics.registry.enabled:
+            return
+        counts = self.counts
+        for state in ("active", "terminal"):
+            metrics.dialogues.set(
+                counts[state], dialogues=self._metrics_name, state=state
+            )
+
+
+def _ensure_storage_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Get and ensure the configuration of the dialogues storage from the keyword arguments of a dialogues model."""
+    return {
+        key: TypeCheckMixin._ensure(  # pylint: disable=protected-access
+            key, kwargs, type_
+        )
+        for key, type_ in STORAGE_ARGS.items()
+    }
+
 
 AbciDialogue = BaseAbciDialogue
 
@@ -91,6 +236,10 @@ class AbciDialogues(Model, BaseAbciDialogues):
             self_address=str(self.skill_id),
             role_from_first_message=role_from_first_message,
         )
+        # the ABCI requests are atomic request-response cycles; there is no history worth keeping
+        self._dialogues_storage = BoundedDialoguesStorage(
+            self, max_terminal_dialogues=0, persist=False
+        )
 
 
 HttpDialogue = BaseHttpDialogue
@@ -105,6 +254,7 @@ class HttpDialogues(Model, BaseHttpDialogues):
 
         :param kwargs: keyword arguments
         """
+        storage_kwargs = _ensure_storage_kwargs(kwargs)
         Model.__init__(self, **kwargs)
 
         def role_from_first_message(  # pylint: disable=unused-argument
@@ -123,6 +273,7 @@ class HttpDialogues(Model, BaseHttpDialogues):
             self_address=str(self.skill_id),
             role_from_first_message=role_from_first_message,
         )
+        self._dialogues_storage = BoundedDialoguesStorage(self, **storage_kwargs)
 
 
 SigningDialogue = BaseSigningDialogue
@@ -137,6 +288,7 @@ class SigningDialogues(Model, BaseSigningDialogues):
 
         :param kwargs: keyword arguments
         """
+        storage_kwargs = _ensure_storage_kwargs(kwargs)
         Model.__init__(self, **kwargs)
 
         def role_from_first_message(  # pylint: disable=unused-argument
@@ -155,6 +307,7 @@ class SigningDialogues(Model, BaseSigningDialogues):
             self_address=str(self.skill_id),
             role_from_first_message=role_from_first_message,
         )
+        self._dialogues_storage = BoundedDialoguesStorage(self, **storage_kwargs)
 
 
 class LedgerApiDialogue(  # pylint: disable=too-few-public-methods
@@ -211,6 +364,7 @@ class LedgerApiDialogues(Model, BaseLedgerApiDialogues):
 
         :param kwargs: keyword arguments
         """
+        storage_kwargs = _ensure_storage_kwargs(kwargs)
         Model.__init__(self, **kwargs)
 
         def role_from_first_message(  # pylint: disable=unused-argument
@@ -230,6 +384,7 @@ class LedgerApiDialogues(Model, BaseLedgerApiDialogues):
             role_from_first_message=role_from_first_message,
             dialogue_class=LedgerApiDialogue,
         )
+        self._dialogues_storage = BoundedDialoguesStorage(self, **storage_kwargs)
 
 
 class ContractApiDialogue(  # pylint: disable=too-few-public-methods
@@ -282,6 +437,7 @@ class ContractApiDialogues(Model, BaseContractApiDialogues):
 
     def __init__(self, **kwargs: Any) -> None:
         """Initialize dialogues."""
+        storage_kwargs = _ensure_storage_kwargs(kwargs)
         Model.__init__(self, **kwargs)
 
         def role_from_first_message(  # pylint: disable=unused-argument
@@ -301,6 +457,7 @@ class ContractApiDialogues(Model, BaseContractApiDialogues):
             role_from_first_message=role_from_first_message,
             dialogue_class=ContractApiDialogue,
         )
+        self._dialogues_storage = BoundedDialoguesStorage(self, **storage_kwargs)
 
 
 TendermintDialogue = BaseTendermintDialogue
@@ -315,6 +472,7 @@ class TendermintDialogues(Model, BaseTendermintDialogues):
 
         :param kwargs: keyword arguments
         """
+        storage_kwargs = _ensure_storage_kwargs(kwargs)
         Model.__init__(self, **kwargs)
 
         def role_from_first_message(  # pylint: disable=unused-argument
@@ -333,6 +491,7 @@ class TendermintDialogues(Model, BaseTendermintDialogues):
             self_address=self.context.agent_address,
             role_from_first_message=role_from_first_message,
         )
+        self._dialogues_storage = BoundedDialoguesStorage(self, **storage_kwargs)
 
 
 IpfsDialogue = BaseIpfsDialogue
@@ -347,6 +506,7 @@ class IpfsDialogues(Model, BaseIpfsDialogues):
 
         :param kwargs: keyword arguments
         """
+        storage_kwargs = _ensure_storage_kwargs(kwargs)
         Model.__init__(self, **kwargs)
 
         def role_from_first_message(  # pylint: disable=unused-argument
@@ -365,3 +525,4 @@ class IpfsDialogues(Model, BaseIpfsDialogues):
             self_address=str(self.skill_id),
             role_from_first_message=role_from_first_message,
         )
+        self._dialogues_storage = BoundedDialoguesStorage(self, **storage_kwargs)
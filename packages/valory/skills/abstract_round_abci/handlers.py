@@ -61,6 +61,7 @@ from packages.valory.skills.abstract_round_abci.base import (
 )
 from packages.valory.skills.abstract_round_abci.behaviours import AbstractRoundBehaviour
 from packages.valory.skills.abstract_round_abci.dialogues import AbciDialogue
+from packages.valory.skills.abstract_round_abci.metrics import instrument_abci_request
 from packages.valory.skills.abstract_round_abci.models import (
     Requests,
     SharedState,
@@ -78,6 +79,7 @@ class ABCIRoundHandler(ABCIHandler):
 
     SUPPORTED_PROTOCOL = AbciMessage.protocol_id
 
+    @instrument_abci_request("info")
     def info(self, message: AbciMessage, dialogue: AbciDialogue) -> AbciMessage:
         """
         Handle the 'info' request.
@@ -114,6 +116,7 @@ class ABCIRoundHandler(ABCIHandler):
         )
         return cast(AbciMessage, reply)
 
+    @instrument_abci_request("init_chain")
     def init_chain(self, message: AbciMessage, dialogue: AbciDialogue) -> AbciMessage:
         """
         Handle a message of REQUEST_INIT_CHAIN performative.
@@ -146,6 +149,7 @@ class ABCIRoundHandler(ABCIHandler):
         )
         return cast(AbciMessage, reply)
 
+    @instrument_abci_request("begin_block")
     def begin_block(self, message: AbciMessage, dialogue: AbciDialogue) -> AbciMessage:
         """Handle the 'begin_block' request."""
         cast(SharedState, self.context.state).round_sequence.begin_block(
@@ -153,6 +157,7 @@ class ABCIRoundHandler(ABCIHandler):
         )
         return super().begin_block(message, dialogue)
 
+    @instrument_abci_request("check_tx", count_transactions=True)
     def check_tx(self, message: AbciMessage, dialogue: AbciDialogue) -> AbciMessage:
         """Handle the 'check_tx' request."""
         transaction_bytes = message.tx
@@ -222,6 +227,7 @@ class ABCIRoundHandler(ABCIHandler):
         )
         round_sequence.add_pending_offence(pending_offense)
 
+    @instrument_abci_request("deliver_tx", count_transactions=True)
     def deliver_tx(self, message: AbciMessage, dialogue: AbciDialogue) -> AbciMessage:
         """Handle the 'deliver_tx' request."""
         transaction_bytes = message.tx
@@ -268,12 +274,14 @@ class ABCIRoundHandler(ABCIHandler):
         )
         return cast(AbciMessage, reply)
 
+    @instrument_abci_request("end_block")
     def end_block(self, message: AbciMessage, dialogue: AbciDialogue) -> AbciMessage:
         """Handle the 'end_block' request."""
         self.context.state.round_sequence.tm_height = message.height
         cast(SharedState, self.context.state).round_sequence.end_block()
         return super().end_block(message, dialogue)
 
+    @instrument_abci_request("commit")
     def commit(self, message: AbciMessage, dialogue: AbciDialogue) -> AbciMessage:
         """
         Handle the 'commit' request.
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""This module contains the compression operations of the behaviours."""
+
+import base64
+import gzip
+import io
+from enum import Enum
+from typing import Any
+
+# the data are written by other agents, so their decompressed size is bounded
+MAX_DECOMPRESSED_BYTES = 100 * 1024 * 1024
+
+
+class Compression(Enum):
+    """Enum for the supported compression algorithms."""
+
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+def _zstandard() -> Any:
+    """Import the optional `zstandard` module."""
+    try:
+        import zstandard  # pylint: disable=import-outside-toplevel
+
+        return zstandard
+    except ImportError as e:
+        raise ImportError(
+            "The zstd compression requires the `zstandard` package. "
+            "Run `pip install zstandard` to install it."
+        ) from e
+
+
+def compress(data: bytes, compression: Compression) -> str:
+    """
+    Compress data, armoured with base64 so that it can be carried as text by the IPFS protocol.
+
+    The compression is deterministic, so that all the agents obtain the same IPFS hash
+    when they store the same data.
+
+    :param data: the data to compress.
+    :param compression: the compression algorithm.
+    :return: the base64-encoded compressed data.
+    """
+    if compression == Compression.GZIP:
+        compressed = gzip.compress(data, mtime=0)
+    else:
+        compressed = _zstandard().ZstdCompressor().compress(data)
+    return base64.b64encode(compressed).decode("ascii")
+
+
+def decompress(
+    armoured: str,
+    compression: Compression,
+    max_size: int = MAX_DECOMPRESSED_BYTES,
+) -> bytes:
+    """
+    Decompress data armoured with base64.
+
+    :param armoured: the base64-encoded compressed data.
+    :param compression: the compression algorithm.
+    :param max_size: the maximum size of the decompressed data.
+    :return: the decompressed data.
+    """
+    compressed = io.BytesIO(base64.b64decode(armoured, validate=True))
+    if compression == Compression.GZIP:
+        reader = gzip.GzipFile(fileobj=compressed, mode="rb")
+    else:
+        reader = _zstandard().ZstdDecompressor().stream_reader(compressed)
+    with reader:
+        data = reader.read(max_size + 1)
+    if len(data) > max_size:
+        raise IOError(f"The data decompress to more than {max_size} bytes.")
+    return data
@@ -19,10 +19,15 @@
 
 """This module contains all the loading operations of the behaviours."""
 
+import io
 import json
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Dict, Optional
 
+from packages.valory.skills.abstract_round_abci.io_.compression import (
+    Compression,
+    decompress,
+)
 from packages.valory.skills.abstract_round_abci.io_.store import (
     CustomObjectType,
     NativelySupportedSingleObjectType,
@@ -73,6 +78,10 @@ class AbstractLoader(ABC):
 class JSONLoader(AbstractLoader):
     """A JSON file loader."""
 
+    def _loads(self, serialized_object: str) -> NativelySupportedSingleObjectType:
+        """Deserialize a JSON string."""
+        return json.loads(serialized_object)
+
     def load_single_object(
         self, serialized_object: str
     ) -> NativelySupportedSingleObjectType:
@@ -82,7 +91,7 @@ class JSONLoader(AbstractLoader):
         :return: the deserialized json file's content.
         """
         try:
-            deserialized_file = json.loads(serialized_object)
+            deserialized_file = self._loads(serialized_object)
             return deserialized_file
         except json.JSONDecodeError as e:  # pragma: no cover
             raise IOError(
@@ -94,6 +103,28 @@ class JSONLoader(AbstractLoader):
             ) from e
 
 
+class JSONLinesLoader(JSONLoader):
+    """A JSON lines file loader, which deserializes each line to an item of a list."""
+
+    def _loads(self, serialized_object: str) -> NativelySupportedSingleObjectType:
+        """Deserialize a JSON lines string, line by line."""
+        return [
+            json.loads(line) for line in io.StringIO(serialized_object) if line.strip()
+        ]
+
+
+class CompressedJSONLoader(JSONLoader):
+    """A compressed JSON file loader."""
+
+    def __init__(self, compression: Compression):
+        """Initialize a compressed JSON loader."""
+        self._compression = compression
+
+    def _loads(self, serialized_object: str) -> NativelySupportedSingleObjectType:
+        """Deserialize a compressed JSON string, armoured with base64."""
+        return json.loads(decompress(serialized_object, self._compression))
+
+
 class Loader(AbstractLoader):
     """Class which loads objects."""
 
@@ -103,6 +134,14 @@ class Loader(AbstractLoader):
         self._custom_loader = custom_loader
         self.__filetype_to_loader: Dict[SupportedFiletype, SupportedLoaderType] = {
             SupportedFiletype.JSON: JSONLoader().load_single_object,
+            SupportedFiletype.JSON_COMPACT: JSONLoader().load_single_object,
+            SupportedFiletype.JSONL: JSONLinesLoader().load_single_object,
+            SupportedFiletype.JSON_GZIP: CompressedJSONLoader(
+                Compression.GZIP
+            ).load_single_object,
+            SupportedFiletype.JSON_ZSTD: CompressedJSONLoader(
+                Compression.ZSTD
+            ).load_single_object,
         }
 
     def load_single_object(self, serialized_object: str) -> SupportedSingleObjectType:
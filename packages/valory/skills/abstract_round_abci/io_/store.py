@@ -25,6 +25,10 @@ from abc import ABC, abstractmethod
 from enum import Enum, auto
 from typing import Any, Callable, Dict, Optional, TypeVar, Union, cast
 
+from packages.valory.skills.abstract_round_abci.io_.compression import (
+    Compression,
+    compress,
+)
 from packages.valory.skills.abstract_round_abci.io_.paths import create_pathdirs
 
 StoredJSONType = Union[dict, list]
@@ -49,6 +53,10 @@ class SupportedFiletype(Enum):
     """Enum for the supported filetypes of the IPFS interacting methods."""
 
     JSON = auto()
+    JSON_COMPACT = auto()
+    JSONL = auto()
+    JSON_GZIP = auto()
+    JSON_ZSTD = auto()
 
 
 class AbstractStorer(ABC):
@@ -90,6 +98,10 @@ class AbstractStorer(ABC):
 class JSONStorer(AbstractStorer):
     """A JSON file storer."""
 
+    def _dumps(self, obj: StoredJSONType) -> str:
+        """Serialize an object to a JSON string."""
+        return json.dumps(obj, ensure_ascii=False, indent=4)
+
     def serialize_object(
         self, filename: str, obj: NativelySupportedSingleObjectType, **kwargs: Any
     ) -> Dict[str, str]:
@@ -102,16 +114,54 @@ class JSONStorer(AbstractStorer):
         """
         if not any(isinstance(obj, type_) for type_ in (dict, list)):
             raise ValueError(  # pragma: no cover
-                f"`JSONStorer` cannot be used with a {type(obj)}! Only with a {StoredJSONType}"
+                f"`{type(self).__name__}` cannot be used with a {type(obj)}! Only with a {StoredJSONType}"
             )
         try:
-            serialized_object = json.dumps(obj, ensure_ascii=False, indent=4)
+            serialized_object = self._dumps(obj)
             name_to_obj = {filename: serialized_object}
             return name_to_obj
         except (TypeError, OSError) as e:  # pragma: no cover
             raise IOError(str(e)) from e
 
 
+class CompactJSONStorer(JSONStorer):
+    """A JSON file storer, without any whitespace and with sorted keys, so that equal objects serialize identically."""
+
+    def _dumps(self, obj: StoredJSONType) -> str:
+        """Serialize an object to a compact, canonical JSON string."""
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+        )
+
+
+class JSONLinesStorer(JSONStorer):
+    """A JSON lines file storer, which serializes each item of a list in its own line."""
+
+    def _dumps(self, obj: StoredJSONType) -> str:
+        """Serialize a list to a JSON lines string."""
+        if not isinstance(obj, list):
+            raise TypeError(
+                f"`{type(self).__name__}` can only be used with a list, not with a {type(obj)}!"
+            )
+        return "".join(
+            json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for item in obj
+        )
+
+
+class CompressedJSONStorer(CompactJSONStorer):
+    """A compressed JSON file storer."""
+
+    def __init__(self, path: str, compression: Compression):
+        """Initialize a compressed JSON storer."""
+        super().__init__(path)
+        self._compression = compression
+
+    def _dumps(self, obj: StoredJSONType) -> str:
+        """Serialize an object to a compressed JSON string, armoured with base64."""
+        return compress(super()._dumps(obj).encode("utf-8"), self._compression)
+
+
 class Storer(AbstractStorer):
     """Class which serializes objects."""
 
@@ -126,9 +176,20 @@ class Storer(AbstractStorer):
         self._filetype = filetype
         self._custom_storer = custom_storer
         self._filetype_to_storer: Dict[Enum, SupportedStorerType] = {
-            SupportedFiletype.JSON: cast(
-                NativelySupportedJSONStorerType, JSONStorer(path).serialize_object
-            ),
+            filetype: cast(NativelySupportedJSONStorerType, storer.serialize_object)
+            for filetype, storer in (
+                (SupportedFiletype.JSON, JSONStorer(path)),
+                (SupportedFiletype.JSON_COMPACT, CompactJSONStorer(path)),
+                (SupportedFiletype.JSONL, JSONLinesStorer(path)),
+                (
+                    SupportedFiletype.JSON_GZIP,
+                    CompressedJSONStorer(path, Compression.GZIP),
+                ),
+                (
+                    SupportedFiletype.JSON_ZSTD,
+                    CompressedJSONStorer(path, Compression.ZSTD),
+                ),
+            )
         }
 
     def serialize_object(
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""This module contains the memory accounting of the 'abstract_round_abci' skill."""
+
+import logging
+import sys
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+
+from aea.skills.base import SkillContext
+
+from packages.valory.skills.abstract_round_abci.metrics import (
+    AbciMetrics,
+    DISABLED_METRICS,
+)
+
+MAX_SIZED_OBJECTS = 1_000_000
+TRACEMALLOC_TOP_STATS = 10
+# objects which are not owned by the structures referencing them
+EXCLUDED_TYPES: Tuple[Type, ...] = (
+    type,
+    ModuleType,
+    FunctionType,
+    BuiltinFunctionType,
+    MethodType,
+    logging.Logger,
+    logging.LoggerAdapter,
+    SkillContext,
+)
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, bool, complex, type(None))
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    """The memory usage of a structure."""
+
+    entries: int
+    size: int
+
+
+def deep_sizeof(
+    obj: Any,
+    seen: Optional[Set[int]] = None,
+    max_objects: int = MAX_SIZED_OBJECTS,
+) -> int:
+    """
+    Approximate the deep size of an object, in bytes.
+
+    The containers, the instance dictionaries and the slots are traversed. The objects
+    in `seen` are skipped, so that sharing it across several calls counts every object
+    once, in the first structure it is reached from. The traversal stops after
+    `max_objects` objects, in which case the size is a lower bound.
+
+    :param obj: the object to size.
+    :param seen: the ids of the objects which have already been sized.
+    :param max_objects: the maximum number of objects to traverse.
+    :return: the approximate deep size of the object.
+    """
+    seen = set() if seen is None else seen
+    stack = [obj]
+    size = 0
+    n_objects = 0
+    while stack and n_objects < max_objects:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, EXCLUDED_TYPES):
+            continue
+        seen.add(id(current))
+        n_objects += 1
+        size += sys.getsizeof(current)
+
+        if isinstance(current, _ATOMIC_TYPES):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            stack.extend(current)
+        if hasattr(current, "__dict__"):
+            stack.append(vars(current))
+        for cls in type(current).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    return size
+
+
+def usage_of(entries: int, obj: Any, seen: Optional[Set[int]] = None) -> MemoryUsage:
+    """Get the memory usage of a structure with the given number of entries."""
+    return MemoryUsage(entries, deep_sizeof(obj, seen))
+
+
+class MemoryMonitor:
+    """
+    Periodically report the memory usage of the agent's structures.
+
+    The usage is logged and exported via the metrics registry every `report_period`
+    periods. If `tracemalloc_frames` is positive, the allocations are traced as well,
+    and the top allocation differences since the previous report are logged.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        report_period: Optional[int] = None,
+        tracemalloc_frames: int = 0,
+        top_stats: int = TRACEMALLOC_TOP_STATS,
+        metrics: AbciMetrics = DISABLED_METRICS,
+    ) -> None:
+        """Initialize the monitor."""
+        self.logger = logger
+        self.metrics = metrics
+        self.report_period = report_period
+        self.tracemalloc_frames = tracemalloc_frames
+        self.top_stats = top_stats
+        self._last_period: Optional[int] = None
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._started_tracing = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the reports are enabled."""
+        return self.report_period is not None and self.report_period > 0
+
+    def start(self) -> None:
+        """Start tracing the allocations, if configured."""
+        if not self.enabled or self.tracemalloc_frames <= 0:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.tracemalloc_frames)
+            self._started_tracing = True
+        self._snapshot = tracemalloc.take_snapshot()
+
+    def stop(self) -> None:
+        """Stop tracing the allocations, if they were traced by the monitor."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._snapshot = None
+
+    def maybe_report(
+        self, period: int, get_usage: Callable[[], Dict[str, MemoryUsage]]
+    ) -> bool:
+        """
+        Report the memory usage if a reporting period has passed.
+
+        :param period: the current period.
+        :param get_usage: a callable returning the memory usage of the structures.
+        :return: whether the memory usage was reported.
+        """
+        if not self.enabled or period == self._last_period:
+            return False
+        if self._last_period is not None and period % self.report_period != 0:  # type: ignore
+            return False
+        self._last_period = period
+        self.report(period, get_usage())
+        return True
+
+    def report(self, period: int, usage: Dict[str, MemoryUsage]) -> None:
+        """Log and export the memory usage of the structures."""
+        for structure, structure_usage in usage.items():
+            self.metrics.memory_entries.set(
+                structure_usage.entries, structure=structure
+            )
+            self.metrics.memory_size.set(structure_usage.size, structure=structure)
+
+        lines = [
+            f"{structure}: {structure_usage.entries} entries, {structure_usage.size} bytes"
+            for structure, structure_usage in sorted(
+                usage.items(), key=lambda item: item[1].size, reverse=True
+            )
+        ]
+        self.logger.info("Memory usage at period %s:\n%s", period, "\n".join(lines))
+
+        diff = self.tracemalloc_diff()
+        if len(diff) > 0:
+            self.logger.info(
+                "Top allocation differences since the previous report:\n%s",
+                "\n".join(diff),
+            )
+
+    def tracemalloc_diff(self) -> List[str]:
+        """Take an allocations snapshot, and get the top differences with the previous one."""
+        if self._snapshot is None or not tracemalloc.is_tracing():
+            return []
+        snapshot = tracemalloc.take_snapshot()
+        stats = snapshot.compare_to(self._snapshot, "lineno")
+        self._snapshot = snapshot
+        return [str(stat) for stat in stats[: self.top_stats]]
@@ -0,0 +1,528 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""This module contains the metrics registry for the 'abstract_round_abci' skill."""
+
+import bisect
+import threading
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, cast
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+METRICS_PATH = "/metrics"
+DEFAULT_METRICS_HOST = "127.0.0.1"
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+ROUND_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+FuncType = TypeVar("FuncType", bound=Callable[..., Any])
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format label names and values in the exposition format."""
+    if len(names) == 0:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _Metric:
+    """Base class for the metrics of a registry."""
+
+    type_: str = ""
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+    ) -> None:
+        """Initialize the metric."""
+        self._registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, Any]) -> LabelValues:
+        """Get the label values in the order of the label names."""
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def samples(self) -> List[str]:
+        """Get the sample lines of the metric."""
+        raise NotImplementedError  # pragma: nocover
+
+    def reset(self) -> None:
+        """Reset the metric."""
+        raise NotImplementedError  # pragma: nocover
+
+    def render(self) -> str:
+        """Render the metric in the exposition format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_}",
+            *self.samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """A monotonically increasing counter."""
+
+    type_ = "counter"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the counter."""
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increment the counter."""
+        if not self._registry.enabled:
+            return
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: Any) -> float:
+        """Get the value of the counter."""
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        """Get the sample lines of the counter."""
+        with self._lock:
+            values = list(self._values.items())
+        return [
+            f"{self.name}_total{_format_labels(self.labels, key)} {value}"
+            for key, value in values
+        ]
+
+    def reset(self) -> None:
+        """Reset the counter."""
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(_Metric):
+    """A value that can go up and down."""
+
+    type_ = "gauge"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the gauge."""
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the value of the gauge."""
+        if not self._registry.enabled:
+            return
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increment the value of the gauge, use a negative amount to decrement it."""
+        if not self._registry.enabled:
+            return
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: Any) -> Optional[float]:
+        """Get the value of the gauge."""
+        return self._values.get(self._label_values(labels))
+
+    def samples(self) -> List[str]:
+        """Get the sample lines of the gauge."""
+        with self._lock:
+            values = list(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labels, key)} {value}"
+            for key, value in values
+        ]
+
+    def reset(self) -> None:
+        """Reset the gauge."""
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    """A histogram of observed values with cumulative buckets."""
+
+    type_ = "histogram"
+
+    def __init__(
+        self, *args: Any, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs: Any
+    ) -> None:
+        """Initialize the histogram."""
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> (bucket counts, sum, count)
+        self._values: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Observe a value."""
+        if not self._registry.enabled:
+            return
+        key = self._label_values(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, sum_, count = self._values.get(
+                key, ([0] * len(self.buckets), 0.0, 0)
+            )
+            if index < len(counts):
+                counts[index] += 1
+            self._values[key] = (counts, sum_ + value, count + 1)
+
+    def get(self, **labels: Any) -> Tuple[float, int]:
+        """Get the sum and the count of the observed values."""
+        _, sum_, count = self._values.get(self._label_values(labels), ([], 0.0, 0))
+        return sum_, count
+
+    def samples(self) -> List[str]:
+        """Get the sample lines of the histogram."""
+        with self._lock:
+            values = [
+                (key, list(counts), sum_, count)
+                for key, (counts, sum_, count) in self._values.items()
+            ]
+
+        names = (*self.labels, "le")
+        lines = []
+        for key, counts, sum_, count in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(names, (*key, str(bound)))} {cumulative}"
+                )
+            lines.append(
+                f"{self.name}_bucket{_format_labels(names, (*key, '+Inf'))} {count}"
+            )
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {sum_}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {count}")
+        return lines
+
+    def reset(self) -> None:
+        """Reset the histogram."""
+        with self._lock:
+            self._values.clear()
+
+    def time(self, **labels: Any) -> Callable[[FuncType], FuncType]:
+        """Get a decorator observing the duration of the decorated function."""
+
+        def decorator(func: FuncType) -> FuncType:
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self._registry.enabled:
+                    return func(*args, **kwargs)
+                start = perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.observe(perf_counter() - start, **labels)
+
+            return cast(FuncType, wrapper)
+
+        return decorator
+
+
+class MetricsRegistry:
+    """
+    A registry of metrics, rendered in the Prometheus text exposition format.
+
+    The registry is disabled by default, in which case observing a metric
+    returns right after checking the `enabled` flag.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self.enabled = False
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> Any:
+        """Register a metric."""
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric `{metric.name}` is already registered.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labels: Sequence[str] = ()
+    ) -> Counter:
+        """Create and register a counter."""
+        return self._register(Counter(self, name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        """Create and register a gauge."""
+        return self._register(Gauge(self, name, documentation, labels))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        return self._register(
+            Histogram(self, name, documentation, labels, buckets=buckets)
+        )
+
+    def render(self) -> str:
+        """Render all the metrics in the exposition format."""
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+    def reset(self) -> None:
+        """Reset the values of all the metrics."""
+        for metric in self._metrics.values():
+            metric.reset()
+
+
+class MetricsServer:
+    """A lightweight HTTP server exposing a metrics registry."""
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        port: int,
+        host: str = DEFAULT_METRICS_HOST,
+    ) -> None:
+        """Initialize the server."""
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _make_handler(self) -> type:
+        """Make the request handler class."""
+        registry = self.registry
+
+        class _Handler(BaseHTTPRequestHandler):
+            """Metrics request handler."""
+
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                """Handle a GET request."""
+                if self.path.split("?")[0] != METRICS_PATH:
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(  # pylint: disable=redefined-builtin
+                self, format: str, *args: Any
+            ) -> None:
+                """Do not log the requests."""
+
+        return _Handler
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the server is running."""
+        return self._server is not None
+
+    def start(self) -> None:
+        """Start serving the metrics and enable the registry."""
+        if self._server is not None:
+            return
+        self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+        self.registry.enabled = True
+
+    def stop(self) -> None:
+        """Stop serving the metrics and disable the registry."""
+        self.registry.enabled = False
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        self._thread = None
+
+
+class AbciMetrics:  # pylint: disable=too-many-instance-attributes
+    """
+    The metrics of an agent's ABCI app, on a registry of its own.
+
+    An instance is held by the shared state of each agent, so that the agents
+    running in the same process do not record to the same metrics.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.registry = MetricsRegistry()
+        self.abci_request_duration = self.registry.histogram(
+            "abci_request_duration_seconds",
+            "Time spent handling ABCI requests.",
+            labels=("request",),
+        )
+        self.abci_transactions = self.registry.counter(
+            "abci_transactions",
+            "Number of transactions checked or delivered, by result code.",
+            labels=("request", "code"),
+        )
+        self.block_duration = self.registry.histogram(
+            "abci_block_duration_seconds",
+            "Time from the 'begin_block' request to the end of the 'commit' request.",
+        )
+        self.block_height = self.registry.gauge(
+            "abci_block_height",
+            "Height of the last committed block.",
+        )
+        self.db_hash_duration = self.registry.histogram(
+            "abci_app_db_hash_duration_seconds",
+            "Time spent hashing the AbciAppDB.",
+        )
+        self.db_size = self.registry.gauge(
+            "abci_app_db_size_bytes",
+            "Size of the serialized AbciAppDB data.",
+        )
+        self.dialogues = self.registry.gauge(
+            "abci_dialogues",
+            "Number of dialogues kept in memory, by dialogues model and state.",
+            labels=("dialogues", "state"),
+        )
+        self.dialogues_evicted = self.registry.counter(
+            "abci_dialogues_evicted",
+            "Number of dialogues in terminal state evicted from memory.",
+            labels=("dialogues",),
+        )
+        self.ipfs_request_duration = self.registry.histogram(
+            "abci_ipfs_request_duration_seconds",
+            "Time from sending an IPFS request to receiving its response, by response.",
+            labels=("request", "response"),
+        )
+        self.ipfs_requests_in_flight = self.registry.gauge(
+            "abci_ipfs_requests_in_flight",
+            "Number of IPFS requests awaiting a response.",
+        )
+        self.memory_entries = self.registry.gauge(
+            "abci_memory_entries",
+            "Number of entries of the agent's structures, at the last memory report.",
+            labels=("structure",),
+        )
+        self.memory_size = self.registry.gauge(
+            "abci_memory_size_bytes",
+            "Approximate deep size of the agent's structures, at the last memory report.",
+            labels=("structure",),
+        )
+        self.round_duration = self.registry.histogram(
+            "abci_round_duration_seconds",
+            "Wall time spent in each round.",
+            labels=("round",),
+            buckets=ROUND_BUCKETS,
+        )
+        self.round_events = self.registry.counter(
+            "abci_round_events",
+            "Number of events ending each round.",
+            labels=("round", "event"),
+        )
+        self.timeouts = self.registry.counter(
+            "abci_timeouts",
+            "Number of timeout events fired.",
+            labels=("event",),
+        )
+        self.transaction_size = self.registry.histogram(
+            "abci_transaction_size_bytes",
+            "Size of the encoded transactions checked or delivered.",
+            labels=("request",),
+            buckets=SIZE_BUCKETS,
+        )
+
+
+# the metrics of the components without a shared state; they are never enabled
+DISABLED_METRICS = AbciMetrics()
+
+
+def get_metrics(context: Any) -> AbciMetrics:
+    """Get the metrics of the agent of a skill context, or the disabled metrics if there is no shared state."""
+    metrics = getattr(getattr(context, "state", None), "metrics", None)
+    return metrics if isinstance(metrics, AbciMetrics) else DISABLED_METRICS
+
+
+def instrument_abci_request(
+    request: str, count_transactions: bool = False
+) -> Callable[[FuncType], FuncType]:
+    """
+    Get a decorator instrumenting an ABCI request handler method.
+
+    :param request: the name of the ABCI request.
+    :param count_transactions: whether to count the transactions by the code of the response, and observe their size.
+    :return: the decorator.
+    """
+
+    def decorator(func: FuncType) -> FuncType:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            metrics = get_metrics(getattr(args[0], "context", None) if args else None)
+            if not metrics.registry.enabled:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                reply = func(*args, **kwargs)
+            finally:
+                metrics.abci_request_duration.observe(
+                    perf_counter() - start, request=request
+                )
+            if count_transactions:
+                metrics.abci_transactions.inc(request=request, code=reply.code)
+                metrics.transaction_size.observe(len(args[1].tx), request=request)
+            return reply
+
+        return cast(FuncType, wrapper)
+
+    return decorator
@@ -23,17 +23,20 @@ import inspect
 import json
 from abc import ABC, ABCMeta
 from collections import Counter
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from time import time
+from time import perf_counter_ns
 from typing import (
     Any,
     Callable,
     Dict,
+    Generator,
     List,
     Optional,
     OrderedDict,
+    Set,
     Tuple,
     Type,
     cast,
@@ -55,6 +58,16 @@ from packages.valory.skills.abstract_round_abci.base import (
     VALUE_NOT_PROVIDED,
     get_name,
 )
+from packages.valory.skills.abstract_round_abci.memory import (
+    MemoryMonitor,
+    MemoryUsage,
+    usage_of,
+)
+from packages.valory.skills.abstract_round_abci.metrics import (
+    AbciMetrics,
+    METRICS_PATH,
+    MetricsServer,
+)
 from packages.valory.skills.abstract_round_abci.utils import (
     check,
     check_type,
@@ -68,6 +81,7 @@ NUMBER_OF_RETRIES: int = 5
 DEFAULT_BACKOFF_FACTOR: float = 2.0
 DEFAULT_TYPE_NAME: str = "str"
 DEFAULT_CHAIN = "ethereum"
+LARGE_VALUES_CACHE_SIZE = 32
 
 
 class FrozenMixin:  # pylint: disable=too-few-public-methods
@@ -320,6 +334,22 @@ class BaseParams(
         self.setup_params: Dict[str, Any] = self._ensure("setup", kwargs, dict)
         # TODO add to all configs
         self.default_chain_id: str = kwargs.get("default_chain_id", DEFAULT_CHAIN)
+        # the port of the local metrics endpoint; metrics are disabled if not set
+        self.metrics_port: Optional[int] = self._ensure(
+            "metrics_port", kwargs, Optional[int]
+        )
+        # the memory usage is reported every `memory_report_period` periods; reports are disabled if not set
+        self.memory_report_period: Optional[int] = self._ensure(
+            "memory_report_period", kwargs, Optional[int]
+        )
+        # the number of frames of the traced allocations; allocations are not traced if not positive
+        self.memory_tracemalloc_frames: int = self._ensure(
+            "memory_tracemalloc_frames", kwargs, int
+        )
+        # the transactions larger than `tx_compression_threshold` bytes are compressed; compression is disabled if not set
+        self.tx_compression_threshold: Optional[int] = self._ensure(
+            "tx_compression_threshold", kwargs, Optional[int]
+        )
 
         # we sanitize for null values as these are just kept for schema definitions
         skill_id = kwargs["skill_context"].skill_id
@@ -433,10 +463,16 @@ class SharedState(Model, ABC, metaclass=_MetaSharedState):  # type: ignore
         """Initialize the state."""
         self.abci_app_cls._is_abstract = skill_context.is_abstract_component
         self._round_sequence: Optional[RoundSequence] = None
+        # the metrics of this agent, exported by the metrics server, if any
+        self.metrics = AbciMetrics()
+        self._metrics_server: Optional[MetricsServer] = None
+        self._memory_monitor: Optional[MemoryMonitor] = None
         # a mapping of the agents' addresses to their initial Tendermint configuration, to be retrieved via ACN
         self.initial_tm_configs: Dict[str, Optional[Dict[str, Any]]] = {}
         # a mapping of the other agents' addresses to ACN deliverables
         self.address_to_acn_deliverable: Dict[str, Any] = {}
+        # a LRU cache of the large payload fields' values, keyed by their IPFS references
+        self.large_values: OrderedDict[str, Any] = OrderedDict()
         self.tm_recovery_params: TendermintRecoveryParams = TendermintRecoveryParams(
             self.abci_app_cls.initial_round_cls.auto_round_id()
         )
@@ -512,6 +548,74 @@ class SharedState(Model, ABC, metaclass=_MetaSharedState):  # type: ignore
             self.initial_tm_configs = dict.fromkeys(
                 self.synchronized_data.all_participants
             )
+        self._start_metrics_server()
+        self._start_memory_monitor()
+
+    def teardown(self) -> None:
+        """Tear down the model."""
+        if self._metrics_server is not None:
+            self._metrics_server.stop()
+            self._metrics_server = None
+        if self._memory_monitor is not None:
+            self._memory_monitor.stop()
+            self._memory_monitor = None
+        super().teardown()
+
+    def _start_metrics_server(self) -> None:
+        """Start serving the metrics, if a metrics port has been configured."""
+        metrics_port = self.context.params.metrics_port
+        if metrics_port is None:
+            return
+        self._metrics_server = MetricsServer(self.metrics.registry, metrics_port)
+        self._metrics_server.start()
+        self.context.logger.info(
+            f"Serving metrics on http://{self._metrics_server.host}:{self._metrics_server.port}{METRICS_PATH}"
+        )
+
+    def _start_memory_monitor(self) -> None:
+        """Start monitoring the memory usage, if a report period has been configured."""
+        report_period = self.context.params.memory_report_period
+        if report_period is None:
+            return
+        self._memory_monitor = MemoryMonitor(
+            self.context.logger,
+            report_period,
+            self.context.params.memory_tracemalloc_frames,
+            metrics=self.metrics,
+        )
+        self._memory_monitor.start()
+
+    def memory_usage(self) -> Dict[str, MemoryUsage]:
+        """
+        Get the approximate memory usage of the structures which grow with the agent's uptime.
+
+        The objects referenced by several structures are only counted in the first one.
+
+        :return: the memory usage of each structure.
+        """
+        seen: Set[int] = set()
+        usage = self.round_sequence.memory_usage(seen)
+        for handler_name in self.context.handlers.__dict__.keys():
+            dialogues = getattr(self.context, f"{handler_name}_dialogues", None)
+            storage = getattr(dialogues, "_dialogues_storage", None)
+            if storage is None:
+                continue
+            n_dialogues = len(
+                storage._dialogues_by_dialogue_label  # pylint: disable=protected-access
+            )
+            usage[f"{handler_name}_dialogues"] = usage_of(n_dialogues, storage, seen)
+        usage["acn_deliverables"] = usage_of(
+            len(self.address_to_acn_deliverable), self.address_to_acn_deliverable, seen
+        )
+        return usage
+
+    def report_memory_usage(self) -> None:
+        """Report the memory usage, if a report period has passed."""
+        if self._memory_monitor is None:
+            return
+        self._memory_monitor.maybe_report(
+            self.synchronized_data.period_count, self.memory_usage
+        )
 
     @property
     def round_sequence(self) -> RoundSequence:
@@ -768,33 +872,80 @@ class BenchmarkBlockTypes(Enum):
     TOTAL = "total"
 
 
+class BenchmarkTraceFormat(Enum):
+    """Benchmark trace export formats."""
+
+    JSONL = "jsonl"
+    CHROME = "chrome"
+
+
+TRACE_FILES = {
+    BenchmarkTraceFormat.JSONL: "spans.jsonl",
+    BenchmarkTraceFormat.CHROME: "spans.trace",
+}
+NANOSECONDS_IN_SECOND = 1_000_000_000
+NANOSECONDS_IN_MICROSECOND = 1_000
+
+
+class BenchmarkSpan:  # pylint: disable=too-few-public-methods
+    """A named span of a benchmarked behaviour, possibly nested in another span."""
+
+    __slots__ = ("name", "parent", "depth", "start", "end")
+
+    def __init__(
+        self, name: str, parent: Optional[str], depth: int, start: int
+    ) -> None:
+        """Initialize the span."""
+        self.name = name
+        self.parent = parent
+        self.depth = depth
+        self.start = start
+        self.end: Optional[int] = None
+
+    @property
+    def duration(self) -> int:
+        """Get the duration of the span in nanoseconds."""
+        if self.end is None:
+            raise ValueError(f"Span {self.name!r} has not ended.")
+        return self.end - self.start
+
+
 class BenchmarkBlock:
     """
     Benchmark
 
     This class represents logic to measure the code block using a
-    context manager.
+    context manager. Entering the same block more than once accumulates its total time.
     """
 
-    start: float
+    start: int
     total_time: float
     block_type: str
 
-    def __init__(self, block_type: str) -> None:
+    def __init__(
+        self, block_type: str, behaviour: Optional["BenchmarkBehaviour"] = None
+    ) -> None:
         """Benchmark for single round."""
         self.block_type = block_type
         self.start = 0
         self.total_time = 0
+        self._behaviour = behaviour
+        self._span: Optional[BenchmarkSpan] = None
 
     def __enter__(
         self,
     ) -> None:
         """Enter context."""
-        self.start = time()
+        if self._behaviour is not None:
+            self._span = self._behaviour.start_span(self.block_type)
+        self.start = perf_counter_ns()
 
     def __exit__(self, *args: List, **kwargs: Dict) -> None:
         """Exit context"""
-        self.total_time = time() - self.start
+        self.total_time += (perf_counter_ns() - self.start) / NANOSECONDS_IN_SECOND
+        if self._behaviour is not None and self._span is not None:
+            self._behaviour.end_span(self._span)
+            self._span = None
 
 
 class BenchmarkBehaviour:
@@ -805,12 +956,18 @@ class BenchmarkBehaviour:
     """
 
     local_data: Dict[str, BenchmarkBlock]
+    spans: List[BenchmarkSpan]
 
-    def __init__(
-        self,
-    ) -> None:
-        """Initialize Benchmark behaviour object."""
+    def __init__(self, record_spans: bool = False) -> None:
+        """
+        Initialize Benchmark behaviour object.
+
+        :param record_spans: whether to keep the finished spans for exporting them.
+        """
         self.local_data = {}
+        self.spans = []
+        self.record_spans = record_spans
+        self._active_spans: List[BenchmarkSpan] = []
 
     def _measure(self, block_type: str) -> BenchmarkBlock:
         """
@@ -821,7 +978,7 @@ class BenchmarkBehaviour:
         """
 
         if block_type not in self.local_data:
-            self.local_data[block_type] = BenchmarkBlock(block_type)
+            self.local_data[block_type] = BenchmarkBlock(block_type, self)
 
         return self.local_data[block_type]
 
@@ -837,29 +994,70 @@ class BenchmarkBehaviour:
         """Measure consensus block."""
         return self._measure(BenchmarkBlockTypes.CONSENSUS.value)
 
+    def start_span(self, name: str) -> BenchmarkSpan:
+        """Start a span nested in the innermost active span."""
+        parent = self._active_spans[-1].name if self._active_spans else None
+        span = BenchmarkSpan(name, parent, len(self._active_spans), perf_counter_ns())
+        self._active_spans.append(span)
+        return span
+
+    def end_span(self, span: BenchmarkSpan) -> None:
+        """End an active span."""
+        span.end = perf_counter_ns()
+        self._active_spans.remove(span)
+        if self.record_spans:
+            self.spans.append(span)
+
+    @contextmanager
+    def span(self, name: str) -> Generator[BenchmarkSpan, None, None]:
+        """
+        Measure a named span, e.g., `signing`, `http:price_api` or `contract:get_state`.
+
+        Spans opened while another span of the behaviour is active are nested in it.
+
+        :param name: the name of the span.
+        :yield: the span.
+        """
+        span = self.start_span(name)
+        try:
+            yield span
+        finally:
+            self.end_span(span)
+
 
 class BenchmarkTool(Model, TypeCheckMixin, FrozenMixin):
     """
     BenchmarkTool
 
     Tool to benchmark ABCI apps.
+
+    If a `trace_format` is configured, the spans of the behaviours are appended to a single
+    trace file per agent on each save, either as JSON lines or in the Chrome trace-event format.
     """
 
     benchmark_data: Dict[str, BenchmarkBehaviour]
     log_dir: Path
+    trace_format: Optional[BenchmarkTraceFormat]
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Benchmark tool for rounds behaviours."""
         self.benchmark_data = {}
         log_dir_ = self._ensure("log_dir", kwargs, str)
         self.log_dir = Path(log_dir_)
+        trace_format = kwargs.pop("trace_format", None)
+        self.trace_format = (
+            None if trace_format is None else BenchmarkTraceFormat(trace_format)
+        )
+        self._trace_thread_ids: Dict[str, int] = {}
         super().__init__(*args, **kwargs)
         self._frozen = True
 
     def measure(self, behaviour: str) -> BenchmarkBehaviour:
         """Measure time to complete round."""
         if behaviour not in self.benchmark_data:
-            self.benchmark_data[behaviour] = BenchmarkBehaviour()
+            self.benchmark_data[behaviour] = BenchmarkBehaviour(
+                record_spans=self.trace_format is not None
+            )
         return self.benchmark_data[behaviour]
 
     @property
@@ -876,6 +1074,63 @@ class BenchmarkTool(Model, TypeCheckMixin, FrozenMixin):
 
         return behavioural_data
 
+    def _trace_events(self, period: int) -> Generator[Dict[str, Any], None, None]:
+        """Get the trace events of the recorded spans in the configured format."""
+        for behaviour, tool in self.benchmark_data.items():
+            if self.trace_format == BenchmarkTraceFormat.JSONL:
+                for span in tool.spans:
+                    yield {
+                        "period": period,
+                        "behaviour": behaviour,
+                        "name": span.name,
+                        "parent": span.parent,
+                        "depth": span.depth,
+                        "start_ns": span.start,
+                        "duration_ns": span.duration,
+                    }
+                continue
+
+            thread_id = self._trace_thread_ids.get(behaviour)
+            if thread_id is None:
+                thread_id = self._trace_thread_ids[behaviour] = len(
+                    self._trace_thread_ids
+                )
+                yield {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 0,
+                    "tid": thread_id,
+                    "args": {"name": behaviour},
+                }
+            for span in tool.spans:
+                yield {
+                    "name": span.name,
+                    "cat": behaviour,
+                    "ph": "X",
+                    "ts": span.start / NANOSECONDS_IN_MICROSECOND,
+                    "dur": span.duration / NANOSECONDS_IN_MICROSECOND,
+                    "pid": 0,
+                    "tid": thread_id,
+                    "args": {"period": period, "parent": span.parent},
+                }
+
+    def _save_trace(self, agent_dir: Path, period: int) -> None:
+        """Append the recorded spans to the trace file of the agent."""
+        if self.trace_format is None:
+            return
+
+        filepath = agent_dir / TRACE_FILES[self.trace_format]
+        is_chrome = self.trace_format == BenchmarkTraceFormat.CHROME
+        is_new = not filepath.exists()
+        with open(str(filepath), "a", encoding="utf-8") as outfile:
+            if is_chrome and is_new:
+                # the closing bracket of the json array format is optional,
+                # which allows appending events to the trace
+                outfile.write("[\n")
+            for event in self._trace_events(period):
+                outfile.write(json.dumps(event))
+                outfile.write(",\n" if is_chrome else "\n")
+
     def save(self, period: int = 0, reset: bool = True) -> None:
         """Save logs to a file."""
 
@@ -887,6 +1142,7 @@ class BenchmarkTool(Model, TypeCheckMixin, FrozenMixin):
 
             with open(str(filepath), "w+", encoding="utf-8") as outfile:
                 json.dump(self.data, outfile)
+            self._save_trace(agent_dir, period)
             self.context.logger.debug(f"Saving benchmarking data for period: {period}")
 
         except PermissionError as e:  # pragma: nocover
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""
+Replay a log of ABCI requests into the `ABCIRoundHandler` of a skill, headless.
+
+The ABCI connection records the requests it receives, along with the app hashes returned at every commit, when its
+`abci_requests_log` is set. The replayer loads the skill without an agent, Tendermint, or the behaviours, feeds the
+requests straight into its ABCI handler as fast as it handles them, and checks the app hash of every commit against
+the recorded one. A divergence points to the first block an agent applied differently, and the throughput of the
+replay can be tracked as a performance regression benchmark.
+
+Run it with:
+
+    autonomy replay requests abci_requests.log \
+        --skill packages/valory/skills/register_reset_abci --overrides overrides.yaml
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from queue import Queue
+from types import SimpleNamespace
+from typing import Any, Deque, Dict, Optional, Union, cast
+
+from aea.configurations.loader import ConfigLoaders, PackageType, SkillConfig
+from aea.context.base import AgentContext
+from aea.crypto.ledger_apis import DEFAULT_CURRENCY_DENOMINATIONS
+from aea.helpers.io import open_file
+from aea.identity.base import Identity
+from aea.multiplexer import AsyncMultiplexer, Multiplexer, OutBox
+from aea.skills.base import Handler, Skill
+from aea.skills.tasks import TaskManager
+
+from packages.valory.connections.abci.connection import PUBLIC_ID
+from packages.valory.connections.abci.recording import RecordType, read_records
+from packages.valory.protocols.abci import AbciMessage
+from packages.valory.skills.abstract_round_abci.models import BaseParams, SharedState
+
+
+class AppHashMismatchError(Exception):
+    """The app hash returned at a commit differs from the recorded one."""
+
+    def __init__(self, height: Optional[int], expected: bytes, actual: bytes) -> None:
+        """
+        Initialize the error.
+
+        :param height: the height of the block, if known.
+        :param expected: the recorded app hash.
+        :param actual: the app hash returned by the replay.
+        """
+        super().__init__(
+            f"App hash mismatch at height {height}: recorded {expected.hex()}, replayed {actual.hex()}."
+        )
+        self.height = height
+        self.expected = expected
+        self.actual = actual
+
+
+@dataclass(frozen=True)
+class ReplayStats:
+    """The statistics of a replay."""
+
+    requests: int
+    blocks: int
+    verified_commits: int
+    runs: int
+    duration: float
+
+    @property
+    def requests_per_second(self) -> float:
+        """Get the number of requests handled per second."""
+        return self.requests / self.duration if self.duration else 0.0
+
+    @property
+    def blocks_per_second(self) -> float:
+        """Get the number of blocks handled per second."""
+        return self.blocks / self.duration if self.duration else 0.0
+
+
+class AbciRequestsReplayer:
+    """Replays a log of ABCI requests into the `ABCIRoundHandler` of a skill.
+
+    The skill is loaded afresh for every run recorded in the log. When Tendermint is reset within a run, which shows
+    as an `init_chain` request after some blocks, the replayer resets the blockchain and cleans up the history of the
+    app, like the behaviours do on a successful hard reset. Everything else the behaviours do is not replayed.
+    """
+
+    def __init__(
+        self,
+        path_to_skill: Union[str, Path],
+        config_overrides: Optional[Dict[str, Any]] = None,
+        agent_address: str = "replay_agent_address",
+    ) -> None:
+        """
+        Initialize the replayer.
+
+        :param path_to_skill: the directory of the skill.
+        :param config_overrides: the overrides of the skill's configuration, as in the agent's configuration.
+        :param agent_address: the address of the agent whose requests were recorded.
+        """
+        self.path_to_skill = Path(path_to_skill)
+        self.config_overrides = config_overrides
+        self.agent_address = agent_address
+        self._multiplexer = AsyncMultiplexer()
+        self._multiplexer._out_queue = (  # pylint: disable=protected-access
+            asyncio.Queue()
+        )
+        self._skill: Optional[Skill] = None
+        self._handler: Optional[Handler] = None
+
+    @property
+    def skill(self) -> Skill:
+        """Get the skill of the current run."""
+        if self._skill is None:
+            raise ValueError("No run of the skill has started.")
+        return self._skill
+
+    def _load_skill(self) -> None:
+        """Load the skill afresh, and set it up."""
+        identity = Identity("replay_agent", self.agent_address, "replay_public_key")
+        agent_context = AgentContext(
+            identity=identity,
+            connection_status=self._multiplexer.connection_status,
+            outbox=OutBox(cast(Multiplexer, self._multiplexer)),
+            decision_maker_message_queue=Queue(),
+            decision_maker_handler_context=SimpleNamespace(),
+            task_manager=TaskManager(),
+            default_ledger_id=identity.default_address_key,
+            currency_denominations=DEFAULT_CURRENCY_DENOMINATIONS,
+            default_connection=None,
+            default_routing={},
+            search_service_address="dummy_author/dummy_search_skill:0.1.0",
+            decision_maker_address="dummy_decision_maker_address",
+            data_dir=os.getcwd(),
+        )
+        loader = ConfigLoaders.from_package_type(PackageType.SKILL)
+        with open_file(self.path_to_skill / "skill.yaml") as fp:
+            skill_config: SkillConfig = loader.load(fp)
+        if self.config_overrides is not None:
+            skill_config.update(self.config_overrides)
+        skill_config.directory = self.path_to_skill
+        skill = Skill.from_config(skill_config, agent_context)
+
+        for model in skill.models.values():
+            model.setup()
+        handlers = [
+            handler
+            for handler in skill.handlers.values()
+            if handler.SUPPORTED_PROTOCOL == AbciMessage.protocol_id
+        ]
+        if not handlers:
+            raise ValueError(f"The skill {skill.public_id} has no ABCI handler.")
+        self._handler = handlers[0]
+        self._handler.setup()
+        self._skill = skill
+
+    def _reset_blockchain(self) -> None:
+        """Reset the blockchain and clean up the history of the app, like the behaviours do on a hard reset."""
+        context = self.skill.skill_context
+        state = cast(SharedState, context.state)
+        params = cast(BaseParams, context.params)
+        state.round_sequence.reset_blockchain()
+        for handler_name in context.handlers.__dict__.keys():
+            getattr(context, f"{handler_name}_dialogues").cleanup()
+        state.round_sequence.abci_app.cleanup(
+            params.cleanup_history_depth, params.cleanup_history_depth_current
+        )
+
+    def _handle(self, request: AbciMessage) -> AbciMessage:
+        """Handle a request, and get the response of the handler."""
+        request.sender = str(PUBLIC_ID)
+        request.to = str(self.skill.public_id)
+        cast(Handler, self._handler).handle(request)
+        out_queue = self._multiplexer.out_queue
+        if out_queue.empty():
+            raise ValueError(f"The handler did not respond to {request.performative}.")
+        response = out_queue.get_nowait().message
+        while not out_queue.empty():  # pragma: nocover
+            out_queue.get_nowait()
+        return cast(AbciMessage, response)
+
+    def replay(self, path: Union[str, Path]) -> ReplayStats:
+        """
+        Replay a log of ABCI requests, as fast as the handler handles them.
+
+        :param path: the path of the log.
+        :return: the statistics of the replay.
+        """
+        requests = blocks = verified = runs = 0
+        height: Optional[int] = None
+        blocks_in_run = 0
+        app_hashes: Deque[bytes] = deque()
+        start = time.perf_counter()
+        for record_type, payload in read_records(path):
+            if record_type == RecordType.START:
+                runs += 1
+                blocks_in_run = 0
+                app_hashes.clear()
+                self._load_skill()
+                continue
+            if record_type == RecordType.COMMIT:
+                if app_hashes:
+                    actual = app_hashes.popleft()
+                    if actual != payload:
+                        raise AppHashMismatchError(height, cast(bytes, payload), actual)
+                    verified += 1
+                continue
+
+            request = cast(AbciMessage, payload)
+            performative = request.performative
+            if (
+                performative == AbciMessage.Performative.REQUEST_INIT_CHAIN
+                and blocks_in_run
+            ):
+                self._reset_blockchain()
+            elif performative == AbciMessage.Performative.REQUEST_END_BLOCK:
+                height = request.height
+            response = self._handle(request)
+            requests += 1
+            if performative == AbciMessage.Performative.REQUEST_COMMIT:
+                app_hashes.append(response.data)
+                blocks += 1
+                blocks_in_run += 1
+        return ReplayStats(
+            requests, blocks, verified, runs, time.perf_counter() - start
+        )
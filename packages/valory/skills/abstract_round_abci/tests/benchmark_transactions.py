@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""
+Benchmark the compression of the transactions.
+
+Synthetic payloads, carrying the serialized collections which are usually shared via consensus,
+are encoded and decoded as transactions, plain and compressed. The size of a transaction and of a
+block carrying one transaction per agent is reported, along with the median encoding and decoding
+times. The rounds' latency is not measured here; in a deployment, it can be compared via the
+`abci_round_duration_seconds` and `abci_transaction_size_bytes` metrics.
+
+Run it with:
+
+    python -m packages.valory.skills.abstract_round_abci.tests.benchmark_transactions --agents 4
+"""
+
+import argparse
+import json
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from aea_test_autonomy.helpers.benchmark import (
+    BaseBenchmarkResult,
+    format_table,
+    median_time,
+    run_benchmark_cli,
+)
+
+from packages.valory.skills.abstract_round_abci.base import BaseTxPayload, Transaction
+
+
+@dataclass(frozen=True)
+class BenchmarkPayload(BaseTxPayload):
+    """A payload carrying a serialized collection."""
+
+    content: str
+
+
+@dataclass(frozen=True)
+class BenchmarkConfig:
+    """The configuration of a benchmark run."""
+
+    agents: int = 4
+    items: int = 100
+    repeats: int = 5
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class BenchmarkResult(BaseBenchmarkResult):
+    """The measurements of a kind of payload, either plain or compressed."""
+
+    kind: str
+    compressed: bool
+    transaction_size: int
+    block_size: int
+    encode_seconds: float
+    decode_seconds: float
+
+
+def _address(rng: random.Random) -> str:
+    """Make a random address."""
+    return f"0x{rng.getrandbits(160):040x}"
+
+
+def _hash(rng: random.Random) -> str:
+    """Make a random transaction hash."""
+    return f"0x{rng.getrandbits(256):064x}"
+
+
+def make_contents(config: BenchmarkConfig) -> Dict[str, str]:
+    """Make the serialized collections carried by the payloads, by kind."""
+    rng = random.Random(config.seed)  # nosec
+    participants = [_address(rng) for _ in range(config.agents)]
+    votes = {
+        participant: {
+            "sender": participant,
+            "round_count": rng.randrange(10**6),
+            "vote": rng.choice((True, False)),
+            "estimate": round(rng.uniform(0, 10_000), 6),
+        }
+        for participant in participants
+    }
+    contents = {
+        "votes": votes,
+        "tx_hashes": [_hash(rng) for _ in range(config.items)],
+        "prices": [
+            {
+                "timestamp": 1_700_000_000 + i * 60,
+                "price": round(rng.uniform(0, 10_000), 6),
+            }
+            for i in range(config.items)
+        ],
+    }
+    return {
+        kind: json.dumps(content, sort_keys=True) for kind, content in contents.items()
+    }
+
+
+def benchmark_transaction(
+    kind: str, content: str, compressed: bool, config: BenchmarkConfig
+) -> BenchmarkResult:
+    """Benchmark the encoding of a transaction carrying the given content."""
+    rng = random.Random(config.seed)  # nosec
+    payload = BenchmarkPayload(_address(rng), content)
+    transaction = Transaction(payload, f"0x{rng.getrandbits(520):0130x}")
+    threshold = 0 if compressed else None
+    encoded = transaction.encode(threshold)
+    if Transaction.decode(encoded) != transaction:
+        raise ValueError(f"The {kind} transaction does not survive a round trip.")
+    return BenchmarkResult(
+        kind=kind,
+        compressed=compressed,
+        transaction_size=len(encoded),
+        block_size=len(encoded) * config.agents,
+        encode_seconds=median_time(
+            lambda: transaction.encode(threshold), config.repeats
+        ),
+        decode_seconds=median_time(lambda: Transaction.decode(encoded), config.repeats),
+    )
+
+
+def run_benchmark(
+    config: BenchmarkConfig, kinds: Optional[Sequence[str]] = None
+) -> List[BenchmarkResult]:
+    """Benchmark the kinds of payloads, plain and compressed."""
+    contents = make_contents(config)
+    return [
+        benchmark_transaction(kind, contents[kind], compressed, config)
+        for kind in kinds or tuple(contents)
+        for compressed in (False, True)
+    ]
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    """Format the results as a table."""
+    header = (
+        "payload",
+        "compressed",
+        "transaction (B)",
+        "block (B)",
+        "ratio",
+        "encode (ms)",
+        "decode (ms)",
+    )
+    plain_sizes = {
+        result.kind: result.transaction_size
+        for result in results
+        if not result.compressed
+    }
+    rows = []
+    for result in results:
+        baseline = plain_sizes.get(result.kind, result.transaction_size)
+        rows.append(
+            (
+                result.kind,
+                str(result.compressed),
+                str(result.transaction_size),
+                str(result.block_size),
+                f"{result.transaction_size / baseline:.3f}",
+                f"{result.encode_seconds * 1000:.3f}",
+                f"{result.decode_seconds * 1000:.3f}",
+            )
+        )
+    return format_table(header, rows)
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the benchmark."""
+    parser.add_argument(
+        "--kind",
+        action="append",
+        choices=tuple(make_contents(BenchmarkConfig(agents=1, items=0))),
+        help="Kind of payload to benchmark, can be repeated (default: all of them).",
+    )
+    parser.add_argument("--agents", type=int, default=4)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def _run(args: argparse.Namespace) -> List[BenchmarkResult]:
+    """Run the benchmark of the requested kinds of payloads."""
+    return run_benchmark(
+        BenchmarkConfig(
+            agents=args.agents, items=args.items, repeats=args.repeats, seed=args.seed
+        ),
+        args.kind,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the benchmarks from the command line."""
+    run_benchmark_cli(__doc__, _add_arguments, _run, format_results, argv)
+
+
+if __name__ == "__main__":
+    main()
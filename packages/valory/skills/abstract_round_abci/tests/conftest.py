@@ -112,4 +112,8 @@ irrelevant_config = {
     "slash_threshold_amount": 10_000_000_000_000_000,
     "light_slash_unit_amount": 5_000_000_000_000_000,
     "serious_slash_unit_amount": 8_000_000_000_000_000,
+    "metrics_port": None,
+    "memory_report_period": None,
+    "memory_tracemalloc_frames": 0,
+    "tx_compression_threshold": None,
 }
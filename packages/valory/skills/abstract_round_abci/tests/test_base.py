@@ -21,10 +21,12 @@
 
 import dataclasses
 import datetime
+import hashlib
 import json
 import logging
 import re
 import shutil
+import zlib
 from abc import ABC
 from calendar import timegm
 from collections import deque
@@ -102,9 +104,11 @@ from packages.valory.skills.abstract_round_abci.base import (
     Block,
     BlockBuilder,
     Blockchain,
+    COMPRESSED_TRANSACTION_PREFIX,
     CollectionRound,
     EventType,
     LateArrivingTransaction,
+    MAX_DECOMPRESSED_TRANSACTION_BYTES,
     OffenceStatus,
     OffenseStatusDecoder,
     OffenseStatusEncoder,
@@ -114,14 +118,20 @@ from packages.valory.skills.abstract_round_abci.base import (
     SlashingNotConfiguredError,
     Timeouts,
     Transaction,
+    TransactionNotValidError,
     TransactionTypeNotRecognizedError,
     _MetaAbciApp,
     _MetaAbstractRound,
     _MetaPayload,
+    from_ipfs_reference,
     get_name,
+    is_ipfs_reference,
+    large_field,
     light_offences,
     serious_offences,
+    to_ipfs_reference,
 )
+from packages.valory.skills.abstract_round_abci.memory import EXCLUDED_TYPES
 from packages.valory.skills.abstract_round_abci.test_tools.abci_app import (
     AbciAppTest,
     ConcreteBackgroundRound,
@@ -205,6 +215,14 @@ class TooBigPayload(BaseTxPayload):
     dummy_field: str = "0" * 10**7
 
 
+@dataclass(frozen=True)
+class LargeFieldPayload(BaseTxPayload):
+    """Payload class with a large field for testing."""
+
+    small_field: int
+    large_field_: Optional[str] = large_field(default=None)
+
+
 class ObjectImitator:
     """For custom __eq__ implementation testing"""
 
@@ -236,6 +254,38 @@ def test_base_tx_payload() -> None:
     assert type(hash(payload)) == int
 
 
+def test_base_tx_payload_large_fields() -> None:
+    """Test the large fields of a BaseTxPayload."""
+
+    assert PayloadA.large_fields() == ()
+    assert LargeFieldPayload.large_fields() == ("large_field_",)
+
+    payload = LargeFieldPayload(sender="sender", small_field=1, large_field_="0" * 10)
+    object.__setattr__(payload, "round_count", 9)
+    reference = to_ipfs_reference("ipfs_hash")
+    new_payload = payload.with_data(large_field_=reference)
+
+    assert new_payload.large_field_ == reference
+    assert new_payload.small_field == payload.small_field
+    assert new_payload.id_ == payload.id_
+    assert new_payload.round_count == payload.round_count
+    assert payload.large_field_ == "0" * 10
+
+
+def test_ipfs_reference() -> None:
+    """Test the references to the large fields' values stored on IPFS."""
+
+    reference = to_ipfs_reference("ipfs_hash")
+    assert is_ipfs_reference(reference)
+    assert from_ipfs_reference(reference) == "ipfs_hash"
+    assert not is_ipfs_reference("ipfs_hash")
+    assert not is_ipfs_reference(None)
+    with pytest.raises(
+        ValueError, match="is not a reference to a value stored on IPFS"
+    ):
+        from_ipfs_reference("ipfs_hash")
+
+
 def test_meta_round_abstract_round_when_instance_not_subclass_of_abstract_round() -> (
     None
 ):
@@ -311,6 +361,42 @@ class TestTransactions:
         actual = expected.decode(expected.encode())
         assert expected == actual
 
+    @pytest.mark.parametrize(
+        "compression_threshold, compressed",
+        ((None, False), (10**6, False), (0, True)),
+    )
+    def test_encode_decode_compressed_transaction(
+        self, compression_threshold: Optional[int], compressed: bool
+    ) -> None:
+        """Test encode/decode of a transaction with compression."""
+        payload = DummyPayload("sender", dummy_attribute=0)
+        expected = Transaction(payload, "signature")
+        encoded = expected.encode(compression_threshold)
+        assert encoded.startswith(COMPRESSED_TRANSACTION_PREFIX) is compressed
+        assert Transaction.decode(encoded) == expected
+
+    @pytest.mark.parametrize(
+        "encoded, match",
+        (
+            (COMPRESSED_TRANSACTION_PREFIX + b"corrupted", "is corrupted"),
+            (
+                COMPRESSED_TRANSACTION_PREFIX + zlib.compress(b"{}")[:-1],
+                "is truncated",
+            ),
+            (
+                COMPRESSED_TRANSACTION_PREFIX
+                + zlib.compress(b"0" * (MAX_DECOMPRESSED_TRANSACTION_BYTES + 1)),
+                f"decompresses to more than {MAX_DECOMPRESSED_TRANSACTION_BYTES} bytes",
+            ),
+        ),
+    )
+    def test_decode_invalid_compressed_transaction(
+        self, encoded: bytes, match: str
+    ) -> None:
+        """Test decode of an invalid compressed transaction."""
+        with pytest.raises(TransactionNotValidError, match=match):
+            Transaction.decode(encoded)
+
     def test_encode_too_big_payload(self) -> None:
         """Test encode of a too big payload."""
         sender = "sender"
@@ -1033,6 +1119,21 @@ class TestAbciAppDB:
         )
         assert self.db.hash() == expected_hash
 
+    def test_hash_does_not_format_data_when_debug_disabled(self) -> None:
+        """Test the commit latency of `hash` does not scale with the size of the formatted data at INFO level."""
+
+        class _Unformattable(str):
+            """A serialized db which fails if it is formatted."""
+
+            def __str__(self) -> str:
+                raise AssertionError("The serialized db should not be formatted.")
+
+        serialized = _Unformattable(json.dumps({"data": ["x" * 1024] * 1024}))
+        with mock.patch.object(
+            self.db.logger, "isEnabledFor", return_value=False
+        ), mock.patch.object(AbciAppDB, "serialize", return_value=serialized):
+            assert self.db.hash() == hashlib.sha256(serialized.encode()).digest()
+
 
 class TestBaseSynchronizedData:
     """Test 'BaseSynchronizedData' class."""
@@ -3085,6 +3186,59 @@ class TestRoundSequence:
         else:
             serialized_offence_status_mock.assert_not_called()
 
+    def test_memory_usage(self) -> None:
+        """Test `memory_usage` method."""
+        db = AbciAppDB(setup_data=dict(participants=[("a", "b")], values=[1, 2, 3]))
+        self.round_sequence.begin_block(MagicMock(height=1), MagicMock(), MagicMock())
+        self.round_sequence._blockchain.add_block(
+            self.round_sequence._block_builder.get_block()
+        )
+        self.round_sequence.pending_offences = {MagicMock(), MagicMock()}
+
+        with mock.patch.object(
+            AbciApp,
+            "synchronized_data",
+            new_callable=mock.PropertyMock,
+            return_value=BaseSynchronizedData(db),
+        ), mock.patch(
+            "packages.valory.skills.abstract_round_abci.memory.EXCLUDED_TYPES",
+            (*EXCLUDED_TYPES, MagicMock),
+        ):
+            usage = self.round_sequence.memory_usage()
+
+        assert {structure: usage_.entries for structure, usage_ in usage.items()} == {
+            "abci_app_db": 4,
+            "blockchain": 1,
+            "round_results": 0,
+            "previous_rounds": 0,
+            "timeouts": 0,
+            "pending_offences": 2,
+            "offence_status": 0,
+        }
+        assert usage["abci_app_db"].size > usage["round_results"].size > 0
+
+    @mock.patch.object(AbciApp, "process_event")
+    def test_update_round_does_not_format_result_when_debug_disabled(
+        self, _: mock.Mock
+    ) -> None:
+        """Test '_update_round' does not format the round result at INFO level."""
+        self.round_sequence.begin_block(MagicMock(height=1), MagicMock(), MagicMock())
+        block = self.round_sequence._block_builder.get_block()
+        self.round_sequence._blockchain.add_block(block)
+        round_result = MagicMock()
+
+        with mock.patch.object(
+            self.round_sequence.current_round,
+            "end_block",
+            return_value=(round_result, MagicMock()),
+        ), mock.patch.object(
+            self.round_sequence.abci_app.logger, "isEnabledFor", return_value=False
+        ):
+            self.round_sequence._update_round()
+
+        round_result.__str__.assert_not_called()
+        round_result.__repr__.assert_not_called()
+
     @mock.patch.object(AbciApp, "process_event")
     @pytest.mark.parametrize(
         "termination_round_result, current_round_result",
@@ -23,6 +23,8 @@ import json
 import logging
 import time
 from abc import ABC
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
@@ -46,6 +48,7 @@ from _pytest.logging import LogCaptureFixture
 
 # pylint: skip-file
 from aea.common import JSONLike
+from aea.helpers.ipfs.base import IPFSHashOnly
 from aea.protocols.base import Message
 from aea.test_tools.utils import as_context
 from aea_test_autonomy.helpers.base import try_send
@@ -53,6 +56,10 @@ from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from packages.open_aea.protocols.signing import SigningMessage
+from packages.valory.connections.abci.clock import (
+    install_virtual_clock,
+    uninstall_virtual_clock,
+)
 from packages.valory.connections.http_client.connection import HttpDialogues
 from packages.valory.connections.ipfs.connection import IpfsDialogues
 from packages.valory.connections.ipfs.connection import PUBLIC_ID as IPFS_CONNECTION_ID
@@ -76,6 +83,9 @@ from packages.valory.skills.abstract_round_abci.base import (
     LEDGER_API_ADDRESS,
     OK_CODE,
     Transaction,
+    is_ipfs_reference,
+    large_field,
+    to_ipfs_reference,
 )
 from packages.valory.skills.abstract_round_abci.behaviour_utils import (
     AsyncBehaviour,
@@ -97,7 +107,13 @@ from packages.valory.skills.abstract_round_abci.io_.ipfs import (
     IPFSInteract,
     IPFSInteractionError,
 )
+from packages.valory.skills.abstract_round_abci.io_.store import (
+    Storer,
+    SupportedFiletype,
+)
+from packages.valory.skills.abstract_round_abci.metrics import AbciMetrics
 from packages.valory.skills.abstract_round_abci.models import (
+    LARGE_VALUES_CACHE_SIZE,
     SharedState,
     TendermintRecoveryParams,
 )
@@ -165,6 +181,14 @@ def yield_and_return_int_wrapper(
     return yield_and_return_int
 
 
+@dataclass(frozen=True)
+class LargeFieldPayload(BaseTxPayload):
+    """Payload class with a large field for testing."""
+
+    small_field: int
+    large_field_: Optional[str] = large_field(default=None)
+
+
 class AsyncBehaviourTest(AsyncBehaviour, ABC):
     """Concrete AsyncBehaviour class for testing purposes."""
 
@@ -368,6 +392,36 @@ def test_async_behaviour_sleep() -> None:
     ).total_seconds() > timedelta
 
 
+def test_async_behaviour_sleep_virtual_clock() -> None:
+    """Test that 'sleep' follows the virtual clock, if one is installed."""
+
+    class MyAsyncBehaviour(AsyncBehaviourTest):
+        counter = 0
+
+        def async_act_wrapper(self) -> Generator:
+            yield from self.async_act()
+
+        def async_act(self) -> Generator:
+            self.counter += 1
+            yield from self.sleep(3600)
+            self.counter += 1
+
+    clock = install_virtual_clock(1.0)
+    try:
+        behaviour = MyAsyncBehaviour()
+        behaviour.act()
+        behaviour.act()
+        assert behaviour.counter == 1
+
+        # fast-forward an hour, instead of sleeping for it
+        clock.advance(3600)
+        behaviour.act()
+        assert behaviour.counter == 2
+        assert behaviour.state == AsyncBehaviour.AsyncState.READY
+    finally:
+        uninstall_virtual_clock()
+
+
 def test_async_behaviour_without_yield() -> None:
     """Test AsyncBehaviour, async_act without yield/yield from."""
 
@@ -507,6 +561,7 @@ class TestBaseBehaviour:
             request_retry_delay=_DEFAULT_REQUEST_RETRY_DELAY,
             tx_timeout=_DEFAULT_TX_TIMEOUT,
             max_attempts=_DEFAULT_TX_MAX_ATTEMPTS,
+            tx_compression_threshold=None,
         )
         self.context_mock.shared_state = {}
         self.context_state_synchronized_data_mock = MagicMock()
@@ -522,6 +577,7 @@ class TestBaseBehaviour:
         self.context_mock.state.round_sequence.current_round_id = "round_a"
         self.context_mock.state.round_sequence.syncing_up = False
         self.context_mock.state.round_sequence.block_stall_deadline_expired = False
+        self.context_mock.state.large_values = OrderedDict()
         self.context_mock.http_dialogues = HttpDialogues()
         self.context_mock.ipfs_dialogues = IpfsDialogues(
             connection_id=str(IPFS_CONNECTION_ID)
@@ -552,9 +608,11 @@ class TestBaseBehaviour:
             ),
             (
                 MagicMock(
-                    ipfs_hash="test", performative=IpfsMessage.Performative.ERROR
+                    ipfs_hash="test",
+                    performative=IpfsMessage.Performative.ERROR,
+                    reason="busy",
                 ),
-                f"Expected performative {IpfsMessage.Performative.IPFS_HASH} but got {IpfsMessage.Performative.ERROR}.",
+                f"Expected performative {IpfsMessage.Performative.IPFS_HASH} but got {IpfsMessage.Performative.ERROR}. Reason: busy",
             ),
         ],
     )
@@ -622,6 +680,36 @@ class TestBaseBehaviour:
             )
             try_send(gen)  # type: ignore[arg-type]
 
+    def test_do_ipfs_request_metrics(self) -> None:
+        """Test that _do_ipfs_request records the IPFS request metrics."""
+        message, dialogue = cast(
+            IpfsDialogues, self.context_mock.ipfs_dialogues
+        ).create(str(IPFS_CONNECTION_ID), IpfsMessage.Performative.GET_FILES)
+        metrics = AbciMetrics()
+        metrics.registry.enabled = True
+        self.context_mock.state.metrics = metrics
+
+        def dummy_wait_for_message(
+            *args: Any, **kwargs: Any
+        ) -> Generator[None, None, Message]:
+            """A dummy implementation of AsyncBehaviour.wait_for_message to be used for mocks."""
+            assert metrics.ipfs_requests_in_flight.get() == 1
+            return MagicMock(performative=IpfsMessage.Performative.FILES)
+            yield
+
+        with mock.patch.object(
+            AsyncBehaviour, "wait_for_message", side_effect=dummy_wait_for_message
+        ):
+            gen = self.behaviour._do_ipfs_request(
+                cast(IpfsDialogue, dialogue), cast(IpfsMessage, message)
+            )
+            try_send(gen)  # type: ignore[arg-type]
+        assert metrics.ipfs_requests_in_flight.get() == 0
+        _, count = metrics.ipfs_request_duration.get(
+            request="get_files", response="files"
+        )
+        assert count == 1
+
     @pytest.mark.parametrize(
         "ipfs_response, expected_log",
         [
@@ -634,9 +722,11 @@ class TestBaseBehaviour:
             ),
             (
                 MagicMock(
-                    ipfs_hash="test", performative=IpfsMessage.Performative.ERROR
+                    ipfs_hash="test",
+                    performative=IpfsMessage.Performative.ERROR,
+                    reason="busy",
                 ),
-                f"Expected performative {IpfsMessage.Performative.FILES} but got {IpfsMessage.Performative.ERROR}.",
+                f"Expected performative {IpfsMessage.Performative.FILES} but got {IpfsMessage.Performative.ERROR}. Reason: busy",
             ),
         ],
     )
@@ -794,6 +884,183 @@ class TestBaseBehaviour:
         gen = self.behaviour.send_a2a_transaction(MagicMock())
         try_send(gen)
 
+    def test_send_a2a_transaction_offloads_large_fields(self) -> None:
+        """Test that 'send_a2a_transaction' stores the large fields on IPFS and sends their references."""
+        payload = LargeFieldPayload(
+            sender="sender", small_field=1, large_field_="0" * 10
+        )
+        reference = to_ipfs_reference("ipfs_hash")
+        with mock.patch.object(
+            BaseBehaviour,
+            "send_to_ipfs",
+            side_effect=mock_yield_and_return("ipfs_hash"),
+        ) as send_to_ipfs, mock.patch.object(
+            BaseBehaviour, "_send_transaction"
+        ) as send_transaction:
+            gen = self.behaviour.send_a2a_transaction(payload)
+            with pytest.raises(StopIteration):
+                while True:
+                    next(gen)
+
+        send_to_ipfs.assert_called_once_with(
+            "large_field_.json",
+            {"large_field_": "0" * 10},
+            filetype=SupportedFiletype.JSON_COMPACT,
+        )
+        sent_payload = send_transaction.call_args[0][0]
+        assert sent_payload.large_field_ == reference
+        assert sent_payload.small_field == payload.small_field
+        assert sent_payload.id_ == payload.id_
+        assert sent_payload.round_count == self.current_round_count
+        assert self.behaviour.shared_state.large_values == {reference: "0" * 10}
+
+    def test_offload_large_fields_canonical(self) -> None:
+        """Test that equal large values offloaded by different agents get the same reference."""
+
+        def send_to_ipfs(
+            filename: str, obj: Dict, filetype: SupportedFiletype
+        ) -> Generator[None, None, str]:
+            """Hash the serialized object as the IPFS connection would."""
+            yield
+            (content,) = (
+                Storer(filetype, None, "").serialize_object(filename, obj).values()
+            )
+            return IPFSHashOnly.hash_bytes(content.encode(), wrap=False)
+
+        # the agents hold equal values, with their keys in different orders
+        values: Tuple[Any, ...] = (
+            {"a": 1, "b": {"c": 2, "d": 3}},
+            {"b": {"d": 3, "c": 2}, "a": 1},
+        )
+        references = []
+        for value in values:
+            payload = LargeFieldPayload(
+                sender="sender", small_field=1, large_field_=value
+            )
+            with mock.patch.object(
+                BaseBehaviour, "send_to_ipfs", side_effect=send_to_ipfs
+            ):
+                gen = self.behaviour._offload_large_fields(payload)
+                with pytest.raises(StopIteration) as e:
+                    while True:
+                        next(gen)
+            references.append(e.value.value.large_field_)
+
+        assert is_ipfs_reference(references[0])
+        assert references[0] == references[1]
+
+    @pytest.mark.parametrize("large_value", (None, to_ipfs_reference("ipfs_hash")))
+    def test_offload_large_fields_skipped(self, large_value: Optional[str]) -> None:
+        """Test that '_offload_large_fields' skips empty and already offloaded values."""
+        payload = LargeFieldPayload(
+            sender="sender", small_field=1, large_field_=large_value
+        )
+        with mock.patch.object(BaseBehaviour, "send_to_ipfs") as send_to_ipfs:
+            gen = self.behaviour._offload_large_fields(payload)
+            with pytest.raises(StopIteration) as e:
+                next(gen)
+        send_to_ipfs.assert_not_called()
+        assert e.value.value is payload
+
+    def test_offload_large_fields_retries(self, caplog: LogCaptureFixture) -> None:
+        """Test that '_offload_large_fields' retries failed uploads until the stop condition is met."""
+        payload = LargeFieldPayload(
+            sender="sender", small_field=1, large_field_="0" * 10
+        )
+        stop_condition = MagicMock(side_effect=[False, True])
+        with mock.patch.object(
+            BaseBehaviour, "send_to_ipfs", side_effect=mock_yield_and_return(None)
+        ) as send_to_ipfs, mock.patch.object(
+            BaseBehaviour, "sleep", side_effect=mock_yield_and_return(None)
+        ), caplog.at_level(
+            logging.ERROR
+        ):
+            gen = self.behaviour._offload_large_fields(payload, stop_condition)
+            with pytest.raises(StopIteration) as e:
+                while True:
+                    next(gen)
+        assert e.value.value is None
+        assert send_to_ipfs.call_count == 2
+        assert (
+            "Could not store the large field `large_field_` of LargeFieldPayload on IPFS"
+            in caplog.text
+        )
+
+    @pytest.mark.parametrize(
+        "ipfs_object, expected",
+        (
+            ({"large_field_": "0" * 10}, "0" * 10),
+            (None, None),
+            ({"a": "0", "b": "1"}, None),
+        ),
+    )
+    def test_resolve_large_value(
+        self, ipfs_object: Optional[Dict[str, str]], expected: Optional[str]
+    ) -> None:
+        """Test 'resolve_large_value'."""
+        reference = to_ipfs_reference("ipfs_hash")
+        with mock.patch.object(
+            BaseBehaviour,
+            "get_from_ipfs",
+            side_effect=mock_yield_and_return(ipfs_object),
+        ) as get_from_ipfs:
+            for _ in range(2):
+                gen = self.behaviour.resolve_large_value(reference)
+                with pytest.raises(StopIteration) as e:
+                    while True:
+                        next(gen)
+                assert e.value.value == expected
+
+        get_from_ipfs.assert_called_with(
+            "ipfs_hash", SupportedFiletype.JSON_COMPACT, timeout=None
+        )
+        # successfully resolved values are served from the cache
+        assert get_from_ipfs.call_count == (1 if expected is not None else 2)
+
+    def test_resolve_large_value_not_a_reference(self) -> None:
+        """Test that 'resolve_large_value' returns inline values as they are."""
+        with mock.patch.object(BaseBehaviour, "get_from_ipfs") as get_from_ipfs:
+            gen = self.behaviour.resolve_large_value("0" * 10)
+            with pytest.raises(StopIteration) as e:
+                next(gen)
+        get_from_ipfs.assert_not_called()
+        assert e.value.value == "0" * 10
+
+    @pytest.mark.parametrize("resolved_value", ("0" * 10, None))
+    def test_resolve_large_fields(self, resolved_value: Optional[str]) -> None:
+        """Test 'resolve_large_fields'."""
+        payload = LargeFieldPayload(
+            sender="sender",
+            small_field=1,
+            large_field_=to_ipfs_reference("ipfs_hash"),
+        )
+        with mock.patch.object(
+            BaseBehaviour,
+            "resolve_large_value",
+            side_effect=mock_yield_and_return(resolved_value),
+        ):
+            gen = self.behaviour.resolve_large_fields(payload)
+            with pytest.raises(StopIteration) as e:
+                while True:
+                    next(gen)
+
+        resolved = e.value.value
+        if resolved_value is None:
+            assert resolved is None
+            return
+        assert resolved.large_field_ == resolved_value
+        assert resolved.id_ == payload.id_
+        assert payload.large_field_ == to_ipfs_reference("ipfs_hash")
+
+    def test_large_values_cache_eviction(self) -> None:
+        """Test that the least recently used large values are evicted from the cache."""
+        for i in range(LARGE_VALUES_CACHE_SIZE + 1):
+            self.behaviour._cache_large_value(to_ipfs_reference(str(i)), i)
+        cache = self.behaviour.shared_state.large_values
+        assert len(cache) == LARGE_VALUES_CACHE_SIZE
+        assert to_ipfs_reference("0") not in cache
+        assert to_ipfs_reference(str(LARGE_VALUES_CACHE_SIZE)) in cache
+
     def test_check_sync_logs_version_mismatch_for_schema_drift(
         self, caplog: LogCaptureFixture
     ) -> None:
@@ -1780,6 +2047,61 @@ class TestBaseBehaviour:
             # wait for message
             try_send(gen, obj=MagicMock())  # type: ignore[arg-type]
 
+    def test_get_contract_api_responses(self) -> None:
+        """Test 'get_contract_api_responses'."""
+        n_requests = 3
+        messages = [MagicMock() for _ in range(n_requests)]
+        dialogues = [MagicMock() for _ in range(n_requests)]
+        nonces = [f"nonce_{i}" for i in range(n_requests)]
+        with mock.patch.object(
+            BaseBehaviour,
+            "_build_contract_api_request",
+            side_effect=zip(messages, dialogues),
+        ), mock.patch.object(
+            BaseBehaviour, "_get_request_nonce_from_dialogue", side_effect=nonces
+        ), mock.patch.object(
+            self.behaviour.context.outbox, "put_message"
+        ) as put_message_mock:
+            gen = self.behaviour.get_contract_api_responses(
+                [dict(contract_callable=f"callable_{i}") for i in range(n_requests)]
+            )
+            # all the requests are sent before waiting for any response
+            next(gen)
+            assert put_message_mock.call_count == n_requests
+            callbacks = self.behaviour.context.requests.request_id_to_callback
+            assert set(callbacks) == set(nonces)
+
+            # the responses arrive in a different order than the requests
+            responses = {nonce: MagicMock() for nonce in nonces}
+            self.behaviour._AsyncBehaviour__stopped = False  # type: ignore
+            for nonce in reversed(nonces[1:]):
+                callbacks.pop(nonce)(responses[nonce], self.behaviour)
+                next(gen)
+            callbacks.pop(nonces[0])(responses[nonces[0]], self.behaviour)
+            with pytest.raises(StopIteration) as e:
+                next(gen)
+            assert e.value.value == [responses[nonce] for nonce in nonces]
+
+    @pytest.mark.parametrize(
+        "is_stopped, is_current, expected_collected",
+        ((True, True, False), (False, False, False), (False, True, True)),
+    )
+    def test_get_collecting_callback(
+        self, is_stopped: bool, is_current: bool, expected_collected: bool
+    ) -> None:
+        """Test 'get_collecting_callback'."""
+        responses: Dict[str, Message] = {}
+        message = MagicMock()
+        self.behaviour._AsyncBehaviour__stopped = is_stopped  # type: ignore
+        current_behaviour = self.behaviour if is_current else MagicMock()
+        callback = self.behaviour.get_collecting_callback(responses, "nonce")
+        with mock.patch.object(
+            self.behaviour, "handle_late_messages"
+        ) as handle_late_messages_mock:
+            callback(message, current_behaviour)
+        assert (responses == {"nonce": message}) is expected_collected
+        assert handle_late_messages_mock.called is (not is_stopped and not is_current)
+
     @mock.patch.object(
         BaseBehaviour, "_build_http_request_message", return_value=(None, None)
     )
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Test the transactions compression benchmark."""
+
+# pylint: skip-file
+
+import json
+from unittest import mock
+
+import pytest
+
+from packages.valory.skills.abstract_round_abci.tests import benchmark_transactions
+from packages.valory.skills.abstract_round_abci.tests.benchmark_transactions import (
+    BenchmarkConfig,
+    format_results,
+    main,
+    make_contents,
+    run_benchmark,
+)
+
+CONFIG = BenchmarkConfig(agents=4, items=50, repeats=1)
+
+
+def test_make_contents() -> None:
+    """Test that the contents are reproducible."""
+    contents = make_contents(CONFIG)
+    assert contents == make_contents(CONFIG)
+    assert set(contents) == {"votes", "tx_hashes", "prices"}
+    assert len(json.loads(contents["votes"])) == CONFIG.agents
+    assert len(json.loads(contents["tx_hashes"])) == CONFIG.items
+
+
+def test_run_benchmark() -> None:
+    """Test benchmarking the transactions."""
+    plain, compressed = run_benchmark(CONFIG, ("prices",))
+    assert (plain.kind, plain.compressed) == ("prices", False)
+    assert (compressed.kind, compressed.compressed) == ("prices", True)
+    assert compressed.transaction_size < plain.transaction_size
+    assert plain.block_size == plain.transaction_size * CONFIG.agents
+    table = format_results([plain, compressed])
+    assert table.splitlines()[1].startswith("prices | False")
+    assert "1.000" in table
+
+
+def test_run_benchmark_round_trip_failure() -> None:
+    """Test that an encoding which does not preserve the transaction is reported."""
+    with mock.patch.object(
+        benchmark_transactions.Transaction, "decode", return_value=None
+    ), pytest.raises(ValueError, match="The votes transaction does not survive"):
+        run_benchmark(CONFIG, ("votes",))
+
+
+def test_main(capsys: pytest.CaptureFixture) -> None:
+    """Test the command line entrypoint."""
+    main(["--items", "10", "--repeats", "1", "--kind", "tx_hashes", "--json"])
+    plain, compressed = json.loads(capsys.readouterr().out)
+    assert plain["kind"] == compressed["kind"] == "tx_hashes"
+    assert compressed["transaction_size"] < plain["transaction_size"]
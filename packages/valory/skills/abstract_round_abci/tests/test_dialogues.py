@@ -22,18 +22,26 @@
 # pylint: skip-file
 
 from enum import Enum
-from typing import Type, cast
+from typing import Any, Dict, Type, cast
+from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
-from aea.protocols.dialogue.base import Dialogues
+from aea.exceptions import AEAEnforceError
+from aea.protocols.base import Address, Message
+from aea.protocols.dialogue.base import Dialogue, Dialogues
 from aea.skills.base import Model
 
 from packages.valory.connections.ipfs.connection import PUBLIC_ID as IPFS_CONNECTION_ID
 from packages.valory.protocols.ipfs import IpfsMessage
+from packages.valory.protocols.tendermint import TendermintMessage
+from packages.valory.protocols.tendermint.dialogues import (
+    TendermintDialogues as BaseTendermintDialogues,
+)
 from packages.valory.skills.abstract_round_abci.dialogues import (
     AbciDialogue,
     AbciDialogues,
+    BoundedDialoguesStorage,
     ContractApiDialogue,
     ContractApiDialogues,
     HttpDialogue,
@@ -47,23 +55,29 @@ from packages.valory.skills.abstract_round_abci.dialogues import (
     TendermintDialogues,
 )
 
+STORAGE_KWARGS = dict(max_terminal_dialogues=1000, terminal_dialogues_max_age=None)
+
 
 @pytest.mark.parametrize(
-    "dialogues_cls,expected_role_from_first_message",
+    "dialogues_cls,expected_role_from_first_message,kwargs",
     [
-        (AbciDialogues, AbciDialogue.Role.CLIENT),
-        (HttpDialogues, HttpDialogue.Role.CLIENT),
-        (SigningDialogues, SigningDialogue.Role.SKILL),
-        (LedgerApiDialogues, LedgerApiDialogue.Role.AGENT),
-        (ContractApiDialogues, ContractApiDialogue.Role.AGENT),
-        (TendermintDialogues, TendermintDialogue.Role.AGENT),
+        (AbciDialogues, AbciDialogue.Role.CLIENT, {}),
+        (HttpDialogues, HttpDialogue.Role.CLIENT, STORAGE_KWARGS),
+        (SigningDialogues, SigningDialogue.Role.SKILL, STORAGE_KWARGS),
+        (LedgerApiDialogues, LedgerApiDialogue.Role.AGENT, STORAGE_KWARGS),
+        (ContractApiDialogues, ContractApiDialogue.Role.AGENT, STORAGE_KWARGS),
+        (TendermintDialogues, TendermintDialogue.Role.AGENT, STORAGE_KWARGS),
     ],
 )
 def test_dialogues_creation(
-    dialogues_cls: Type[Model], expected_role_from_first_message: Enum
+    dialogues_cls: Type[Model],
+    expected_role_from_first_message: Enum,
+    kwargs: Dict[str, Any],
 ) -> None:
     """Test XDialogues creations."""
-    dialogues = cast(Dialogues, dialogues_cls(name="", skill_context=MagicMock()))
+    dialogues = cast(
+        Dialogues, dialogues_cls(name="", skill_context=MagicMock(), **kwargs)
+    )
     assert expected_role_from_first_message == dialogues._role_from_first_message(
         MagicMock(), MagicMock()
     )
@@ -93,8 +107,138 @@ def test_contract_api_dialogue() -> None:
 
 def test_ipfs_dialogue() -> None:
     """Test 'IpfsDialogues' creation."""
-    dialogues = IpfsDialogues(name="", skill_context=MagicMock())
+    dialogues = IpfsDialogues(name="", skill_context=MagicMock(), **STORAGE_KWARGS)
     dialogues.create(
         counterparty=str(IPFS_CONNECTION_ID),
         performative=IpfsMessage.Performative.GET_FILES,
     )
+
+
+def _role_from_first_message(  # pylint: disable=unused-argument
+    message: Message, receiver_address: Address
+) -> Dialogue.Role:
+    """Get the role of the tendermint dialogues used in the tests."""
+    return TendermintDialogue.Role.AGENT
+
+
+class TestBoundedDialoguesStorage:
+    """Test `BoundedDialoguesStorage`."""
+
+    def setup_method(self) -> None:
+        """Set up the tests."""
+        self.dialogues = BaseTendermintDialogues("agent", _role_from_first_message)
+        self.counterparty_dialogues = BaseTendermintDialogues(
+            "counterparty", _role_from_first_message
+        )
+
+    def _complete_dialogue(self) -> None:
+        """Complete a request-response dialogue with the counterparty."""
+        request, _ = self.dialogues.create(
+            counterparty="counterparty",
+            performative=TendermintMessage.Performative.GET_GENESIS_INFO,
+        )
+        dialogue = cast(Dialogue, self.counterparty_dialogues.update(request))
+        response = dialogue.reply(
+            performative=TendermintMessage.Performative.GENESIS_INFO,
+            target_message=request,
+            info="info",
+        )
+        self.dialogues.update(response)
+
+    def test_count_eviction(self) -> None:
+        """Test that the oldest dialogues in terminal state are evicted above the maximum count."""
+        storage = BoundedDialoguesStorage(self.dialogues, max_terminal_dialogues=3)
+        self.dialogues._dialogues_storage = storage
+        for _ in range(5):
+            self._complete_dialogue()
+        assert storage.counts == {"active": 0, "terminal": 3, "evicted": 2}
+
+    def test_age_eviction(self) -> None:
+        """Test that the dialogues in terminal state are evicted above the maximum age."""
+        storage = BoundedDialoguesStorage(
+            self.dialogues, max_terminal_dialogues=None, terminal_dialogues_max_age=10
+        )
+        self.dialogues._dialogues_storage = storage
+        with mock.patch("time.monotonic", return_value=0.0):
+            self._complete_dialogue()
+            self._complete_dialogue()
+        with mock.patch("time.monotonic", return_value=5.0):
+            self._complete_dialogue()
+        assert storage.counts == {"active": 0, "terminal": 3, "evicted": 0}
+        with mock.patch("time.monotonic", return_value=12.0):
+            self._complete_dialogue()
+        assert storage.counts == {"active": 0, "terminal": 2, "evicted": 2}
+
+    def test_no_terminal_dialogues(self) -> None:
+        """Test that no dialogue in terminal state is kept when the maximum count is zero."""
+        storage = BoundedDialoguesStorage(self.dialogues, max_terminal_dialogues=0)
+        self.dialogues._dialogues_storage = storage
+        request, _ = self.dialogues.create(
+            counterparty="counterparty",
+            performative=TendermintMessage.Performative.GET_GENESIS_INFO,
+        )
+        assert storage.counts == {"active": 1, "terminal": 0, "evicted": 0}
+        dialogue = cast(Dialogue, self.counterparty_dialogues.update(request))
+        self.dialogues.update(
+            dialogue.reply(
+                performative=TendermintMessage.Performative.GENESIS_INFO,
+                target_message=request,
+                info="info",
+            )
+        )
+        assert storage.counts == {"active": 0, "terminal": 0, "evicted": 1}
+        storage.cleanup()
+        assert storage.counts == {"active": 0, "terminal": 0, "evicted": 1}
+
+    def test_reloaded_dialogues_eviction(self) -> None:
+        """Test that the terminal state dialogues which are reloaded from the offloaded ones are evicted again."""
+        self.dialogues._dialogues_storage = BoundedDialoguesStorage(
+            self.dialogues, max_terminal_dialogues=None
+        )
+        for _ in range(3):
+            self._complete_dialogue()
+        offloaded = list(self.dialogues._dialogues_storage.dialogues_in_terminal_state)
+        storage = BoundedDialoguesStorage(self.dialogues, max_terminal_dialogues=1)
+        self.dialogues._dialogues_storage = storage
+        for dialogue in offloaded:
+            with mock.patch.object(
+                storage, "_get_dialogue_from_collection", return_value=dialogue
+            ):
+                assert storage.get(dialogue.dialogue_label) is dialogue
+        assert storage.counts == {"active": 0, "terminal": 1, "evicted": 2}
+        assert storage.get(offloaded[-1].dialogue_label) is offloaded[-1]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        (
+            dict(max_terminal_dialogues=-1),
+            dict(terminal_dialogues_max_age=-1.0),
+        ),
+    )
+    def test_invalid_bounds(self, kwargs: dict) -> None:
+        """Test that negative bounds are rejected."""
+        with pytest.raises(AEAEnforceError, match="must be non-negative"):
+            BoundedDialoguesStorage(self.dialogues, **kwargs)
+
+
+def test_dialogues_storage_configuration() -> None:
+    """Test that the dialogues models configure their storage."""
+    dialogues = HttpDialogues(
+        name="",
+        skill_context=MagicMock(),
+        max_terminal_dialogues=10,
+        terminal_dialogues_max_age=60.0,
+    )
+    storage = cast(BoundedDialoguesStorage, dialogues._dialogues_storage)
+    assert isinstance(storage, BoundedDialoguesStorage)
+    assert storage._max_terminal_dialogues == 10
+    assert storage._terminal_dialogues_max_age == 60.0
+    assert "max_terminal_dialogues" not in dialogues.configuration.args
+
+    with pytest.raises(AEAEnforceError, match="'max_terminal_dialogues' of type"):
+        HttpDialogues(name="", skill_context=MagicMock())
+
+    abci_dialogues = AbciDialogues(name="", skill_context=MagicMock())
+    abci_storage = cast(BoundedDialoguesStorage, abci_dialogues._dialogues_storage)
+    assert abci_storage._max_terminal_dialogues == 0
+    assert abci_storage._skill_component is None
@@ -391,7 +391,12 @@ class TestTendermintHandler:
         self.context.state = MagicMock(acn_container=lambda: other_agents)
         self.handler = TendermintHandler(name="dummy", skill_context=self.context)
         self.handler.context.logger = logging.getLogger()
-        self.dialogues = TendermintDialogues(name="dummy", skill_context=self.context)
+        self.dialogues = TendermintDialogues(
+            name="dummy",
+            skill_context=self.context,
+            max_terminal_dialogues=1000,
+            terminal_dialogues_max_age=None,
+        )
 
     @property
     def dummy_validator_config(self) -> Dict[str, Dict[str, str]]:
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""
+Benchmark the filetypes supported by the IPFS interacting methods.
+
+A synthetic dataset is serialized and deserialized with each filetype, as `send_to_ipfs` and
+`get_from_ipfs` do, reporting the size of the payload carried by the IPFS protocol and the median
+time of each operation. The filetypes whose optional dependencies are not installed are skipped.
+
+Run it with:
+
+    python -m packages.valory.skills.abstract_round_abci.tests.test_io.benchmark --rows 10000
+"""
+
+import argparse
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from aea_test_autonomy.helpers.benchmark import (
+    BaseBenchmarkResult,
+    format_table,
+    median_time,
+    run_benchmark_cli,
+)
+
+from packages.valory.skills.abstract_round_abci.io_.ipfs import (
+    IPFSInteract,
+    IPFSInteractionError,
+)
+from packages.valory.skills.abstract_round_abci.io_.store import SupportedFiletype
+
+FILENAME = "dataset"
+
+
+@dataclass(frozen=True)
+class BenchmarkConfig:
+    """The configuration of a benchmark run."""
+
+    rows: int = 1000
+    repeats: int = 5
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class BenchmarkResult(BaseBenchmarkResult):
+    """The measurements of a filetype."""
+
+    filetype: str
+    payload_size: int
+    serialize_seconds: float
+    deserialize_seconds: float
+
+
+def make_dataset(config: BenchmarkConfig) -> List[Dict[str, Any]]:
+    """Make a synthetic tabular dataset, as the ones usually shared via IPFS."""
+    rng = random.Random(config.seed)  # nosec
+    return [
+        {
+            "id": i,
+            "timestamp": 1_700_000_000 + i * 60,
+            "price": round(rng.uniform(0, 10_000), 6),
+            "volume": rng.randrange(10**12),
+            "address": f"0x{rng.getrandbits(160):040x}",
+            "tags": rng.sample(("buy", "sell", "swap", "mint", "burn"), 2),
+        }
+        for i in range(config.rows)
+    ]
+
+
+def benchmark_filetype(
+    filetype: SupportedFiletype, dataset: List[Dict[str, Any]], repeats: int
+) -> BenchmarkResult:
+    """Benchmark a filetype."""
+    interact = IPFSInteract()
+    serialized = interact.store(FILENAME, dataset, False, filetype)
+    if interact.load(serialized, filetype) != dataset:
+        raise ValueError(f"The dataset does not survive a {filetype.name} round trip.")
+    return BenchmarkResult(
+        filetype=filetype.name,
+        payload_size=sum(len(data.encode("utf-8")) for data in serialized.values()),
+        serialize_seconds=median_time(
+            lambda: interact.store(FILENAME, dataset, False, filetype), repeats
+        ),
+        deserialize_seconds=median_time(
+            lambda: interact.load(serialized, filetype), repeats
+        ),
+    )
+
+
+def run_benchmark(
+    config: BenchmarkConfig, filetypes: Optional[Sequence[SupportedFiletype]] = None
+) -> List[BenchmarkResult]:
+    """Benchmark the filetypes, skipping the unavailable ones."""
+    dataset = make_dataset(config)
+    results = []
+    for filetype in filetypes or tuple(SupportedFiletype):
+        try:
+            results.append(benchmark_filetype(filetype, dataset, config.repeats))
+        except IPFSInteractionError as e:
+            if not isinstance(e.__cause__, ImportError):
+                raise
+    return results
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    """Format the results as a table."""
+    header = (
+        "filetype",
+        "payload (KiB)",
+        "ratio",
+        "serialize (ms)",
+        "deserialize (ms)",
+    )
+    baseline = results[0].payload_size if results else 1
+    rows = (
+        (
+            result.filetype,
+            f"{result.payload_size / 1024:.1f}",
+            f"{result.payload_size / baseline:.3f}",
+            f"{result.serialize_seconds * 1000:.3f}",
+            f"{result.deserialize_seconds * 1000:.3f}",
+        )
+        for result in results
+    )
+    return format_table(header, rows)
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the benchmark."""
+    parser.add_argument(
+        "--filetype",
+        action="append",
+        choices=[filetype.name for filetype in SupportedFiletype],
+        help="Filetype to benchmark, can be repeated (default: all of them).",
+    )
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def _run(args: argparse.Namespace) -> List[BenchmarkResult]:
+    """Run the benchmark of the requested filetypes."""
+    filetypes = [SupportedFiletype[name] for name in args.filetype or ()]
+    return run_benchmark(
+        BenchmarkConfig(rows=args.rows, repeats=args.repeats, seed=args.seed),
+        filetypes,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the benchmarks from the command line."""
+    run_benchmark_cli(__doc__, _add_arguments, _run, format_results, argv)
+
+
+if __name__ == "__main__":
+    main()
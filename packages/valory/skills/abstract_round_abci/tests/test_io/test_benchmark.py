@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Test the IPFS filetypes benchmark."""
+
+# pylint: skip-file
+
+import json
+from unittest import mock
+
+import pytest
+
+from packages.valory.skills.abstract_round_abci.io_.store import SupportedFiletype
+from packages.valory.skills.abstract_round_abci.tests.test_io import benchmark
+from packages.valory.skills.abstract_round_abci.tests.test_io.benchmark import (
+    BenchmarkConfig,
+    format_results,
+    main,
+    make_dataset,
+    run_benchmark,
+)
+
+CONFIG = BenchmarkConfig(rows=50, repeats=1)
+
+
+def test_make_dataset() -> None:
+    """Test that the dataset is reproducible."""
+    assert make_dataset(CONFIG) == make_dataset(CONFIG)
+    assert len(make_dataset(CONFIG)) == CONFIG.rows
+
+
+def test_run_benchmark() -> None:
+    """Test benchmarking the filetypes."""
+    filetypes = (SupportedFiletype.JSON, SupportedFiletype.JSON_GZIP)
+    results = run_benchmark(CONFIG, filetypes)
+    assert [result.filetype for result in results] == ["JSON", "JSON_GZIP"]
+    assert results[1].payload_size < results[0].payload_size
+    table = format_results(results)
+    assert table.splitlines()[1].startswith("JSON ")
+    assert "1.000" in table
+
+
+def test_run_benchmark_skips_unavailable() -> None:
+    """Test that the filetypes whose dependencies are missing are skipped."""
+    with mock.patch.dict("sys.modules", {"zstandard": None}):
+        results = run_benchmark(CONFIG, (SupportedFiletype.JSON_ZSTD,))
+    assert results == []
+
+
+def test_run_benchmark_round_trip_failure() -> None:
+    """Test that a filetype which does not preserve the dataset is reported."""
+    with mock.patch.object(
+        benchmark.IPFSInteract, "load", return_value=[]
+    ), pytest.raises(ValueError, match="does not survive a JSON round trip"):
+        run_benchmark(CONFIG, (SupportedFiletype.JSON,))
+
+
+def test_main(capsys: pytest.CaptureFixture) -> None:
+    """Test the command line entrypoint."""
+    main(["--rows", "10", "--repeats", "1", "--filetype", "JSONL", "--json"])
+    (result,) = json.loads(capsys.readouterr().out)
+    assert result["filetype"] == "JSONL"
+    assert result["payload_size"] > 0
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Tests for the compression functionality of abstract round abci."""
+
+# pylint: skip-file
+
+import binascii
+import sys
+from unittest import mock
+
+import pytest
+
+from packages.valory.skills.abstract_round_abci.io_.compression import (
+    Compression,
+    compress,
+    decompress,
+)
+
+DATA = b'{"test":"test"}' * 100
+
+
+def test_gzip() -> None:
+    """Test the gzip compression."""
+    armoured = compress(DATA, Compression.GZIP)
+    assert armoured.isascii()
+    assert len(armoured) < len(DATA)
+    assert compress(DATA, Compression.GZIP) == armoured
+    assert decompress(armoured, Compression.GZIP) == DATA
+
+
+def test_zstd() -> None:
+    """Test the zstd compression."""
+    pytest.importorskip("zstandard")
+    armoured = compress(DATA, Compression.ZSTD)
+    assert len(armoured) < len(DATA)
+    assert decompress(armoured, Compression.ZSTD) == DATA
+
+
+def test_zstd_not_installed() -> None:
+    """Test the zstd compression when `zstandard` is not installed."""
+    with mock.patch.dict(sys.modules, {"zstandard": None}), pytest.raises(
+        ImportError, match="pip install zstandard"
+    ):
+        compress(DATA, Compression.ZSTD)
+
+
+@pytest.mark.parametrize("compression", (Compression.GZIP, Compression.ZSTD))
+def test_decompress_bounded(compression: Compression) -> None:
+    """Test decompressing data which expand past the maximum size."""
+    if compression == Compression.ZSTD:
+        pytest.importorskip("zstandard")
+    armoured = compress(DATA, compression)
+    assert decompress(armoured, compression, max_size=len(DATA)) == DATA
+    with pytest.raises(IOError, match=f"decompress to more than {len(DATA) - 1} bytes"):
+        decompress(armoured, compression, max_size=len(DATA) - 1)
+
+
+def test_decompress_invalid() -> None:
+    """Test decompressing data which is not base64-encoded."""
+    with pytest.raises(binascii.Error):
+        decompress("not base64!", Compression.GZIP)
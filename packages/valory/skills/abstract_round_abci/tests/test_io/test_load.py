@@ -32,7 +32,10 @@ from packages.valory.skills.abstract_round_abci.io_.load import (
     Loader,
     SupportedLoaderType,
 )
-from packages.valory.skills.abstract_round_abci.io_.store import SupportedFiletype
+from packages.valory.skills.abstract_round_abci.io_.store import (
+    Storer,
+    SupportedFiletype,
+)
 
 
 class TestLoader:
@@ -112,3 +115,24 @@ class TestLoader:
         }
         actual_objects = self.json_loader.load(serialized_objects)
         assert expected_objects == actual_objects
+
+    @pytest.mark.parametrize(
+        "filetype",
+        (
+            SupportedFiletype.JSON,
+            SupportedFiletype.JSON_COMPACT,
+            SupportedFiletype.JSONL,
+            SupportedFiletype.JSON_GZIP,
+        ),
+    )
+    def test_load_stored(self, filetype: SupportedFiletype) -> None:
+        """Test loading the objects stored with each filetype."""
+        dummy_objects = {"obj1": [{"test": "tést"}, [1, 2]], "obj2": []}
+        serialized_objects = Storer(filetype, None, "tmp").store(dummy_objects, True)
+        loaded_objects = Loader(filetype, None).load(serialized_objects)
+        assert list(loaded_objects.values()) == list(dummy_objects.values())
+
+    def test_load_jsonl_blank_lines(self) -> None:
+        """Test that blank lines are ignored when loading JSON lines."""
+        loader = Loader(SupportedFiletype.JSONL, None)
+        assert loader.load({"test": '{"a":1}\n\n[2]\n'}) == [{"a": 1}, [2]]
@@ -27,6 +27,10 @@ from typing import Optional, cast
 
 import pytest
 
+from packages.valory.skills.abstract_round_abci.io_.compression import (
+    Compression,
+    decompress,
+)
 from packages.valory.skills.abstract_round_abci.io_.store import (
     CustomStorerType,
     JSONStorer,
@@ -102,3 +106,42 @@ class TestStorer:
         expected_object = {expected_path: json.dumps(dummy_object, indent=4)}
         actual_object = self.json_storer.store({dummy_filename: dummy_object}, True)
         assert expected_object == actual_object
+
+    @pytest.mark.parametrize(
+        "filetype, expected_serialization",
+        (
+            (SupportedFiletype.JSON_COMPACT, '[{"test":"tést"},[1,2]]'),
+            (SupportedFiletype.JSONL, '{"test":"tést"}\n[1,2]\n'),
+        ),
+    )
+    def test_store_compact(
+        self, filetype: SupportedFiletype, expected_serialization: str
+    ) -> None:
+        """Test `store` with the compact filetypes."""
+        storer = Storer(filetype, None, self.path)
+        actual_object = storer.store([{"test": "tést"}, [1, 2]], False)
+        assert actual_object == {self.path: expected_serialization}
+
+    def test_store_compact_sorts_keys(self) -> None:
+        """Test that equal objects are serialized identically with the compact filetype."""
+        storer = Storer(SupportedFiletype.JSON_COMPACT, None, self.path)
+        actual_object = storer.store({"b": {"d": 1, "c": 2}, "a": 3}, False)
+        assert actual_object == {self.path: '{"a":3,"b":{"c":2,"d":1}}'}
+        assert actual_object == storer.store({"a": 3, "b": {"c": 2, "d": 1}}, False)
+
+    def test_store_jsonl_not_list(self) -> None:
+        """Test that only lists can be stored as JSON lines."""
+        storer = Storer(SupportedFiletype.JSONL, None, self.path)
+        with pytest.raises(IOError, match="can only be used with a list"):
+            storer.store({"test": "test"}, False)
+
+    def test_store_gzip(self) -> None:
+        """Test `store` with gzip compression."""
+        dummy_object = {"test": ["test"] * 100}
+        storer = Storer(SupportedFiletype.JSON_GZIP, None, self.path)
+        actual_object = storer.store(dummy_object, False)
+        # the compression is deterministic
+        assert actual_object == storer.store(dummy_object, False)
+        serialized = actual_object[self.path]
+        assert len(serialized) < len(json.dumps(dummy_object))
+        assert json.loads(decompress(serialized, Compression.GZIP)) == dummy_object
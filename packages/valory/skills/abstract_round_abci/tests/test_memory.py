@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Test the memory.py module of the skill."""
+
+import logging
+import sys
+import tracemalloc
+from typing import Dict
+from unittest import mock
+
+import pytest
+
+from packages.valory.skills.abstract_round_abci.memory import (
+    MemoryMonitor,
+    MemoryUsage,
+    deep_sizeof,
+    usage_of,
+)
+from packages.valory.skills.abstract_round_abci.metrics import AbciMetrics
+
+# pylint: skip-file
+
+
+class _Slotted:
+    """A class with slots."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: bytes) -> None:
+        """Initialize the object."""
+        self.value = value
+
+
+class _WithDict:
+    """A class with an instance dictionary."""
+
+    def __init__(self, value: bytes) -> None:
+        """Initialize the object."""
+        self.value = value
+        self.logger = logging.getLogger(__name__)
+
+
+class TestDeepSizeof:
+    """Test `deep_sizeof`."""
+
+    def test_containers(self) -> None:
+        """Test that the containers are traversed."""
+        value = b"x" * 1000
+        assert deep_sizeof(value) == sys.getsizeof(value)
+        for container in ([value], (value,), {value}, {"key": value}):
+            assert deep_sizeof(container) > sys.getsizeof(value)
+
+    def test_objects(self) -> None:
+        """Test that the instance dictionaries and the slots are traversed, and the excluded types are not."""
+        value = b"x" * 1000
+        assert deep_sizeof(_Slotted(value)) >= sys.getsizeof(value)
+        with_dict = _WithDict(value)
+        seen: set = set()
+        assert deep_sizeof(with_dict, seen) >= sys.getsizeof(value)
+        assert id(value) in seen
+        assert id(with_dict.logger) not in seen
+
+    def test_shared_objects(self) -> None:
+        """Test that the objects are counted once when sharing the seen ids."""
+        value = b"x" * 1000
+        seen: set = set()
+        first = deep_sizeof([value], seen)
+        second = deep_sizeof([value], seen)
+        assert first - second == sys.getsizeof(value)
+        # cycles are traversed once
+        cyclic: list = [value]
+        cyclic.append(cyclic)
+        assert deep_sizeof(cyclic) == sys.getsizeof(cyclic) + sys.getsizeof(value)
+
+    def test_max_objects(self) -> None:
+        """Test that the traversal is bounded."""
+        values = [str(i) for i in range(100)]
+        assert deep_sizeof(values, max_objects=1) == sys.getsizeof(values)
+        assert deep_sizeof(values, max_objects=10) < deep_sizeof(values)
+
+    def test_usage_of(self) -> None:
+        """Test `usage_of`."""
+        values = [1, 2]
+        assert usage_of(2, values) == MemoryUsage(2, deep_sizeof(values))
+
+
+class TestMemoryMonitor:
+    """Test `MemoryMonitor`."""
+
+    @staticmethod
+    def get_usage() -> Dict[str, MemoryUsage]:
+        """Get a dummy memory usage."""
+        return {"small": MemoryUsage(1, 10), "large": MemoryUsage(2, 100)}
+
+    @pytest.mark.parametrize("report_period", (None, 0))
+    def test_disabled(self, report_period: int) -> None:
+        """Test that a monitor without a report period does not report."""
+        monitor = MemoryMonitor(mock.MagicMock(), report_period, tracemalloc_frames=1)
+        monitor.start()
+        assert not tracemalloc.is_tracing()
+        assert not monitor.maybe_report(0, self.get_usage)
+        monitor.logger.info.assert_not_called()
+
+    def test_maybe_report(self) -> None:
+        """Test that the memory usage is reported every report period."""
+        metrics = AbciMetrics()
+        metrics.registry.enabled = True
+        monitor = MemoryMonitor(mock.MagicMock(), report_period=2, metrics=metrics)
+        reported = [
+            monitor.maybe_report(period, self.get_usage)
+            for period in (1, 1, 2, 3, 4, 4)
+        ]
+        assert reported == [True, False, True, False, True, False]
+
+        assert metrics.memory_entries.get(structure="large") == 2
+        assert metrics.memory_size.get(structure="small") == 10
+        _, period, lines = monitor.logger.info.call_args[0]
+        assert period == 4
+        assert lines == "large: 2 entries, 100 bytes\nsmall: 1 entries, 10 bytes"
+
+    def test_tracemalloc(self) -> None:
+        """Test that the allocations are diffed between the reports."""
+        assert not tracemalloc.is_tracing()
+        monitor = MemoryMonitor(mock.MagicMock(), report_period=1, tracemalloc_frames=1)
+        try:
+            monitor.start()
+            assert tracemalloc.is_tracing()
+            allocated = [b"x" * 1000 for _ in range(1000)]  # noqa: F841
+            monitor.maybe_report(1, self.get_usage)
+            assert monitor.logger.info.call_count == 2
+            message, diff = monitor.logger.info.call_args[0]
+            assert message.startswith("Top allocation differences")
+            assert __file__ in diff
+        finally:
+            monitor.stop()
+        assert not tracemalloc.is_tracing()
+        assert monitor.tracemalloc_diff() == []
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Test the metrics.py module of the skill."""
+
+from unittest import mock
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from packages.valory.skills.abstract_round_abci.metrics import (
+    AbciMetrics,
+    CONTENT_TYPE,
+    DISABLED_METRICS,
+    METRICS_PATH,
+    MetricsRegistry,
+    MetricsServer,
+    get_metrics,
+    instrument_abci_request,
+)
+
+# pylint: skip-file
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    """Get an enabled registry."""
+    registry = MetricsRegistry()
+    registry.enabled = True
+    return registry
+
+
+@pytest.fixture
+def metrics() -> AbciMetrics:
+    """Get enabled ABCI metrics."""
+    metrics = AbciMetrics()
+    metrics.registry.enabled = True
+    return metrics
+
+
+class TestMetricsRegistry:
+    """Test `MetricsRegistry`."""
+
+    def test_disabled(self) -> None:
+        """Test that a disabled registry does not record anything."""
+        registry = MetricsRegistry()
+        counter = registry.counter("requests", "Requests.", labels=("kind",))
+        histogram = registry.histogram("latency_seconds", "Latency.")
+        gauge = registry.gauge("height", "Height.")
+        counter.inc(kind="a")
+        histogram.observe(0.1)
+        gauge.set(1)
+        assert counter.get(kind="a") == 0.0
+        assert histogram.get() == (0.0, 0)
+        assert gauge.get() is None
+
+    def test_duplicate_name(self, registry: MetricsRegistry) -> None:
+        """Test registering a metric twice."""
+        registry.counter("requests", "Requests.")
+        with pytest.raises(ValueError, match="`requests` is already registered"):
+            registry.gauge("requests", "Requests.")
+
+    def test_counter(self, registry: MetricsRegistry) -> None:
+        """Test a counter."""
+        counter = registry.counter("requests", "Requests.", labels=("kind",))
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+        counter.inc(kind='b"')
+        assert counter.get(kind="a") == 3.0
+        assert registry.render() == (
+            "# HELP requests Requests.\n"
+            "# TYPE requests counter\n"
+            'requests_total{kind="a"} 3.0\n'
+            'requests_total{kind="b\\""} 1.0\n'
+        )
+
+    def test_gauge(self, registry: MetricsRegistry) -> None:
+        """Test a gauge."""
+        gauge = registry.gauge("height", "Height.")
+        gauge.set(3)
+        gauge.set(2)
+        assert gauge.get() == 2
+        assert registry.render().endswith("height 2\n")
+        gauge.inc()
+        gauge.inc(-2)
+        assert gauge.get() == 1
+
+    def test_histogram(self, registry: MetricsRegistry) -> None:
+        """Test a histogram."""
+        histogram = registry.histogram(
+            "latency_seconds", "Latency.", labels=("op",), buckets=(1.0, 0.1)
+        )
+        histogram.observe(0.05, op="x")
+        histogram.observe(0.5, op="x")
+        histogram.observe(5.0, op="x")
+        assert histogram.get(op="x") == (5.55, 3)
+        assert registry.render().splitlines()[2:] == [
+            'latency_seconds_bucket{op="x",le="0.1"} 1',
+            'latency_seconds_bucket{op="x",le="1.0"} 2',
+            'latency_seconds_bucket{op="x",le="+Inf"} 3',
+            'latency_seconds_sum{op="x"} 5.55',
+            'latency_seconds_count{op="x"} 3',
+        ]
+
+    def test_histogram_time(self, registry: MetricsRegistry) -> None:
+        """Test timing a function with a histogram."""
+        histogram = registry.histogram("latency_seconds", "Latency.")
+        timed = histogram.time()(lambda x: x * 2)
+        assert timed(2) == 4
+        assert histogram.get()[1] == 1
+
+    def test_reset(self, registry: MetricsRegistry) -> None:
+        """Test resetting the registry."""
+        counter = registry.counter("requests", "Requests.")
+        counter.inc()
+        registry.reset()
+        assert counter.get() == 0.0
+
+
+def test_get_metrics(metrics: AbciMetrics) -> None:
+    """Test that the metrics are those of the agent of the context."""
+    context = mock.MagicMock()
+    context.state.metrics = metrics
+    assert get_metrics(context) is metrics
+    assert get_metrics(mock.MagicMock()) is DISABLED_METRICS
+    assert get_metrics(None) is DISABLED_METRICS
+
+
+def test_instrument_abci_request(metrics: AbciMetrics) -> None:
+    """Test `instrument_abci_request`."""
+    reply = mock.MagicMock(code=0)
+    handler = instrument_abci_request("check_tx", count_transactions=True)(
+        lambda *_: reply
+    )
+    message = mock.MagicMock(tx=b"0" * 10)
+    self_ = mock.MagicMock()
+    self_.context.state.metrics = metrics
+    other_metrics = AbciMetrics()
+    other_metrics.registry.enabled = True
+    other_self = mock.MagicMock()
+    other_self.context.state.metrics = other_metrics
+    assert handler(self_, message, mock.MagicMock()) is reply
+    assert metrics.abci_request_duration.get(request="check_tx")[1] == 1
+    assert metrics.abci_transactions.get(request="check_tx", code=0) == 1.0
+    assert metrics.transaction_size.get(request="check_tx") == (10.0, 1)
+
+    # the agents in the same process record to their own metrics
+    assert handler(other_self, message, mock.MagicMock()) is reply
+    assert other_metrics.abci_transactions.get(request="check_tx", code=0) == 1.0
+    assert metrics.abci_transactions.get(request="check_tx", code=0) == 1.0
+
+
+def test_instrument_abci_request_disabled() -> None:
+    """Test that `instrument_abci_request` does not record when disabled."""
+    reply = mock.MagicMock(code=0)
+    handler = instrument_abci_request("deliver_tx", count_transactions=True)(
+        lambda: reply
+    )
+    assert handler() is reply
+    assert DISABLED_METRICS.abci_request_duration.get(request="deliver_tx") == (
+        0.0,
+        0,
+    )
+
+
+def test_metrics_server(registry: MetricsRegistry) -> None:
+    """Test serving the metrics."""
+    registry.counter("requests", "Requests.").inc()
+    server = MetricsServer(registry, port=0)
+    server.start()
+    try:
+        assert server.is_running
+        assert registry.enabled
+        url = f"http://{server.host}:{server.port}"
+        with urlopen(url + METRICS_PATH) as response:  # nosec
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert b"requests_total 1.0" in response.read()
+        with pytest.raises(HTTPError):
+            urlopen(url + "/other")  # nosec
+    finally:
+        server.stop()
+    assert not server.is_running
+    assert not registry.enabled
@@ -31,6 +31,7 @@ from enum import Enum
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from time import sleep
+from types import SimpleNamespace
 from typing import Any, Dict, List, Literal, Optional, Set, Tuple, Type, TypedDict, cast
 from unittest import mock
 from unittest.mock import MagicMock
@@ -44,7 +45,9 @@ from packages.valory.skills.abstract_round_abci.base import (
     OffenceStatus,
     OffenseStatusEncoder,
     ROUND_COUNT_DEFAULT,
+    RoundSequence,
 )
+from packages.valory.skills.abstract_round_abci.memory import MemoryUsage
 from packages.valory.skills.abstract_round_abci.models import (
     ApiSpecs,
     BaseParams,
@@ -117,6 +120,10 @@ BASE_DUMMY_PARAMS = dict(
     slash_threshold_amount=10_000_000_000_000_000,
     light_slash_unit_amount=5_000_000_000_000_000,
     serious_slash_unit_amount=8_000_000_000_000_000,
+    metrics_port=None,
+    memory_report_period=None,
+    memory_tracemalloc_frames=0,
+    tx_compression_threshold=None,
 )
 
 
@@ -466,6 +473,8 @@ class TestSharedState:
             "test": [],
             "all_participants": list(range(4)),
         }
+        shared_state.context.params.metrics_port = None
+        shared_state.context.params.memory_report_period = None
         shared_state.setup()
 
     @pytest.mark.parametrize(
@@ -549,6 +558,54 @@ class TestSharedState:
         self.dummy_state_setup(shared_state)
         assert shared_state.initial_tm_configs == {i: None for i in range(4)}
 
+    def test_memory_usage(self, *_: Any) -> None:
+        """Test the memory usage accounting and reports."""
+        shared_state = SharedState(
+            name="", skill_context=MagicMock(is_abstract_component=False)
+        )
+        shared_state.context.params.setup_params = {
+            "test": [],
+            "all_participants": list(range(4)),
+        }
+        shared_state.context.params.metrics_port = None
+        shared_state.context.params.memory_report_period = 1
+        shared_state.context.params.memory_tracemalloc_frames = 0
+        shared_state.setup()
+        shared_state.context.handlers = SimpleNamespace(abci=None, http=None)
+        shared_state.context.abci_dialogues = SimpleNamespace(
+            _dialogues_storage=SimpleNamespace(
+                _dialogues_by_dialogue_label={"label": "dialogue"}
+            )
+        )
+        shared_state.context.http_dialogues = None
+        shared_state.address_to_acn_deliverable = {"0x0": None, "0x1": None}
+
+        with mock.patch.object(
+            RoundSequence,
+            "memory_usage",
+            return_value={"abci_app_db": MemoryUsage(1, 1)},
+        ):
+            usage = shared_state.memory_usage()
+            assert {
+                structure: usage_.entries for structure, usage_ in usage.items()
+            } == {"abci_app_db": 1, "abci_dialogues": 1, "acn_deliverables": 2}
+
+            shared_state.report_memory_usage()
+            shared_state.report_memory_usage()
+
+        (call,) = [
+            call
+            for call in shared_state.context.logger.info.call_args_list
+            if call[0][0].startswith("Memory usage")
+        ]
+        assert call[0][1] == shared_state.synchronized_data.period_count
+        assert "abci_dialogues: 1 entries" in call[0][2]
+        # the usage is exported to the metrics of this agent
+        assert shared_state._memory_monitor.metrics is shared_state.metrics
+
+        shared_state.teardown()
+        assert shared_state._memory_monitor is None
+
     @pytest.mark.parametrize(
         "initial_tm_configs, address_input, exception, expected",
         (
@@ -599,6 +656,8 @@ class TestSharedState:
             mock_params.setup_params = {
                 "all_participants": ["0x0"],
             }
+            mock_params.metrics_port = None
+            mock_params.memory_report_period = None
             shared_state.setup()
             shared_state.initial_tm_configs = initial_tm_configs
             if exception is None:
@@ -631,6 +690,8 @@ class TestSharedState:
             "test": [],
             "all_participants": [["0x0"]],
         }
+        shared_state.context.params.metrics_port = None
+        shared_state.context.params.memory_report_period = None
         shared_state.setup()
         shared_state.round_sequence.abci_app._round_results = [MagicMock()]
         shared_state.synchronized_data
@@ -644,6 +705,8 @@ class TestSharedState:
                 "oracle_contract_address": "0xoracle",
                 "all_participants": "0x0",
             }
+            mock_params.metrics_port = None
+            mock_params.memory_report_period = None
             shared_state.setup()
             for key, value in mock_params.setup_params.items():
                 assert shared_state.synchronized_data.db.get_strict(key) == value
@@ -677,6 +740,8 @@ class TestSharedState:
             "test": [],
             "all_participants": ["0x0"],
         }
+        shared_state.context.params.metrics_port = None
+        shared_state.context.params.memory_report_period = None
         shared_state.setup()
         shared_state.synchronized_data.update(participants=tuple(range(n_participants)))
         shared_state.address_to_acn_deliverable = address_to_acn_deliverable
@@ -747,6 +812,83 @@ class TestBenchmarkTool:
             behaviour_data = json.loads(benchmark_file.read_text())
             self._check_behaviour_data(behaviour_data, agent_name)
 
+    def test_spans(self) -> None:
+        """Test nested spans and accumulated blocks."""
+        benchmark = BenchmarkTool(
+            name="agent", skill_context=MagicMock(), log_dir="", trace_format="jsonl"
+        )
+        behaviour = benchmark.measure("behaviour")
+        with behaviour.local():
+            with behaviour.span("signing"):
+                with behaviour.span("http:price_api"):
+                    pass
+        first_total = behaviour.local_data["local"].total_time
+        with behaviour.local():
+            pass
+
+        assert behaviour.local_data["local"].total_time >= first_total
+        assert [(span.name, span.parent, span.depth) for span in behaviour.spans] == [
+            ("http:price_api", "signing", 2),
+            ("signing", "local", 1),
+            ("local", None, 0),
+            ("local", None, 0),
+        ]
+        assert all(span.duration >= 0 for span in behaviour.spans)
+
+    def test_spans_not_recorded(self) -> None:
+        """Test that the spans are not kept if no trace format is configured."""
+        benchmark = BenchmarkTool(name="agent", skill_context=MagicMock(), log_dir="")
+        behaviour = benchmark.measure("behaviour")
+        with behaviour.span("signing") as span:
+            pass
+        assert span.duration >= 0
+        assert behaviour.spans == []
+
+    @pytest.mark.parametrize(
+        "trace_format, filename", (("jsonl", "spans.jsonl"), ("chrome", "spans.trace"))
+    )
+    def test_save_trace(self, trace_format: str, filename: str) -> None:
+        """Test saving the spans to a trace file."""
+        agent_name = "agent"
+        skill_context = MagicMock(agent_address=agent_name)
+
+        with TemporaryDirectory() as temp_dir:
+            benchmark = BenchmarkTool(
+                name=agent_name,
+                skill_context=skill_context,
+                log_dir=temp_dir,
+                trace_format=trace_format,
+            )
+            for period in range(2):
+                with benchmark.measure("behaviour").local():
+                    with benchmark.measure("behaviour").span("signing"):
+                        pass
+                benchmark.save(period)
+
+            trace = (Path(temp_dir, agent_name) / filename).read_text()
+            assert not list(Path(temp_dir, agent_name).glob("spans*.json"))
+
+        if trace_format == "jsonl":
+            events = [json.loads(line) for line in trace.splitlines()]
+            assert [(e["period"], e["name"], e["parent"]) for e in events] == [
+                (0, "signing", "local"),
+                (0, "local", None),
+                (1, "signing", "local"),
+                (1, "local", None),
+            ]
+            return
+
+        events = json.loads(trace.rstrip(",\n") + "]")
+        assert [event["ph"] for event in events] == ["M", "X", "X", "X", "X"]
+        assert {event["tid"] for event in events} == {0}
+
+    def test_invalid_trace_format(self) -> None:
+        """Test an invalid trace format."""
+        with pytest.raises(ValueError, match="'csv' is not a valid"):
+            BenchmarkTool(
+                name="agent", skill_context=MagicMock(), log_dir="", trace_format="csv"
+            )
+
 
 def test_requests_model_initialization() -> None:
     """Test initialization of the 'Requests(Model)' class."""
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Tests for abstract_round_abci/test_tools/replay.py"""
+
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from packages.valory.connections.abci.connection import MockServerChannel, PUBLIC_ID
+from packages.valory.connections.abci.dialogues import AbciDialogues
+from packages.valory.connections.abci.recording import AbciRequestsRecorder
+from packages.valory.protocols.abci import AbciMessage
+from packages.valory.protocols.abci.custom_types import (
+    Evidences,
+    LastCommitInfo,
+    Timestamp,
+    ValidatorUpdates,
+)
+from packages.valory.skills.abstract_round_abci.test_tools.replay import (
+    AbciRequestsReplayer,
+    AppHashMismatchError,
+)
+from packages.valory.skills.abstract_round_abci.tests.data.dummy_abci import (
+    PATH_TO_SKILL,
+)
+from packages.valory.skills.abstract_round_abci.tests.data.dummy_abci import (
+    PUBLIC_ID as SKILL_ID,
+)
+
+N_BLOCKS = 3
+
+
+def _requests(n_blocks: int) -> List[AbciMessage]:
+    """Create the requests of the startup handshake, followed by some empty blocks."""
+    dialogues = AbciDialogues(connection_id=PUBLIC_ID)
+    channel = MockServerChannel(target_skill_id=SKILL_ID)
+
+    def create(performative: AbciMessage.Performative, **kwargs: object) -> None:
+        message, _ = dialogues.create(
+            counterparty=str(SKILL_ID), performative=performative, **kwargs
+        )
+        requests.append(message)
+
+    requests: List[AbciMessage] = []
+    create(
+        AbciMessage.Performative.REQUEST_INFO,
+        version="",
+        block_version=0,
+        p2p_version=0,
+    )
+    create(
+        AbciMessage.Performative.REQUEST_INIT_CHAIN,
+        time=Timestamp(0, 0),
+        chain_id="replay",
+        validators=ValidatorUpdates([]),
+        app_state_bytes=b"",
+        initial_height=1,
+    )
+    for height in range(1, n_blocks + 1):
+        create(
+            AbciMessage.Performative.REQUEST_BEGIN_BLOCK,
+            hash=b"",
+            header=channel._make_header(height, float(height)),
+            last_commit_info=LastCommitInfo(0, []),
+            byzantine_validators=Evidences([]),
+        )
+        create(AbciMessage.Performative.REQUEST_END_BLOCK, height=height)
+        create(AbciMessage.Performative.REQUEST_COMMIT)
+    return requests
+
+
+def _record(path: Path, app_hashes: Optional[List[bytes]] = None) -> None:
+    """Record a log of requests, with the given app hashes for the commits."""
+    recorder = AbciRequestsRecorder(path)
+    recorder.open()
+    commits = iter(app_hashes or [])
+    for request in _requests(N_BLOCKS):
+        recorder.record_request(request)
+        if request.performative == AbciMessage.Performative.REQUEST_COMMIT:
+            app_hash = next(commits, None)
+            if app_hash is not None:
+                recorder.record_commit(app_hash)
+    recorder.close()
+
+
+class _CollectingReplayer(AbciRequestsReplayer):
+    """A replayer collecting the app hashes returned at every commit."""
+
+    app_hashes: List[bytes]
+
+    def _handle(self, request: AbciMessage) -> AbciMessage:
+        """Handle a request, collecting the app hashes."""
+        response = super()._handle(request)
+        if response.performative == AbciMessage.Performative.RESPONSE_COMMIT:
+            self.app_hashes.append(response.data)
+        return response
+
+
+def test_replay(tmp_path: Path) -> None:
+    """Test replaying a log, checking the app hashes."""
+    unchecked = tmp_path / "unchecked.log"
+    _record(unchecked)
+    replayer = _CollectingReplayer(PATH_TO_SKILL)
+    replayer.app_hashes = []
+    stats = replayer.replay(unchecked)
+    assert stats.blocks == N_BLOCKS
+    assert stats.verified_commits == 0
+    assert len(replayer.app_hashes) == N_BLOCKS
+
+    log = tmp_path / "abci_requests.log"
+    _record(log, replayer.app_hashes)
+    stats = AbciRequestsReplayer(PATH_TO_SKILL).replay(log)
+    assert stats.requests == 2 + 3 * N_BLOCKS
+    assert stats.blocks == N_BLOCKS
+    assert stats.verified_commits == N_BLOCKS
+    assert stats.runs == 1
+    assert stats.requests_per_second > 0
+
+
+def test_replay_mismatch(tmp_path: Path) -> None:
+    """Test that a divergent app hash is reported along with the height of its block."""
+    log = tmp_path / "abci_requests.log"
+    _record(log, [b"divergent"])
+    with pytest.raises(AppHashMismatchError, match="at height 1") as error:
+        AbciRequestsReplayer(PATH_TO_SKILL).replay(log)
+    assert error.value.expected == b"divergent"
+
+
+def test_replay_restarts(tmp_path: Path) -> None:
+    """Test that every run recorded in a log is replayed with a fresh skill."""
+    log = tmp_path / "abci_requests.log"
+    for _ in range(2):
+        _record(log)
+    stats = AbciRequestsReplayer(PATH_TO_SKILL).replay(log)
+    assert stats.runs == 2
+    assert stats.blocks == 2 * N_BLOCKS
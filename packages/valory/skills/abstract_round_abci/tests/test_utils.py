@@ -19,6 +19,7 @@
 
 """Test the utils.py module of the skill."""
 
+import logging
 from collections import defaultdict
 from string import printable
 from typing import Any, Dict, List, Tuple, Type
@@ -32,6 +33,7 @@ from packages.valory.skills.abstract_round_abci.tests.conftest import profile_na
 from packages.valory.skills.abstract_round_abci.utils import (
     DEFAULT_TENDERMINT_P2P_PORT,
     KeyType,
+    LazyFormat,
     MAX_UINT64,
     ValueType,
     VerifyDrand,
@@ -306,3 +308,21 @@ def test_inverse(
 ) -> None:
     """Test `inverse`."""
     assert inverse(dict_) == expected
+
+
+def test_lazy_format() -> None:
+    """Test `LazyFormat` is only evaluated when the message is emitted."""
+    func = mock.Mock(return_value="formatted")
+    logger = logging.getLogger("test_lazy_format")
+    logger.setLevel(logging.INFO)
+
+    with mock.patch.object(logger, "handle") as handle_mock:
+        logger.debug("value: %s", LazyFormat(func, 1, 2))
+        func.assert_not_called()
+        handle_mock.assert_not_called()
+
+        logger.info("value: %s", LazyFormat(func, 1, 2))
+        func.assert_not_called()
+        (record,), _ = handle_mock.call_args
+        assert record.getMessage() == "value: formatted"
+        func.assert_called_once_with(1, 2)
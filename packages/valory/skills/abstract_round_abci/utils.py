@@ -28,6 +28,7 @@ from hashlib import sha256
 from math import ceil
 from typing import (
     Any,
+    Callable,
     Dict,
     FrozenSet,
     Iterator,
@@ -442,3 +443,26 @@ def inverse(dict_: Dict[KeyType, ValueType]) -> Dict[ValueType, List[KeyType]]:
     for key, value in dict_.items():
         inverse_[value].append(key)
     return inverse_
+
+
+class LazyFormat:  # pylint: disable=too-few-public-methods
+    """
+    A logging argument which is only formatted when the message is emitted.
+
+    The logging module formats the arguments of a message only if its level is enabled,
+    hence expensive string representations can be deferred by wrapping them, e.g.:
+
+        logger.debug("payload: %s", LazyFormat(pprint.pformat, payload.json))
+        logger.debug("root hash: %s", LazyFormat(lambda: db.hash().hex()))
+    """
+
+    __slots__ = ("_func", "_args")
+
+    def __init__(self, func: Callable[..., Any], *args: Any) -> None:
+        """Initialize the lazy argument."""
+        self._func = func
+        self._args = args
+
+    def __str__(self) -> str:
+        """Evaluate and format the argument."""
+        return str(self._func(*self._args))
@@ -42,6 +42,8 @@ class TestModels:
         """Test `SharedState`'s `setup`."""
         shared_state = SharedState(name="", skill_context=MagicMock())
         shared_state.context.params.setup_params = {"test": []}
+        shared_state.context.params.metrics_port = None
+        shared_state.context.params.memory_report_period = None
         shared_state.setup()
         assert (
             OffendAbciApp.event_to_timeout[Event.ROUND_TIMEOUT]
@@ -19,7 +19,6 @@
 
 """This module contains the behaviours for the 'registration_abci' skill."""
 
-import datetime
 import json
 from abc import ABC
 from enum import Enum
@@ -35,7 +34,10 @@ from packages.valory.protocols.contract_api import ContractApiMessage
 from packages.valory.protocols.http import HttpMessage
 from packages.valory.protocols.tendermint import TendermintMessage
 from packages.valory.skills.abstract_round_abci.base import ABCIAppInternalError
-from packages.valory.skills.abstract_round_abci.behaviour_utils import TimeoutException
+from packages.valory.skills.abstract_round_abci.behaviour_utils import (
+    TimeoutException,
+    local_now,
+)
 from packages.valory.skills.abstract_round_abci.behaviours import (
     AbstractRoundBehaviour,
     BaseBehaviour,
@@ -377,7 +379,7 @@ class RegistrationStartupBehaviour(RegistrationBaseBehaviour):
         """Wait for a block to be received in the specified timeout."""
         # every agent will finish with the reset at a different time
         # hence the following will be different for all agents
-        start_time = datetime.datetime.now()
+        start_time = local_now()
 
         def received_block() -> bool:
             """Check whether we have received a block after "start_time"."""
@@ -54,6 +54,8 @@ class TestSharedState:
             "test": [],
             "all_participants": [["0x0"]],
         }
+        shared_state.context.params.metrics_port = None
+        shared_state.context.params.memory_report_period = None
         shared_state.setup()
         assert (
             TestAbciApp.event_to_timeout[Event.ROUND_TIMEOUT]
@@ -275,13 +275,13 @@ class TransactionSettlementBaseBehaviour(BaseBehaviour, ABC):
 
         return tx_data
 
-    def _verify_tx(self, tx_hash: str) -> Generator[None, None, ContractApiMessage]:
-        """Verify a transaction."""
+    def _verify_tx_request(self, tx_hash: str) -> Dict[str, Any]:
+        """Get the contract api request's kwargs to verify a transaction."""
         tx_params = skill_input_hex_to_payload(
             self.synchronized_data.most_voted_tx_hash
         )
         chain_id = self.synchronized_data.get_chain_id(self.params.default_chain_id)
-        contract_api_msg = yield from self.get_contract_api_response(
+        return dict(
             performative=ContractApiMessage.Performative.GET_STATE,  # type: ignore
             contract_address=self.synchronized_data.safe_contract_address,
             contract_id=str(GnosisSafeContract.contract_id),
@@ -299,6 +299,12 @@ class TransactionSettlementBaseBehaviour(BaseBehaviour, ABC):
             operation=tx_params["operation"],
             chain_id=chain_id,
         )
+
+    def _verify_tx(self, tx_hash: str) -> Generator[None, None, ContractApiMessage]:
+        """Verify a transaction."""
+        contract_api_msg = yield from self.get_contract_api_response(
+            **self._verify_tx_request(tx_hash)
+        )
         return contract_api_msg
 
     @staticmethod
@@ -580,10 +586,18 @@ class CheckTransactionHistoryBehaviour(TransactionSettlementBaseBehaviour):
         self.context.logger.info(
             f"Starting check for the transaction history: {self.history}. "
         )
+        # the history is checked from the most recent hash to the oldest one;
+        # all the hashes are verified concurrently, and the results are then
+        # evaluated in order, so that the latency is that of a single request
+        history = self.history[::-1]
+        verification_msgs = yield from self.get_contract_api_responses(
+            [self._verify_tx_request(tx_hash) for tx_hash in history]
+        )
+        revert_reasons = yield from self._get_revert_reasons(history, verification_msgs)
+
         was_nonce_reused = False
-        for tx_hash in self.history[::-1]:
+        for tx_hash, contract_api_msg in zip(history, verification_msgs):
             self.context.logger.info(f"Checking hash {tx_hash}...")
-            contract_api_msg = yield from self._verify_tx(tx_hash)
 
             if (
                 contract_api_msg.performative != ContractApiMessage.Performative.STATE
@@ -607,16 +621,9 @@ class CheckTransactionHistoryBehaviour(TransactionSettlementBaseBehaviour):
             status = cast(int, contract_api_msg.state.body["status"])
             if status == -1:
                 self.context.logger.info(f"Tx hash {tx_hash} has no receipt!")
-                # this loop might take a long time
-                # we do not want to starve the rest of the behaviour
-                # we yield which freezes this loop here until the
-                # AbstractRoundBehaviour it belongs to, sends a tick to it
-                yield
                 continue
 
-            tx_data = cast(Dict[str, Any], contract_api_msg.state.body["transaction"])
-            revert_reason = yield from self._get_revert_reason(tx_data)
-
+            revert_reason = revert_reasons[tx_hash]
             if revert_reason is not None:
                 if self._safe_nonce_reused(revert_reason):
                     self.context.logger.info(
@@ -624,11 +631,6 @@ class CheckTransactionHistoryBehaviour(TransactionSettlementBaseBehaviour):
                         f"{self.check_expected_to_be_verified} is expected to be verified!"
                     )
                     was_nonce_reused = True
-                    # this loop might take a long time
-                    # we do not want to starve the rest of the behaviour
-                    # we yield which freezes this loop here until the
-                    # AbstractRoundBehaviour it belongs to, sends a tick to it
-                    yield
                     continue
 
                 self.context.logger.warning(
@@ -646,12 +648,47 @@ class CheckTransactionHistoryBehaviour(TransactionSettlementBaseBehaviour):
 
         return VerificationStatus.NOT_VERIFIED, None
 
-    def _get_revert_reason(
-        self, tx: Dict[str, Any]
-    ) -> Generator[None, None, Optional[str]]:
-        """Get the revert reason of the given transaction."""
+    def _get_revert_reasons(
+        self, history: List[str], verification_msgs: List[ContractApiMessage]
+    ) -> Generator[None, None, Dict[str, Optional[str]]]:
+        """
+        Get the revert reasons of the unverified transactions, concurrently.
+
+        Only the transactions which will be evaluated are considered,
+        i.e., those preceding the first erroneous or verified one.
+
+        :param history: the hashes to check, in the order of evaluation.
+        :param verification_msgs: the verification responses for the hashes.
+        :return: a mapping of the hashes to their revert reasons.
+        :yields: None
+        """
+        txs: Dict[str, Dict[str, Any]] = {}
+        for tx_hash, contract_api_msg in zip(history, verification_msgs):
+            if (
+                contract_api_msg.performative != ContractApiMessage.Performative.STATE
+                or contract_api_msg.state.body["verified"]
+            ):
+                break
+            if contract_api_msg.state.body["status"] != -1:
+                txs[tx_hash] = cast(
+                    Dict[str, Any], contract_api_msg.state.body["transaction"]
+                )
+
+        if not txs:
+            return {}
+
+        revert_reason_msgs = yield from self.get_contract_api_responses(
+            [self._revert_reason_request(tx) for tx in txs.values()]
+        )
+        return {
+            tx_hash: self._parse_revert_reason_response(tx, contract_api_msg)
+            for (tx_hash, tx), contract_api_msg in zip(txs.items(), revert_reason_msgs)
+        }
+
+    def _revert_reason_request(self, tx: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the contract api request's kwargs to get the revert reason of the given transaction."""
         chain_id = self.synchronized_data.get_chain_id(self.params.default_chain_id)
-        contract_api_msg = yield from self.get_contract_api_response(
+        return dict(
             performative=ContractApiMessage.Performative.GET_STATE,  # type: ignore
             contract_address=self.synchronized_data.safe_contract_address,
             contract_id=str(GnosisSafeContract.contract_id),
@@ -660,6 +697,10 @@ class CheckTransactionHistoryBehaviour(TransactionSettlementBaseBehaviour):
             chain_id=chain_id,
         )
 
+    def _parse_revert_reason_response(
+        self, tx: Dict[str, Any], contract_api_msg: ContractApiMessage
+    ) -> Optional[str]:
+        """Parse the revert reason of the given transaction from the contract api response."""
         if (
             contract_api_msg.performative != ContractApiMessage.Performative.STATE
         ):  # pragma: nocover
@@ -1247,6 +1247,115 @@ class TestCheckTransactionHistoryBehaviour(TransactionSettlementFSMBehaviourBase
             ).auto_behaviour_id()
         )
 
+    @pytest.mark.parametrize(
+        "verification_results, revert_reasons, expected_status, expected_hash_index",
+        (
+            (
+                ((False, -1), (True, 1), (False, 0)),
+                {},
+                VerificationStatus.VERIFIED,
+                1,
+            ),
+            (
+                ((False, 0), (False, 0), (False, -1)),
+                {0: "GS026", 1: "GS026"},
+                VerificationStatus.BAD_SAFE_NONCE,
+                None,
+            ),
+            (
+                ((False, -1), (False, 0), (True, 1)),
+                {1: "test"},
+                VerificationStatus.INVALID_PAYLOAD,
+                1,
+            ),
+            (
+                ((False, -1), (False, -1), (False, -1)),
+                {},
+                VerificationStatus.NOT_VERIFIED,
+                None,
+            ),
+        ),
+    )
+    def test_check_tx_history_concurrently(
+        self,
+        verification_results: Tuple[Tuple[bool, int], ...],
+        revert_reasons: Dict[int, str],
+        expected_status: VerificationStatus,
+        expected_hash_index: Optional[int],
+    ) -> None:
+        """Test that the history is verified concurrently and evaluated from the most recent hash."""
+        hashes = ["0x" + char * 64 for char in "abc"]
+        self._fast_forward("".join(hashes))
+        behaviour = cast(
+            CheckTransactionHistoryBehaviour, self.behaviour.current_behaviour
+        )
+        evaluation_order = hashes[::-1]
+
+        def dummy_safe_nonce(**_: Any) -> Generator[None, None, MagicMock]:
+            """Dummy `get_contract_api_response` returning the safe nonce."""
+            yield
+            return MagicMock(
+                performative=ContractApiMessage.Performative.STATE,
+                state=MagicMock(body={"safe_nonce": 0}),
+            )
+
+        requests_made: List[List[Dict[str, Any]]] = []
+
+        def dummy_responses(
+            requests: List[Dict[str, Any]],
+        ) -> Generator[None, None, List[MagicMock]]:
+            """Dummy `get_contract_api_responses` for `verify_tx` and `revert_reason`."""
+            requests_made.append(requests)
+            yield
+            if requests[0]["contract_callable"] == "verify_tx":
+                return [
+                    MagicMock(
+                        performative=ContractApiMessage.Performative.STATE,
+                        state=MagicMock(
+                            body={
+                                "verified": verified,
+                                "status": status,
+                                "transaction": {"hash": i},
+                            }
+                        ),
+                    )
+                    for i, (verified, status) in enumerate(verification_results)
+                ]
+            return [
+                MagicMock(
+                    performative=ContractApiMessage.Performative.STATE,
+                    state=MagicMock(
+                        body={"revert_reason": revert_reasons[request["tx"]["hash"]]}
+                    ),
+                )
+                for request in requests
+            ]
+
+        with mock.patch.object(
+            behaviour, "get_contract_api_response", side_effect=dummy_safe_nonce
+        ), mock.patch.object(
+            behaviour, "get_contract_api_responses", side_effect=dummy_responses
+        ):
+            gen = behaviour._check_tx_history()
+            with pytest.raises(StopIteration) as e:
+                while True:
+                    next(gen)
+
+        expected_hash = (
+            None
+            if expected_hash_index is None
+            else evaluation_order[expected_hash_index]
+        )
+        assert e.value.value == (expected_status, expected_hash)
+        verification_requests = requests_made[0]
+        assert [request["tx_hash"] for request in verification_requests] == (
+            evaluation_order
+        )
+        expected_revert_requests = [[{"hash": i} for i in sorted(revert_reasons)]]
+        assert [
+            [request["tx"] for request in requests] for requests in requests_made[1:]
+        ] == ([] if not revert_reasons else expected_revert_requests)
+
 
 class TestCheckLateTxHashesBehaviour(TransactionSettlementFSMBehaviourBaseCase):
     """Test CheckLateTxHashesBehaviour."""
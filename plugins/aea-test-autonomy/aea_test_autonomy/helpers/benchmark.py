@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Helpers for the command-line benchmarks of the packages."""
+
+import argparse
+import json
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class BaseBenchmarkResult:
+    """The base class of the results of a benchmark."""
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get the result as a json-serializable dictionary."""
+        return asdict(self)
+
+
+def median_time(func: Callable[[], Any], repeats: int) -> float:
+    """Get the median time of a function's calls, in seconds."""
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def format_table(header: Sequence[str], rows: Iterable[Sequence[str]]) -> str:
+    """Format the rows as a table, with the columns aligned."""
+    table = [tuple(header), *map(tuple, rows)]
+    widths = [max(len(row[i]) for row in table) for i in range(len(header))]
+    return "\n".join(
+        " | ".join(value.ljust(width) for value, width in zip(row, widths)).rstrip()
+        for row in table
+    )
+
+
+def run_benchmark_cli(  # pylint: disable=too-many-arguments
+    description: str,
+    add_arguments: Callable[[argparse.ArgumentParser], None],
+    run: Callable[[argparse.Namespace], Sequence[BaseBenchmarkResult]],
+    format_results: Callable[[Sequence[Any]], str],
+    argv: Optional[Sequence[str]] = None,
+) -> None:
+    """
+    Run a benchmark from the command line, and print its results.
+
+    :param description: the description of the benchmark. Only its first paragraph is used.
+    :param add_arguments: adds the arguments of the benchmark to the parser.
+    :param run: runs the benchmark with the parsed arguments.
+    :param format_results: formats the results as a table.
+    :param argv: the command-line arguments, defaults to `sys.argv`.
+    """
+    parser = argparse.ArgumentParser(description=description.split("\n\n")[0].strip())
+    add_arguments(parser)
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as json."
+    )
+    args = parser.parse_args(argv)
+    results = run(args)
+    if args.json:
+        print(json.dumps([result.to_json() for result in results], indent=2))
+    else:
+        print(format_results(results))
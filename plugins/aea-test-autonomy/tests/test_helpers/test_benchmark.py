@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Tests for the benchmark helpers."""
+
+import argparse
+import json
+from dataclasses import dataclass
+from typing import List, Sequence
+
+import pytest
+from aea_test_autonomy.helpers.benchmark import (
+    BaseBenchmarkResult,
+    format_table,
+    median_time,
+    run_benchmark_cli,
+)
+
+
+@dataclass(frozen=True)
+class _Result(BaseBenchmarkResult):
+    """A dummy result."""
+
+    name: str
+    seconds: float
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the dummy benchmark."""
+    parser.add_argument("--name", default="dummy")
+
+
+def _run(args: argparse.Namespace) -> List[_Result]:
+    """Run the dummy benchmark."""
+    return [_Result(name=args.name, seconds=0.5)]
+
+
+def _format_results(results: Sequence[_Result]) -> str:
+    """Format the results of the dummy benchmark."""
+    return format_table(
+        ("name", "seconds"), ((result.name, str(result.seconds)) for result in results)
+    )
+
+
+def test_median_time() -> None:
+    """Test that the function is called once per repeat."""
+    calls = []
+    assert median_time(lambda: calls.append(None), 3) >= 0
+    assert len(calls) == 3
+
+
+def test_format_table() -> None:
+    """Test that the columns are aligned."""
+    table = format_table(("a", "long header"), (("long value", "1"), ("b", "22")))
+    assert table.splitlines() == [
+        "a          | long header",
+        "long value | 1",
+        "b          | 22",
+    ]
+
+
+@pytest.mark.parametrize("as_json", (False, True))
+def test_run_benchmark_cli(as_json: bool, capsys: pytest.CaptureFixture) -> None:
+    """Test running a benchmark from the command line."""
+    argv = ["--name", "test"] + (["--json"] if as_json else [])
+    run_benchmark_cli(
+        "\nA dummy benchmark.\n\nMore details.\n",
+        _add_arguments,
+        _run,
+        _format_results,
+        argv,
+    )
+    output = capsys.readouterr().out
+    if as_json:
+        assert json.loads(output) == [{"name": "test", "seconds": 0.5}]
+    else:
+        assert output.splitlines() == ["name | seconds", "test | 0.5"]
+
+
+def test_run_benchmark_cli_description(capsys: pytest.CaptureFixture) -> None:
+    """Test that the first paragraph of the description is used in the help."""
+    with pytest.raises(SystemExit):
+        run_benchmark_cli(
+            "\nA dummy benchmark.\n\nMore details.\n",
+            _add_arguments,
+            _run,
+            _format_results,
+            ["--help"],
+        )
+    output = capsys.readouterr().out
+    assert "A dummy benchmark." in output
+    assert "More details." not in output
@@ -22,7 +22,13 @@
 import tempfile
 from pathlib import Path
 
-from autonomy.analyse.logs.collection import LogCollection
+from autonomy.analyse.logs.base import LOGS_DB, LogsProgress
+from autonomy.analyse.logs.collection import (
+    FromDirectory,
+    LogCollection,
+    iter_log_blocks,
+)
+from autonomy.analyse.logs.db import AgentLogsDB, INDEXED_COLUMNS
 
 LOGS = """[2023-09-26 06:27:56,015] [INFO] [agent] Entered in the 'check_transaction_history_behaviour' behaviour
 [2023-09-26 06:27:56,078] [ERROR] [agent] get_safe_nonce unsuccessful! Received: Message(sender=valory/ledger:0.19.0,to=valory/trader_abci:0.1.0,code=500,data=b'',dialogue_reference=('974278ff7b4e00019f7542a193987a8359b1c785d11a98a84bfaff2ea77b1e8f', '6b8e33fe183de2ac45e8d8f9625db5562b6230677fdc6995efc4ce05c798f83a'),message=Traceback (most recent call last):
@@ -69,3 +75,177 @@ def test_multiline_parse() -> None:
 
         for line in LOGS_CLEAN.split("\n"):
             assert line in parsed
+
+
+def test_insert_many() -> None:
+    """Test the batched ingestion of logs."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = Path(temp_dir, "log.txt")
+        file.write_text(LOGS)
+        db = AgentLogsDB(agent="aea_0", file=Path(temp_dir, LOGS_DB)).create()
+        db.insert_many(logs=LogCollection.parse(file=file), batch_size=2)
+
+        assert len(db.select()) == 3
+        indexes = {
+            name
+            for (name,) in db.cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='aea_0';"
+            )
+        }
+        assert indexes == {f"aea_0_{column}" for column in INDEXED_COLUMNS}
+        assert db.has_fts()
+
+        (row,) = db.select(search="RemoteDisconnected")
+        assert row[2].startswith("get_safe_nonce unsuccessful!")
+        assert len(db.select(include_regexes=("Entered", "arrived"))) == 2
+        assert len(db.select(exclude_regexes=("Entered",))) == 2
+
+        db.create(reset=True)
+        assert not db.has_fts()
+
+
+APPENDED_LOGS = """  File "/usr/lib/python3.10/http/client.py", line 288, in _read_status
+[2023-09-26 06:27:57,015] [INFO] [agent] Entered in the 'registration_startup' round for period 1
+"""
+
+
+def test_iter_log_blocks() -> None:
+    """Test the log blocks are split on the timestamps."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = Path(temp_dir, "log.txt")
+        file.write_text("Starting the agent\n" + LOGS)
+        blocks = list(iter_log_blocks(file=file))
+
+        assert len(blocks) == 3
+        assert blocks[0][0] == len("Starting the agent\n")
+        assert blocks[1][1].startswith("[2023-09-26 06:27:56,078] [ERROR]")
+        assert list(iter_log_blocks(file=file, offset=file.stat().st_size)) == []
+
+
+def test_parse_progress() -> None:
+    """Test parsing resumes from the progress."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = Path(temp_dir, "log.txt")
+        file.write_text(LOGS)
+        progress = LogsProgress()
+        rows = list(LogCollection.parse(file=file, progress=progress))
+
+        assert len(rows) == 3
+        assert progress.offset == list(iter_log_blocks(file=file))[2][0]
+        assert progress.behaviour_name == "check_transaction_history_behaviour"
+
+        (row,) = LogCollection.parse(file=file, progress=progress)
+        assert row[2:] == rows[-1][2:]
+
+
+def test_incremental_ingestion() -> None:
+    """Test only the appended lines are ingested."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = Path(temp_dir, "aea_0.txt")
+        file.write_text(LOGS)
+        collection = FromDirectory(directory=Path(temp_dir))
+        db = AgentLogsDB(agent="aea_0", file=Path(temp_dir, LOGS_DB))
+        collection.create_agent_db(agent="aea_0", db=db)
+
+        rows = db.select()
+        assert len(rows) == 3
+        assert db.get_progress().rowid == 3  # type: ignore
+
+        with file.open("a") as fp:
+            fp.write(APPENDED_LOGS)
+        collection.create_agent_db(agent="aea_0", db=db)
+
+        new_rows = db.select()
+        assert len(new_rows) == 4
+        assert new_rows[:2] == rows[:2]
+        assert new_rows[2][2].endswith("line 288, in _read_status\n")
+        assert new_rows[3][3:5] == (1, "registration_startup")
+        assert len(db.select(search="arrived")) == 1
+        assert db.get_progress().rowid == 4  # type: ignore
+
+        file.write_text(LOGS)
+        collection.create_agent_db(agent="aea_0", db=db)
+        assert db.select() == rows
+
+
+def test_parallel_ingestion() -> None:
+    """Test the log files of several agents are ingested in parallel."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for agent in ("aea_0", "aea_1"):
+            Path(temp_dir, f"{agent}.txt").write_text(LOGS)
+        collection = FromDirectory(directory=Path(temp_dir))
+        dbs = {
+            agent: AgentLogsDB(agent=agent, file=Path(temp_dir, LOGS_DB))
+            for agent in collection.agents
+        }
+        collection.create_agent_dbs(dbs=dbs, max_workers=2)
+
+        for db in dbs.values():
+            assert len(db.select()) == 3
+            assert len(db.select(search="RemoteDisconnected")) == 1
+            assert db.get_progress().rowid == 3  # type: ignore
+        assert sorted(path.name for path in Path(temp_dir).iterdir()) == [
+            "aea_0.txt",
+            "aea_1.txt",
+            LOGS_DB,
+        ]
+
+
+ROUND_LOGS = """[2023-09-26 06:27:50,000] [INFO] [agent] Entered in the 'registration_startup' round for period 0
+[2023-09-26 06:27:51,500] [INFO] [agent] 'registration_startup' round is done with event: Event.DONE
+[2023-09-26 06:27:51,500] [INFO] [agent] Entered in the 'new_tokens' round for period 0
+[2023-09-26 06:27:53,000] [INFO] [agent] 'new_tokens' round is done with event: Event.ROUND_TIMEOUT
+[2023-09-26 06:27:53,000] [INFO] [agent] Entered in the 'new_tokens' round for period 0
+"""
+
+APPENDED_ROUND_LOGS = """[2023-09-26 06:27:54,000] [INFO] [agent] 'new_tokens' round is done with event: Event.DONE
+[2023-09-26 06:27:54,000] [INFO] [agent] Entered in the 'reset_and_pause' round for period 0
+[2023-09-26 06:27:55,000] [INFO] [agent] Entered in the 'registration_startup' round for period 0
+"""
+
+
+def test_materialise_rounds() -> None:
+    """Test the round transitions are extracted during the ingestion."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file = Path(temp_dir, "aea_0.txt")
+        file.write_text(ROUND_LOGS)
+        collection = FromDirectory(directory=Path(temp_dir))
+        db = AgentLogsDB(agent="aea_0", file=Path(temp_dir, LOGS_DB))
+        assert db.rounds() == []
+
+        collection.create_agent_db(agent="aea_0", db=db)
+        rounds = db.rounds()
+        assert [(row[1], row[4], row[5]) for row in rounds] == [
+            ("registration_startup", 1.5, "Event.DONE"),
+            ("new_tokens", 1.5, "Event.ROUND_TIMEOUT"),
+            ("new_tokens", None, None),
+        ]
+
+        with file.open("a") as fp:
+            fp.write(APPENDED_ROUND_LOGS)
+        collection.create_agent_db(agent="aea_0", db=db)
+
+        assert db.rounds()[:2] == rounds[:2]
+        assert [(row[1], row[4], row[5]) for row in db.rounds()[2:]] == [
+            ("new_tokens", 1.0, "Event.DONE"),
+            # the exit log of the round is missing, the next round closes it
+            ("reset_and_pause", 1.0, None),
+            ("registration_startup", None, None),
+        ]
+        assert [row[4] for row in db.rounds(slowest=True, limit=3)] == [1.5, 1.5, 1.0]
+        assert db.rounds(round_name="new_tokens", period=0)[0] == rounds[1]
+        assert sorted(db.round_timeouts()) == [
+            ("new_tokens", 2, 1),
+            ("registration_startup", 2, 0),
+            ("reset_and_pause", 1, 0),
+        ]
+        assert db.execution_path()[:2] == [
+            (0, "registration_startup", "Event.DONE"),
+            (0, "new_tokens", "Event.ROUND_TIMEOUT"),
+        ]
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Test chain query cache."""
+
+import os
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from autonomy.chain.cache import (
+    CHAIN_CACHE_ENV_VAR,
+    CHAIN_CACHE_TTL_ENV_VAR,
+    ChainQueryCache,
+    DEFAULT_CHAIN_CACHE_DIR,
+    cached_contract_call,
+    get_chain_query_cache,
+)
+from autonomy.chain.subgraph.client import SubgraphClient
+
+
+class TestChainQueryCache:
+    """Test `ChainQueryCache`."""
+
+    def test_get_and_set(self, tmp_path: Path) -> None:
+        """Test storing and retrieving entries."""
+        cache = ChainQueryCache(path=tmp_path)
+        key = cache.make_key("contract", 1, "0xaddress", "getService", (1,))
+        assert cache.get(key=key) == (False, None)
+
+        value = [1, "0xmultisig", b"\x00\x01", [1, 2]]
+        cache.set(key=key, value=value)
+        assert cache.get(key=key) == (True, value)
+
+        cache.clear()
+        assert cache.get(key=key) == (False, None)
+
+    def test_expiry(self, tmp_path: Path) -> None:
+        """Test regular entries expire and permanent entries do not."""
+        cache = ChainQueryCache(path=tmp_path, ttl=10.0)
+        cache.set(key="regular", value=1)
+        cache.set(key="permanent", value=2, permanent=True)
+
+        with mock.patch("autonomy.chain.cache.time.time", return_value=1e12):
+            assert cache.get(key="regular") == (False, None)
+            assert cache.get(key="permanent") == (True, 2)
+
+    def test_fetch(self, tmp_path: Path) -> None:
+        """Test values are only computed on a cache miss."""
+        cache = ChainQueryCache(path=tmp_path)
+        call = mock.Mock(return_value={"units": []})
+
+        for _ in range(2):
+            assert cache.fetch(call, "query") == {"units": []}
+        call.assert_called_once()
+
+        for _ in range(2):
+            cache.fetch(call, "other", should_cache=lambda value: False)
+        assert call.call_count == 3
+
+    def test_not_serializable(self, tmp_path: Path) -> None:
+        """Test values which cannot be serialized are skipped."""
+        cache = ChainQueryCache(path=tmp_path)
+        cache.set(key="key", value=object())
+        assert cache.get(key="key") == (False, None)
+
+
+@pytest.mark.parametrize(
+    argnames=("value", "expected"),
+    argvalues=(("", None), ("0", None), ("1", DEFAULT_CHAIN_CACHE_DIR)),
+)
+def test_get_chain_query_cache(value: str, expected: Any) -> None:
+    """Test enabling the cache using the environment."""
+    with mock.patch.dict(os.environ, {CHAIN_CACHE_ENV_VAR: value}):
+        cache = get_chain_query_cache()
+    assert (cache and cache.path) == expected
+
+
+def test_get_chain_query_cache_custom(tmp_path: Path) -> None:
+    """Test configuring the cache directory and TTL."""
+    with mock.patch.dict(
+        os.environ,
+        {CHAIN_CACHE_ENV_VAR: str(tmp_path), CHAIN_CACHE_TTL_ENV_VAR: "5"},
+    ):
+        cache = get_chain_query_cache()
+    assert cache is not None
+    assert cache.path == tmp_path
+    assert cache.ttl == 5.0
+
+
+def test_cached_contract_call(tmp_path: Path) -> None:
+    """Test contract calls are keyed by chain, contract, method and arguments."""
+    ledger_api = mock.Mock()
+    ledger_api.api.eth.chain_id = 1
+    call = mock.Mock(return_value="ipfs://hash")
+
+    with mock.patch.dict(os.environ, {CHAIN_CACHE_ENV_VAR: ""}):
+        cached_contract_call(call, ledger_api, "0xAddress", "tokenURI", 1)
+        cached_contract_call(call, ledger_api, "0xAddress", "tokenURI", 1)
+    assert call.call_count == 2
+
+    call.reset_mock()
+    with mock.patch.dict(os.environ, {CHAIN_CACHE_ENV_VAR: str(tmp_path)}):
+        cached_contract_call(call, ledger_api, "0xAddress", "tokenURI", 1)
+        cached_contract_call(call, ledger_api, "0xaddress", "tokenURI", 1)
+        assert call.call_count == 1
+
+        cached_contract_call(call, ledger_api, "0xaddress", "tokenURI", 2)
+        cached_contract_call(call, ledger_api, "0xaddress", "getService", 1)
+        assert call.call_count == 3
+
+        other_ledger_api = mock.Mock()
+        other_ledger_api.api.eth.chain_id = 100
+        cached_contract_call(call, other_ledger_api, "0xaddress", "tokenURI", 1)
+        assert call.call_count == 4
+
+
+def test_cached_contract_call_chain_id_requested_once(tmp_path: Path) -> None:
+    """Test the chain id is requested once per ledger API, not on every call."""
+    ledger_api = mock.Mock()
+    chain_id = mock.PropertyMock(return_value=1)
+    type(ledger_api.api.eth).chain_id = chain_id
+    call = mock.Mock(return_value="ipfs://hash")
+
+    with mock.patch.dict(os.environ, {CHAIN_CACHE_ENV_VAR: str(tmp_path)}):
+        for _ in range(3):
+            cached_contract_call(call, ledger_api, "0xAddress", "tokenURI", 1)
+    assert call.call_count == 1
+    chain_id.assert_called_once_with()
+
+
+def test_subgraph_client_cache(tmp_path: Path) -> None:
+    """Test only non-empty subgraph results are cached."""
+    client = SubgraphClient(url="http://subgraph")
+    with mock.patch.dict(
+        os.environ, {CHAIN_CACHE_ENV_VAR: str(tmp_path)}
+    ), mock.patch.object(
+        SubgraphClient,
+        "_request",
+        side_effect=[{"units": []}, {"units": [{"tokenId": "1"}]}],
+    ) as request:
+        assert client._query("query") == {"units": []}
+        assert client._query("query") == {"units": [{"tokenId": "1"}]}
+        assert client._query("query") == {"units": [{"tokenId": "1"}]}
+    assert request.call_count == 2
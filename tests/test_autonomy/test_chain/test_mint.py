@@ -21,12 +21,12 @@
 
 import re
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict
 from unittest import mock
 
 import pytest
 
-from autonomy.chain.base import registry_contracts
+from autonomy.chain.base import UnitType, registry_contracts
 from autonomy.chain.config import ChainType
 from autonomy.chain.constants import COMPONENT_REGISTRY_CONTRACT, CONTRACTS_DIR_LOCAL
 from autonomy.chain.exceptions import InvalidMintParameter
@@ -173,3 +173,33 @@ def test_transaction_timeout() -> None:
             sleep=1.0,
             timeout=-1.0,
         )
+
+
+def test_mint_components_dry_run(capsys: Any) -> None:
+    """Test minting several components on dry run."""
+
+    ledger_api = mock.MagicMock()
+    ledger_api.api.to_checksum_address.side_effect = lambda address: address
+    with mock.patch.object(
+        registry_contracts.registries_manager,
+        "get_create_transaction",
+        side_effect=lambda **kwargs: {"metadata_hash": kwargs["metadata_hash"]},
+    ) as get_create_transaction:
+        token_ids = MintManager(
+            ledger_api=ledger_api,  # type: ignore
+            crypto=mock.MagicMock(address="0xowner"),  # type: ignore
+            chain_type=ChainType.LOCAL,
+            dry_run=True,
+        ).mint_components(
+            components=[
+                ("0x1", UnitType.COMPONENT, [2, 1, 2]),
+                ("0x2", UnitType.AGENT, [1]),
+            ]
+        )
+
+    assert token_ids == [None, None]
+    assert get_create_transaction.call_count == 2
+    assert get_create_transaction.call_args_list[0].kwargs["dependencies"] == [1, 2]
+    output = capsys.readouterr().out
+    assert output.count("=== Dry run output ===") == 2
+    assert "    metadata_hash: 0x2" in output
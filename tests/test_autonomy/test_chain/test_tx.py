@@ -28,6 +28,7 @@ import pytest
 from aea_ledger_ethereum import GAS_STATION
 from aea_test_autonomy.fixture_helpers import registries_scope_class  # noqa: F401
 from requests.exceptions import ConnectionError as RequestsConnectionError
+from web3.exceptions import TransactionNotFound
 
 from autonomy.chain.config import ChainType
 from autonomy.chain.exceptions import (
@@ -37,7 +38,7 @@ from autonomy.chain.exceptions import (
     TxSettleError,
     TxVerifyError,
 )
-from autonomy.chain.tx import ERRORS_TO_RETRY, TxSettler
+from autonomy.chain.tx import ERRORS_TO_RETRY, TxPipeline, TxSettler
 
 from tests.test_autonomy.test_chain.base import BaseChainInteractionTest
 
@@ -896,3 +897,112 @@ class TestGasMultipliers:
         assert settler.tx_dict["maxPriorityFeePerGas"] == 100  # 50 * 2.0
         # Gas estimate should not be multiplied (using default 1.0)
         assert settler.tx_dict["gas"] == 21000
+
+
+class _PipelineChain:
+    """Mock chain tracking the transactions sent by a pipeline."""
+
+    def __init__(self, start_nonce: int = 7, stuck: int = 0) -> None:
+        """Initialize the chain, keeping the first `stuck` sends unmined."""
+        self.start_nonce = start_nonce
+        self.stuck = stuck
+        self.sent: list = []
+        self.block_number = 1
+
+    def get_transaction_count(self, address: str, block: str) -> int:
+        """Get the pending nonce."""
+        assert block == "pending"
+        return self.start_nonce
+
+    def send_signed_transaction(self, tx_signed: Dict, raise_on_try: bool) -> str:
+        """Send a transaction."""
+        tx_hash = f"0x{tx_signed['nonce']}{tx_signed['maxFeePerGas']}"
+        self.sent.append(tx_hash)
+        return tx_hash
+
+    def get_transaction_receipt(self, tx_hash: str) -> Any:
+        """Get the receipt of a transaction, if it is mined."""
+        if self.sent.index(tx_hash) < self.stuck:
+            raise TransactionNotFound(tx_hash)
+        return mock.Mock(blockNumber=1)
+
+    def ledger_api(self) -> mock.Mock:
+        """Get a ledger api mock backed by this chain."""
+        return mock.Mock(
+            api=mock.Mock(eth=self),
+            try_get_gas_pricing=lambda **kwargs: {
+                "maxFeePerGas": 100,
+                "maxPriorityFeePerGas": 100,
+            },
+            update_with_gas_estimate=lambda tx: tx,
+            send_signed_transaction=self.send_signed_transaction,
+        )
+
+
+class TestTxPipeline:
+    """Test TxPipeline."""
+
+    def _pipeline(self, chain: _PipelineChain, size: int) -> TxPipeline:
+        """Build a pipeline with `size` transactions."""
+        pipeline = TxPipeline(
+            ledger_api=chain.ledger_api(),
+            crypto=mock.Mock(sign_transaction=lambda transaction: transaction),
+            chain_type=ChainType.LOCAL,
+            timeout=0.01,
+            sleep=0.01,
+        )
+        for _ in range(size):
+            pipeline.add(tx_builder=lambda: {"nonce": 0})
+        return pipeline
+
+    def test_consecutive_nonces(self) -> None:
+        """Test transactions are sent back-to-back with consecutive nonces."""
+        chain = _PipelineChain()
+        pipeline = self._pipeline(chain=chain, size=3)
+        pipeline.transact()
+
+        assert [settler.nonce for settler in pipeline.settlers] == [7, 8, 9]
+        assert chain.sent == ["0x7100", "0x8100", "0x9100"]
+        assert all(settler.tx_receipt is None for settler in pipeline.settlers)
+
+        pipeline.settle()
+        assert all(settler.tx_receipt is not None for settler in pipeline.settlers)
+
+    def test_dry_run(self) -> None:
+        """Test dry run does not assign nonces nor send transactions."""
+        chain = _PipelineChain()
+        pipeline = self._pipeline(chain=chain, size=2)
+        pipeline.transact(dry_run=True)
+
+        assert chain.sent == []
+        assert all(settler.tx_dict == {"nonce": 0} for settler in pipeline.settlers)
+
+    def test_settle_before_transact(self) -> None:
+        """Test settling before sending the transactions."""
+        pipeline = self._pipeline(chain=_PipelineChain(), size=1)
+        with pytest.raises(TxSettleError, match="before they are sent"):
+            pipeline.settle()
+
+    @mock.patch("autonomy.chain.tx.logger")
+    def test_replace_stuck_transaction(self, logger: mock.Mock) -> None:
+        """Test a stuck transaction is replaced by a repriced one."""
+        chain = _PipelineChain(stuck=1)
+        pipeline = self._pipeline(chain=chain, size=2)
+        pipeline.transact().settle()
+
+        first, second = pipeline.settlers
+        assert chain.sent == ["0x7100", "0x8100", "0x7112"]
+        assert first.tx_hash == "0x7112"
+        assert second.tx_hash == "0x8100"
+        logger.warning.assert_called_once()
+        assert "nonce 7 not mined" in logger.warning.call_args[0][0]
+
+    @mock.patch("autonomy.chain.tx.logger")
+    def test_timeout(self, logger: mock.Mock) -> None:
+        """Test pipeline raises when transactions are never mined."""
+        chain = _PipelineChain(stuck=100)
+        pipeline = self._pipeline(chain=chain, size=1)
+        pipeline.retries = 2
+        with pytest.raises(ChainTimeoutError, match="not mined after 2 replacements"):
+            pipeline.transact().settle()
+        assert len(chain.sent) == 3
@@ -19,13 +19,17 @@
 
 """Test `benchmarks` command"""
 
+import csv
 import json
 import os
 from contextlib import suppress
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-from autonomy.analyse.benchmark.aggregate import BlockTypes
+import pytest
+
+from autonomy.analyse.benchmark.aggregate import BlockTypes, OutputFormats, percentile
+from autonomy.analyse.benchmark.compare import mann_whitney_u
 from autonomy.deploy.constants import BENCHMARKS_DIR
 
 from tests.test_autonomy.test_cli.base import BaseCliTest
@@ -139,3 +143,139 @@ class TestBenchmarks(BaseCliTest):
         """Test with only total blocks."""
 
         self._run_test(BlockTypes.TOTAL)
+
+    def test_output_formats(
+        self,
+    ) -> None:
+        """Test the csv and json output formats."""
+
+        for output_format in (OutputFormats.CSV, OutputFormats.JSON):
+            output_file = self.t / f"benchmarks.{output_format}"
+            result = self.run_cli(
+                (
+                    str(self.benchmarks_dir),
+                    "--output",
+                    str(output_file),
+                    f"--format={output_format}",
+                ),
+            )
+            assert result.exit_code == 0, result.output
+
+            if output_format == OutputFormats.JSON:
+                rows = json.loads(output_file.read_text())
+            else:
+                with open(output_file, encoding="utf-8") as fp:
+                    rows = list(csv.DictReader(fp))
+
+            assert len(rows) == NUMBER_OF_BEHAVIOURS * len(BlockTypes.types)
+            assert {
+                "behaviour",
+                "block",
+                "count",
+                "mean",
+                "p50",
+                "p90",
+                "p99",
+            }.issubset(rows[0])
+            assert int(rows[0]["count"]) == NUMBER_OF_AGENTS * NUMBER_OF_PERIODS
+
+    def test_ignores_other_files(
+        self,
+    ) -> None:
+        """Test that files which are not period files are ignored."""
+
+        (self.benchmarks_dir / "agent_0" / "spans.jsonl").write_text("{}\n")
+        (self.benchmarks_dir / "agent_0" / "10.json").write_text(
+            json.dumps(generate_benchmark_data())
+        )
+        self._run_test(BlockTypes.ALL)
+
+
+def test_percentile() -> None:
+    """Test `percentile`."""
+
+    assert percentile([3.0], 99) == 3.0
+    assert percentile([4.0, 1.0, 3.0, 2.0], 50) == 2.5
+    assert percentile(list(range(101)), 90) == 90
+    with pytest.raises(ValueError, match="no values"):
+        percentile([], 50)
+
+
+def test_mann_whitney_u() -> None:
+    """Test `mann_whitney_u`."""
+
+    baseline, candidate = [1.0, 2.0, 3.0, 4.0, 5.0], [6.0, 7.0, 8.0, 9.0, 10.0]
+    assert mann_whitney_u(baseline, candidate) == pytest.approx(0.0061, abs=1e-4)
+    assert mann_whitney_u(candidate, baseline) > 0.99
+    assert mann_whitney_u([1.0, 1.0], [1.0, 1.0]) == 1.0
+
+
+class TestBenchmarksCompare(BaseCliTest):
+    """Test comparing benchmarks."""
+
+    cli_options: Tuple[str, ...] = ("analyse", "benchmarks")
+
+    def setup_method(self) -> None:
+        """Setup test method."""
+
+        super().setup_method()
+        self.output_file = self.t / "comparison.json"
+
+    def _write_run(self, name: str, consensus: float) -> Path:
+        """Write the benchmark data of a run."""
+
+        run_dir = self.t / name
+        for agent in range(NUMBER_OF_AGENTS):
+            agent_dir = run_dir / f"agent_{agent}"
+            agent_dir.mkdir(parents=True)
+            for i in range(NUMBER_OF_PERIODS):
+                data = generate_benchmark_data()
+                data[0]["data"]["consensus"] = consensus + (agent + i) * 0.01
+                (agent_dir / f"{i}.json").write_text(json.dumps(data))
+        return run_dir
+
+    def _compare(self, *extra: str) -> Tuple[int, str, List[Dict]]:
+        """Compare a slower candidate against the baseline."""
+
+        baseline = self._write_run("baseline", consensus=1.0)
+        candidate = self._write_run("candidate", consensus=2.0)
+        result = self.run_cli(
+            (
+                str(candidate),
+                "--compare",
+                str(baseline),
+                "--block-type=consensus",
+                "--format=json",
+                "--output",
+                str(self.output_file),
+                *extra,
+            ),
+        )
+        return result.exit_code, result.output, json.loads(self.output_file.read_text())
+
+    def test_regression(self) -> None:
+        """Test flagging a regression."""
+
+        exit_code, output, rows = self._compare()
+        assert exit_code == 0, output
+        assert "Found 1 regression(s)" in output
+        assert "behaviour_0 (consensus)" in output
+        assert [row["behaviour"] for row in rows if row["regression"]] == [
+            "behaviour_0"
+        ]
+        assert all(row["block"] == BlockTypes.CONSENSUS for row in rows)
+
+    def test_fail_on_regression(self) -> None:
+        """Test failing on a regression."""
+
+        exit_code, output, _ = self._compare("--fail-on-regression")
+        assert exit_code == 1
+        assert "Benchmark regressions found." in output
+
+    def test_no_regression(self) -> None:
+        """Test comparing without regressions."""
+
+        exit_code, output, rows = self._compare("--min-change=2.0")
+        assert exit_code == 0, output
+        assert "No regressions found." in output
+        assert not any(row["regression"] for row in rows)
@@ -23,6 +23,7 @@
 import contextlib
 import os
 from typing import Tuple
+from unittest import mock
 
 from autonomy.analyse.logs.base import LOGS_DB
 from autonomy.deploy.constants import WARNING
@@ -242,3 +243,118 @@ class TestAnalyseLogs(BaseLogAnalyserTest):
         )
         assert result.exit_code == 1, result.stdout
         assert "Cannot find agent log data in" in result.output
+
+    def test_multiple_include_regex_filter(self) -> None:
+        """Test including the logs matching any of several regexes."""
+
+        result = self.run_cli(
+            commands=(
+                "--from-dir",
+                str(LOGS_DIR),
+                "-a",
+                "aea_0",
+                "-ir",
+                ".*'new_tokens' round.*",
+                "-ir",
+                ".*'db_update' round.*",
+            )
+        )
+        assert result.exit_code == 0, result.stdout
+        assert "new_tokens" in result.output
+        assert "db_update" in result.output
+        assert "registration_startup" not in result.output
+
+    def test_invalid_regex(self) -> None:
+        """Test an invalid regex."""
+
+        result = self.run_cli(
+            commands=("--from-dir", str(LOGS_DIR), "-a", "aea_0", "-ir", "(")
+        )
+        assert result.exit_code == 1, result.stdout
+        assert "Invalid regex '('" in result.output
+
+    def test_search(self) -> None:
+        """Test the full-text search."""
+
+        result = self.run_cli(
+            commands=(
+                "--from-dir",
+                str(LOGS_DIR),
+                "-a",
+                "aea_0",
+                "--search",
+                '"arrived block"',
+            )
+        )
+        assert result.exit_code == 0, result.stdout
+        assert "arrived block with timestamp" in result.output
+        assert "Entered in the" not in result.output
+
+    def test_follow(self) -> None:
+        """Test following the logs."""
+
+        with mock.patch(
+            "autonomy.cli.helpers.analyse.time.sleep", side_effect=KeyboardInterrupt
+        ):
+            result = self.run_cli(
+                commands=(
+                    "--from-dir",
+                    str(LOGS_DIR),
+                    "-a",
+                    "aea_0",
+                    "--follow",
+                    "-ir",
+                    "arrived block",
+                )
+            )
+        assert result.exit_code == 1, result.stdout
+        assert "[aea_0]" in result.output
+        assert "arrived block with timestamp" in result.output
+        assert "Entered in the" not in result.output
+
+    def test_slowest_rounds(self) -> None:
+        """Test printing the slowest rounds."""
+
+        result = self.run_cli(
+            commands=(
+                "--from-dir",
+                str(LOGS_DIR),
+                "-a",
+                "aea_0",
+                "--slowest-rounds",
+                "2",
+            )
+        )
+        assert result.exit_code == 0, result.stdout
+        lines = result.output.strip().splitlines()[-2:]
+        assert lines[0].startswith("aea_0 | 0 | reset_and_pause |")
+        assert lines[0].endswith("| 29.525 | Event.DONE")
+        assert lines[1].startswith("aea_0 | 1 | reset_and_pause |")
+
+    def test_round_timeouts(self) -> None:
+        """Test printing the timeout frequency of the rounds."""
+
+        result = self.run_cli(
+            commands=("--from-dir", str(LOGS_DIR), "-a", "aea_0", "--timeouts")
+        )
+        assert result.exit_code == 0, result.stdout
+        assert "new_tokens | 5 | 1 | 20.00%" in result.output
+
+    def test_critical_path(self) -> None:
+        """Test printing the critical path of a period."""
+
+        result = self.run_cli(
+            commands=(
+                "--from-dir",
+                str(LOGS_DIR),
+                "-a",
+                "aea_0",
+                "--critical-path",
+                "--period",
+                "1",
+            )
+        )
+        assert result.exit_code == 0, result.stdout
+        assert "|_ Period 1 | 21.558s" in result.output
+        assert "| |_ reset_and_pause | aea_0 | 16.472s" in result.output
+        assert "Period 0" not in result.output
@@ -22,20 +22,37 @@
 import re
 import tempfile
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 from unittest import mock
 
 import click
 import pytest
-from aea.configurations.data_types import PackageType
+from aea.configurations.data_types import PackageId, PackageType
+from aea.helpers.base import IPFSHash
+from aea.helpers.ipfs.base import IPFSHashOnly
 from aea_test_autonomy.configurations import ETHEREUM_KEY_DEPLOYER
 
-from autonomy.chain.base import ServiceState
+from autonomy.chain.base import ServiceState, UnitType
 from autonomy.chain.config import ChainConfigs, ChainType, OnChainHelper
 from autonomy.chain.mint import DEFAULT_NFT_IMAGE_HASH, registry_contracts
-from autonomy.cli.helpers.chain import MintHelper, ServiceHelper
+from autonomy.cli.helpers.chain import (
+    DRY_RUN_TOKEN_ID,
+    MintHelper,
+    ServiceHelper,
+    get_mint_order,
+)
 
 from tests.conftest import ROOT_DIR
-from tests.test_autonomy.test_chain.base import patch_subgraph
+from tests.test_autonomy.test_chain.base import (
+    DUMMY_AGENT,
+    DUMMY_CONNECTION,
+    DUMMY_CONTRACT,
+    DUMMY_PACKAGE_MANAGER,
+    DUMMY_PROTOCOL,
+    DUMMY_SKILL,
+    PACKAGES_DIR,
+    patch_subgraph,
+)
 
 PACKAGE_DIR = ROOT_DIR / "packages" / "valory" / "protocols" / "abci"
 DUMMY_METADATA_HASH = (
@@ -552,3 +569,160 @@ def test_wrong_private_key_format(key: str) -> None:
         file = Path(temp_dir, "key.txt")
         file.write_text(key)
         OnChainHelper.load_crypto(file=file)
+
+
+def test_get_mint_order() -> None:
+    """Test packages are grouped in dependency order."""
+    assert get_mint_order(packages_dir=PACKAGES_DIR) == [
+        [DUMMY_PROTOCOL],
+        [DUMMY_CONNECTION, DUMMY_CONTRACT],
+        [DUMMY_SKILL],
+        [DUMMY_AGENT],
+    ]
+
+
+def test_mint_packages(capsys: Any) -> None:
+    """Test minting a packages directory."""
+    minted: List[List] = []
+
+    def _mint_components(components: List, owner: Optional[str]) -> List[int]:
+        minted.append(components)
+        start = sum(map(len, minted[:-1])) + 1
+        return list(range(start, start + len(components)))
+
+    with tempfile.TemporaryDirectory() as temp_dir, mock.patch(
+        "autonomy.cli.helpers.chain.publish_metadata",
+        side_effect=lambda package_id, **kwargs: (
+            f"0x{package_id.name}",
+            str(package_id),
+        ),
+    ), mock.patch.object(Path, "cwd", return_value=Path(temp_dir)):
+        helper = MintHelper(chain_type=ChainType.LOCAL, key=ETHEREUM_KEY_DEPLOYER)
+        helper.manager = mock.Mock(mint_components=_mint_components)
+        helper.verify_nft().mint_packages(packages_dir=PACKAGES_DIR)
+        assert sorted(file.name for file in Path(temp_dir).iterdir()) == [
+            f"{token_id}.json" for token_id in range(1, 6)
+        ]
+
+    assert [len(components) for components in minted] == [1, 2, 1, 1]
+    assert minted[0] == [("0xdummy_protocol", UnitType.COMPONENT, [])]
+    assert minted[-1] == [("0xdummy_agent", UnitType.AGENT, [])]
+    output = capsys.readouterr().out
+    assert "Packages minted with:" in output
+    assert "| (agent, dummy_author/dummy_agent:0.1.0)" in output
+
+
+def _package_hash(package_id: PackageId) -> str:
+    """Get the hash of a dummy package."""
+    return IPFSHashOnly.get(
+        file_path=str(DUMMY_PACKAGE_MANAGER.package_path_from_package_id(package_id))
+    )
+
+
+@pytest.mark.parametrize("dry_run", (False, True))
+def test_mint_packages_ethereum(dry_run: bool, capsys: Any) -> None:
+    """Test minting a packages directory on a chain with dependency checks."""
+    minted: List[List] = []
+
+    def _mint_components(components: List, owner: Optional[str]) -> List[Optional[int]]:
+        minted.append(components)
+        if dry_run:
+            return [None] * len(components)
+        start = sum(map(len, minted[:-1])) + 10
+        return list(range(start, start + len(components)))
+
+    def _get_record_by_package_hash(package_hash: str) -> Dict:
+        if package_hash == _package_hash(DUMMY_PROTOCOL):
+            return {"units": [{"tokenId": "7"}]}
+        return {"units": []}
+
+    with tempfile.TemporaryDirectory() as temp_dir, mock.patch(
+        "autonomy.cli.helpers.chain.publish_metadata",
+        side_effect=lambda package_id, **kwargs: (
+            f"0x{package_id.name}",
+            str(package_id),
+        ),
+    ) as publish_mock, mock.patch.object(Path, "cwd", return_value=Path(temp_dir)):
+        helper = MintHelper(
+            chain_type=ChainType.ETHEREUM, key=ETHEREUM_KEY_DEPLOYER, dry_run=dry_run
+        )
+        helper.manager = mock.Mock(mint_components=_mint_components)
+        helper.subgraph = mock.Mock(
+            get_record_by_package_hash=_get_record_by_package_hash
+        )
+        helper.verify_nft(nft=IPFSHash(DEFAULT_NFT_IMAGE_HASH)).mint_packages(
+            packages_dir=PACKAGES_DIR
+        )
+        written = sorted(file.name for file in Path(temp_dir).iterdir())
+
+    # the protocol is already minted, so it is neither published nor minted again
+    assert publish_mock.call_count == 4
+    assert [len(components) for components in minted] == [2, 1, 1]
+    assert {components[0] for components in minted[0]} == {
+        "0xdummy_connection",
+        "0xdummy_contract",
+    }
+
+    connection_id, contract_id = 10, 11
+    if minted[0][0][0] == "0xdummy_contract":
+        connection_id, contract_id = contract_id, connection_id
+    skill_id = 12
+    if dry_run:
+        connection_id = contract_id = skill_id = DRY_RUN_TOKEN_ID
+
+    connection = next(c for c in minted[0] if c[0] == "0xdummy_connection")
+    assert connection[2] == [7]
+    skill, *_ = minted[1]
+    assert sorted(skill[2]) == sorted([7, connection_id, contract_id])
+    agent, *_ = minted[2]
+    assert agent[1] == UnitType.AGENT
+    assert sorted(agent[2]) == sorted([7, connection_id, contract_id, skill_id])
+
+    output = capsys.readouterr().out
+    assert "is already minted with token ID 7" in output
+    if dry_run:
+        assert written == []
+        assert "Packages minted with:" not in output
+    else:
+        assert written == [f"{token_id}.json" for token_id in range(10, 14)]
+        assert "Packages minted with:" in output
+
+
+def test_mint_packages_changed_package_hash() -> None:
+    """Test that a package minted with a different package hash is minted again."""
+    minted: List[List] = []
+
+    def _mint_components(components: List, owner: Optional[str]) -> List[int]:
+        minted.append(components)
+        start = sum(map(len, minted[:-1])) + 10
+        return list(range(start, start + len(components)))
+
+    # the same public id is on chain, but with the hash of an older version
+    subgraph = mock.Mock(
+        get_record_by_package_hash=mock.Mock(return_value={"units": []}),
+        get_record_by_package_id=mock.Mock(
+            return_value={"units": [{"tokenId": "7", "publicId": "dummy_protocol"}]}
+        ),
+    )
+    with tempfile.TemporaryDirectory() as temp_dir, mock.patch(
+        "autonomy.cli.helpers.chain.publish_metadata",
+        side_effect=lambda package_id, **kwargs: (
+            f"0x{package_id.name}",
+            str(package_id),
+        ),
+    ), mock.patch.object(Path, "cwd", return_value=Path(temp_dir)):
+        helper = MintHelper(chain_type=ChainType.ETHEREUM, key=ETHEREUM_KEY_DEPLOYER)
+        helper.manager = mock.Mock(mint_components=_mint_components)
+        helper.subgraph = subgraph
+        helper.verify_nft(nft=IPFSHash(DEFAULT_NFT_IMAGE_HASH)).mint_packages(
+            packages_dir=PACKAGES_DIR
+        )
+
+    subgraph.get_record_by_package_hash.assert_any_call(
+        package_hash=_package_hash(DUMMY_PROTOCOL)
+    )
+    assert [len(components) for components in minted] == [1, 2, 1, 1]
+    assert minted[0] == [("0xdummy_protocol", UnitType.COMPONENT, [])]
+    connection = next(c for c in minted[1] if c[0] == "0xdummy_connection")
+    # the connection depends on the protocol minted in this run, not on the older version
+    assert connection[2] == [10]
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""Test `autonomy replay requests`."""
+
+import json
+from typing import Tuple
+
+from packages.valory.skills.abstract_round_abci.tests.data.dummy_abci import (
+    PATH_TO_SKILL,
+)
+from packages.valory.skills.abstract_round_abci.tests.test_tools.test_replay import (
+    N_BLOCKS,
+    _record,
+)
+
+from tests.conftest import ROOT_DIR
+from tests.test_autonomy.test_cli.base import BaseCliTest
+
+
+class TestReplayRequests(BaseCliTest):
+    """Test `autonomy replay requests`."""
+
+    cli_options: Tuple[str, ...] = ("replay", "requests")
+
+    def test_run(self) -> None:
+        """Test replaying a log of ABCI requests."""
+        log = self.t / "abci_requests.log"
+        _record(log)
+        options = (
+            "--skill",
+            str(PATH_TO_SKILL),
+            "--registry",
+            str(ROOT_DIR / "packages"),
+        )
+
+        result = self.run_cli((str(log), *options, "--json"))
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["blocks"] == N_BLOCKS
+
+        result = self.run_cli((str(log), *options))
+        assert result.exit_code == 0, result.output
+        assert f"{N_BLOCKS} blocks in 1 run(s)" in result.output
+
+    def test_mismatch(self) -> None:
+        """Test that a divergent app hash fails the command."""
+        log = self.t / "abci_requests.log"
+        _record(log, [b"divergent"])
+        result = self.run_cli(
+            (
+                str(log),
+                "--skill",
+                str(PATH_TO_SKILL),
+                "--registry",
+                str(ROOT_DIR / "packages"),
+            )
+        )
+        assert result.exit_code == 1, result.output
+        assert "App hash mismatch at height 1" in result.output
@@ -31,6 +31,7 @@ from autonomy.constants import DEFAULT_BUILD_FOLDER
 from autonomy.deploy._http_server import App as _InlineHttpApp
 from autonomy.deploy.base import build_hash_id
 from autonomy.deploy.constants import PERSISTENT_DATA_DIR, TM_STATE_DIR
+from autonomy.replay.store import DumpStore
 from autonomy.replay.tendermint import TendermintNetwork
 
 from tests.conftest import ROOT_DIR, skip_docker_tests
@@ -141,3 +142,32 @@ class TestTendermintRunner(BaseCliTest):
                 assert addr["addr"]["port"] == (26630 + i)
 
             assert "# persistent_peers" in config_toml.read_text()
+
+
+class TestMaterialise(BaseCliTest):
+    """Test `autonomy replay materialise`."""
+
+    cli_options: Tuple[str, ...] = ("replay", "materialise")
+
+    def test_run(self) -> None:
+        """Test materialising a period."""
+
+        dump_dir = self.t / PERSISTENT_DATA_DIR / TM_STATE_DIR
+        store = DumpStore(dump_dir)
+        for node_id in range(2):
+            node_home = self.t / f"node{node_id}"
+            (node_home / "config").mkdir(parents=True)
+            (node_home / "config" / "config.toml").write_text(f"node {node_id}")
+            store.ingest(store.stage(node_home, 0, node_id), 0, node_id)
+
+        result = self.run_cli(("1", "--build", str(self.t)))
+        assert result.exit_code == 1, result.output
+        assert "Can't find the dumps of period 1" in result.output
+
+        output_dir = self.t / "output"
+        result = self.run_cli(("0", "--build", str(self.t), "--output", output_dir))
+        assert result.exit_code == 0, result.output
+        for node_id in range(2):
+            assert (
+                output_dir / f"node{node_id}" / "config" / "config.toml"
+            ).read_text() == f"node {node_id}"
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2026 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the localhost tendermint server app."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from autonomy.deploy.generators.localhost.tendermint.app import PeriodDumper
+from autonomy.replay.store import materialise_periods
+
+
+def test_period_dumper() -> None:
+    """Test the incremental dumps of the periods."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tm_home = Path(temp_dir, "tm_home")
+        (tm_home / "config").mkdir(parents=True)
+        (tm_home / "config" / "genesis.json").write_text("genesis")
+        (tm_home / "data").mkdir()
+        (tm_home / "data" / "state.db").write_bytes(b"state")
+        dump_dir = Path(temp_dir, "tm_state")
+        logger = mock.Mock()
+
+        with mock.patch.dict(os.environ, {"TMHOME": str(tm_home), "ID": "0"}):
+            period_dumper = PeriodDumper(logger, dump_dir=dump_dir, compression="gzip")
+            assert period_dumper.store_period() is None
+            period_dumper.dump_period()
+            shutil.rmtree(tm_home / "data")
+            (tm_home / "data").mkdir()
+            futures = [period_dumper.store_period()]
+
+            # a failed reset restarts the node on the same data
+            period_dumper.dump_period()
+            (tm_home / "data" / "state.db").write_bytes(b"new state")
+            period_dumper.discard_period()
+            assert period_dumper.resets == 1
+            assert not (dump_dir / ".staging" / "period_1" / "node0").exists()
+
+            period_dumper.dump_period()
+            futures.append(period_dumper.store_period())
+
+        for future in futures:
+            future.result(timeout=10)
+
+        assert period_dumper.resets == 2
+        assert period_dumper.store.periods() == [0, 1]
+        logger.info.assert_any_call("Dumped data for period 1")
+
+        materialise_periods(dump_dir)
+        period_0 = dump_dir / "period_0" / "node0"
+        assert (period_0 / "data" / "state.db").read_bytes() == b"state"
+        period_1 = dump_dir / "period_1" / "node0"
+        assert (period_1 / "data" / "state.db").read_bytes() == b"new state"
+        # the config is stored once for both periods
+        assert len(list(period_dumper.store.objects_dir.rglob("*.gz"))) == 3
+
+        with mock.patch.dict(
+            os.environ, {"TMHOME": str(tm_home), "ID": "0"}
+        ), mock.patch.object(
+            period_dumper.store, "stage", side_effect=OSError("error")
+        ):
+            assert period_dumper.dump_period() is None
+        logger.info.assert_called_with(
+            "Error occurred while dumping data for period 2: error"
+        )
+
+
+def test_period_dumper_background_errors() -> None:
+    """Test that the unexpected errors of the background dumps are logged, and that stopping drains them."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tm_home = Path(temp_dir, "tm_home")
+        (tm_home / "data").mkdir(parents=True)
+        logger = mock.Mock()
+
+        with mock.patch.dict(os.environ, {"TMHOME": str(tm_home), "ID": "0"}):
+            period_dumper = PeriodDumper(logger, dump_dir=Path(temp_dir, "tm_state"))
+            period_dumper.dump_period()
+            with mock.patch.object(
+                period_dumper.store, "ingest", side_effect=ValueError("error")
+            ):
+                future = period_dumper.store_period()
+                period_dumper.dump_period()
+                period_dumper.stop()
+
+        assert future is not None and future.done()
+        logger.error.assert_called_once_with("Failed to dump data for period 0: error")
+        # the snapshot staged after the last reset is discarded
+        assert period_dumper.resets == 1
@@ -19,6 +19,7 @@
 
 """Test replay tools."""
 
+import os
 import shutil
 import subprocess  # nosec
 import tempfile
@@ -31,6 +32,7 @@ import pytest
 from autonomy.deploy.base import TENDERMINT_COM_URL_PARAM, TENDERMINT_URL_PARAM
 from autonomy.deploy.constants import TM_STATE_DIR
 from autonomy.replay.agent import AgentRunner
+from autonomy.replay.store import DumpStore, materialise_periods
 from autonomy.replay.tendermint import (
     RanOutOfDumpsToReplay,
     TendermintRunner,
@@ -67,6 +69,25 @@ def ctrl_c() -> None:
     raise KeyboardInterrupt()
 
 
+def make_node_home(home: Path, genesis: str = "genesis") -> None:
+    """Create a dummy tendermint home."""
+    (home / "config").mkdir(parents=True)
+    (home / "config" / "genesis.json").write_text(genesis)
+    (home / "config" / "config.toml").write_text("config")
+    (home / "data" / "blockstore.db").mkdir(parents=True)
+    (home / "data" / "blockstore.db" / "000001.ldb").write_bytes(os.urandom(1024))
+    (home / "data" / "priv_validator_state.json").write_text('{"height": "5"}')
+    (home / "data" / "cs.wal").mkdir()
+
+
+def read_tree(root: Path) -> dict:
+    """Read the files of a directory tree."""
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes() if path.is_file() else None
+        for path in root.rglob("*")
+    }
+
+
 def init_tendermint(home: Path) -> None:
     """Initialize tendermint home."""
     result = subprocess.run(  # nosec
@@ -215,3 +236,89 @@ def test_agent_runner() -> None:
 
     agent_runner.stop()
     assert agent_runner.process is None
+
+
+@pytest.mark.parametrize("compression", (None, "gzip"))
+def test_dump_store(compression: str) -> None:
+    """Test the roundtrip of a node home through the dump store."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        home = Path(temp_dir, "home")
+        make_node_home(home)
+        expected = read_tree(home)
+        store = DumpStore(Path(temp_dir, TM_STATE_DIR), compression=compression)
+
+        staged = store.stage(home, period=0, node_id=0)
+        assert store.periods() == []
+
+        # a reset rewrites the configs in place and recreates the data folder
+        (home / "config" / "genesis.json").write_text("reset genesis")
+        shutil.rmtree(home / "data")
+        (home / "data").mkdir()
+
+        # the linked files are copied, not moved, when the node still has them
+        (home / "data" / "kept.log").write_bytes(b"log")
+        os.link(home / "data" / "kept.log", staged / "data" / "kept.log")
+        expected["data/kept.log"] = b"log"
+
+        manifest = store.ingest(staged, period=0, node_id=0)
+        (home / "data" / "kept.log").write_bytes(b"log appended")
+        assert not staged.exists()
+        assert store.periods() == [0]
+        assert store.nodes(0) == [0]
+        assert all(
+            entry["object"].endswith(".gz") is (compression == "gzip")
+            for entry in manifest["files"].values()
+        )
+
+        target = store.materialise(0, 0, Path(temp_dir, "period_0", "node0"))
+        assert read_tree(target) == expected
+
+        # unchanged files are stored once
+        n_objects = len([p for p in store.objects_dir.rglob("*") if p.is_file()])
+        make_node_home(home / "next", genesis="genesis")
+        store.ingest(store.stage(home / "next", 1, 0), period=1, node_id=0)
+        assert store.periods() == [0, 1]
+        assert (
+            len([p for p in store.objects_dir.rglob("*") if p.is_file()])
+            == n_objects + 1
+        )
+
+
+def test_dump_store_errors() -> None:
+    """Test the errors of the dump store."""
+
+    with pytest.raises(ValueError, match="Unsupported compression 'zip'"):
+        DumpStore(Path("."), compression="zip")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = DumpStore(Path(temp_dir))
+        assert store.periods() == []
+        with pytest.raises(FileNotFoundError, match="Can't find the dump of node 0"):
+            store.materialise(0, 0, Path(temp_dir, "node0"))
+
+
+def test_materialise_periods() -> None:
+    """Test materialising the periods which are not on disk."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        dump_dir = Path(temp_dir, TM_STATE_DIR)
+        store = DumpStore(dump_dir)
+        for period in range(2):
+            for node_id in range(2):
+                home = Path(temp_dir, f"home_{period}_{node_id}")
+                make_node_home(home)
+                store.ingest(store.stage(home, period, node_id), period, node_id)
+
+        (dump_dir / "period_0" / "node1").mkdir(parents=True)
+        materialised = materialise_periods(dump_dir)
+
+        assert materialised == [
+            dump_dir / "period_0" / "node0",
+            dump_dir / "period_1" / "node0",
+            dump_dir / "period_1" / "node1",
+        ]
+        assert not any((dump_dir / "period_0" / "node1").iterdir())
+        assert (
+            dump_dir / "period_1" / "node1" / "data" / "priv_validator_state.json"
+        ).read_text() == '{"height": "5"}'